@@ -0,0 +1,40 @@
+"""
+Gemeinsame Fixtures der Unit-Tests.
+
+Die Repositories laufen auf mongomock statt auf MongoDB: echter Konstruktor
+samt Indizes (z.B. eindeutige job_id), aber In-Memory-Collections. Der
+Job-Notifier (Push-Dispatch der Worker) ist stillgelegt.
+"""
+
+from typing import Any
+
+import pytest
+
+from src.core.mongodb.repository import SessionJobRepository
+from src.core.mongodb.secretary_repository import SecretaryJobRepository
+
+
+class _NoopNotifier:
+    def notify(self) -> None:
+        pass
+
+
+@pytest.fixture
+def mongo_db(monkeypatch: pytest.MonkeyPatch) -> Any:
+    """In-Memory-Datenbank, die get_mongodb_database() in den Repositories liefert."""
+    mongomock = pytest.importorskip("mongomock")
+    db = mongomock.MongoClient().db
+    monkeypatch.setattr("src.core.mongodb.secretary_repository.get_mongodb_database", lambda: db)
+    monkeypatch.setattr("src.core.mongodb.repository.get_mongodb_database", lambda: db)
+    monkeypatch.setattr("src.core.mongodb.secretary_repository.get_job_notifier", lambda: _NoopNotifier())
+    return db
+
+
+@pytest.fixture
+def secretary_repo(mongo_db: Any) -> SecretaryJobRepository:
+    return SecretaryJobRepository()
+
+
+@pytest.fixture
+def session_repo(mongo_db: Any) -> SessionJobRepository:
+    return SessionJobRepository()
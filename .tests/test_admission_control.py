@@ -0,0 +1,117 @@
+"""
+Unit-Tests für die Admission Control (src/core/admission_control.py, src/api/admission.py).
+
+Der Flask-Teil läuft gegen einen minimalen Blueprint; keine MongoDB
+(Job-Warteschlange über eine Stub-Funktion).
+"""
+
+import threading
+import time
+from typing import Any, Tuple
+
+import pytest
+from flask import Blueprint, Flask
+
+from src.api.admission import register_admission_control, sync_call_deferred
+from src.core.admission_control import AdmissionController, AdmissionRejected, EndpointLimit
+
+
+def test_rejects_with_503_when_no_slot_frees_up_in_time() -> None:
+    limit = EndpointLimit(name="pdf", path="/pdf", max_concurrent=1, max_queue=1, queue_timeout_sec=0.05)
+    controller = AdmissionController([limit], default_retry_after_sec=7)
+    controller.acquire(limit)
+
+    with pytest.raises(AdmissionRejected) as rejected:
+        controller.acquire(limit)
+    assert (rejected.value.status_code, rejected.value.retry_after) == (503, 7)
+
+
+def test_rejects_immediately_with_429_when_wait_queue_is_full() -> None:
+    limit = EndpointLimit(name="pdf", path="/pdf", max_concurrent=1, max_queue=1, queue_timeout_sec=5)
+    controller = AdmissionController([limit])
+    held = controller.acquire(limit)
+    waiter = threading.Thread(target=lambda: controller.release(controller.acquire(limit)))
+    waiter.start()
+    while controller.snapshot()["pdf"]["waiting"] == 0:
+        time.sleep(0.01)
+
+    with pytest.raises(AdmissionRejected) as rejected:
+        controller.acquire(limit)
+    assert rejected.value.status_code == 429
+
+    controller.release(held)  # wartender Request bekommt den Slot
+    waiter.join(2)
+    assert controller.snapshot()["pdf"] == {"running": 0, "waiting": 0, "max_concurrent": 1, "max_queue": 1}
+
+
+def test_retry_after_follows_recent_throughput() -> None:
+    limit = EndpointLimit(name="audio", path="/audio/process", max_concurrent=1)
+    controller = AdmissionController([limit], window_sec=60)
+    for _ in range(10):
+        controller.release(controller.acquire(limit))
+    # 10 Abschlüsse in < 1 s -> Rate >= 10/s, ein Request vor uns -> 1 s (Minimum)
+    assert controller.retry_after("audio") == 1
+
+
+def test_job_queue_depth_rejects_with_retry_after_from_job_throughput() -> None:
+    limit = EndpointLimit(name="jobs", path="/jobs", max_pending_jobs=100)
+    stats: Tuple[int, int] = (130, 60)  # 130 wartend, 60 fertig pro 60 s
+    controller = AdmissionController([limit], window_sec=60, job_queue_stats=lambda _w: stats)
+
+    with pytest.raises(AdmissionRejected) as rejected:
+        controller.acquire(limit)
+    assert (rejected.value.status_code, rejected.value.code, rejected.value.retry_after) == (503, "JOB_QUEUE_FULL", 31)
+
+
+def _app(controller: AdmissionController) -> Tuple[Flask, threading.Event, threading.Event]:
+    bp = Blueprint("api", __name__)
+    register_admission_control(bp, controller)
+    entered = threading.Event()
+    proceed = threading.Event()
+
+    @bp.route("/audio/process", methods=["POST"])
+    def _process() -> Any:
+        if sync_call_deferred():
+            return {"status": "accepted"}, 202
+        entered.set()
+        proceed.wait(5)
+        return {"status": "success"}
+
+    app = Flask(__name__)
+    app.register_blueprint(bp, url_prefix="/api")
+    return app, entered, proceed
+
+
+def test_middleware_rejects_fast_with_retry_after_header() -> None:
+    controller = AdmissionController([EndpointLimit(name="audio", path="/audio/process", max_concurrent=1)])
+    app, entered, proceed = _app(controller)
+    client = app.test_client()
+    first = threading.Thread(target=lambda: app.test_client().post("/api/audio/process"))
+    first.start()
+    assert entered.wait(2)
+
+    resp = client.post("/api/audio/process")
+    proceed.set()
+    first.join()
+
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == "5"
+    assert resp.get_json()["error"]["code"] == "TOO_MANY_REQUESTS"
+    # Slot ist nach dem ersten Request wieder frei
+    assert controller.snapshot()["audio"]["running"] == 0
+
+
+def test_middleware_defers_sync_calls_with_auto_queue() -> None:
+    controller = AdmissionController(
+        [EndpointLimit(name="audio", path="/audio/process", max_concurrent=1, auto_queue=True)]
+    )
+    app, entered, proceed = _app(controller)
+    first = threading.Thread(target=lambda: app.test_client().post("/api/audio/process"))
+    first.start()
+    assert entered.wait(2)
+
+    resp = app.test_client().post("/api/audio/process")
+    proceed.set()
+    first.join()
+
+    assert resp.status_code == 202
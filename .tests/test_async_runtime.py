@@ -0,0 +1,149 @@
+"""
+Unit-Tests für die langlebigen Event-Loops (src/utils/async_runtime.py).
+"""
+
+import asyncio
+import gc
+import threading
+from typing import Any, List
+
+import pytest
+from flask import Flask, request
+
+from src.utils.async_runtime import close_loop, close_thread_loop, loop_resource, run_async
+
+
+async def _current_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+def test_loop_persists_per_thread_and_resources_are_reused() -> None:
+    created: List[object] = []
+
+    async def _client() -> object:
+        return loop_resource("client", lambda: created.append(object()) or created[-1])
+
+    first = run_async(_current_loop())
+    assert run_async(_current_loop()) is first
+    assert run_async(_client()) is run_async(_client())
+    assert len(created) == 1
+
+    other: List[asyncio.AbstractEventLoop] = []
+    thread = threading.Thread(target=lambda: other.append(run_async(_current_loop())))
+    thread.start()
+    thread.join()
+    assert other[0] is not first
+
+
+def test_exceptions_propagate_and_loop_stays_usable() -> None:
+    async def _fail() -> None:
+        raise ValueError("kaputt")
+
+    with pytest.raises(ValueError):
+        run_async(_fail())
+    assert run_async(asyncio.sleep(0, result=42)) == 42
+
+
+def test_nested_call_from_running_loop_is_rejected() -> None:
+    async def _nested() -> None:
+        run_async(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError):
+        run_async(_nested())
+
+
+def test_coroutine_sees_flask_request_context() -> None:
+    app = Flask(__name__)
+
+    @app.route("/echo", methods=["POST"])
+    def _echo() -> str:
+        async def _process() -> str:
+            return str(request.form["value"])
+        return run_async(_process())
+
+    assert app.test_client().post("/echo", data={"value": "ok"}).get_data(as_text=True) == "ok"
+
+
+class _AsyncResource:
+    def __init__(self, events: List[str]) -> None:
+        self.events = events
+
+    async def aclose(self) -> None:
+        self.events.append("aclose")
+
+
+def test_thread_end_cancels_tasks_and_closes_loop_resources() -> None:
+    events: List[str] = []
+    loops: List[asyncio.AbstractEventLoop] = []
+    open_gens: List[Any] = []
+
+    async def _background() -> None:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+
+    async def _agen() -> Any:
+        try:
+            yield 1
+            yield 2
+        finally:
+            events.append("agen")
+
+    async def _work() -> None:
+        loops.append(asyncio.get_running_loop())
+        loop_resource("client", lambda: _AsyncResource(events))
+        asyncio.ensure_future(_background())
+        gen = _agen()
+        await gen.__anext__()
+        open_gens.append(gen)  # bleibt offen, bis der Loop schließt
+        await asyncio.sleep(0)
+
+    thread = threading.Thread(target=lambda: run_async(_work()))
+    thread.start()
+    thread.join()
+    gc.collect()
+
+    assert loops[0].is_closed()
+    assert events.count("cancelled") == 1 and events.count("aclose") == 1 and "agen" in events
+
+
+def test_close_loop_closes_sync_resources() -> None:
+    closed: List[bool] = []
+
+    class _SyncResource:
+        def close(self) -> None:
+            closed.append(True)
+
+    loop = asyncio.new_event_loop()
+
+    async def _register() -> None:
+        loop_resource("sync", _SyncResource)
+
+    loop.run_until_complete(_register())
+    close_loop(loop)
+    assert closed == [True] and loop.is_closed()
+    close_loop(loop)  # idempotent
+
+
+def test_close_thread_loop_releases_resources_at_job_end() -> None:
+    events: List[str] = []
+    loops: List[asyncio.AbstractEventLoop] = []
+
+    async def _job() -> None:
+        loops.append(asyncio.get_running_loop())
+        loop_resource("client", lambda: _AsyncResource(events))
+
+    def _worker() -> None:
+        # Wie SecretaryWorkerManager._run_worker: ein Loop pro Job-Thread
+        try:
+            run_async(_job())
+        finally:
+            close_thread_loop()
+        events.append("after")
+
+    thread = threading.Thread(target=_worker)
+    thread.start()
+    thread.join()
+    assert events == ["aclose", "after"] and loops[0].is_closed()
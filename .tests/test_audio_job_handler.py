@@ -24,7 +24,7 @@ class _FakeRepo:
         self.status_updates: List[Dict[str, Any]] = []
         self.logs: List[Dict[str, Any]] = []
 
-    def update_job_status(self, *, job_id: str, status: str, progress: Any = None, results: Any = None, error: Any = None) -> bool:
+    def update_job_status(self, *, job_id: str, status: str, progress: Any = None, results: Any = None, error: Any = None, worker_id: Any = None) -> bool:
         self.status_updates.append(
             {
                 "job_id": job_id,
@@ -40,6 +40,9 @@ class _FakeRepo:
         self.logs.append({"job_id": job_id, "level": level, "message": message})
         return True
 
+    def store_final_webhook_payload(self, job_id: str, payload: Dict[str, Any]) -> bool:
+        return False
+
 
 class _FakeAudioProcessor:
     def __init__(self, *_args: Any, **_kwargs: Any) -> None:
@@ -68,7 +71,7 @@ class _FakeAudioProcessor:
 async def test_audio_handler_sends_completed_webhook_and_persists_results(monkeypatch: pytest.MonkeyPatch) -> None:
     from src.core.processing.handlers.audio_handler import handle_audio_job
 
-    # Monkeypatch AudioProcessor + requests.post
+    # Monkeypatch AudioProcessor + Webhook-Transport
     monkeypatch.setattr("src.core.processing.handlers.audio_handler.AudioProcessor", _FakeAudioProcessor)
 
     posted: List[Dict[str, Any]] = []
@@ -82,7 +85,12 @@ async def test_audio_handler_sends_completed_webhook_and_persists_results(monkey
 
         return _Resp()
 
-    monkeypatch.setattr("src.core.processing.handlers.audio_handler.requests.post", _fake_post)
+    from src.utils.webhook_dispatcher import WebhookDispatcher
+    dispatcher = WebhookDispatcher(workers=1, coalesce_window_sec=0.0, transport=_fake_post)
+    monkeypatch.setattr(
+        "src.core.processing.handlers.audio_handler.get_webhook_dispatcher",
+        lambda: dispatcher,
+    )
 
     repo = _FakeRepo()
 
@@ -98,6 +106,7 @@ async def test_audio_handler_sends_completed_webhook_and_persists_results(monkey
 
     class _Job:
         job_id = "job-1"
+        worker_id = None
         parameters = _Params()
 
     # ResourceCalculator wird im FakeAudioProcessor nicht genutzt
@@ -0,0 +1,101 @@
+"""
+Unit-Tests für das geordnete Herunterfahren der Secretary-Worker
+(SecretaryWorkerManager.drain, SecretaryJobRepository.release_job,
+src/core/background_workers.py).
+
+Keine MongoDB: Fake-Repository bzw. Fake-Collection.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from src.core import background_workers
+from src.core.models.job_models import Job, JobStatus
+from src.core.mongodb import secretary_repository
+from src.core.mongodb.secretary_repository import SecretaryJobRepository
+from src.core.mongodb.secretary_worker_manager import SecretaryWorkerManager
+
+
+class _FakeRepo:
+    def __init__(self, pending: List[Job]) -> None:
+        self.pending = pending
+        self.released: List[str] = []
+
+    def get_queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {"pdf": {"pending": len(self.pending)}}
+
+    def claim_next_job(self, worker_id: str, lease_seconds: int, **kwargs: Any) -> Optional[Job]:
+        return self.pending.pop(0) if self.pending else None
+
+    def add_log_entry(self, job_id: str, level: str, message: str) -> bool:
+        return True
+
+    def release_job(self, job_id: str, worker_id: str) -> bool:
+        self.released.append(job_id)
+        return True
+
+
+def test_drain_waits_for_finished_jobs_and_releases_the_rest() -> None:
+    repo = _FakeRepo([Job(job_id="fast", job_type="pdf"), Job(job_id="slow", job_type="pdf")])
+    manager = SecretaryWorkerManager(
+        job_repo=repo,  # type: ignore[arg-type]
+        resource_calculator=None,  # type: ignore[arg-type]
+        max_concurrent_workers=2,
+        worker_id="node-a",
+    )
+    hold = threading.Event()
+    manager._run_worker = lambda job: job.job_id == "slow" and hold.wait(5)  # type: ignore[method-assign,assignment,return-value]
+    manager._claim_jobs()
+    assert sorted(manager.running_workers) == ["fast", "slow"]
+    try:
+        assert manager.drain(timeout_sec=0.3) == 1
+        assert repo.released == ["slow"]
+        assert manager.stop_flag
+    finally:
+        hold.set()
+
+
+class _FakeCollection:
+    def __init__(self, doc: Optional[Dict[str, Any]]) -> None:
+        self.doc = doc
+        self.calls: List[Dict[str, Any]] = []
+
+    def find_one_and_update(self, flt: Dict[str, Any], update: Dict[str, Any], **kwargs: Any) -> Optional[Dict[str, Any]]:
+        self.calls.append({"filter": flt, "update": update})
+        return self.doc
+
+
+class _Hub:
+    def __init__(self) -> None:
+        self.notified: List[str] = []
+
+    def notify(self, job_id: str) -> None:
+        self.notified.append(job_id)
+
+
+def test_release_job_requeues_only_own_job_without_counting_an_attempt(monkeypatch: pytest.MonkeyPatch) -> None:
+    hub = _Hub()
+    monkeypatch.setattr(secretary_repository, "get_job_event_hub", lambda: hub)
+    repo = SecretaryJobRepository.__new__(SecretaryJobRepository)
+    repo.jobs = _FakeCollection({"job_id": "job-1"})  # type: ignore[assignment]
+
+    assert repo.release_job("job-1", "node-a")
+    call = repo.jobs.calls[0]  # type: ignore[attr-defined]
+    assert call["filter"] == {"job_id": "job-1", "worker_id": "node-a", "status": JobStatus.PROCESSING.value}
+    assert call["update"]["$set"]["status"] == JobStatus.PENDING.value
+    assert call["update"]["$inc"] == {"attempts": -1}
+    assert "lease_expires_at" in call["update"]["$unset"]
+    assert hub.notified == ["job-1"]
+
+    repo.jobs = _FakeCollection(None)  # type: ignore[assignment]
+    assert not repo.release_job("job-1", "node-a")
+
+
+def test_server_role_prefers_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SERVER_ROLE", "Worker")
+    assert background_workers.server_role() == "worker"
+    monkeypatch.setenv("SERVER_ROLE", "scheduler")
+    with pytest.raises(ValueError):
+        background_workers.server_role()
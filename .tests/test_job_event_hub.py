@@ -0,0 +1,166 @@
+"""
+Unit-Tests für den JobEventHub (src/core/mongodb/job_event_hub.py).
+
+Keine MongoDB: Snapshots kommen aus einem Dict, jede Abfrage wird gezählt;
+der Change Stream ist ein Stub.
+"""
+
+import datetime
+import threading
+from typing import Any, Dict, List, Optional
+
+from src.core.mongodb.job_event_hub import JobEventHub, event_id_for
+from src.core.models.job_models import Job, JobProgress, JobResults, JobStatus
+from src.core.mongodb.secretary_repository import SecretaryJobRepository
+
+
+class _Store:
+    def __init__(self) -> None:
+        self.jobs: Dict[str, Job] = {}
+        self.snapshot_queries: List[List[str]] = []
+        self.full_loads: List[str] = []
+        self.queried = threading.Event()
+
+    def set(self, job_id: str, status: JobStatus, percent: int = 0) -> None:
+        job = Job(job_id=job_id, job_type="pdf", status=status, progress=JobProgress(step="s", percent=percent))
+        if status == JobStatus.COMPLETED:
+            job.results = JobResults(markdown_content="fertig")
+        self.jobs[job_id] = job
+
+    def snapshots(self, ids: List[str]) -> List[Job]:
+        self.snapshot_queries.append(sorted(ids))
+        self.queried.set()
+        # Projektion: ohne results
+        return [Job(job_id=j.job_id, job_type=j.job_type, status=j.status, progress=j.progress)
+                for i in ids if (j := self.jobs.get(i))]
+
+    def load(self, job_id: str) -> Optional[Job]:
+        self.full_loads.append(job_id)
+        return self.jobs.get(job_id)
+
+
+def _hub(store: _Store) -> JobEventHub:
+    return JobEventHub(store.snapshots, store.load, poll_interval_sec=60, safety_poll_interval_sec=60)
+
+
+def test_notify_fans_out_one_query_to_all_subscribers() -> None:
+    store = _Store()
+    store.set("a", JobStatus.PROCESSING, 10)
+    store.set("b", JobStatus.PENDING)
+    hub = _hub(store)
+    subs = [hub.subscribe("a") for _ in range(3)]
+    other = hub.subscribe("b")
+    try:
+        assert hub.current("a") is not None
+        store.snapshot_queries.clear()
+
+        store.set("a", JobStatus.PROCESSING, 50)
+        hub.notify("a")
+        updates = [sub.next(2) for sub in subs]
+
+        assert [u.progress.percent for u in updates if u and u.progress] == [50, 50, 50]
+        assert store.snapshot_queries == [["a"]]
+        assert other.next(0.05) is None
+    finally:
+        hub.shutdown()
+
+
+def test_terminal_state_is_loaded_once_with_results() -> None:
+    store = _Store()
+    store.set("a", JobStatus.PROCESSING, 90)
+    hub = _hub(store)
+    subs = [hub.subscribe("a"), hub.subscribe("a")]
+    try:
+        hub.current("a")
+        store.set("a", JobStatus.COMPLETED, 100)
+        hub.notify("a")
+        finals = [sub.next(2) for sub in subs]
+
+        assert all(f is not None and f.results and f.results.markdown_content == "fertig" for f in finals)
+        assert store.full_loads == ["a"]
+    finally:
+        hub.shutdown()
+
+
+def test_unchanged_state_and_unsubscribed_jobs_produce_no_events() -> None:
+    store = _Store()
+    store.set("a", JobStatus.PROCESSING, 10)
+    hub = _hub(store)
+    sub = hub.subscribe("a")
+    try:
+        hub.current("a")
+        hub.notify("a")  # z.B. nur Lease verlängert
+        assert sub.next(0.2) is None
+
+        hub.unsubscribe(sub)
+        store.queried.clear()
+        hub.notify("a")
+        assert not store.queried.wait(0.2)
+        assert hub.subscriber_count() == 0
+    finally:
+        hub.shutdown()
+
+
+def test_deleted_job_marks_subscription_missing() -> None:
+    store = _Store()
+    store.set("a", JobStatus.PENDING)
+    hub = _hub(store)
+    sub = hub.subscribe("a")
+    try:
+        del store.jobs["a"]
+        hub.notify("a")
+        assert sub.next(2) is None
+        assert sub.missing
+    finally:
+        hub.shutdown()
+
+
+def test_event_id_treats_naive_mongo_timestamps_as_utc() -> None:
+    aware = Job(job_id="a")
+    aware.updated_at = datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC)
+    naive = Job(job_id="a")
+    naive.updated_at = datetime.datetime(2025, 1, 1)
+    assert event_id_for(aware) == event_id_for(naive) == "1735689600000"
+
+
+class _ChangeStream:
+    def __init__(self, changes: List[Dict[str, Any]]) -> None:
+        self.changes = changes
+        self.alive = True
+
+    def __enter__(self) -> "_ChangeStream":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def try_next(self) -> Optional[Dict[str, Any]]:
+        if not self.changes:
+            self.alive = False
+            return None
+        return self.changes.pop(0)
+
+
+class _WatchedJobs:
+    def __init__(self, changes: List[Dict[str, Any]]) -> None:
+        self.changes = changes
+        self.pipelines: List[List[Dict[str, Any]]] = []
+
+    def watch(self, pipeline: List[Dict[str, Any]], **kwargs: Any) -> _ChangeStream:
+        self.pipelines.append(pipeline)
+        return _ChangeStream(list(self.changes))
+
+
+def test_change_stream_also_matches_progress_only_updates() -> None:
+    # Fortschritt aus einem anderen Prozess: Status unverändert
+    change = {"operationType": "update", "fullDocument": {"job_id": "job-1"},
+              "updateDescription": {"updatedFields": {"progress": {"percent": 40}, "updated_at": 1}}}
+    repo = SecretaryJobRepository.__new__(SecretaryJobRepository)
+    repo.jobs = _WatchedJobs([change])  # type: ignore[assignment]
+    updates: List[str] = []
+    assert repo.watch_job_updates(updates.append, lambda: False)
+    assert updates == ["job-1"]
+
+    match = repo.jobs.pipelines[0][0]["$match"]  # type: ignore[attr-defined]
+    watched = {key.rsplit(".", 1)[-1] for cond in match["$or"] for key in cond}
+    assert watched == {"status", "progress", "updated_at"}
@@ -0,0 +1,126 @@
+"""
+Unit-Tests für die Duplikaterkennung von Secretary-Jobs
+(src/utils/job_fingerprint.py, SecretaryJobRepository.create_job).
+
+Keine MongoDB: `secretary_repo` läuft auf mongomock (.tests/conftest.py),
+inklusive des eindeutigen Index auf `active_fingerprint`.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from src.core.models.job_models import Job
+from src.core.mongodb.secretary_repository import SecretaryJobRepository
+from src.utils.job_fingerprint import compute_job_fingerprint
+
+
+def _job(params: Dict[str, Any], job_type: str = "pdf", user_id: Optional[str] = "u1") -> Job:
+    return Job.from_dict({"job_type": job_type, "parameters": params, "user_id": user_id})
+
+
+def test_fingerprint_uses_file_content_and_ignores_path_and_webhook(tmp_path: Path) -> None:
+    a = tmp_path / "upload_a.pdf"
+    b = tmp_path / "upload_b.pdf"
+    a.write_bytes(b"%PDF same")
+    b.write_bytes(b"%PDF same")
+
+    fp_a = compute_job_fingerprint(_job({"filename": str(a), "webhook": {"url": "http://x"}}))
+    fp_b = compute_job_fingerprint(_job({"filename": str(b), "page_start": 2}))
+    fp_b_extra = compute_job_fingerprint(_job({"filename": str(b), "template": "other"}))
+
+    assert fp_a and fp_a == compute_job_fingerprint(_job({"filename": str(b)}))
+    assert fp_b != fp_a  # page_start landet in extra und zählt mit
+    assert fp_b_extra != fp_a
+    assert compute_job_fingerprint(_job({"filename": str(a)}, job_type="office")) != fp_a
+    assert compute_job_fingerprint(_job({"filename": str(a), "force_refresh": True})) is None
+    assert compute_job_fingerprint(_job({"filename": str(a)}, user_id=None)) is None
+    assert compute_job_fingerprint(_job({"filename": str(a)}, user_id="u2")) != fp_a
+
+
+def test_fingerprint_prefers_upload_hash_over_reading_the_file(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _no_read(path: str) -> str:
+        raise AssertionError("Datei darf nicht erneut gelesen werden")
+
+    monkeypatch.setattr("src.utils.job_fingerprint.hash_file", _no_read)
+    monkeypatch.setattr("src.utils.job_fingerprint.os.path.isfile", lambda path: True)
+    fp = compute_job_fingerprint(_job({"filename": "/tmp/upload_1.pdf", "file_hash": "abc"}))
+    assert fp == compute_job_fingerprint(_job({"filename": "/tmp/upload_2.pdf", "file_hash": "abc"}))
+    assert fp != compute_job_fingerprint(_job({"filename": "/tmp/upload_2.pdf", "file_hash": "def"}))
+
+
+@pytest.fixture
+def repo(secretary_repo: SecretaryJobRepository) -> SecretaryJobRepository:
+    secretary_repo.deduplicate_jobs = True
+    return secretary_repo
+
+
+def test_duplicate_attaches_to_open_job_and_registers_new_webhook(repo: SecretaryJobRepository) -> None:
+    params = {"url": "https://youtu.be/x", "webhook": {"url": "http://a", "token": None, "jobId": "a-1"}}
+    first = repo.create_job({"job_type": "youtube", "parameters": dict(params)}, user_id="u1")
+    again = repo.create_job({"job_type": "youtube", "parameters": dict(params)}, user_id="u1")
+    other = repo.create_job({
+        "job_type": "youtube",
+        "parameters": {**params, "webhook": {"url": "http://b", "token": "t", "jobId": "b-1"}},
+    }, user_id="u1")
+
+    docs = list(repo.jobs.find({}))
+    assert first == again == other
+    assert len(docs) == 1
+    assert docs[0]["attached_webhooks"] == [{"url": "http://b", "token": "t", "jobId": "b-1"}]
+
+
+def test_finished_job_no_longer_absorbs_duplicates(repo: SecretaryJobRepository) -> None:
+    params = {"url": "https://example.org/doc.pdf"}
+    first = repo.create_job({"job_type": "pdf", "parameters": dict(params)}, user_id="u1")
+    repo.update_job_status(first, "completed")  # Endstatus entfernt active_fingerprint
+
+    second = repo.create_job({"job_type": "pdf", "parameters": dict(params)}, user_id="u1")
+
+    assert second != first
+    assert repo.jobs.count_documents({}) == 2
+
+
+def test_attached_webhooks_get_the_handler_payload_and_stay_out_of_the_api(
+    repo: SecretaryJobRepository, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from src.core.mongodb.secretary_worker_manager import SecretaryWorkerManager
+
+    repo.jobs.insert_one({
+        "job_id": "j1",
+        "job_type": "pdf",
+        "status": "completed",
+        "parameters": {"filename": "/tmp/a.pdf"},
+        "attached_webhooks": [{"url": "http://b", "token": "t", "jobId": "b-1"}],
+    })
+    handler_payload = {"phase": "completed", "message": "Extraktion abgeschlossen", "data": {"extracted_text": "x"}}
+    assert repo.store_final_webhook_payload("j1", handler_payload)
+    assert not repo.store_final_webhook_payload("missing", handler_payload)
+
+    job = repo.get_job("j1")
+    assert job is not None and job.attached_webhooks
+    assert "attached_webhooks" not in job.to_dict()
+
+    sent: List[Dict[str, Any]] = []
+
+    class _Dispatcher:
+        def send_final(self, job_key: str, url: str, payload: Dict[str, Any], headers: Dict[str, str], timeout: float = 30) -> None:
+            sent.append({"url": url, "payload": payload, "headers": headers})
+
+    monkeypatch.setattr("src.core.mongodb.secretary_worker_manager.get_webhook_dispatcher", lambda: _Dispatcher())
+    monkeypatch.setattr(repo, "add_log_entry", lambda *args: True)
+    manager = SecretaryWorkerManager.__new__(SecretaryWorkerManager)
+    manager.job_repo = repo
+    manager._notify_attached_webhooks("j1")
+
+    assert sent == [{
+        "url": "http://b",
+        "payload": {**handler_payload, "job": {"id": "b-1"}},
+        "headers": {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "Authorization": "Bearer t",
+            "X-Callback-Token": "t",
+        },
+    }]
@@ -0,0 +1,76 @@
+"""
+Unit-Tests für die gepufferte Job-Log-Ablage (src/core/mongodb/job_log_repository.py).
+
+Der Puffer schreibt in eine Liste; write_batches läuft gegen aufzeichnende
+Fake-Collections. Keine MongoDB.
+"""
+
+import threading
+from datetime import datetime, UTC
+from typing import Any, Dict, List
+
+from src.core.mongodb.job_log_repository import JobLogBuffer, JobLogRepository, LogBatches
+
+
+def _entry(msg: str) -> Dict[str, Any]:
+    return {"timestamp": datetime.now(UTC), "level": "info", "message": msg}
+
+
+def test_buffer_groups_entries_per_job_in_order() -> None:
+    written: List[LogBatches] = []
+    buffer = JobLogBuffer(written.append, flush_interval_sec=60, max_entries=100)
+    for i in range(3):
+        buffer.add("a", _entry(f"a{i}"))
+    buffer.add("b", _entry("b0"))
+
+    buffer.flush("b")
+    assert [list(batch) for batch in written] == [["b"]]
+
+    buffer.flush()
+    assert [e["message"] for e in written[1]["a"]] == ["a0", "a1", "a2"]
+    buffer.flush()
+    assert len(written) == 2
+
+
+def test_buffer_flushes_in_background_when_full() -> None:
+    done = threading.Event()
+    written: List[LogBatches] = []
+
+    def _write(batches: LogBatches) -> None:
+        written.append(batches)
+        done.set()
+
+    buffer = JobLogBuffer(_write, flush_interval_sec=60, max_entries=2)
+    buffer.add("a", _entry("1"))
+    buffer.add("a", _entry("2"))
+    assert done.wait(2)
+    assert len(written[0]["a"]) == 2
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.calls: List[Any] = []
+
+    def insert_many(self, docs: List[Dict[str, Any]], ordered: bool = True) -> None:
+        self.calls.append(("insert_many", docs))
+
+    def update_one(self, flt: Dict[str, Any], update: Dict[str, Any]) -> None:
+        self.calls.append(("update_one", flt, update))
+
+
+def test_write_batches_inserts_once_and_keeps_bounded_tail_on_job() -> None:
+    repo = JobLogRepository.__new__(JobLogRepository)
+    repo.logs = _Recorder()  # type: ignore[assignment]
+    repo.jobs = _Recorder()  # type: ignore[assignment]
+    repo.keep_on_job = 2
+
+    repo.write_batches({"a": [_entry("1"), _entry("2"), _entry("3")], "b": [_entry("x")]})
+
+    inserts = repo.logs.calls  # type: ignore[attr-defined]
+    assert len(inserts) == 1 and len(inserts[0][1]) == 4
+    assert {d["job_id"] for d in inserts[0][1]} == {"a", "b"}
+    _, flt, update = repo.jobs.calls[0]  # type: ignore[attr-defined]
+    assert flt == {"job_id": "a"}
+    push = update["$push"]["logs"]
+    assert push["$slice"] == -2
+    assert [e["message"] for e in push["$each"]] == ["2", "3"]
@@ -0,0 +1,79 @@
+"""
+Unit-Tests für die Keyset-Paginierung (src/core/mongodb/pagination.py).
+
+Keine MongoDB: `secretary_repo` läuft auf mongomock (.tests/conftest.py).
+"""
+
+import datetime
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from src.core.mongodb.pagination import decode_cursor, encode_cursor, keyset_page
+from src.core.mongodb.secretary_repository import SecretaryJobRepository
+
+
+def _jobs() -> List[Dict[str, Any]]:
+    base = datetime.datetime(2025, 3, 1, 12, 0)
+    # Je drei Jobs mit gleichem Zeitstempel: der Cursor muss über job_id weiterzählen
+    return [
+        {"job_id": f"job-{i:02d}", "job_type": "pdf", "status": "completed" if i % 2 else "pending",
+         "created_at": base + datetime.timedelta(seconds=i // 3), "results": {"big": "x" * 100},
+         "parameters": {"callback_token": "geheim"}, "attached_webhooks": [{"callback_token": "geheim"}]}
+        for i in range(10)
+    ]
+
+
+def test_cursor_roundtrip_and_invalid_token() -> None:
+    when = datetime.datetime(2025, 3, 1, 12, 0, 0, 123000)
+    token = encode_cursor(when, "job-1:x")
+    assert decode_cursor(token) == (when.replace(tzinfo=datetime.UTC), "job-1:x")
+    with pytest.raises(ValueError):
+        decode_cursor("not a cursor")
+
+
+@pytest.mark.parametrize("newest_first", [True, False])
+def test_pages_cover_all_documents_once_across_equal_timestamps(
+    secretary_repo: SecretaryJobRepository, newest_first: bool
+) -> None:
+    collection = secretary_repo.jobs
+    collection.insert_many(_jobs())
+    seen: List[str] = []
+    after: Optional[str] = None
+    pages = 0
+    while True:
+        docs, after = keyset_page(collection, {}, "job_id", limit=4, after=after, newest_first=newest_first)
+        seen.extend(d["job_id"] for d in docs)
+        pages += 1
+        if after is None:
+            break
+    expected = sorted((d["job_id"] for d in _jobs()), reverse=newest_first)
+    assert seen == expected and pages == 3
+
+
+def test_repository_page_filters_and_skips_results(secretary_repo: SecretaryJobRepository) -> None:
+    repo = secretary_repo
+    repo.jobs.insert_many(_jobs())
+
+    first = repo.get_jobs_page(status="completed", limit=3)
+    assert [j.job_id for j in first["jobs"]] == ["job-09", "job-07", "job-05"]
+    assert all(j.results is None for j in first["jobs"])
+    second = repo.get_jobs_page(status="completed", limit=3, after=first["next_cursor"])
+    assert [j.job_id for j in second["jobs"]] == ["job-03", "job-01"] and second["next_cursor"] is None
+
+
+def test_list_route_omits_parameters_and_webhook_tokens(
+    secretary_repo: SecretaryJobRepository, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from src.api import create_app
+    from src.api.routes import secretary_job_routes
+
+    secretary_repo.jobs.insert_many(_jobs())
+    monkeypatch.setattr(secretary_job_routes, "get_repo", lambda: secretary_repo)
+
+    resp = create_app().test_client().get("/api/jobs/?limit=3")
+    assert resp.status_code == 200
+    jobs = resp.get_json()["data"]["jobs"]
+    assert len(jobs) == 3
+    assert all("parameters" not in j and "attached_webhooks" not in j for j in jobs)
+    assert "geheim" not in resp.get_data(as_text=True)
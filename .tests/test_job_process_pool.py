@@ -0,0 +1,86 @@
+"""
+Unit-Tests für den Prozess-Pool der Secretary-Jobs (src/core/processing/process_pool.py).
+
+Die Pool-Prozesse laden keine echten Handler; ein Initializer registriert
+Test-Handler, das Repository schreibt Log-Einträge in eine Datei, damit der
+Elternprozess prüfen kann, was im Pool-Prozess angekommen ist.
+"""
+
+import asyncio
+import functools
+import os
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from src.core.models.job_models import Job
+from src.core.processing.process_pool import JobProcessPool, ProcessJobError
+
+
+class _FileRepo:
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def add_log_entry(self, job_id: str, level: str, message: str) -> bool:
+        with open(self.path, "a", encoding="utf-8") as fh:
+            fh.write(f"{job_id}|{message}\n")
+        return True
+
+
+async def _pid_handler(job: Job, repo: Any, _rc: Any) -> None:
+    await asyncio.sleep(0)
+    repo.add_log_entry(job.job_id, "info", str(os.getpid()))
+
+
+async def _failing_handler(job: Job, repo: Any, _rc: Any) -> None:
+    raise KeyError("kaputt")
+
+
+def _register_test_handlers() -> None:
+    from src.core.processing import registry
+    registry.register("pid", _pid_handler, execution="process")
+    registry.register("fail", _failing_handler, execution="process")
+
+
+def _read(path: Path) -> List[List[str]]:
+    return [line.split("|") for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def _pool(log: Path, **kwargs: Any) -> JobProcessPool:
+    return JobProcessPool(
+        size=1,
+        repo_factory=functools.partial(_FileRepo, str(log)),
+        preload=(),
+        initializer=_register_test_handlers,
+        **kwargs,
+    )
+
+
+def test_jobs_run_in_long_lived_process_and_log_through_repo(tmp_path: Path) -> None:
+    log = tmp_path / "log.txt"
+    pool = _pool(log)
+    try:
+        pool.run(Job(job_id="a", job_type="pid"))
+        with pytest.raises(ProcessJobError) as exc_info:
+            pool.run(Job(job_id="x", job_type="fail"))
+        assert exc_info.value.error_type == "KeyError"
+        # Handler-Fehler beenden den Prozess nicht
+        pool.run(Job(job_id="b", job_type="pid"))
+    finally:
+        pool.shutdown()
+    rows = _read(log)
+    assert [r[0] for r in rows] == ["a", "b"]
+    assert rows[0][1] == rows[1][1] != str(os.getpid())
+
+
+def test_worker_is_recycled_after_job_limit(tmp_path: Path) -> None:
+    log = tmp_path / "log.txt"
+    pool = _pool(log, max_jobs_per_worker=1)
+    try:
+        pool.run(Job(job_id="a", job_type="pid"))
+        pool.run(Job(job_id="b", job_type="pid"))
+    finally:
+        pool.shutdown()
+    rows = _read(log)
+    assert rows[0][1] != rows[1][1]
@@ -0,0 +1,70 @@
+"""
+Unit-Tests für die Keyframe-Auswahl (src/utils/keyframe_utils.py).
+
+Es wird kein ffmpeg benötigt: Die Bilder werden mit NumPy/Pillow erzeugt,
+die showinfo-Ausgabe ist ein statischer String.
+"""
+
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+from PIL import Image
+
+from src.utils.keyframe_utils import (
+    KeyframeCandidate,
+    build_keyframe_filter,
+    compute_dhash,
+    deduplicate_keyframes,
+    hamming_distance,
+    parse_showinfo_timestamps,
+)
+
+
+def _write_gradient(path: Path, horizontal: bool, noise_seed: int = 0) -> Path:
+    """Erzeugt ein Graustufen-Bild mit Verlauf (optional leicht verrauscht)."""
+    ramp = np.linspace(0, 255, 64, dtype=np.float32)
+    arr = np.tile(ramp, (64, 1)) if horizontal else np.tile(ramp[:, None], (1, 64))
+    if noise_seed:
+        arr = arr + np.random.default_rng(noise_seed).normal(0, 1.0, arr.shape)
+    Image.fromarray(np.clip(arr, 0, 255).astype(np.uint8), mode="L").save(path)
+    return path
+
+
+def test_parse_showinfo_timestamps() -> None:
+    stderr = (
+        "[Parsed_showinfo_1 @ 0x1] n:   0 pts:      0 pts_time:0       duration:1\n"
+        "[Parsed_showinfo_1 @ 0x1] n:   1 pts: 126000 pts_time:12.6    duration:1\n"
+        "frame=    2 fps=0.0 q=2.0 Lsize=N/A time=00:00:12.60\n"
+    )
+    assert parse_showinfo_timestamps(stderr) == [0.0, 12.6]
+
+
+def test_build_keyframe_filter_quotes_select_and_scales() -> None:
+    vf = build_keyframe_filter(0.25, width=640)
+    assert vf.startswith("select='eq(n,0)+gt(scene,0.250)',showinfo")
+    assert vf.endswith("scale=640:-1:flags=lanczos")
+
+
+def test_dhash_similar_and_different_images(tmp_path: Path) -> None:
+    a = compute_dhash(_write_gradient(tmp_path / "a.png", horizontal=True))
+    a_noisy = compute_dhash(_write_gradient(tmp_path / "b.png", horizontal=True, noise_seed=7))
+    other = compute_dhash(_write_gradient(tmp_path / "c.png", horizontal=False))
+    assert hamming_distance(a, a_noisy) <= 6
+    assert hamming_distance(a, other) > 6
+
+
+def test_deduplicate_keyframes_merges_and_keeps_spans() -> None:
+    hashes: Dict[str, int] = {"f1": 0x0, "f2": 0x1, "f3": 0xFFFF, "f4": 0xFFFE}
+    candidates = [
+        KeyframeCandidate(file_path=Path("f1"), timestamp_s=0.0),
+        KeyframeCandidate(file_path=Path("f2"), timestamp_s=4.0),
+        KeyframeCandidate(file_path=Path("f3"), timestamp_s=30.0),
+        KeyframeCandidate(file_path=Path("f4"), timestamp_s=31.0),
+    ]
+    kept = deduplicate_keyframes(
+        candidates, max_distance=2, duration_s=60.0, hash_fn=lambda p: hashes[str(p)]
+    )
+    assert [str(k.file_path) for k in kept] == ["f1", "f3"]
+    assert (kept[0].start_s, kept[0].end_s, kept[0].merged_count) == (0.0, 30.0, 2)
+    assert (kept[1].start_s, kept[1].end_s, kept[1].merged_count) == (30.0, 60.0, 2)
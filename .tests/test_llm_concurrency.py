@@ -0,0 +1,193 @@
+"""
+Unit-Tests für den adaptiven LLM-Concurrency-Limiter (src/core/llm/concurrency.py).
+
+Zeitabhängige AIMD-Regeln laufen mit einer Fake-Uhr; die gemeinsame
+Warteschlange von Threads und Coroutinen mit echter Zeit.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, List
+
+import httpx
+import pytest
+
+from src.core.exceptions import ProcessingError
+from src.core.llm import ProviderManager
+from src.core.llm.concurrency import ConcurrencyLimiter, LimitSettings, classify_outcome
+from src.utils.async_runtime import run_async
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _StatusError(Exception):
+    def __init__(self, status: int, headers: Any = None) -> None:
+        super().__init__(f"HTTP {status}")
+        self.response = httpx.Response(status, headers=headers or {})
+        self.status_code = status
+
+
+def _wrapped(status: int, headers: Any = None) -> ProcessingError:
+    # Provider verpacken SDK-Fehler in ProcessingError
+    try:
+        raise ProcessingError("Provider-Fehler") from _StatusError(status, headers)
+    except ProcessingError as exc:
+        return exc
+
+
+def test_classify_reads_status_and_retry_after_from_cause_chain() -> None:
+    assert classify_outcome(_wrapped(429, {"retry-after": "7"})) == (429, 7.0, False)
+    assert classify_outcome(_wrapped(503, {"retry-after-ms": "1500"})) == (503, 1.5, False)
+    assert classify_outcome(result=httpx.Response(200)) == (200, None, False)
+    assert classify_outcome(httpx.ReadTimeout("zu langsam")) == (None, None, True)
+
+
+def test_429_halves_once_per_round_and_honors_retry_after() -> None:
+    clock = _Clock()
+    limiter = ConcurrencyLimiter(LimitSettings(initial_limit=8), clock=clock)
+    slots = [limiter.acquire("openai", "gpt-4o") for _ in range(4)]
+    clock.now += 1
+    limiter.release(slots[0], error=_wrapped(429, {"retry-after": "5"}))
+    # Gleichzeitig gestartete Aufrufe senken nicht erneut
+    limiter.release(slots[1], error=_wrapped(429))
+    stats = limiter.snapshot()["openai:gpt-4o"]
+    assert stats["limit"] == 4.0 and stats["decreases"] == 1 and stats["throttled"] == 2
+    assert stats["retry_after_remaining_s"] == 5.0
+
+    # Während der Sperre wartet auch ein neuer Aufruf (Queue-Timeout über die Fake-Uhr)
+    limiter_short = ConcurrencyLimiter(LimitSettings(queue_timeout_seconds=0), clock=clock)
+    blocked = limiter_short.acquire("mistral", "ocr")
+    limiter_short.release(blocked, error=_wrapped(503, {"retry-after": "30"}))
+    with pytest.raises(ProcessingError) as exc_info:
+        limiter_short.acquire("mistral", "ocr")
+    assert exc_info.value.details["error_type"] == "LLM_CONCURRENCY_TIMEOUT"
+
+    clock.now += 5
+    for slot in slots[2:]:
+        limiter.release(slot)
+    assert limiter.acquire("openai", "gpt-4o").waited == 0.0
+
+
+def test_success_increases_when_saturated_and_latency_spike_decreases() -> None:
+    clock = _Clock()
+    limiter = ConcurrencyLimiter(LimitSettings(initial_limit=2, max_limit=3, latency_tolerance=3.0), clock=clock)
+    for _ in range(10):
+        slots = [limiter.acquire("openrouter", "m"), limiter.acquire("openrouter", "m")]
+        clock.now += 1
+        for slot in slots:
+            limiter.release(slot)
+    assert limiter.snapshot()["openrouter:m"]["limit"] == 3.0
+
+    slot = limiter.acquire("openrouter", "m")
+    clock.now += 10
+    limiter.release(slot)
+    assert limiter.snapshot()["openrouter:m"]["limit"] == pytest.approx(2.7)
+
+    # Nicht ausgelastet: kein Anstieg; Provider- und Modell-Abweichungen greifen
+    tuned = ConcurrencyLimiter(provider_settings={"ollama": {"max_limit": 2, "models": {"llama3": {"initial_limit": 1}}}})
+    assert tuned.settings_for("ollama", "llama3") == LimitSettings(initial_limit=1, max_limit=2)
+    tuned.release(tuned.acquire("ollama", "other"))
+    assert tuned.snapshot()["ollama:other"]["limit"] == 2.0
+
+
+def test_slow_successful_calls_do_not_lower_limit_by_default() -> None:
+    # Kurze und lange Antworten im Wechsel, keine Fehler: das Limit darf nicht fallen
+    clock = _Clock()
+    limiter = ConcurrencyLimiter(LimitSettings(initial_limit=8), clock=clock)
+    for i in range(40):
+        slot = limiter.acquire("openai", "gpt-4o")
+        clock.now += 1 if i % 2 else 20
+        limiter.release(slot)
+    stats = limiter.snapshot()["openai:gpt-4o"]
+    assert stats["limit"] == 8.0 and stats["decreases"] == 0
+
+
+def test_threads_and_coroutines_share_one_fifo_queue() -> None:
+    limiter = ConcurrencyLimiter(LimitSettings(initial_limit=1))
+    holder = limiter.acquire("openai", "whisper-1")
+    order: List[str] = []
+
+    def sync_call() -> None:
+        limiter.call("openai", "whisper-1", order.append, "thread")
+
+    async def async_call() -> None:
+        async def _append() -> None:
+            order.append("coroutine")
+        await limiter.acall("openai", "whisper-1", _append)
+
+    thread = threading.Thread(target=sync_call)
+    thread.start()
+    while limiter.snapshot()["openai:whisper-1"]["queued"] < 1:
+        time.sleep(0.01)
+    runner = threading.Thread(target=lambda: run_async(async_call()))
+    runner.start()
+    while limiter.snapshot()["openai:whisper-1"]["queued"] < 2:
+        time.sleep(0.01)
+    limiter.release(holder)
+    thread.join(5)
+    runner.join(5)
+    stats = limiter.snapshot()["openai:whisper-1"]
+    assert order == ["thread", "coroutine"]
+    assert stats["in_flight"] == 0 and stats["queued"] == 0 and stats["calls"] == 3
+
+
+def test_cancelled_waiter_leaves_queue() -> None:
+    limiter = ConcurrencyLimiter(LimitSettings(initial_limit=1))
+    holder = limiter.acquire("mistral", "large")
+
+    async def _cancel() -> None:
+        task = asyncio.ensure_future(limiter.aacquire("mistral", "large"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    run_async(_cancel())
+    assert limiter.snapshot()["mistral:large"]["queued"] == 0
+    limiter.release(holder)
+    assert limiter.acquire("mistral", "large").waited == 0.0
+
+
+class _FakeProvider:
+    def __init__(self, api_key: str, **kwargs: Any) -> None:
+        self.label = "fake"
+
+    def chat_completion(self, messages: Any, model: str, temperature: float = 0.7) -> Any:
+        return f"{model}:{temperature}"
+
+
+def test_manager_routes_provider_calls_through_limiter() -> None:
+    pm = ProviderManager()
+    pm.register_provider_class("fake-limited", _FakeProvider)  # type: ignore[arg-type]
+    try:
+        provider: Any = pm.get_provider("fake-limited", api_key="k")
+        assert provider.chat_completion([], "m1", temperature=0.1) == "m1:0.1"
+        assert provider.label == "fake"
+        assert pm.get_concurrency_limiter().snapshot()["fake-limited:m1"]["successes"] >= 1
+    finally:
+        pm._provider_classes.pop("fake-limited", None)
+        pm.clear_cache()
+
+
+def test_transcriber_sdk_fallback_goes_through_limiter() -> None:
+    from src.utils.transcription_utils import WhisperTranscriber
+
+    transcriber = WhisperTranscriber.__new__(WhisperTranscriber)
+    transcriber.provider = None
+    seen: List[Any] = []
+
+    def create(**kwargs: Any) -> str:
+        seen.append(pm.get_concurrency_limiter().snapshot()["openai:fallback-model"]["in_flight"])
+        return "antwort"
+
+    pm = ProviderManager()
+    assert transcriber._limited_client_call(create, model="fallback-model", messages=[]) == "antwort"
+    assert seen == [1]
+    assert pm.get_concurrency_limiter().snapshot()["openai:fallback-model"]["successes"] == 1
@@ -0,0 +1,85 @@
+"""
+Unit-Tests für die gemeinsamen HTTP-Clients der LLM-Provider
+(src/core/llm/http_clients.py, ProviderManager, Provider).
+
+Kein Netzwerk: Anfragen laufen über httpx.MockTransport.
+"""
+
+import threading
+from typing import Any, Dict, List
+
+import httpx
+
+from src.core.llm import ProviderManager
+from src.core.llm.http_clients import create_http_client
+from src.core.llm.providers.openai_provider import OpenAIProvider
+from src.core.llm.providers.openrouter_provider import OpenRouterProvider
+from src.utils.async_runtime import run_async
+
+_COMPLETION = {
+    "id": "c-1", "object": "chat.completion", "created": 1, "model": "gpt-4o",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "Hallo"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+}
+
+
+class _FakeProvider:
+    def __init__(self, api_key: str, **kwargs: Any) -> None:
+        self.kwargs = kwargs
+
+
+def test_manager_shares_clients_per_provider_and_loop() -> None:
+    pm = ProviderManager()
+    pm.register_provider_class("fake-http", _FakeProvider)  # type: ignore[arg-type]
+    try:
+        provider: Any = pm.get_provider("fake-http", api_key="k")
+        assert provider.kwargs["http_client"] is pm.get_http_client("fake-http")
+        assert pm.get_http_client("fake-http", "http://other") is not pm.get_http_client("fake-http")
+
+        async def _clients() -> List[httpx.AsyncClient]:
+            return [pm.get_async_http_client("fake-http"), pm.get_async_http_client("fake-http")]
+
+        first = run_async(_clients())
+        assert first[0] is first[1] and run_async(_clients())[0] is first[0]
+        # Anderer Thread -> anderer Event-Loop -> eigener async Client
+        other: List[httpx.AsyncClient] = []
+        thread = threading.Thread(target=lambda: other.extend(run_async(_clients())))
+        thread.start()
+        thread.join()
+        assert other[0] is not first[0]
+    finally:
+        pm._provider_classes.pop("fake-http", None)
+        pm.clear_cache()
+
+
+def test_chat_and_vision_reuse_the_shared_client() -> None:
+    seen: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=_COMPLETION)
+
+    provider = OpenAIProvider(
+        api_key="k", base_url="http://llm.test/v1",
+        http_client=create_http_client({}, transport=httpx.MockTransport(handler)),
+    )
+
+    text, request = provider.chat_completion([{"role": "user", "content": "Hi"}], model="gpt-4o")
+    _, vision_request = provider.vision(b"\x89PNG", prompt="Was ist zu sehen?", model="gpt-4o")
+    assert text == "Hallo" and request.tokens == 5 and vision_request.purpose == "vision"
+    assert len(seen) == 2 and all(r.url.path == "/v1/chat/completions" for r in seen)
+
+
+def test_openrouter_quota_uses_shared_client() -> None:
+    paths: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        data: Dict[str, Any] = {"usage": 1.5, "limit": None} if request.url.path.endswith("/key") \
+            else {"total_credits": 10, "total_usage": 4}
+        return httpx.Response(200, json={"data": data})
+
+    provider = OpenRouterProvider(api_key="k", http_client=create_http_client({}, transport=httpx.MockTransport(handler)))
+    quota = provider.get_quota_status()
+    assert paths == ["/api/v1/key", "/api/v1/credits"]
+    assert quota["reachable"] and quota["remaining_usd"] == 6.0
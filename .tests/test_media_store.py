@@ -0,0 +1,96 @@
+"""
+Unit-Tests für den gemeinsamen Media-Store (src/utils/media_store.py).
+
+Der Download wird durch eine Funktion ersetzt, die Bytes in das
+Staging-Verzeichnis schreibt. Kein Netzwerk, keine MongoDB.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from src.utils.media_store import MediaStore
+
+
+def _fetcher(payload: bytes, calls: List[str], name: str = "talk.mp3", delay: float = 0.0) -> Callable[[Path], Path]:
+    def _fetch(staging: Path) -> Path:
+        calls.append(name)
+        time.sleep(delay)
+        target = staging / name
+        target.write_bytes(payload)
+        return target
+    return _fetch
+
+
+def test_checkout_downloads_once_and_links_into_working_dirs(tmp_path: Path) -> None:
+    store = MediaStore(tmp_path / "store", max_size_bytes=10_000)
+    calls: List[str] = []
+
+    first = store.checkout("youtube:abc|audio.mp3", tmp_path / "job1", _fetcher(b"x" * 100, calls))
+    second = store.checkout("youtube:abc|audio.mp3", tmp_path / "job2", _fetcher(b"x" * 100, calls))
+
+    assert calls == ["talk.mp3"]
+    assert first.name == second.name == "talk.mp3"
+    assert first.read_bytes() == second.read_bytes() == b"x" * 100
+    # Löschen im Arbeitsverzeichnis berührt das Store-Objekt nicht
+    first.unlink()
+    assert store.lookup("youtube:abc|audio.mp3") is not None
+
+
+def test_concurrent_checkouts_wait_for_single_download(tmp_path: Path) -> None:
+    store = MediaStore(tmp_path / "store", max_size_bytes=10_000)
+    calls: List[str] = []
+    fetch = _fetcher(b"y" * 50, calls, delay=0.2)
+
+    threads = [
+        threading.Thread(target=store.checkout, args=("k", tmp_path / f"w{i}", fetch))
+        for i in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert calls == ["talk.mp3"]
+    assert all((tmp_path / f"w{i}" / "talk.mp3").exists() for i in range(4))
+
+
+def test_identical_content_is_stored_once(tmp_path: Path) -> None:
+    store = MediaStore(tmp_path / "store", max_size_bytes=10_000)
+    calls: List[str] = []
+    store.checkout("url:a|raw", tmp_path / "w1", _fetcher(b"same", calls, name="a.mp3"))
+    store.checkout("url:b|raw", tmp_path / "w2", _fetcher(b"same", calls, name="b.mp3"))
+    assert len(list((tmp_path / "store" / "objects").glob("*/*"))) == 1
+    assert (tmp_path / "w2" / "b.mp3").read_bytes() == b"same"
+
+
+def test_budget_evicts_least_recently_used(tmp_path: Path) -> None:
+    store = MediaStore(tmp_path / "store", max_size_bytes=250)
+    calls: List[str] = []
+    store.checkout("old", tmp_path / "w", _fetcher(b"a" * 100, calls, name="old.mp3"))
+    time.sleep(0.02)
+    store.checkout("mid", tmp_path / "w", _fetcher(b"b" * 100, calls, name="mid.mp3"))
+    time.sleep(0.02)
+    # Treffer aktualisiert "old" -> jetzt ist "mid" am längsten unbenutzt
+    assert store.lookup("old") is not None
+    time.sleep(0.02)
+    store.checkout("new", tmp_path / "w", _fetcher(b"c" * 100, calls, name="new.mp3"))
+
+    assert store.total_size() <= 250
+    assert store.lookup("mid") is None
+    assert store.lookup("old") is not None
+    assert store.lookup("new") is not None
+
+
+def test_lock_file_left_by_dead_process_does_not_block(tmp_path: Path) -> None:
+    store = MediaStore(tmp_path / "store", max_size_bytes=10_000)
+    calls: List[str] = []
+    # Lock-Datei eines abgestürzten Prozesses: ohne gehaltenes OS-Lock kein Warten
+    (store.locks_dir / f"{store._key_id('k')}.lock").write_text("4711")
+
+    started = time.monotonic()
+    store.checkout("k", tmp_path / "w", _fetcher(b"z", calls))
+
+    assert calls == ["talk.mp3"]
+    assert time.monotonic() - started < 5
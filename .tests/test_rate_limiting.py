@@ -0,0 +1,134 @@
+"""
+Unit-Tests für das Rate Limiting (src/core/rate_limiting.py, src/api/rate_limit.py).
+
+Zähler im Speicher, Uhr als Stub. Das MongoDB-Backend läuft gegen mongomock;
+gegen eine echte MongoDB nur mit gesetztem MONGODB_URI.
+"""
+
+import os
+import uuid
+from typing import Any, List
+
+import pytest
+from flask import Blueprint, Flask
+from pymongo.errors import DuplicateKeyError
+
+from src.api.rate_limit import register_rate_limiting
+from src.core.mongodb.rate_limit_repository import MongoRateLimitBackend
+from src.core.rate_limiting import InMemoryRateLimitBackend, RateLimiter
+
+
+class _Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_sliding_window_weights_previous_window_and_ignores_rejections() -> None:
+    clock = _Clock(999_980.0)  # 20 s in ein 60-s-Fenster
+    limiter = RateLimiter(limit=10, window_sec=60, clock=clock)
+    assert all(limiter.check("ip:a").allowed for _ in range(10))
+    rejected = limiter.check("ip:a")
+    # Rest des Fensters (40 s) plus 6 s, bis der Anteil des Fensters unter das Limit fällt
+    assert not rejected.allowed and rejected.retry_after == 46
+    assert limiter.check("ip:b").allowed
+
+    # Nächstes Fenster, 30 s: Hälfte des vorherigen Fensters zählt noch (5)
+    clock.now = 1_000_050.0
+    decisions = [limiter.check("ip:a") for _ in range(6)]
+    assert [d.allowed for d in decisions] == [True] * 5 + [False]
+    assert decisions[0].remaining == 4
+    assert decisions[-1].retry_after == 6
+
+
+def test_in_memory_backend_evicts_idle_and_excess_keys() -> None:
+    backend = InMemoryRateLimitBackend(max_keys=3)
+    for key in ["a", "b", "c", "d"]:
+        backend.increment(key, 0, 60)
+    assert len(backend) == 3
+
+    backend.increment("e", 180, 60)  # alle anderen seit zwei Fenstern inaktiv
+    assert len(backend) == 1
+    assert backend.increment("e", 240, 60) == (1, 1)
+
+
+def test_middleware_rejects_with_429_and_counts_only_configured_methods() -> None:
+    limiter = RateLimiter(limit=2, window_sec=60, clock=_Clock(1_000_000.0))
+    blueprint = Blueprint("api", __name__)
+    register_rate_limiting(blueprint, limiter)
+    calls: List[str] = []
+
+    @blueprint.route("/pdf", methods=["GET", "POST"])
+    def _pdf() -> str:
+        calls.append("pdf")
+        return "ok"
+
+    app = Flask(__name__)
+    app.register_blueprint(blueprint, url_prefix="/api")
+    client = app.test_client()
+
+    first = client.post("/api/pdf")
+    assert first.headers["X-RateLimit-Remaining"] == "1"
+    client.post("/api/pdf")
+    rejected = client.post("/api/pdf")
+    assert rejected.status_code == 429
+    assert rejected.get_json()["error"]["code"] == "RATE_LIMITED"
+    assert int(rejected.headers["Retry-After"]) >= 1
+    assert client.get("/api/pdf").status_code == 200
+    assert len(calls) == 3
+
+
+def _mongo_backend_collection() -> Any:
+    mongomock = pytest.importorskip("mongomock")
+    return mongomock.MongoClient().db.rate_limits
+
+
+def test_mongo_backend_pipeline_upsert_rolls_windows() -> None:
+    backend = MongoRateLimitBackend(_mongo_backend_collection())
+    assert backend.increment("ip:a", 600, 60) == (1, 0)
+    assert backend.increment("ip:a", 600, 60, cost=2) == (3, 0)
+    # Nächstes Fenster: alter Zähler wird zu `previous`
+    assert backend.increment("ip:a", 660, 60) == (1, 3)
+    backend.decrement("ip:a", 660)
+    # Zwei Fenster Pause: nichts bleibt übrig
+    assert backend.increment("ip:a", 780, 60) == (1, 0)
+    limiter = RateLimiter(limit=2, window_sec=60, backend=backend, clock=_Clock(1_000_000.0))
+    assert [limiter.check("ip:b").allowed for _ in range(3)] == [True, True, False]
+
+
+class _RacingCollection:
+    """Erster Upsert scheitert, als hätte ein anderer Prozess das Dokument gerade angelegt."""
+
+    def __init__(self, inner: Any) -> None:
+        self.inner = inner
+        self.raced = False
+
+    def find_one_and_update(self, *args: Any, **kwargs: Any) -> Any:
+        if not self.raced:
+            self.raced = True
+            self.inner.insert_one({"_id": args[0]["_id"], "window_start": 600, "count": 1, "previous": 0})
+            raise DuplicateKeyError("E11000 duplicate key error")
+        return self.inner.find_one_and_update(*args, **kwargs)
+
+
+def test_mongo_backend_retries_concurrent_first_upsert() -> None:
+    collection = _RacingCollection(_mongo_backend_collection())
+    backend = MongoRateLimitBackend(collection)  # type: ignore[arg-type]
+    assert backend.increment("ip:a", 600, 60) == (2, 0)
+    assert collection.raced
+
+
+@pytest.mark.skipif(not os.environ.get("MONGODB_URI"), reason="MONGODB_URI nicht gesetzt (Integrationstest)")
+def test_mongo_backend_against_real_mongodb() -> None:
+    from src.core.mongodb.connection import get_mongodb_database
+
+    collection = get_mongodb_database().rate_limits
+    key = f"test:{uuid.uuid4()}"
+    try:
+        backend = MongoRateLimitBackend(collection)
+        assert backend.increment(key, 600, 60) == (1, 0)
+        assert backend.increment(key, 660, 60) == (1, 1)
+    finally:
+        collection.delete_one({"_id": key})
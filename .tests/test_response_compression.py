@@ -0,0 +1,110 @@
+"""
+Unit-Tests für Antwortkompression und bedingte GETs
+(src/api/compression.py, src/api/conditional.py, secretary_job_routes).
+
+Keine MongoDB: das Repository ist ein Fake, der die Ladevorgänge mitzählt.
+"""
+
+import gzip
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import brotli  # type: ignore
+import pytest
+from flask import Blueprint, Flask, jsonify
+from flask.testing import FlaskClient
+from flask_restx import Api  # type: ignore
+
+from src.api.compression import register_compression
+from src.api.routes import secretary_job_routes
+from src.core.models.job_models import Job, JobResults, JobStatus
+from src.utils.serialization import FastJSONProvider, loads, output_json
+
+_WHEN = datetime(2025, 3, 1, 12, 0, tzinfo=timezone.utc)
+_SETTINGS: Dict[str, Any] = {"min_size_bytes": 1024, "algorithms": ["br", "gzip"]}
+
+
+class _FakeRepo:
+    def __init__(self, job: Job) -> None:
+        self.job = job
+        self.calls: List[str] = []
+
+    def get_job_version(self, job_id: str) -> Optional[Dict[str, Any]]:
+        self.calls.append("version")
+        job = self.job
+        return {"job_id": job.job_id, "status": job.status.value, "updated_at": job.updated_at, "lease_expires_at": None}
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        self.calls.append("job")
+        return self.job
+
+
+@pytest.fixture
+def job_client(monkeypatch: pytest.MonkeyPatch) -> tuple[FlaskClient, _FakeRepo]:
+    job = Job(job_id="job-1", job_type="pdf", status=JobStatus.COMPLETED, updated_at=_WHEN,
+              results=JobResults(markdown_content="Seite " * 2000))
+    repo = _FakeRepo(job)
+    monkeypatch.setattr(secretary_job_routes, "get_repo", lambda: repo)
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    blueprint = Blueprint("api", __name__)
+    api = Api(blueprint)
+    api.representation("application/json")(output_json)
+    api.add_namespace(secretary_job_routes.secretary_ns, path="/jobs")
+    register_compression(blueprint, _SETTINGS)
+    app.register_blueprint(blueprint, url_prefix="/api")
+    return app.test_client(), repo
+
+
+def test_json_compressed_by_accept_encoding_above_threshold() -> None:
+    app = Flask(__name__)
+    blueprint = Blueprint("api", __name__)
+    register_compression(blueprint, _SETTINGS)
+
+    @blueprint.route("/big")
+    def _big() -> Any:
+        return jsonify(text="Übersicht " * 500)
+
+    @blueprint.route("/small")
+    def _small() -> Any:
+        return jsonify(ok=True)
+
+    app.register_blueprint(blueprint, url_prefix="/api")
+    client = app.test_client()
+
+    br = client.get("/api/big", headers={"Accept-Encoding": "gzip, br"})
+    assert br.headers["Content-Encoding"] == "br" and br.headers["Vary"] == "Accept-Encoding"
+    assert loads(brotli.decompress(br.data))["text"].startswith("Übersicht")
+    assert int(br.headers["Content-Length"]) == len(br.data)
+
+    gz = client.get("/api/big", headers={"Accept-Encoding": "gzip;q=1.0, br;q=0.5"})
+    assert gz.headers["Content-Encoding"] == "gzip"
+    assert loads(gzip.decompress(gz.data))["text"].startswith("Übersicht")
+
+    assert "Content-Encoding" not in client.get("/api/big").headers
+    assert "Content-Encoding" not in client.get("/api/small", headers={"Accept-Encoding": "br"}).headers
+
+
+def test_job_get_returns_304_without_loading_results(job_client: tuple[FlaskClient, _FakeRepo]) -> None:
+    client, repo = job_client
+
+    first = client.get("/api/jobs/job-1")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200 and repo.calls == ["job"]
+    assert first.get_json()["data"]["updated_at"] == _WHEN.isoformat()
+
+    repo.calls.clear()
+    again = client.get("/api/jobs/job-1", headers={"If-None-Match": etag})
+    assert again.status_code == 304 and again.data == b""
+    assert again.headers["ETag"] == etag
+    assert repo.calls == ["version"]
+
+    # Komprimierte Darstellung: eigener ETag, der im If-None-Match ebenfalls passt
+    br = client.get("/api/jobs/job-1", headers={"Accept-Encoding": "br"})
+    assert br.headers["ETag"] == etag[:-1] + '-br"'
+    revalidated = client.get("/api/jobs/job-1", headers={"Accept-Encoding": "br", "If-None-Match": br.headers["ETag"]})
+    assert revalidated.status_code == 304 and revalidated.headers["ETag"] == br.headers["ETag"]
+
+    repo.job.updated_at = datetime(2025, 3, 1, 12, 5, tzinfo=timezone.utc)
+    changed = client.get("/api/jobs/job-1", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["ETag"] != etag
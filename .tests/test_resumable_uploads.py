@@ -0,0 +1,164 @@
+"""
+Unit-Tests für fortsetzbare Uploads (src/core/resumable_uploads.py,
+src/api/routes/upload_routes.py).
+
+Keine MongoDB: Der Job wird über ein Fake-Repository angelegt.
+"""
+
+import base64
+import hashlib
+import io
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+from flask import Flask
+from flask_restx import Api  # type: ignore
+
+from src.api.routes import upload_routes
+from src.core.resumable_uploads import ResumableUploadStore, UploadProtocolError
+
+_DATA = b"ID3" + os.urandom(250_000)
+
+
+def _store(tmp_path: Path) -> ResumableUploadStore:
+    return ResumableUploadStore(
+        staging_dir=str(tmp_path / "staging"),
+        upload_dir=str(tmp_path / "uploads"),
+        max_size_bytes=1024 * 1024,
+        chunk_size=64 * 1024,
+    )
+
+
+class _BrokenStream(io.BytesIO):
+    """Liefert einige Bytes und bricht dann ab (Verbindungsabbruch)."""
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if self.tell() >= 100_000:
+            raise ConnectionResetError("client gone")
+        return super().read(min(size or 65536, 100_000 - self.tell()))
+
+
+def test_resume_after_broken_chunk_and_complete(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    upload = store.create(len(_DATA), "talk.mp3", "audio/mpeg")
+
+    with pytest.raises(ConnectionResetError):
+        store.append(upload.upload_id, 0, _BrokenStream(_DATA))
+    offset = store.get(upload.upload_id).offset
+    assert offset == 100_000
+
+    with pytest.raises(UploadProtocolError) as mismatch:
+        store.append(upload.upload_id, 0, io.BytesIO(_DATA))
+    assert (mismatch.value.status_code, mismatch.value.offset) == (409, offset)
+
+    # Neuer Prozess ohne Hash-Zustand: der vorhandene Teil wird nachgelesen
+    other = _store(tmp_path)
+    assert other.append(upload.upload_id, offset, io.BytesIO(_DATA[offset:])).offset == len(_DATA)
+    done = other.complete(upload.upload_id, expected_md5=hashlib.md5(_DATA).hexdigest())
+
+    assert done.md5 == hashlib.md5(_DATA).hexdigest()
+    assert done.mime_type == "audio/mpeg"
+    assert done.path is not None and Path(done.path).read_bytes() == _DATA
+    assert other.complete(upload.upload_id).path == done.path
+    assert sorted(os.listdir(tmp_path / "staging")) == [f"{upload.upload_id}.json"]
+
+
+def test_rejects_oversized_and_overflowing_uploads(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    with pytest.raises(UploadProtocolError) as too_large:
+        store.create(2 * 1024 * 1024, "big.wav")
+    assert too_large.value.status_code == 413
+
+    upload = store.create(10, "small.wav")
+    with pytest.raises(UploadProtocolError) as overflow:
+        store.append(upload.upload_id, 0, io.BytesIO(b"x" * 11))
+    assert (overflow.value.status_code, overflow.value.offset) == (413, 10)
+    with pytest.raises(UploadProtocolError) as incomplete:
+        store.complete(store.create(10, "a.wav").upload_id)
+    assert incomplete.value.status_code == 409
+
+
+def test_expired_uploads_are_purged(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    store.expire_sec = -1
+    upload = store.create(10, "old.wav")
+    with pytest.raises(UploadProtocolError) as expired:
+        store.get(upload.upload_id)
+    assert expired.value.status_code == 410
+    assert os.listdir(tmp_path / "staging") == []
+
+
+def test_concurrent_completes_create_one_job(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    upload = store.create(len(_DATA), "talk.mp3")
+    store.append(upload.upload_id, 0, io.BytesIO(_DATA))
+    created: List[str] = []
+    outcomes: List[Any] = []
+
+    def _create_job(done: Any) -> str:
+        time.sleep(0.2)
+        created.append(done.upload_id)
+        return "job-1"
+
+    def _complete() -> None:
+        try:
+            outcomes.append(store.complete(upload.upload_id, create_job=_create_job).job_id)
+        except UploadProtocolError as e:
+            outcomes.append(e.status_code)
+
+    threads = [threading.Thread(target=_complete) for _ in range(3)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    # Wer den Lock nicht bekommt, erhält 423 und fragt erneut an
+    assert len(created) == 1 and sorted(map(str, outcomes)) == ["423", "423", "job-1"]
+    assert store.complete(upload.upload_id, create_job=_create_job).job_id == "job-1"
+    assert len(created) == 1
+
+
+class _FakeRepo:
+    jobs: List[Dict[str, Any]] = []
+
+    def create_job(self, job_data: Dict[str, Any], user_id: Optional[str] = None) -> str:
+        self.jobs.append(job_data)
+        return f"job-{len(self.jobs)}"
+
+
+def test_tus_flow_creates_secretary_job(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    store = _store(tmp_path)
+    _FakeRepo.jobs = []
+    monkeypatch.setattr(upload_routes, "get_resumable_upload_store", lambda: store)
+    monkeypatch.setattr(upload_routes, "SecretaryJobRepository", _FakeRepo)
+    monkeypatch.setattr(upload_routes, "_allowed_job_types", lambda: {"audio"})
+    app = Flask(__name__)
+    Api(app).add_namespace(upload_routes.upload_ns, path="/uploads")
+    client = app.test_client()
+
+    meta = "filename " + base64.b64encode(b"talk.mp3").decode()
+    created = client.post("/uploads/", headers={"Upload-Length": str(len(_DATA)), "Upload-Metadata": meta, "Tus-Resumable": "1.0.0"})
+    assert created.status_code == 201
+    location = created.headers["Location"]
+    upload_id = location.rsplit("/", 1)[1]
+
+    headers = {"Content-Type": "application/offset+octet-stream"}
+    first = client.patch(f"/uploads/{upload_id}", data=_DATA[:120_000], headers={**headers, "Upload-Offset": "0"})
+    assert (first.status_code, first.headers["Upload-Offset"]) == (204, "120000")
+    assert client.patch(f"/uploads/{upload_id}", data=b"x", headers={**headers, "Upload-Offset": "0"}).status_code == 409
+    assert client.head(f"/uploads/{upload_id}").headers["Upload-Offset"] == "120000"
+    client.patch(f"/uploads/{upload_id}", data=_DATA[120_000:], headers={**headers, "Upload-Offset": "120000"})
+
+    body = {"job_type": "audio", "parameters": {"target_language": "de"}}
+    done = client.post(f"/uploads/{upload_id}/complete", json=body)
+    assert done.status_code == 202
+    assert client.post(f"/uploads/{upload_id}/complete", json=body).get_json()["data"]["job_id"] == "job-1"
+    assert len(_FakeRepo.jobs) == 1
+    params = _FakeRepo.jobs[0]["parameters"]
+    assert params["file_hash"] == hashlib.md5(_DATA).hexdigest()
+    assert Path(params["filename"]).read_bytes() == _DATA
+    assert params["context"]["original_filename"] == "talk.mp3"
+    assert params["target_language"] == "de"
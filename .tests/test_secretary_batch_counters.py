@@ -0,0 +1,37 @@
+"""
+Unit-Tests für die $inc-basierten Batch-Zähler (src/core/mongodb/secretary_repository.py).
+
+Keine MongoDB: `secretary_repo` läuft auf mongomock (.tests/conftest.py).
+"""
+
+from src.core.models.job_models import Batch, Job, JobStatus
+from src.core.mongodb.secretary_repository import SecretaryJobRepository
+
+
+def test_status_transitions_move_batch_counters_and_complete_batch(secretary_repo: SecretaryJobRepository) -> None:
+    repo = secretary_repo
+    batch_id = repo.create_batch(Batch(total_jobs=2))
+    ids = [repo.create_job(Job(job_type="pdf", batch_id=batch_id)) for _ in range(2)]
+
+    batch = repo.get_batch(batch_id)
+    assert batch is not None and batch.pending_jobs == 2
+
+    repo.update_job_status(ids[0], JobStatus.PROCESSING)
+    repo.update_job_status(ids[0], JobStatus.PROCESSING)  # Fortschritt: kein Zählerwechsel
+    repo.update_job_status(ids[0], JobStatus.COMPLETED)
+    batch = repo.get_batch(batch_id)
+    assert batch is not None
+    assert (batch.pending_jobs, batch.processing_jobs, batch.completed_jobs) == (1, 0, 1)
+    assert batch.status == JobStatus.PROCESSING
+
+    repo.update_job_status(ids[1], JobStatus.PROCESSING)
+    repo.update_job_status(ids[1], JobStatus.FAILED)
+    batch = repo.get_batch(batch_id)
+    assert batch is not None
+    assert (batch.pending_jobs, batch.completed_jobs, batch.failed_jobs) == (0, 1, 1)
+    assert batch.status == JobStatus.COMPLETED
+    assert batch.completed_at is not None
+
+
+def test_update_of_unknown_job_returns_false(secretary_repo: SecretaryJobRepository) -> None:
+    assert secretary_repo.update_job_status("missing", JobStatus.COMPLETED) is False
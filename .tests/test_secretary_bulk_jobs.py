@@ -0,0 +1,72 @@
+"""
+Unit-Tests für die Bulk-Anlage von Batches (SecretaryJobRepository.create_jobs_bulk).
+
+Keine MongoDB: `secretary_repo` läuft auf mongomock (.tests/conftest.py);
+Spies auf den Collections zählen die Round-Trips.
+"""
+
+from typing import Any, Dict, List
+from unittest import mock
+
+import pytest
+
+from src.core.mongodb.secretary_repository import SecretaryJobRepository
+
+
+def _spy(monkeypatch: pytest.MonkeyPatch, collection: Any, method: str) -> mock.MagicMock:
+    spy = mock.MagicMock(wraps=getattr(collection, method))
+    monkeypatch.setattr(collection, method, spy)
+    return spy
+
+
+def test_bulk_inserts_in_chunks_and_sets_total_once(
+    secretary_repo: SecretaryJobRepository, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    inserts = _spy(monkeypatch, secretary_repo.jobs, "insert_many")
+    batch_updates = _spy(monkeypatch, secretary_repo.batches, "find_one_and_update")
+    jobs_data = [{"job_type": "pdf", "parameters": {"url": f"https://x/{i}.pdf"}} for i in range(5)]
+
+    result = secretary_repo.create_jobs_bulk(jobs_data, batch_name="b", user_id="u1", known_job_types={"pdf"}, chunk_size=2)
+
+    batch = secretary_repo.batches.find_one({"batch_id": result["batch_id"]})
+    docs = list(secretary_repo.jobs.find({}).sort("_id", 1))
+    assert [len(call.args[0]) for call in inserts.call_args_list] == [2, 2, 1]
+    assert all(call.kwargs["ordered"] is False for call in inserts.call_args_list)
+    assert batch is not None and (batch["total_jobs"], batch["pending_jobs"]) == (5, 5)
+    assert not batch_updates.called
+    assert result["job_ids"] == [d["job_id"] for d in docs]
+    assert all(d["batch_id"] == result["batch_id"] and d["user_id"] == "u1" for d in docs)
+    assert result["errors"] == []
+
+
+def test_bulk_reports_invalid_and_failed_entries_by_request_index(
+    secretary_repo: SecretaryJobRepository, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Eindeutiger job_name lässt den Eintrag "dup" beim insert_many scheitern
+    secretary_repo.jobs.create_index("job_name", unique=True, sparse=True)
+    secretary_repo.jobs.insert_one({"job_id": "existing", "job_name": "dup"})
+    batch_updates = _spy(monkeypatch, secretary_repo.batches, "find_one_and_update")
+    jobs_data: List[Any] = [
+        {"job_type": "pdf", "parameters": {}},
+        {"job_type": "unknown", "parameters": {}},
+        {"job_type": "pdf", "parameters": {}, "job_name": "dup"},
+        "kein objekt",
+        {"job_type": "pdf", "parameters": []},
+        {"job_type": "pdf", "parameters": {}},
+    ]
+
+    result = secretary_repo.create_jobs_bulk(jobs_data, known_job_types={"pdf"}, chunk_size=10)
+
+    batch = secretary_repo.batches.find_one({"batch_id": result["batch_id"]})
+    assert [e["index"] for e in result["errors"]] == [1, 2, 3, 4]
+    assert len(result["job_ids"]) == 2
+    assert batch is not None and (batch["total_jobs"], batch["pending_jobs"]) == (2, 2)
+    incs: List[Dict[str, int]] = [call.args[1]["$inc"] for call in batch_updates.call_args_list]
+    assert incs == [{"total_jobs": -1, "pending_jobs": -1}]
+
+
+def test_bulk_without_valid_jobs_creates_no_batch(secretary_repo: SecretaryJobRepository) -> None:
+    result = secretary_repo.create_jobs_bulk([{"parameters": {}}])
+
+    assert result["batch_id"] is None
+    assert secretary_repo.batches.count_documents({}) == 0
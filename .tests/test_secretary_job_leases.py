@@ -0,0 +1,111 @@
+"""
+Unit-Tests für das lease-basierte Claiming der Secretary-Jobs
+(src/core/mongodb/secretary_repository.py, src/core/mongodb/secretary_worker_manager.py).
+
+Keine MongoDB: `secretary_repo` läuft auf mongomock (.tests/conftest.py);
+der Worker-Manager bekommt ein Fake-Repository.
+"""
+
+import threading
+from datetime import datetime, timedelta, UTC
+from typing import Any, Dict, List, Optional
+
+from src.core.models.job_models import Job, JobStatus
+from src.core.mongodb.secretary_repository import SecretaryJobRepository
+from src.core.mongodb.secretary_worker_manager import SecretaryWorkerManager
+
+
+def test_claim_sets_status_worker_lease_and_attempts_atomically(secretary_repo: SecretaryJobRepository) -> None:
+    now = datetime.now(UTC)
+    for i, job_id in enumerate(["job-old", "job-new"]):
+        secretary_repo.jobs.insert_one({"job_id": job_id, "job_type": "pdf", "status": "pending",
+                                        "created_at": now + timedelta(seconds=i)})
+
+    job = secretary_repo.claim_next_job("node-a", lease_seconds=60)
+
+    assert job is not None and job.job_id == "job-old"
+    assert (job.worker_id, job.attempts, job.status) == ("node-a", 1, JobStatus.PROCESSING)
+    assert job.lease_expires_at is not None
+    pending = secretary_repo.jobs.find_one({"job_id": "job-new"})
+    assert pending is not None and pending["status"] == "pending"
+
+
+def test_claim_returns_none_when_queue_is_empty(secretary_repo: SecretaryJobRepository) -> None:
+    assert secretary_repo.claim_next_job("node-a", 60) is None
+
+
+class _FakeRepo:
+    def __init__(self, pending: List[Job]) -> None:
+        self.pending = pending
+        self.claims: List[str] = []
+        self.renewed: List[str] = []
+        self.logs: List[str] = []
+
+    def get_queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        stats: Dict[str, Dict[str, Any]] = {}
+        for job in self.pending:
+            stats.setdefault(job.job_type, {"pending": 0})["pending"] += 1
+        return stats
+
+    def claim_next_job(
+        self,
+        worker_id: str,
+        lease_seconds: int,
+        job_types: Optional[List[str]] = None,
+        exclude_job_types: Optional[List[str]] = None,
+    ) -> Optional[Job]:
+        self.claims.append(worker_id)
+        for job in self.pending:
+            if job_types is not None and job.job_type not in job_types:
+                continue
+            if exclude_job_types and job.job_type in exclude_job_types:
+                continue
+            self.pending.remove(job)
+            return job
+        return None
+
+    def renew_lease(self, job_id: str, worker_id: str, lease_seconds: int) -> bool:
+        self.renewed.append(job_id)
+        return True
+
+    def add_log_entry(self, job_id: str, level: str, message: str) -> bool:
+        self.logs.append(message)
+        return True
+
+
+def test_manager_claims_only_free_slots_and_renews_running_leases() -> None:
+    repo = _FakeRepo([Job(job_id=f"job-{i}", job_type="pdf") for i in range(5)])
+    manager = SecretaryWorkerManager(
+        job_repo=repo,  # type: ignore[arg-type]
+        resource_calculator=None,  # type: ignore[arg-type]
+        max_concurrent_workers=2,
+        worker_id="node-a",
+    )
+    release = threading.Event()
+    manager._run_worker = lambda job: release.wait(5)  # type: ignore[method-assign, assignment]
+
+    manager._claim_jobs()
+    assert sorted(manager.running_workers) == ["job-0", "job-1"]
+    assert len(repo.pending) == 3
+
+    manager._renew_leases()
+    assert sorted(repo.renewed) == ["job-0", "job-1"]
+
+    release.set()
+    for th in manager.running_workers.values():
+        th.join()
+
+
+def test_worker_without_lease_cannot_finish_requeued_job(secretary_repo: SecretaryJobRepository) -> None:
+    repo = secretary_repo
+    repo.jobs.insert_one({"job_id": "job-1", "job_type": "pdf", "status": "pending",
+                          "created_at": datetime.now(UTC)})
+
+    assert repo.claim_next_job("node-a", lease_seconds=60) is not None
+    # Lease von node-a abgelaufen, node-b hat den Job übernommen
+    repo.jobs.update_one({"job_id": "job-1"}, {"$set": {"worker_id": "node-b"}})
+
+    assert not repo.update_job_status("job-1", JobStatus.FAILED, error={"code": "X", "message": "alt"}, worker_id="node-a")
+    assert repo.update_job_status("job-1", JobStatus.COMPLETED, results={"markdown_content": "neu"}, worker_id="node-b")
+    doc = repo.jobs.find_one({"job_id": "job-1"})
+    assert doc is not None and doc["status"] == "completed" and "error" not in doc
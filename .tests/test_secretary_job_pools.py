@@ -0,0 +1,121 @@
+"""
+Unit-Tests für die Concurrency-Pools pro job_type
+(src/core/mongodb/secretary_worker_manager.py).
+
+Reine Funktionen und ein Fake-Repository; keine MongoDB.
+"""
+
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, UTC
+from typing import Any, Dict, List, Optional
+
+from src.core.models.job_models import Job
+from src.core.mongodb.secretary_worker_manager import (
+    DEFAULT_POOL,
+    SecretaryWorkerManager,
+    build_queue_stats,
+    load_job_type_pools,
+    select_pool,
+)
+
+
+_CFG: Dict[str, Any] = {
+    "max_concurrent": 4,
+    "job_types": {
+        "pdf": {"max_concurrent": 3, "priority": 3},
+        "audio": {"max_concurrent": 1, "priority": 1},
+    },
+}
+
+
+def test_load_pools_adds_default_pool_with_global_limit() -> None:
+    pools = load_job_type_pools(_CFG)
+    assert set(pools) == {"pdf", "audio", DEFAULT_POOL}
+    assert pools[DEFAULT_POOL].max_concurrent == 4
+    assert set(load_job_type_pools({"max_concurrent": 2})) == {DEFAULT_POOL}
+
+
+def test_select_pool_weights_by_priority_and_respects_limits() -> None:
+    pools = load_job_type_pools(_CFG)
+    running: Counter[str] = Counter()
+    pending = {"pdf": 10, "audio": 10}
+    picks: List[str] = []
+    for _ in range(4):
+        pool = select_pool(pools, running, pending)
+        assert pool is not None
+        picks.append(pool)
+        running[pool] += 1
+    assert Counter(picks) == {"pdf": 3, "audio": 1}
+    # Beide Pools am Limit -> nichts mehr
+    assert select_pool(pools, running, pending) is None
+
+
+class _FakeRepo:
+    def __init__(self, pending: List[Job]) -> None:
+        self.pending = pending
+
+    def get_queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        stats: Dict[str, Dict[str, Any]] = {}
+        for job in self.pending:
+            stats.setdefault(job.job_type, {"pending": 0, "processing": 0, "oldest_pending_at": job.created_at})
+            stats[job.job_type]["pending"] += 1
+        return stats
+
+    def claim_next_job(
+        self,
+        worker_id: str,
+        lease_seconds: int,
+        job_types: Optional[List[str]] = None,
+        exclude_job_types: Optional[List[str]] = None,
+    ) -> Optional[Job]:
+        for job in self.pending:
+            if job_types is not None and job.job_type not in job_types:
+                continue
+            if exclude_job_types and job.job_type in exclude_job_types:
+                continue
+            self.pending.remove(job)
+            return job
+        return None
+
+    def add_log_entry(self, job_id: str, level: str, message: str) -> bool:
+        return True
+
+
+def test_burst_of_cheap_jobs_does_not_starve_other_types() -> None:
+    jobs = [Job(job_id=f"t-{i}", job_type="transformer_template") for i in range(50)]
+    jobs.append(Job(job_id="pdf-1", job_type="pdf"))
+    repo = _FakeRepo(jobs)
+    manager = SecretaryWorkerManager(
+        job_repo=repo,  # type: ignore[arg-type]
+        resource_calculator=None,  # type: ignore[arg-type]
+        max_concurrent_workers=3,
+        worker_id="node-a",
+        job_type_pools=load_job_type_pools(_CFG),
+    )
+    release = threading.Event()
+    manager._run_worker = lambda job: release.wait(5)  # type: ignore[method-assign]
+
+    manager._claim_jobs()
+
+    assert "pdf-1" in manager.running_workers
+    assert len(manager.running_workers) == 3
+    stats = manager.queue_stats()
+    assert stats["pools"][DEFAULT_POOL]["pending"] == 48
+    assert stats["pools"][DEFAULT_POOL]["running_local"] == 2
+
+    release.set()
+    for th in manager.running_workers.values():
+        th.join()
+
+
+def test_queue_stats_reports_wait_time_per_type() -> None:
+    now = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    type_stats = {
+        "pdf": {"pending": 2, "processing": 1, "oldest_pending_at": (now - timedelta(seconds=90)).replace(tzinfo=None)},
+        "office": {"pending": 1, "processing": 0, "oldest_pending_at": now - timedelta(seconds=30)},
+    }
+    stats = build_queue_stats(type_stats, load_job_type_pools(_CFG), now=now)
+    assert stats["job_types"]["pdf"] == {"pending": 2, "processing": 1, "oldest_wait_sec": 90.0}
+    assert stats["pools"][DEFAULT_POOL]["pending"] == 1
+    assert stats["pools"][DEFAULT_POOL]["oldest_wait_sec"] == 30.0
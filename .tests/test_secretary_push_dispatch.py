@@ -0,0 +1,78 @@
+"""
+Unit-Tests für den Push-Dispatch des Secretary-Workers
+(src/core/mongodb/job_notifier.py, src/core/mongodb/secretary_worker_manager.py).
+
+Fake-Repository ohne MongoDB; der Sicherheits-Poll ist so lang gewählt,
+dass nur die Benachrichtigung den Job starten kann.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from src.core.models.job_models import Job
+from src.core.mongodb.job_notifier import JobNotifier
+from src.core.mongodb.secretary_worker_manager import SecretaryWorkerManager
+
+
+class _FakeRepo:
+    def __init__(self) -> None:
+        self.pending: List[Job] = []
+        self.claim_calls = 0
+
+    def get_queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {"": {"pending": len(self.pending)}} if self.pending else {}
+
+    def claim_next_job(self, worker_id: str, lease_seconds: int, **_kwargs: Any) -> Optional[Job]:
+        self.claim_calls += 1
+        return self.pending.pop(0) if self.pending else None
+
+    def add_log_entry(self, job_id: str, level: str, message: str) -> bool:
+        return True
+
+    def requeue_expired_leases(self, max_attempts: int = 3) -> int:
+        return 0
+
+    def renew_lease(self, job_id: str, worker_id: str, lease_seconds: int) -> bool:
+        return True
+
+    def watch_job_inserts(self, on_insert: Any, should_stop: Any) -> bool:
+        return False
+
+
+def test_notifier_coalesces_signals() -> None:
+    notifier = JobNotifier()
+    notifier.notify()
+    notifier.notify()
+    assert notifier.wait(0) is True
+    notifier.clear()
+    assert notifier.wait(0.01) is False
+
+
+def test_push_mode_starts_job_without_waiting_for_poll() -> None:
+    repo = _FakeRepo()
+    notifier = JobNotifier()
+    started = threading.Event()
+    manager = SecretaryWorkerManager(
+        job_repo=repo,  # type: ignore[arg-type]
+        resource_calculator=None,  # type: ignore[arg-type]
+        worker_id="node-a",
+        dispatch_mode="push",
+        safety_poll_interval_sec=60,
+        notifier=notifier,
+    )
+    manager._process_job = lambda job: _mark(started)  # type: ignore[method-assign,assignment]
+    manager.start()
+    try:
+        time.sleep(0.1)  # Monitor wartet jetzt auf ein Signal
+        repo.pending.append(Job(job_id="job-1", job_type="pdf"))
+        t0 = time.monotonic()
+        notifier.notify()
+        assert started.wait(2)
+        assert time.monotonic() - t0 < 1
+    finally:
+        manager.stop()
+
+
+async def _mark(event: threading.Event) -> None:
+    event.set()
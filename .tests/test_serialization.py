@@ -0,0 +1,84 @@
+"""
+Unit-Tests für die JSON-Serialisierung (src/utils/serialization.py).
+"""
+
+import dataclasses
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict
+
+from bson import ObjectId
+from flask import Flask, jsonify
+from flask_restx import Api, Namespace, Resource  # type: ignore
+
+from src.core.models.job_models import Job, JobResults, JobStatus
+from src.utils.serialization import FastJSONProvider, dataclass_to_dict, dumps, dumps_str, json_size, output_json, to_jsonable
+
+_WHEN = datetime(2025, 3, 1, 12, 30, 5, 123456, tzinfo=timezone.utc)
+
+
+def test_matches_stdlib_isoformat_and_handles_project_types() -> None:
+    job = Job(job_id="job-1", job_type="pdf", status=JobStatus.COMPLETED, created_at=_WHEN, updated_at=_WHEN)
+    data = {"when": _WHEN, "naive": _WHEN.replace(tzinfo=None), "_id": ObjectId("65e1f0000000000000000000"),
+            "path": Path("cache/uploads/a.pdf"), "pages": {1: "Übersicht"}, "tags": {"x"}, "job": job}
+
+    plain = to_jsonable(data)
+    assert plain["when"] == _WHEN.isoformat()
+    assert plain["naive"] == _WHEN.replace(tzinfo=None).isoformat()
+    assert plain["_id"] == "65e1f0000000000000000000"
+    assert (plain["path"], plain["pages"], plain["tags"]) == ("cache/uploads/a.pdf", {"1": "Übersicht"}, ["x"])
+    assert plain["job"]["status"] == "completed" and plain["job"]["created_at"] == _WHEN.isoformat()
+    assert "Übersicht" in dumps_str(data)
+    assert json_size({"a": "ü"}) == len(json.dumps({"a": "ü"}, ensure_ascii=False, separators=(",", ":")).encode())
+
+
+def test_dataclass_to_dict_matches_asdict_without_deep_copy() -> None:
+    pages: Dict[str, Any] = {"data": {"extracted_text": "x" * 1000}}
+    results = JobResults(structured_data=pages, page_texts=["a", "b"])
+
+    converted = dataclass_to_dict(results)
+    assert converted == dataclasses.asdict(results)
+    assert converted["structured_data"]["data"]["extracted_text"] is pages["data"]["extracted_text"]
+    converted["page_texts"].append("c")
+    assert results.page_texts == ["a", "b"]
+
+
+def test_dataclass_to_dict_converts_dataclasses_in_containers() -> None:
+    @dataclasses.dataclass
+    class _Point:
+        x: int
+
+    @dataclasses.dataclass
+    class _Shape:
+        points: list[_Point]
+        named: Dict[str, _Point]
+        pair: tuple[_Point, _Point]
+
+    shape = _Shape(points=[_Point(1)], named={"a": _Point(2)}, pair=(_Point(3), _Point(4)))
+    assert dataclass_to_dict(shape) == dataclasses.asdict(shape)
+    assert dataclass_to_dict(shape)["named"] == {"a": {"x": 2}}
+
+
+def test_api_representation_and_json_provider_serialize_datetimes() -> None:
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    ns = Namespace("t")
+
+    @ns.route("/job")
+    class _Job(Resource):  # type: ignore[misc]
+        def get(self) -> Any:
+            return {"status": "success", "data": {"updated_at": _WHEN}}, 200
+
+    api = Api(app)
+    api.representation("application/json")(output_json)
+    api.add_namespace(ns, path="/t")
+
+    @app.route("/plain")
+    def _plain() -> Any:
+        return jsonify(when=_WHEN)
+
+    client = app.test_client()
+    assert client.get("/t/job").get_json() == {"status": "success", "data": {"updated_at": _WHEN.isoformat()}}
+    assert client.get("/plain").get_json() == {"when": _WHEN.isoformat()}
+    assert json.loads(dumps({"n": 1})) == {"n": 1}
@@ -0,0 +1,27 @@
+"""
+Unit-Tests für das atomare Claiming der Session-Jobs
+(src/core/mongodb/repository.py, src/core/mongodb/worker_manager.py).
+
+Keine MongoDB: `session_repo` läuft auf mongomock (.tests/conftest.py).
+"""
+
+from datetime import datetime, timedelta, UTC
+
+from src.core.models.job_models import JobStatus
+from src.core.mongodb.repository import SessionJobRepository
+
+
+def test_each_pending_job_is_claimed_by_one_worker_only(session_repo: SessionJobRepository) -> None:
+    repo = session_repo
+    base = datetime.now(UTC)
+    for i in range(2):
+        repo.jobs.insert_one({"job_id": f"job-{i}", "status": "pending", "created_at": base + timedelta(seconds=i)})
+
+    first = repo.claim_next_job("node-a")
+    second = repo.claim_next_job("node-b")
+    assert first is not None and second is not None
+    assert (first.job_id, second.job_id) == ("job-0", "job-1")
+    assert repo.claim_next_job("node-a") is None
+
+    doc = repo.jobs.find_one({"job_id": "job-1"})
+    assert doc is not None and doc["status"] == JobStatus.PROCESSING.value and doc["worker_id"] == "node-b"
@@ -0,0 +1,88 @@
+"""
+Unit-Tests für die Upload-Übernahme in einem Durchlauf (src/utils/upload_ingest.py).
+"""
+
+import hashlib
+import io
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from flask import Flask, request
+
+from src.utils import upload_ingest
+from src.utils.upload_ingest import IngestRequest, ingest_upload, sniff_mime_type, staged_upload
+
+_PDF = b"%PDF-1.7\n" + os.urandom(300_000)
+
+
+def _app(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, threshold_kb: int) -> Flask:
+    monkeypatch.setattr(upload_ingest, "_settings", lambda: {
+        "chunk_size_kb": 64,
+        "memory_threshold_kb": threshold_kb,
+        "staging_dir": str(tmp_path / "staging"),
+    })
+    app = Flask(__name__)
+    app.request_class = IngestRequest
+    results: List[Dict[str, Any]] = []
+    app.config["results"] = results
+
+    @app.route("/upload", methods=["POST"])
+    def _upload() -> str:
+        file = request.files["file"]
+        staged = staged_upload(file)
+        results.append({
+            "staged": staged,
+            "upload": ingest_upload(file, str(tmp_path / "dest" / "doc.pdf")),
+        })
+        return "ok"
+
+    @app.route("/ignore", methods=["POST"])
+    def _ignore() -> str:
+        request.files["file"]
+        return "ok"
+
+    return app
+
+
+def _post(app: Flask, path: str) -> None:
+    data = {"file": (io.BytesIO(_PDF), "doc.pdf", "application/pdf")}
+    assert app.test_client().post(path, data=data, content_type="multipart/form-data").status_code == 200
+
+
+def test_large_upload_is_staged_measured_and_renamed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    app = _app(tmp_path, monkeypatch, threshold_kb=0)
+    _post(app, "/upload")
+
+    result = app.config["results"][0]
+    upload = result["upload"]
+    assert result["staged"] is not None and result["staged"].md5 == upload.md5
+    assert (upload.size, upload.md5) == (len(_PDF), hashlib.md5(_PDF).hexdigest())
+    assert (upload.mime_type, upload.declared_mime_type, upload.filename) == ("application/pdf", "application/pdf", "doc.pdf")
+    assert Path(upload.path).read_bytes() == _PDF
+    assert os.listdir(tmp_path / "staging") == []
+
+
+def test_small_upload_is_written_in_one_pass(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    app = _app(tmp_path, monkeypatch, threshold_kb=10_000)
+    _post(app, "/upload")
+
+    result = app.config["results"][0]
+    assert result["staged"] is None
+    assert result["upload"].md5 == hashlib.md5(_PDF).hexdigest()
+    assert Path(result["upload"].path).read_bytes() == _PDF
+
+
+def test_unclaimed_staged_upload_is_removed_after_request(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    app = _app(tmp_path, monkeypatch, threshold_kb=0)
+    _post(app, "/ignore")
+    assert os.listdir(tmp_path / "staging") == []
+
+
+def test_sniff_mime_type_prefers_content_over_extension(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Signatur-Fallback, unabhängig davon, ob libmagic installiert ist
+    monkeypatch.setattr(upload_ingest, "magic", None)
+    assert sniff_mime_type(b"\x89PNG\r\n\x1a\n....", "bild.pdf") == "image/png"
+    assert sniff_mime_type(b"RIFF\x00\x00\x00\x00WAVEfmt ", "x.bin") == "audio/wav"
+    assert sniff_mime_type(b"", "notiz.txt") == "text/plain"
@@ -0,0 +1,124 @@
+"""
+Unit-Tests für die Frame-Extraktion (VideoProcessor.extract_frames) und den
+synchronen Pfad von POST /api/video/youtube.
+
+Kein ffmpeg, keine MongoDB: subprocess.run erzeugt Platzhalter-Dateien,
+der Prozessor wird ohne __init__ (ohne Cache-Collection) aufgebaut.
+"""
+
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+import src.api.routes.video_routes as video_routes
+import src.processors.video_processor as video_processor_module
+from src.api import create_app
+from src.core.models.base import ProcessInfo
+from src.core.models.video import VideoSource
+from src.processors.video_processor import VideoProcessor
+from src.utils.async_runtime import run_async
+from src.utils.logger import get_logger
+
+
+def _processor(tmp_path: Path) -> VideoProcessor:
+    processor = VideoProcessor.__new__(VideoProcessor)
+    processor.temp_dir = tmp_path  # type: ignore[assignment]
+    processor.process_id = "test-frames"
+    processor.keyframe_scene_threshold = 0.3
+    processor.keyframe_hash_distance = 6
+    processor.is_cache_enabled_flag = False
+    processor.cache_collection_name = None
+    processor.logger = get_logger(process_id="test-frames")
+    processor.process_info = ProcessInfo(
+        id="test-frames", main_processor="VideoProcessor",
+        started=datetime.now().isoformat(), sub_processors=[],
+    )
+    return processor
+
+
+def test_extract_frames_interval_mode(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    commands: List[List[str]] = []
+
+    def fake_run(cmd: List[str], **kwargs: Any) -> subprocess.CompletedProcess:  # type: ignore[type-arg]
+        commands.append(cmd)
+        pattern = Path(cmd[-1])
+        for i in range(3):
+            (pattern.parent / (pattern.name % (i + 1))).write_bytes(b"frame")
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(video_processor_module.subprocess, "run", fake_run)
+    response = run_async(_processor(tmp_path).extract_frames(
+        VideoSource(file_name="clip.mp4"), interval_seconds=2, binary_data=b"video"
+    ))
+    data = response.to_dict()
+    assert data["status"] == "success", data["error"]
+    assert data["request"]["parameters"]["mode"] == "interval"
+    assert [f["timestamp_s"] for f in data["data"]["frames"]] == [0.0, 2.0, 4.0]
+    assert "fps=1/2" in commands[0]
+
+
+def test_frames_cache_key_depends_on_mode_and_thresholds(tmp_path: Path) -> None:
+    processor = _processor(tmp_path)
+    source = VideoSource(url="https://example.com/v.mp4")
+
+    def key(**kwargs: Any) -> str:
+        return processor._create_cache_key_frames(source, 5, 640, None, "jpg", **kwargs)
+
+    keys = {
+        key(),
+        key(mode="keyframes", scene_threshold=0.3, hash_distance=6),
+        key(mode="keyframes", scene_threshold=0.5, hash_distance=6),
+        key(mode="keyframes", scene_threshold=0.3, hash_distance=10),
+    }
+    assert len(keys) == 4
+
+
+def test_youtube_sync_route_calls_process_youtube(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: List[Dict[str, Any]] = []
+
+    class _Result:
+        def to_dict(self) -> Dict[str, Any]:
+            return {"status": "success", "data": {"title": "Test"}}
+
+    async def fake_process_youtube(**kwargs: Any) -> _Result:
+        calls.append(kwargs)
+        return _Result()
+
+    monkeypatch.setattr(video_routes, "process_youtube", fake_process_youtube)
+    app = create_app()
+    app.testing = True
+    response = app.test_client().post(
+        "/api/video/youtube",
+        json={"url": "https://www.youtube.com/watch?v=jNQXAC9IVRw", "useCache": False},
+    )
+    assert response.status_code == 200, response.get_json()
+    assert response.get_json()["status"] == "success"
+    assert calls[0]["url"] == "https://www.youtube.com/watch?v=jNQXAC9IVRw"
+    assert calls[0]["use_cache"] is False
+    assert "mode" not in calls[0]
+
+
+def test_frames_route_rejects_unknown_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: List[Dict[str, Any]] = []
+
+    async def fake_process_video_frames(**kwargs: Any) -> Any:
+        calls.append(kwargs)
+
+    monkeypatch.setattr(video_routes, "process_video_frames", fake_process_video_frames)
+    app = create_app()
+    app.testing = True
+    response = app.test_client().post(
+        "/api/video/frames",
+        json={"url": "https://example.org/video.mp4", "mode": "keyframe"},
+    )
+    assert response.status_code == 400
+    assert response.get_json()["error"]["details"]["error_type"] == "INVALID_MODE"
+    assert calls == []
+
+
+def test_extract_frames_rejects_unknown_mode(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        run_async(_processor(tmp_path).extract_frames("https://example.com/v.mp4", mode="scenes"))
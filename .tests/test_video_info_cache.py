@@ -0,0 +1,71 @@
+"""
+Unit-Tests für den yt-dlp-Metadaten-Cache
+(src/core/mongodb/video_info_repository.py, src/processors/ytdlp_info_extractor.py).
+
+Kein Netzwerk, keine MongoDB: YoutubeDL wird durch ein Fake ersetzt,
+der Cache-Zugriff per monkeypatch umgeleitet.
+"""
+
+from typing import Any, Dict, List
+
+from src.core.mongodb.video_info_repository import normalize_video_key, slim_video_info
+from src.processors import ytdlp_info_extractor
+
+
+class _FakeYDL:
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+
+    def extract_info(self, url: str, download: bool = False) -> Dict[str, Any]:
+        self.calls.append(url)
+        return {"id": "abc", "title": "T", "duration": 12, "formats": [{"url": "signed"}]}
+
+    def sanitize_info(self, info: Dict[str, Any]) -> Dict[str, Any]:
+        return info
+
+
+def test_normalize_video_key_collapses_url_variants() -> None:
+    ids = {
+        normalize_video_key("https://www.youtube.com/watch?v=jNQXAC9IVRw&t=10"),
+        normalize_video_key("https://youtu.be/jNQXAC9IVRw?si=xyz"),
+        normalize_video_key("https://www.youtube.com/embed/jNQXAC9IVRw"),
+    }
+    assert ids == {"youtube:jNQXAC9IVRw"}
+    assert normalize_video_key("https://player.vimeo.com/video/123") == "vimeo:123"
+    assert normalize_video_key("HTTPS://Example.org/v.mp4?utm_source=x&b=2&a=1#t") == (
+        "url:https://example.org/v.mp4?a=1&b=2"
+    )
+
+
+def test_slim_video_info_drops_stream_urls() -> None:
+    slim = slim_video_info({"id": "a", "formats": [], "url": "x", "title": "t"})
+    assert slim == {"id": "a", "title": "t"}
+
+
+def test_extract_video_info_uses_cache_before_extractor(monkeypatch: Any) -> None:
+    fake = _FakeYDL()
+    stored: Dict[str, Dict[str, Any]] = {}
+
+    def _lookup(url: str) -> Any:
+        return stored.get(url)
+
+    def _store(url: str, info: Dict[str, Any]) -> Dict[str, Any]:
+        stored[url] = slim_video_info(info)
+        return stored[url]
+
+    monkeypatch.setattr(ytdlp_info_extractor, "lookup_video_info", _lookup)
+    monkeypatch.setattr(ytdlp_info_extractor, "store_video_info", _store)
+
+    first = ytdlp_info_extractor.extract_video_info("u", {}, ydl_factory=lambda _o: fake)
+    second = ytdlp_info_extractor.extract_video_info("u", {}, ydl_factory=lambda _o: fake)
+
+    assert first == second == {"id": "abc", "title": "T", "duration": 12}
+    assert fake.calls == ["u"]
+
+
+def test_reusable_ydl_is_shared_per_thread_and_opts() -> None:
+    a = ytdlp_info_extractor.get_reusable_ydl({"quiet": True})
+    b = ytdlp_info_extractor.get_reusable_ydl({"quiet": True})
+    c = ytdlp_info_extractor.get_reusable_ydl({"quiet": True, "retries": 3})
+    assert a is b
+    assert a is not c
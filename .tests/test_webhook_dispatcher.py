@@ -0,0 +1,69 @@
+"""
+Unit-Tests für die Hintergrund-Zustellung von Webhooks (src/utils/webhook_dispatcher.py).
+
+Der Transport ist eine aufzeichnende Funktion mit der Signatur von requests.post.
+"""
+
+import threading
+from typing import Any, Dict, List
+
+from src.utils.webhook_dispatcher import WebhookDispatcher
+
+
+class _Resp:
+    def __init__(self, status_code: int = 200) -> None:
+        self.status_code = status_code
+        self.ok = status_code < 400
+
+
+class _Transport:
+    def __init__(self, statuses: List[int] | None = None) -> None:
+        self.sent: List[Dict[str, Any]] = []
+        self.statuses = list(statuses or [])
+        self.lock = threading.Lock()
+
+    def __call__(self, *, url: str, json: Dict[str, Any], headers: Dict[str, str], timeout: float) -> _Resp:  # noqa: A002
+        with self.lock:
+            self.sent.append({"url": url, "json": json})
+            return _Resp(self.statuses.pop(0) if self.statuses else 200)
+
+
+def test_progress_is_coalesced_and_final_is_delivered_last() -> None:
+    transport = _Transport()
+    dispatcher = WebhookDispatcher(workers=2, coalesce_window_sec=0.2, transport=transport)
+    for i in range(20):
+        dispatcher.post_progress("job-1", "http://cb", {"phase": "progress", "n": i}, {})
+
+    resp = dispatcher.send_final("job-1", "http://cb", {"phase": "completed"}, {})
+
+    assert resp.status_code == 200
+    # Nicht gesendeter Fortschritt entfällt, der Abschluss kommt zuletzt
+    assert [m["json"]["phase"] for m in transport.sent] == ["completed"]
+    # Fortschritt nach dem Abschluss wird verworfen
+    assert dispatcher.post_progress("job-1", "http://cb", {"phase": "progress"}, {}) is False
+    dispatcher.shutdown()
+
+
+def test_latest_progress_per_url_is_sent_after_window() -> None:
+    transport = _Transport()
+    dispatcher = WebhookDispatcher(workers=1, coalesce_window_sec=0.05, transport=transport)
+    for i in range(5):
+        dispatcher.post_progress("job-1", "http://cb", {"n": i}, {})
+    dispatcher.post_progress("job-1", "http://cb/ext-1", {"log": True}, {})
+    dispatcher.shutdown()
+
+    assert sorted((m["url"], m["json"].get("n")) for m in transport.sent) == [
+        ("http://cb", 4),
+        ("http://cb/ext-1", None),
+    ]
+
+
+def test_final_is_retried_on_server_errors() -> None:
+    transport = _Transport(statuses=[503, 500, 200])
+    dispatcher = WebhookDispatcher(workers=1, backoff_base_sec=0.01, max_retries=3, transport=transport)
+
+    resp = dispatcher.send_final("job-2", "http://cb", {"phase": "error"}, {})
+
+    assert resp.status_code == 200
+    assert len(transport.sent) == 3
+    dispatcher.shutdown()
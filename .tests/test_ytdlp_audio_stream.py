@@ -0,0 +1,80 @@
+"""
+Unit-Tests für die Audio-only-Planung (src/processors/ytdlp_audio_stream.py).
+
+Die yt-dlp-Infos sind statische Dicts; es wird weder yt-dlp noch ffmpeg aufgerufen.
+"""
+
+from pathlib import Path
+
+from src.processors.ytdlp_audio_stream import build_ffmpeg_stream_cmd, plan_audio_download
+
+
+def test_prefers_best_audio_only_format() -> None:
+    info = {
+        "formats": [
+            {"format_id": "18", "vcodec": "avc1", "acodec": "mp4a", "url": "u18", "tbr": 500},
+            {"format_id": "139", "vcodec": "none", "acodec": "mp4a", "abr": 48, "url": "u139"},
+            {"format_id": "140", "vcodec": "none", "acodec": "mp4a", "abr": 128, "url": "u140"},
+        ]
+    }
+    plan = plan_audio_download(info)
+    assert plan is not None
+    assert (plan.mode, plan.format_id) == ("audio_only", "140")
+
+
+def test_streams_smallest_muxed_format_through_ffmpeg() -> None:
+    info = {
+        "http_headers": {"User-Agent": "UA"},
+        "formats": [
+            {"format_id": "hd", "vcodec": "avc1", "acodec": "mp4a", "url": "https://cdn/hd.mp4", "tbr": 4000},
+            {"format_id": "sd", "vcodec": "avc1", "acodec": "mp4a", "url": "https://cdn/sd.mp4", "tbr": 900},
+            {"format_id": "dash", "vcodec": "avc1", "acodec": "mp4a", "url": "x", "protocol": "http_dash_segments", "tbr": 100},
+        ],
+    }
+    plan = plan_audio_download(info)
+    assert plan is not None
+    assert plan.mode == "ffmpeg_stream"
+    assert plan.stream_url == "https://cdn/sd.mp4"
+    assert plan.http_headers == {"User-Agent": "UA"}
+
+
+def test_video_only_source_has_no_plan() -> None:
+    info = {"formats": [{"format_id": "v", "vcodec": "avc1", "acodec": "none", "url": "u"}]}
+    assert plan_audio_download(info) is None
+
+
+def test_ffmpeg_stream_cmd_reads_url_and_drops_video() -> None:
+    cmd = build_ffmpeg_stream_cmd("https://cdn/a.mp4", Path("out.mp3"), {"Referer": "r"})
+    assert cmd[cmd.index("-i") + 1] == "https://cdn/a.mp4"
+    assert cmd[cmd.index("-headers") + 1] == "Referer: r\r\n"
+    assert "-vn" in cmd and cmd[-1] == "out.mp3"
+
+
+def test_ranks_by_bitrate_not_mixed_with_filesize() -> None:
+    # Format ohne Bitrate, aber mit Dateigröße darf nicht gegen kbit/s-Werte antreten
+    info = {
+        "formats": [
+            {"format_id": "sized", "vcodec": "avc1", "acodec": "mp4a", "url": "https://cdn/a.mp4", "filesize": 300},
+            {"format_id": "low", "vcodec": "avc1", "acodec": "mp4a", "url": "https://cdn/b.mp4", "tbr": 900},
+        ]
+    }
+    plan = plan_audio_download(info)
+    assert plan is not None and plan.format_id == "low"
+
+    no_bitrate = {
+        "formats": [
+            {"format_id": "big", "vcodec": "avc1", "acodec": "mp4a", "url": "https://cdn/big.mp4", "filesize": 9000},
+            {"format_id": "small", "vcodec": "avc1", "acodec": "mp4a", "url": "https://cdn/small.mp4", "filesize": 3000},
+        ]
+    }
+    plan = plan_audio_download(no_bitrate)
+    assert plan is not None and plan.format_id == "small"
+
+
+def test_reconnect_flags_only_for_progressive_http() -> None:
+    info = {"formats": [{"format_id": "hls", "vcodec": "avc1", "acodec": "mp4a", "url": "https://cdn/p.m3u8",
+                         "protocol": "m3u8_native", "tbr": 800}]}
+    plan = plan_audio_download(info)
+    assert plan is not None and plan.progressive is False
+    assert "-reconnect" not in build_ffmpeg_stream_cmd("https://cdn/p.m3u8", Path("o.mp3"), progressive=plan.progressive)
+    assert "-reconnect" in build_ffmpeg_stream_cmd("https://cdn/a.mp4", Path("o.mp3"))
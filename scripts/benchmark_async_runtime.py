@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Durchsatzvergleich: asyncio.run() pro Request vs. run_async() (src/utils/async_runtime.py).
+
+Simuliert synchrone Flask-Routen, die eine async Funktion ausführen, unter
+paralleler Last. Ein Thread-Pool fester Größe spielt den Server (wie gunicorn
+`gthread`: Threads werden wiederverwendet). Jeder "Request" macht einen
+HTTP-Aufruf gegen einen lokalen Keep-Alive-Server:
+
+- asyncio.run: neuer Event-Loop pro Request, daher auch eine neue
+  TCP-Verbindung pro Request (an den Loop gebundene Clients überleben nicht).
+- run_async: langlebiger Loop pro Thread, die Verbindung wird über
+  loop_resource() wiederverwendet.
+
+Zusätzlich wird der reine Loop-Overhead ohne I/O gemessen. Gegen echte
+Provider mit TLS fällt der Unterschied größer aus, weil dort jeder neue
+Verbindungsaufbau einen Handshake kostet.
+
+Aufruf:
+    python scripts/benchmark_async_runtime.py [--requests 4000] [--concurrency 1 8 32]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, List, Optional, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.utils.async_runtime import loop_resource, run_async  # noqa: E402
+
+_RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: keep-alive\r\n\r\nok"
+_REQUEST = b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n"
+
+
+def _start_server() -> Tuple[int, Callable[[], None]]:
+    """Startet einen minimalen HTTP/1.1-Keep-Alive-Server in einem eigenen Thread."""
+    ready = threading.Event()
+    state: dict[str, Any] = {}
+
+    async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                writer.write(_RESPONSE)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def _main() -> None:
+        server = await asyncio.start_server(_handle, "127.0.0.1", 0, backlog=1024)
+        state["port"] = server.sockets[0].getsockname()[1]
+        state["loop"] = asyncio.get_running_loop()
+        state["stop"] = asyncio.Event()
+        ready.set()
+        async with server:
+            await state["stop"].wait()
+
+    thread = threading.Thread(target=lambda: asyncio.run(_main()), daemon=True)
+    thread.start()
+    ready.wait()
+
+    def _stop() -> None:
+        state["loop"].call_soon_threadsafe(state["stop"].set)
+        thread.join(timeout=5)
+
+    return int(state["port"]), _stop
+
+
+class _Connection:
+    """Eine Keep-Alive-Verbindung, lazy geöffnet (an einen Event-Loop gebunden)."""
+
+    def __init__(self, port: int) -> None:
+        self.port = port
+        self.streams: Optional[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = None
+
+    async def get(self) -> bytes:
+        if self.streams is None:
+            self.streams = await asyncio.open_connection("127.0.0.1", self.port)
+        reader, writer = self.streams
+        writer.write(_REQUEST)
+        await writer.drain()
+        await reader.readuntil(b"\r\n\r\n")
+        return await reader.readexactly(2)
+
+    async def close(self) -> None:
+        if self.streams is not None:
+            self.streams[1].close()
+            await self.streams[1].wait_closed()
+
+
+async def _call_new_connection(port: int) -> bytes:
+    conn = _Connection(port)
+    try:
+        return await conn.get()
+    finally:
+        await conn.close()
+
+
+async def _call_pooled_connection(port: int) -> bytes:
+    return await loop_resource(f"conn:{port}", lambda: _Connection(port)).get()
+
+
+async def _no_io() -> int:
+    await asyncio.sleep(0)
+    return 1
+
+
+def _measure(runner: Callable[[Coroutine[Any, Any, Any]], Any], make: Callable[[], Coroutine[Any, Any, Any]],
+             requests: int, concurrency: int) -> float:
+    """Führt `requests` Aufrufe mit `concurrency` Server-Threads aus; liefert Requests/s."""
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        # Aufwärmen: Threads (und bei run_async deren Loops) anlegen
+        list(pool.map(lambda _: runner(make()), range(concurrency)))
+        start = time.perf_counter()
+        list(pool.map(lambda _: runner(make()), range(requests)))
+        return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    args = parser.parse_args()
+
+    port, stop = _start_server()
+    rows: List[Tuple[str, int, float, float]] = []
+    try:
+        for concurrency in args.concurrency:
+            rows.append((
+                "HTTP-Aufruf",
+                concurrency,
+                _measure(asyncio.run, lambda: _call_new_connection(port), args.requests, concurrency),
+                _measure(run_async, lambda: _call_pooled_connection(port), args.requests, concurrency),
+            ))
+            rows.append((
+                "ohne I/O",
+                concurrency,
+                _measure(asyncio.run, _no_io, args.requests, concurrency),
+                _measure(run_async, _no_io, args.requests, concurrency),
+            ))
+    finally:
+        stop()
+
+    print(f"{'Workload':<12} {'Threads':>7} {'asyncio.run req/s':>18} {'run_async req/s':>16} {'Faktor':>7}")
+    for workload, concurrency, baseline, persistent in rows:
+        print(f"{workload:<12} {concurrency:>7} {baseline:>18.0f} {persistent:>16.0f} {persistent / baseline:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
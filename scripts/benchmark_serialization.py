@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Vergleich: Standardbibliothek `json` vs. src/utils/serialization.py (orjson).
+
+Nutzlast ist das Ergebnis eines PDF-Jobs mit vielen Seiten (Standard: 200):
+extrahierter Text, Seitentexte in `metadata.text_contents`, `page_texts`
+sowie ein Job-Dokument mit datetime-Feldern. Gemessen werden die Pfade, die
+die API bisher genommen hat, gegen die neuen:
+
+- API-Antwort: `json.loads(json.dumps(..., cls=DateTimeEncoder))` in der Route
+  plus `json.dumps` in Flask-RESTX vs. ein `dumps()` in `output_json`
+- SSE-Event: `json.dumps(..., ensure_ascii=False)` vs. `dumps_str()`
+- Job.to_dict: `dataclasses.asdict` (tiefe Kopie) vs. `dataclass_to_dict`
+- Feldgröße: `len(json.dumps(...))` vs. `json_size()`
+
+Aufruf:
+    python scripts/benchmark_serialization.py [--pages 200] [--repeat 20]
+"""
+
+import argparse
+import dataclasses
+import json
+import os
+import random
+import string
+import sys
+import time
+from datetime import datetime, UTC
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.core.models.job_models import Job, JobParameters, JobProgress, JobResults, JobStatus  # noqa: E402
+from src.utils import serialization  # noqa: E402
+from src.utils.serialization import dataclass_to_dict, dumps, dumps_str, json_size  # noqa: E402
+
+
+class _DateTimeEncoder(json.JSONEncoder):
+    """Bisheriger Encoder aus secretary_job_routes/sse."""
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def _page_text(rng: random.Random, words: int = 450) -> str:
+    vocab = ["Gemeinde", "Übersicht", "Straße", "Planung", "Bürger", "Beschluss", "Haushalt", "für", "über"]
+    vocab += ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10))) for _ in range(200)]
+    return " ".join(rng.choice(vocab) for _ in range(words))
+
+
+def build_pdf_job(pages: int) -> Job:
+    """Job mit einem PDF-Ergebnis in der Form von pdf_handler."""
+    rng = random.Random(42)
+    texts = [_page_text(rng) for _ in range(pages)]
+    structured: Dict[str, Any] = {
+        "status": "success",
+        "data": {
+            "extracted_text": "\n\n".join(f"--- Seite {i + 1} ---\n{t}" for i, t in enumerate(texts)),
+            "metadata": {
+                "page_count": pages,
+                "file_name": "haushalt_2025.pdf",
+                "text_contents": [{"page": i + 1, "content": t} for i, t in enumerate(texts)],
+                "image_paths": [f"cache/pdf/abc/page_{i + 1:03d}.png" for i in range(pages)],
+            },
+        },
+        "process": {"id": "p-1", "started": datetime.now(UTC).isoformat(), "duration_ms": 81234},
+    }
+    return Job(
+        job_type="pdf",
+        status=JobStatus.COMPLETED,
+        parameters=JobParameters(filename="cache/uploads/haushalt_2025.pdf", extraction_method="native"),
+        results=JobResults(structured_data=structured, page_texts=texts, markdown_content="\n\n".join(texts)),
+        progress=JobProgress(step="completed", percent=100, message="Verarbeitung abgeschlossen"),
+        completed_at=datetime.now(UTC),
+        log_entries=[{"timestamp": datetime.now(UTC), "level": "info", "message": f"Seite {i + 1}"} for i in range(50)],
+    )
+
+
+def _best(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    job = build_pdf_job(args.pages)
+    job_dict = job.to_dict()
+    response = {"status": "success", "data": {"job": job_dict}}
+    sse_data = {"phase": "completed", "job": {"id": job.job_id}, "data": job.results.to_dict() if job.results else {}}
+    payload_mb = len(dumps(response)) / 1024 / 1024
+    backend = "orjson" if serialization.orjson is not None else "json (Fallback)"
+    print(f"PDF-Ergebnis mit {args.pages} Seiten, Antwort {payload_mb:.1f} MB, Backend: {backend}\n")
+
+    def _old_api() -> None:
+        data = json.loads(json.dumps(response, cls=_DateTimeEncoder))
+        json.dumps(data)
+
+    cases = [
+        ("API-Antwort", _old_api, lambda: dumps(response)),
+        ("SSE-Event", lambda: json.dumps(sse_data, cls=_DateTimeEncoder, ensure_ascii=False), lambda: dumps_str(sse_data)),
+        ("Job.to_dict (Ergebnis)", lambda: dataclasses.asdict(job.results), lambda: dataclass_to_dict(job.results)),
+        ("Feldgröße data", lambda: len(json.dumps(job_dict["results"])), lambda: json_size(job_dict["results"])),
+    ]
+    print(f"{'Pfad':<24}{'json [ms]':>12}{'neu [ms]':>12}{'Faktor':>10}")
+    for name, old, new in cases:
+        t_old = _best(old, args.repeat)
+        t_new = _best(new, args.repeat)
+        print(f"{name:<24}{t_old * 1000:>12.2f}{t_new * 1000:>12.2f}{t_old / t_new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -90,6 +90,12 @@ def create_app(template_dir: Optional[str] = None, static_dir: Optional[str] = N
     app.config['MAX_CONTENT_LENGTH'] = _max_upload_bytes
     app.config['MAX_FORM_MEMORY_SIZE'] = _max_upload_bytes
     app.config['PREFERRED_URL_SCHEME'] = 'http'
+    # Uploads beim Parsen direkt ins Staging schreiben (Hash/Größe im selben Durchlauf)
+    from src.utils.upload_ingest import IngestRequest
+    app.request_class = IngestRequest
+    # JSON über orjson (jsonify, request.get_json)
+    from src.utils.serialization import FastJSONProvider
+    app.json = FastJSONProvider(app)
     
     # Registriere die API-Routen bei der App
     app.register_blueprint(api_blueprint, url_prefix='/api')
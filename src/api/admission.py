@@ -0,0 +1,101 @@
+"""
+@fileoverview API Admission - Flask middleware for admission control
+
+@description
+Bindet den AdmissionController (src/core/admission_control.py) an den
+API-Blueprint: Vor jedem POST auf einen konfigurierten Endpunkt wird ein Slot
+vergeben, nach dem Request wieder freigegeben. Abweisungen sind schnelle
+JSON-Antworten mit 429/503 und `Retry-After`, bevor ein Upload gelesen wird.
+
+Routen mit Job-Fallback fragen über `sync_call_deferred()`, ob der Request
+wegen Sättigung als Job eingereiht werden soll (`auto_queue`).
+
+@module api.admission
+
+@exports
+- register_admission_control(): None - Registriert before/teardown-Hooks am Blueprint
+- sync_call_deferred(): bool - True, wenn der aktuelle Request als Job eingereiht werden soll
+
+@usedIn
+- src.api.routes: Registrierung nach der Auth-Middleware
+- src.api.routes.audio_routes, pdf_routes, office_routes: Auto-Queue bei Sättigung
+
+@dependencies
+- External: flask - Blueprint, g, request
+- Internal: src.core.admission_control - AdmissionController
+"""
+
+import logging
+from typing import Any, Optional
+
+from flask import Blueprint, g, has_request_context, request
+from flask.typing import ResponseReturnValue
+
+from src.core.admission_control import AdmissionController, AdmissionRejected, load_admission_controller
+
+
+logger = logging.getLogger(__name__)
+
+_API_PREFIX = "/api"
+
+
+def sync_call_deferred() -> bool:
+    """True, wenn der Server gesättigt ist und die Route einen Job anlegen soll."""
+    if not has_request_context():
+        return False
+    admission = getattr(g, "admission", None)
+    return bool(admission is not None and admission.deferred)
+
+
+def register_admission_control(
+    blueprint: Blueprint,
+    controller: Optional[AdmissionController] = None,
+) -> Optional[AdmissionController]:
+    """
+    Registriert die Admission Control am Blueprint.
+
+    Args:
+        blueprint: API-Blueprint (nach der Auth-Middleware aufrufen)
+        controller: Optionaler Controller; sonst aus der Konfiguration
+
+    Returns:
+        Optional[AdmissionController]: Der aktive Controller oder None (deaktiviert)
+    """
+    active = controller or load_admission_controller()
+    if active is None:
+        return None
+
+    @blueprint.before_request
+    def _admit() -> ResponseReturnValue | None:
+        if request.method != "POST":
+            return None
+        path = request.path[len(_API_PREFIX):] if request.path.startswith(_API_PREFIX) else request.path
+        limit = active.limit_for(path)
+        if limit is None:
+            return None
+        try:
+            g.admission = active.acquire(limit)
+        except AdmissionRejected as rejected:
+            logger.warning(f"Admission abgewiesen ({rejected.status_code}) für {path}: {rejected}")
+            body = {
+                "status": "error",
+                "error": {
+                    "code": rejected.code,
+                    "message": str(rejected),
+                    "details": {"retry_after_sec": rejected.retry_after},
+                },
+            }
+            return body, rejected.status_code, {"Retry-After": str(rejected.retry_after)}
+        except Exception as e:
+            # Admission Control darf die API nicht lahmlegen (z.B. MongoDB nicht erreichbar)
+            logger.error(f"Admission Control fehlgeschlagen für {path}: {e}")
+        return None
+
+    @blueprint.teardown_request
+    def _release(_exc: Optional[BaseException]) -> None:
+        admission: Any = g.pop("admission", None)
+        if admission is not None:
+            active.release(admission)
+
+    logger.info(f"Admission Control aktiv für {[lim.path for lim in active.limits]}")
+    return active
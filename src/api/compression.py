@@ -0,0 +1,141 @@
+"""
+@fileoverview API Compression - Content-negotiated gzip/brotli for JSON responses
+
+@description
+Komprimiert JSON-Antworten des API-Blueprints ab `compression.min_size_bytes`
+mit dem Verfahren, das der Client per `Accept-Encoding` akzeptiert (Reihenfolge
+aus `compression.algorithms`, Standard: br vor gzip). Große Job-Ergebnisse,
+Session-Markdown und PDF-`text_contents` bestehen überwiegend aus Text und
+lassen sich gut komprimieren.
+
+Nicht komprimiert werden: gestreamte Antworten (SSE, Dateidownloads),
+Antworten mit vorhandenem `Content-Encoding` oder `Cache-Control: no-transform`,
+Statuscodes ohne Body und andere MIME-Typen (ZIP, Bilder).
+
+Ein starker ETag wird für die komprimierte Darstellung um das Verfahren ergänzt
+(`"<tag>-br"`), siehe src/api/conditional.py.
+
+brotli ist optional; ohne das Paket wird nur gzip angeboten.
+
+@module api.compression
+
+@exports
+- register_compression(): bool - Registriert den after_request-Hook am Blueprint
+- choose_encoding(): Optional[str] - Verfahren für einen Accept-Encoding-Header
+- compress(): bytes - Komprimiert Bytes mit einem Verfahren
+
+@usedIn
+- src.api.routes: Registrierung am API-Blueprint
+
+@dependencies
+- External: flask - Blueprint, request
+- Optional: brotli - Brotli-Kompression
+- Internal: src.api.conditional - ETag komprimierter Darstellungen
+- Internal: src.core.config - Schwellwert, Verfahren, Stufen
+"""
+
+import gzip
+import logging
+from typing import Any, Dict, List, Optional
+
+from flask import Blueprint, request
+from werkzeug.datastructures import Accept
+
+from src.api.conditional import etag_for_encoding
+from src.core.config import Config
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - brotli nicht installiert
+    brotli = None
+
+
+logger = logging.getLogger(__name__)
+
+_SUPPORTED = ("br", "gzip")
+
+
+def _available(encoding: str) -> bool:
+    return encoding == "gzip" or (encoding == "br" and brotli is not None)
+
+
+def choose_encoding(accept: Accept, algorithms: List[str]) -> Optional[str]:
+    """
+    Wählt das Verfahren mit der höchsten Client-Qualität; bei Gleichstand
+    entscheidet die Reihenfolge in `algorithms`.
+
+    Returns:
+        Optional[str]: "br", "gzip" oder None (unkomprimiert)
+    """
+    best: Optional[str] = None
+    best_quality = 0.0
+    for encoding in algorithms:
+        if not _available(encoding):
+            continue
+        quality = accept.quality(encoding)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(data: bytes, encoding: str, gzip_level: int = 6, brotli_quality: int = 4) -> bytes:
+    """Komprimiert `data` mit gzip oder br."""
+    if encoding == "br":
+        compressed: bytes = brotli.compress(data, quality=brotli_quality)
+        return compressed
+    # mtime=0: gleicher Inhalt ergibt gleiche Bytes
+    return gzip.compress(data, compresslevel=gzip_level, mtime=0)
+
+
+def register_compression(blueprint: Blueprint, settings: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Registriert die Antwortkompression am Blueprint.
+
+    Args:
+        blueprint: API-Blueprint
+        settings: Optionale Einstellungen; sonst `compression` aus der Konfiguration
+
+    Returns:
+        bool: True, wenn die Kompression aktiv ist
+    """
+    cfg: Dict[str, Any] = settings if settings is not None else (Config().get("compression", {}) or {})
+    if not cfg.get("enabled", True):
+        return False
+    min_size = int(cfg.get("min_size_bytes", 2048))
+    algorithms = [str(a).lower() for a in (cfg.get("algorithms") or list(_SUPPORTED)) if str(a).lower() in _SUPPORTED]
+    mimetypes = {str(m).lower() for m in (cfg.get("mimetypes") or ["application/json"])}
+    gzip_level = int(cfg.get("gzip_level", 6))
+    brotli_quality = int(cfg.get("brotli_quality", 4))
+    if not any(_available(a) for a in algorithms):
+        logger.warning("Antwortkompression deaktiviert: kein verfügbares Verfahren in compression.algorithms")
+        return False
+
+    @blueprint.after_request
+    def _compress(response: Any) -> Any:
+        if (
+            response.direct_passthrough
+            or response.is_streamed
+            or response.status_code < 200
+            or response.status_code in (204, 206, 304)
+            or (response.mimetype or "").lower() not in mimetypes
+            or "Content-Encoding" in response.headers
+            or "no-transform" in (response.headers.get("Cache-Control") or "")
+        ):
+            return response
+        data: bytes = response.get_data()
+        if len(data) < min_size:
+            return response
+        # Die Darstellung hängt ab jetzt vom Accept-Encoding des Clients ab
+        response.vary.add("Accept-Encoding")
+        encoding = choose_encoding(request.accept_encodings, algorithms)
+        if encoding is None:
+            return response
+        response.set_data(compress(data, encoding, gzip_level, brotli_quality))
+        response.headers["Content-Encoding"] = encoding
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag_for_encoding(etag, encoding))
+        return response
+
+    logger.info(f"Antwortkompression aktiv: {algorithms} ab {min_size} Bytes")
+    return True
@@ -0,0 +1,111 @@
+"""
+@fileoverview API Conditional - Strong ETags and If-None-Match handling
+
+@description
+Bedingte GET-Requests für große, selten geänderte Antworten (Job-Ergebnisse,
+ZIP-Archive). Der ETag wird aus Werten gebildet, die sich bei jeder Änderung
+der Antwort ändern (z.B. Job-ID, Status und `updated_at`), nicht aus dem
+Antwortinhalt: eine Route kann so vor dem Laden und Serialisieren der Daten
+mit 304 antworten.
+
+Komprimierte Antworten (src/api/compression.py) erhalten einen eigenen starken
+ETag mit Suffix (`"<tag>-gzip"`, `"<tag>-br"`). `if_none_match()` vergleicht
+deshalb ohne dieses Suffix.
+
+@module api.conditional
+
+@exports
+- make_etag(): str - Starker ETag (ohne Anführungszeichen) aus beliebigen Teilen
+- etag_for_encoding(): str - ETag einer komprimierten Darstellung
+- if_none_match(): bool - True, wenn der Client die Darstellung zu `etag` bereits hat
+- cache_headers(): Dict[str, str] - ETag- und Cache-Control-Header für 200-Antworten
+- not_modified(): Response - 304-Antwort
+
+@usedIn
+- src.api.routes.secretary_job_routes: Job-Abfrage und Archiv-Download
+- src.api.compression: ETag komprimierter Antworten
+
+@dependencies
+- External: flask - request, Response
+- External: werkzeug - quote_etag
+"""
+
+import hashlib
+from datetime import date, datetime
+from typing import Any, Dict, Optional
+
+from flask import Response, request
+from werkzeug.http import quote_etag
+
+# Bedingte Antworten dürfen gespeichert, müssen aber vor jeder Verwendung geprüft werden
+_CACHE_CONTROL = "private, no-cache"
+
+# Suffixe komprimierter Darstellungen (Content-Encoding)
+_ENCODING_SUFFIXES = ("-gzip", "-br")
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Bildet einen starken ETag aus den übergebenen Werten.
+
+    Args:
+        *parts: Werte, die die Antwort eindeutig bestimmen (datetime als ISO 8601)
+
+    Returns:
+        str: ETag ohne Anführungszeichen (32 Hex-Zeichen)
+    """
+    raw = "\x1f".join(p.isoformat() if isinstance(p, (datetime, date)) else str(p) for p in parts)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def etag_for_encoding(etag: str, encoding: str) -> str:
+    """ETag der mit `encoding` (gzip, br) komprimierten Darstellung."""
+    return f"{etag}-{encoding}"
+
+
+def _strip_encoding(tag: str) -> str:
+    for suffix in _ENCODING_SUFFIXES:
+        if tag.endswith(suffix):
+            return tag[: -len(suffix)]
+    return tag
+
+
+def _matching_tag(etag: str) -> Optional[str]:
+    """Der Tag aus `If-None-Match`, der zu `etag` gehört (mit Encoding-Suffix)."""
+    header = request.if_none_match
+    if not header:
+        return None
+    if header.star_tag:
+        return etag
+    for tag in header.as_set(include_weak=True):
+        if _strip_encoding(tag) == etag:
+            return tag
+    return None
+
+
+def if_none_match(etag: str) -> bool:
+    """
+    Prüft `If-None-Match` des aktuellen Requests (schwacher Vergleich, RFC 9110).
+
+    Returns:
+        bool: True, wenn eine der genannten Darstellungen zu `etag` gehört
+    """
+    return _matching_tag(etag) is not None
+
+
+def cache_headers(etag: str) -> Dict[str, str]:
+    """Header für eine 200-Antwort mit `etag`."""
+    return {"ETag": quote_etag(etag), "Cache-Control": _CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    """
+    304 Not Modified ohne Body; der Client verwendet seine gespeicherte Antwort.
+
+    Der ETag-Header nennt die Darstellung, die der Client angefragt hat
+    (bei komprimierten Antworten mit Suffix).
+    """
+    response = Response(status=304)
+    response.headers.update(cache_headers(_matching_tag(etag) or etag))
+    response.vary.add("Accept-Encoding")
+    return response
@@ -0,0 +1,116 @@
+"""
+@fileoverview API Rate Limit - Flask middleware for per-client request limits
+
+@description
+Bindet den RateLimiter (src/core/rate_limiting.py) an den API-Blueprint.
+Gezählt werden Requests mit den Methoden aus `rate_limiting.methods`
+(Standard: POST, also Verarbeitungsaufträge; Status-Abfragen und Upload-
+Blöcke bleiben frei) pro Client-IP. Über dem Limit wird mit 429 und
+`Retry-After` abgewiesen; erlaubte Requests erhalten `X-RateLimit-Limit`
+und `X-RateLimit-Remaining`.
+
+Die Client-IP ist `remote_addr`; `X-Forwarded-For` wird nur mit
+`trust_forwarded_for: true` ausgewertet (hinter einem eigenen Reverse Proxy).
+
+@module api.rate_limit
+
+@exports
+- register_rate_limiting(): Optional[RateLimiter] - Registriert before/after-Hooks am Blueprint
+
+@usedIn
+- src.api.routes: Registrierung nach der Auth-Middleware, vor der Admission Control
+
+@dependencies
+- External: flask - Blueprint, g, request
+- Internal: src.core.rate_limiting - RateLimiter
+- Internal: src.core.config - Methoden, Ausnahmen, Proxy-Einstellung
+"""
+
+import logging
+from typing import Any, List, Optional
+
+from flask import Blueprint, g, request
+from flask.typing import ResponseReturnValue
+
+from src.core.config import Config
+from src.core.rate_limiting import RateLimiter, load_rate_limiter
+
+
+logger = logging.getLogger(__name__)
+
+_API_PREFIX = "/api"
+
+
+def _client_key(trust_forwarded_for: bool) -> str:
+    if trust_forwarded_for:
+        forwarded = request.headers.get("X-Forwarded-For", "")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.remote_addr or "unknown"
+
+
+def register_rate_limiting(
+    blueprint: Blueprint,
+    limiter: Optional[RateLimiter] = None,
+) -> Optional[RateLimiter]:
+    """
+    Registriert das Rate Limiting am Blueprint.
+
+    Args:
+        blueprint: API-Blueprint (nach der Auth-Middleware aufrufen)
+        limiter: Optionaler Limiter; sonst aus der Konfiguration
+
+    Returns:
+        Optional[RateLimiter]: Der aktive Limiter oder None (deaktiviert)
+    """
+    active = limiter or load_rate_limiter()
+    if active is None:
+        return None
+    cfg = Config().get("rate_limiting", {}) or {}
+    methods = {str(m).upper() for m in (cfg.get("methods") or ["POST"])}
+    exempt_paths: List[str] = [str(p) for p in (cfg.get("exempt_paths") or [])]
+    trust_forwarded_for = bool(cfg.get("trust_forwarded_for", False))
+
+    @blueprint.before_request
+    def _limit() -> ResponseReturnValue | None:
+        if request.method not in methods:
+            return None
+        path = request.path[len(_API_PREFIX):] if request.path.startswith(_API_PREFIX) else request.path
+        if any(path == p or path.startswith(p.rstrip("/") + "/") for p in exempt_paths):
+            return None
+        key = _client_key(trust_forwarded_for)
+        try:
+            decision = active.check(f"ip:{key}")
+        except Exception as e:
+            # Rate Limiting darf die API nicht lahmlegen (z.B. MongoDB nicht erreichbar)
+            logger.error(f"Rate Limiting fehlgeschlagen für {key}: {e}")
+            return None
+        if decision.allowed:
+            g.rate_limit = decision
+            return None
+        logger.warning(f"Rate Limit überschritten für {key} ({request.method} {path})")
+        body = {
+            "status": "error",
+            "error": {
+                "code": "RATE_LIMITED",
+                "message": f"Zu viele Anfragen: höchstens {decision.limit} pro Minute",
+                "details": {"retry_after_sec": decision.retry_after},
+            },
+        }
+        headers = {
+            "Retry-After": str(decision.retry_after),
+            "X-RateLimit-Limit": str(decision.limit),
+            "X-RateLimit-Remaining": "0",
+        }
+        return body, 429, headers
+
+    @blueprint.after_request
+    def _headers(response: Any) -> Any:
+        decision: Any = g.pop("rate_limit", None)
+        if decision is not None:
+            response.headers["X-RateLimit-Limit"] = str(decision.limit)
+            response.headers["X-RateLimit-Remaining"] = str(decision.remaining)
+        return response
+
+    logger.info(f"Rate Limiting aktiv: {active.limit}/min pro Client für {sorted(methods)}")
+    return active
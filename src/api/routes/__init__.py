@@ -14,6 +14,8 @@ Main functionality:
   - Localhost exception for local development
   - IP whitelist for Swagger UI access
 - Logs auth decisions (optional)
+- Rate limiting: per-client request limits with 429 and Retry-After
+- Admission control: per-endpoint concurrency/queue limits with 429/503 and Retry-After
 
 Authentication:
 All API requests (except exempt_paths) require a valid API key:
@@ -35,6 +37,10 @@ All API requests (except exempt_paths) require a valid API key:
 - External: flask - Flask web framework
 - External: flask_restx - RESTX for API documentation and Swagger UI
 - Internal: src.utils.logger - Logging system
+- Internal: src.api.rate_limit - Rate limiting middleware
+- Internal: src.utils.serialization - JSON representation (orjson)
+- Internal: src.api.admission - Admission control middleware
+- Internal: src.api.compression - gzip/brotli response compression
 - System: os.environ - Environment variables for auth configuration
 """
 # pyright: reportUnusedFunction=false
@@ -71,6 +77,10 @@ api = Api(
     doc='/doc'  # Swagger-UI unter /api/doc verfügbar machen
 )
 
+# Antworten über orjson serialisieren (datetime, Dataclasses, Enums nativ)
+from src.utils.serialization import output_json
+api.representation('application/json')(output_json)
+
 # Middleware: SECRETARY_SERVICE_API_KEY Check für alle /api-Requests
 _SERVICE_TOKEN = os.environ.get('SECRETARY_SERVICE_API_KEY')
 _ALLOW_LOCALHOST_NO_AUTH = os.environ.get('ALLOW_LOCALHOST_NO_AUTH', 'false').lower() in {'1', 'true', 'yes'}
@@ -224,6 +234,18 @@ def _check_service_token() -> ResponseReturnValue | None:
         )
     return None
 
+# Rate Limiting pro Client nach der Auth-Prüfung, vor der Admission Control
+from src.api.rate_limit import register_rate_limiting
+rate_limiter = register_rate_limiting(blueprint)
+
+# Admission Control (Concurrency- und Queue-Limits) nach der Auth-Prüfung
+from src.api.admission import register_admission_control
+admission_controller = register_admission_control(blueprint)
+
+# gzip/brotli für große JSON-Antworten (Job-Ergebnisse, Markdown, text_contents)
+from src.api.compression import register_compression
+register_compression(blueprint)
+
 # Importiere Namespaces aus den Modulen
 from .audio_routes import audio_ns
 from .video_routes import video_ns
@@ -242,6 +264,7 @@ from .rag_routes import rag_ns
 from .text2image_routes import text2image_ns
 from .image_analyzer_routes import image_analyzer_ns
 from .health_routes import health_ns
+from .upload_routes import upload_ns
 
 # Registriere alle Namespaces bei der API
 api.add_namespace(audio_ns, path='/audio')  # type: ignore
@@ -260,6 +283,7 @@ api.add_namespace(rag_ns, path='/rag')  # type: ignore
 api.add_namespace(text2image_ns, path='/text2image')  # type: ignore
 api.add_namespace(image_analyzer_ns, path='/image-analyzer')  # type: ignore
 api.add_namespace(health_ns, path='/health')  # type: ignore
+api.add_namespace(upload_ns, path='/uploads')
 
 # Root-Namespace für die API-Root-Seite
 root_ns: Namespace = api.namespace('', description='Root Namespace')  # type: ignore
@@ -35,12 +35,12 @@ Features:
 - Internal: src.core.models.audio - AudioResponse
 - Internal: src.core.exceptions - ProcessingError
 - Internal: src.utils.logger - Logging system
+- Internal: src.utils.upload_ingest - Single-pass upload storage (size, hash)
 """
 # pyright: reportMissingTypeStubs=false
 # type: ignore
 from flask_restx import Model, Namespace, OrderedModel, Resource, fields, inputs
 from typing import Dict, Any, Union, Optional, IO, cast
-import asyncio
 import uuid
 import os
 import time
@@ -51,9 +51,12 @@ from src.processors.audio_processor import AudioProcessor
 from src.core.models.audio import AudioResponse
 from src.core.exceptions import ProcessingError
 from src.core.resource_tracking import ResourceCalculator
+from src.utils.async_runtime import run_async
+from src.utils.upload_ingest import ingest_upload
 from src.utils.logger import get_logger
 from src.utils.logger import ProcessingLogger
 from src.core.mongodb import SecretaryJobRepository
+from src.api.admission import sync_call_deferred
 
 # Initialisiere Logger
 logger: ProcessingLogger = get_logger(process_id="audio-api")
@@ -144,8 +147,8 @@ async def process_file(uploaded_file: FileStorage, source_info: Dict[str, Any],
         temp_file, temp_file_path = processor.get_upload_temp_file(
             suffix=Path(uploaded_file.filename).suffix if uploaded_file.filename else ".audio"
         )
-        uploaded_file.save(temp_file_path)
         temp_file.close()
+        ingest_upload(uploaded_file, temp_file_path)
         
         # Verarbeite die Datei
         result: AudioResponse = await processor.process(
@@ -315,8 +318,9 @@ class AudioProcessEndpoint(Resource):
                     details={'error_type': 'INVALID_FORMAT', 'supported_formats': list(supported_formats)}
                 )
 
-            # Async Mode (wie PDF): Wenn callback_url gesetzt ist, Job enqueuen und 202 zurückgeben
-            if callback_url:
+            # Async Mode (wie PDF): Wenn callback_url gesetzt ist, Job enqueuen und 202 zurückgeben.
+            # Bei Sättigung (Admission Control, auto_queue) auch ohne Callback: Client pollt /api/jobs/<id>
+            if callback_url or sync_call_deferred():
                 process_id = str(uuid.uuid4())
 
                 # Upload persistieren, damit der Worker später zugreifen kann
@@ -324,7 +328,7 @@ class AudioProcessEndpoint(Resource):
                 upload_dir.mkdir(parents=True, exist_ok=True)
                 suffix = Path(audio_file.filename).suffix if audio_file.filename else ".audio"
                 temp_file_path = str(upload_dir / f"upload_{uuid.uuid4()}{suffix}")
-                audio_file.save(temp_file_path)
+                upload = ingest_upload(audio_file, temp_file_path)
                 temp_file_path = os.path.abspath(temp_file_path)
                 try:
                     temp_file_path = Path(temp_file_path).as_posix()
@@ -337,10 +341,12 @@ class AudioProcessEndpoint(Resource):
                     "source_language": str(source_language),
                     "target_language": str(target_language),
                     "template": str(template) if template else None,
+                    # Inhalts-Hash aus dem Upload: Duplikaterkennung muss die Datei nicht erneut lesen
+                    "file_hash": upload.md5,
                     # Kontext/Metadaten: minimal, aber hilfreich (AudioProcessor nutzt es fürs Template)
                     "context": {
                         "original_filename": audio_file.filename,
-                        "file_size_bytes": int(actual_file_size or 0),
+                        "file_size_bytes": upload.size,
                         "file_type": audio_file.content_type,
                         "file_ext": file_ext,
                     },
@@ -366,7 +372,7 @@ class AudioProcessEndpoint(Resource):
                     },
                     # Für den Client die externe jobId (falls gesetzt) zurückgeben
                     "job": {"id": job_id_form or job_id_form_early or created_job_id},
-                    "webhook": {"delivered_to": callback_url},
+                    "webhook": {"delivered_to": callback_url} if callback_url else None,
                     "error": None,
                 }
                 logger.info(
@@ -379,7 +385,7 @@ class AudioProcessEndpoint(Resource):
                 return ack, 202
 
             # Sync fallback (bestehendes Verhalten)
-            result = asyncio.run(process_file(
+            result = run_async(process_file(
                 audio_file,
                 source_info,
                 source_language,
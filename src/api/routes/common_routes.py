@@ -37,11 +37,11 @@ import traceback
 import mimetypes
 from pathlib import Path
 import sys
-import asyncio
 
 from src.processors.session_processor import SessionProcessor
 from src.core.exceptions import ProcessingError
 from src.core.resource_tracking import ResourceCalculator
+from src.utils.async_runtime import run_async
 from src.utils.logger import get_logger
 from src.utils.logger import ProcessingLogger
 
@@ -196,7 +196,7 @@ class NotionEndpoint(Resource):
             except Exception as e:
                 return handle_processing_error(e)
         
-        return asyncio.run(process_request())
+        return run_async(process_request())
 
 # Samples-Endpoints
 @common_ns.route('/samples')  # type: ignore
@@ -43,6 +43,7 @@ from src.core.exceptions import ProcessingError, ValidationError
 from src.core.models.event import EventResponse
 from src.core.resource_tracking import ResourceCalculator
 from src.processors.event_processor import EventProcessor
+from src.utils.async_runtime import run_async
 from src.utils.logger import get_logger
 from src.utils.logger import ProcessingLogger
 
@@ -182,34 +183,12 @@ class EventSummaryEndpoint(Resource):
             )
             
             # Event-Zusammenfassung erstellen (asynchron)
-            import asyncio
-            try:
-                # Versuche, den bestehenden Event-Loop zu verwenden
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # Wenn der Loop bereits läuft, erstelle einen neuen
-                    event_response = asyncio.run(processor.create_event_summary(
-                        event_name=event_name,
-                        template=template,
-                        target_language=target_language,
-                        use_cache=use_cache
-                    ))
-                else:
-                    # Verwende den bestehenden Loop
-                    event_response = loop.run_until_complete(processor.create_event_summary(
-                        event_name=event_name,
-                        template=template,
-                        target_language=target_language,
-                        use_cache=use_cache
-                    ))
-            except RuntimeError:
-                # Fallback, wenn kein Event-Loop verfügbar ist
-                event_response: EventResponse = asyncio.run(processor.create_event_summary(
-                    event_name=event_name,
-                    template=template,
-                    target_language=target_language,
-                    use_cache=use_cache
-                ))
+            event_response: EventResponse = run_async(processor.create_event_summary(
+                event_name=event_name,
+                template=template,
+                target_language=target_language,
+                use_cache=use_cache
+            ))
             
             # Response in Dictionary umwandeln
             return event_response.to_dict()
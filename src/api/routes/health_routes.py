@@ -15,6 +15,7 @@ Endpoints:
 - GET /api/health/                       - Übersicht aller Use-Cases + Endpunkte
 - GET /api/health/use-case/<use_case>    - Status eines einzelnen Use-Cases
 - GET /api/health/endpoint/<endpoint>    - Status eines (kaskadierenden) Endpoints
+- GET /api/health/llm-concurrency        - Adaptive LLM-Limits und Zähler pro Provider/Modell
 
 Hinweis: ``/api/health*`` ist in der Auth-Middleware ausgenommen (kein Token
 nötig), siehe src/api/routes/__init__.py.
@@ -30,6 +31,7 @@ from typing import Any, Dict, Tuple, Union
 
 from flask_restx import Namespace, Resource  # type: ignore
 
+from src.core.llm import ProviderManager
 from src.core.llm.health import LLMHealthService, KNOWN_ENDPOINTS
 from src.core.llm.use_cases import UseCase
 from src.utils.logger import get_logger
@@ -58,6 +60,19 @@ class LiveEndpoint(Resource):
         }
 
 
+@health_ns.route("/llm-concurrency")
+class LLMConcurrencyEndpoint(Resource):
+    @health_ns.doc(description="Aktuelle adaptive Parallelitäts-Limits, Warteschlangen und Drosselungen pro Provider/Modell")
+    def get(self) -> Dict[str, Any]:
+        """Metriken des prozessweiten LLM-Concurrency-Limiters (nur dieser Prozess)."""
+        limiter = ProviderManager().get_concurrency_limiter()
+        return {
+            "enabled": limiter.enabled,
+            "limits": limiter.snapshot(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+
 @health_ns.route("/")  # type: ignore
 class HealthOverviewEndpoint(Resource):
     @health_ns.doc(description="Übersicht: Status aller Use-Cases und (kaskadierender) Endpunkte")  # type: ignore
@@ -33,12 +33,12 @@ Features:
 - External: werkzeug - FileStorage for file uploads
 - Internal: src.processors.imageocr_processor - ImageOCRProcessor
 - Internal: src.utils.performance_tracker - Performance tracking
+- Internal: src.utils.upload_ingest - Single-pass upload storage (hash for cache key)
 """
 # pyright: reportUnknownMemberType=warning, reportUnknownParameterType=warning, reportUnknownVariableType=warning
 import os
 import uuid
 import json
-import asyncio
 import hashlib
 from typing import Dict, Any, Union, Optional, cast
 from pathlib import Path
@@ -48,6 +48,8 @@ from flask_restx.reqparse import RequestParser  # type: ignore
 from werkzeug.datastructures import FileStorage
 
 from src.core.exceptions import ProcessingError
+from src.utils.async_runtime import run_async
+from src.utils.upload_ingest import ingest_upload
 from src.utils.logger import get_logger
 from src.utils.performance_tracker import get_performance_tracker, PerformanceTracker
 from src.processors.imageocr_processor import (
@@ -128,21 +130,6 @@ def get_imageocr_processor(process_id: Optional[str] = None) -> ImageOCRProcesso
     from src.core.resource_tracking import ResourceCalculator
     return ImageOCRProcessor(ResourceCalculator(), process_id)
 
-def calculate_file_hash(file_path: str) -> str:
-    """Berechnet einen MD5-Hash für die angegebene Datei.
-    
-    Args:
-        file_path: Pfad zur Datei
-        
-    Returns:
-        str: MD5-Hash der Datei
-    """
-    hash_md5 = hashlib.md5()
-    with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b''):
-            hash_md5.update(chunk)
-    return hash_md5.hexdigest()
-
 @imageocr_ns.route('/process')  # type: ignore
 class ImageOCREndpoint(Resource):
     @imageocr_ns.expect(imageocr_upload_parser)  # type: ignore
@@ -172,10 +159,8 @@ class ImageOCREndpoint(Resource):
                 
                 # Speichere die Datei temporär
                 temp_file_path = os.path.join(os.path.dirname(__file__), f"temp_{uuid.uuid4()}{Path(uploaded_file.filename).suffix}")
-                uploaded_file.save(temp_file_path)
-                
-                # Berechne den Hash der Datei für Cache-Key
-                file_hash = calculate_file_hash(temp_file_path)
+                # Speichern und Hash für den Cache-Key in einem Durchlauf
+                file_hash = ingest_upload(uploaded_file, temp_file_path).md5
                 
                 # Verarbeite die Datei
                 processing_result: ImageOCRResponse
@@ -226,7 +211,7 @@ class ImageOCREndpoint(Resource):
                         logger.warning(f"Konnte temporäre Datei nicht löschen: {str(e)}")
         
         # Führe die asynchrone Verarbeitung aus
-        return asyncio.run(process_request())
+        return run_async(process_request())
 
 @imageocr_ns.route('/process-url')  # type: ignore
 class ImageOCRUrlEndpoint(Resource):
@@ -299,4 +284,4 @@ class ImageOCRUrlEndpoint(Resource):
                 }, 400
         
         # Führe die asynchrone Verarbeitung aus
-        return asyncio.run(process_request()) 
\ No newline at end of file
+        return run_async(process_request()) 
\ No newline at end of file
@@ -25,7 +25,9 @@ from werkzeug.datastructures import FileStorage
 
 from src.core.mongodb.secretary_repository import SecretaryJobRepository
 from src.core.models.job_models import JobStatus
+from src.api.admission import sync_call_deferred
 from src.utils.logger import get_logger
+from src.utils.upload_ingest import UploadDescriptor, ingest_upload
 
 
 logger = get_logger(process_id="office_routes", processor_name="office_routes")
@@ -100,12 +102,9 @@ office_via_pdf_parser.add_argument("force_refresh", location="form", type=inputs
 office_via_pdf_parser.add_argument("wait_ms", location="form", type=int, required=False, default=0)  # type: ignore
 
 
-def _save_upload_to_temp(file: FileStorage, base_dir: str) -> str:
-    os.makedirs(base_dir, exist_ok=True)
+def _save_upload_to_temp(file: FileStorage, base_dir: str) -> UploadDescriptor:
     filename = file.filename or "upload.bin"
-    out_path = os.path.join(base_dir, filename)
-    file.save(out_path)
-    return out_path
+    return ingest_upload(file, os.path.join(base_dir, filename))
 
 
 def _json_response(data: Dict[str, Any], status_code: int = 200) -> Tuple[Dict[str, Any], int]:
@@ -139,7 +138,8 @@ class OfficeProcessEndpoint(Resource):
         wait_ms = int(args.get("wait_ms", 0) or 0)
 
         temp_dir = os.path.join("cache", "uploads", "office", process_id)
-        temp_file_path = _save_upload_to_temp(up, temp_dir)
+        upload = _save_upload_to_temp(up, temp_dir)
+        temp_file_path = upload.path
 
         job_repo = SecretaryJobRepository()
         job_webhook: Optional[Dict[str, Any]] = None
@@ -152,6 +152,7 @@ class OfficeProcessEndpoint(Resource):
             "include_images": include_images,
             "include_previews": include_previews,
             "force_refresh": force_refresh,
+            "file_hash": upload.md5,
         }
         if job_webhook:
             params["webhook"] = job_webhook
@@ -177,7 +178,8 @@ class OfficeProcessEndpoint(Resource):
             )
 
         # Optional wait_ms (polling)
-        if wait_ms > 0:
+        # Bei Sättigung (Admission Control, auto_queue) nicht im Request-Thread warten
+        if wait_ms > 0 and not sync_call_deferred():
             deadline = time.time() + (wait_ms / 1000.0)
             while time.time() < deadline:
                 job = job_repo.get_job(created_job_id)
@@ -253,7 +255,8 @@ class OfficeViaPdfEndpoint(Resource):
         page_end = args.get("page_end")
 
         temp_dir = os.path.join("cache", "uploads", "office_via_pdf", process_id)
-        temp_file_path = _save_upload_to_temp(up, temp_dir)
+        upload = _save_upload_to_temp(up, temp_dir)
+        temp_file_path = upload.path
 
         job_repo = SecretaryJobRepository()
         job_webhook: Optional[Dict[str, Any]] = None
@@ -269,6 +272,7 @@ class OfficeViaPdfEndpoint(Resource):
             "include_images": include_images,
             "target_language": target_language,
             "force_refresh": force_refresh,
+            "file_hash": upload.md5,
         }
         if page_start is not None:
             params["page_start"] = int(page_start)
@@ -297,7 +301,8 @@ class OfficeViaPdfEndpoint(Resource):
                 202,
             )
 
-        if wait_ms > 0:
+        # Bei Sättigung (Admission Control, auto_queue) nicht im Request-Thread warten
+        if wait_ms > 0 and not sync_call_deferred():
             deadline = time.time() + (wait_ms / 1000.0)
             while time.time() < deadline:
                 job = job_repo.get_job(created_job_id)
@@ -34,12 +34,12 @@ Features:
 - Internal: src.core.mongodb.secretary_repository - SecretaryJobRepository for asynchronous jobs
 - Internal: src.core.models.job_models - JobStatus
 - Internal: src.utils.logger - Logging system
+- Internal: src.utils.upload_ingest - Single-pass upload storage (size, hash)
 """
 import os
 import traceback
 import uuid
 import json
-import asyncio
 import hashlib
 from typing import Dict, Any, Union, Optional, cast, Tuple
 from pathlib import Path
@@ -50,11 +50,14 @@ from werkzeug.datastructures import FileStorage
 import time
 
 from src.core.exceptions import ProcessingError
+from src.utils.async_runtime import run_async
+from src.utils.upload_ingest import ingest_upload
 from src.utils.logger import get_logger
 # Performance-Tracker wird in diesem Flow nicht benötigt
 from src.processors.pdf_processor import PDFProcessor
 from src.core.mongodb.secretary_repository import SecretaryJobRepository
 from src.core.models.job_models import JobStatus
+from src.api.admission import sync_call_deferred
 
 # Logger initialisieren
 logger = get_logger(process_id="pdf_routes", processor_name="pdf_routes")
@@ -373,21 +376,6 @@ def get_pdf_processor(process_id: Optional[str] = None) -> PDFProcessor:
     from src.core.resource_tracking import ResourceCalculator
     return PDFProcessor(ResourceCalculator(), process_id)
 
-def calculate_file_hash(file_path: str) -> str:
-    """Berechnet einen MD5-Hash für die angegebene Datei.
-    
-    Args:
-        file_path: Pfad zur Datei
-        
-    Returns:
-        str: MD5-Hash der Datei
-    """
-    hash_md5 = hashlib.md5()
-    with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b''):
-            hash_md5.update(chunk)
-    return hash_md5.hexdigest()
-
 @pdf_ns.route('/process')  # type: ignore
 class PDFEndpoint(Resource):
     @pdf_ns.expect(pdf_upload_parser)  # type: ignore
@@ -445,7 +433,8 @@ class PDFEndpoint(Resource):
                 upload_dir = Path("cache") / "uploads"
                 upload_dir.mkdir(parents=True, exist_ok=True)
                 temp_file_path = str(upload_dir / f"upload_{uuid.uuid4()}.pdf")
-                uploaded_file.save(temp_file_path)
+                # Speichern, Hash und Größe in einem Durchlauf
+                upload = ingest_upload(uploaded_file, temp_file_path)
                 # Reduzierte Logs: keine Pfad-/FS-Dumps
                 # WICHTIG: Absoluten Pfad als POSIX-Form persistieren (forward slashes)
                 temp_file_path = os.path.abspath(temp_file_path)
@@ -455,8 +444,8 @@ class PDFEndpoint(Resource):
                     # Fallback: einfache Backslash-Ersetzung
                     temp_file_path = temp_file_path.replace('\\', '/')
                 
-                # Berechne optionalen Hash (nur für Logging/Cache-Key in Prozessdaten)
-                file_hash = calculate_file_hash(temp_file_path)
+                # Hash (nur für Logging/Cache-Key in Prozessdaten) stammt aus dem Upload
+                file_hash = upload.md5
                 
                 # Wartezeit optional aus Request
                 wait_ms: int = 0
@@ -511,7 +500,7 @@ class PDFEndpoint(Resource):
                 try:
                     # Diagnose: Direkt nach Enqueue prüfen
                     enq_job = job_repo.get_job(created_job_id)
-                    pending_after = len(job_repo.get_jobs(status=JobStatus.PENDING))
+                    pending_after = job_repo.count_jobs(status=JobStatus.PENDING)
                     print(f"[PDF-ROUTE] SecretaryJob erstellt: {created_job_id}, status={getattr(enq_job,'status',None)}")
                     print(f"[PDF-ROUTE] Pending nach Enqueue: {pending_after}")
                 except Exception as _diag_err:
@@ -543,7 +532,8 @@ class PDFEndpoint(Resource):
                     return ack, 202
 
                 # Ohne Callback → optional auf Abschluss warten, sonst 202 mit job_id
-                if wait_ms > 0:
+                # Bei Sättigung (Admission Control, auto_queue) nicht im Request-Thread warten
+                if wait_ms > 0 and not sync_call_deferred():
                     deadline = time.time() + (wait_ms / 1000.0)
                     while time.time() < deadline:
                         job = job_repo.get_job(created_job_id)
@@ -603,7 +593,7 @@ class PDFEndpoint(Resource):
                             logger.warning(f"Konnte temporäre Datei nicht löschen: {str(e)}")
         
         # Führe die asynchrone Verarbeitung aus
-        return asyncio.run(process_request())
+        return run_async(process_request())
 
 @pdf_ns.route('/process-mistral-ocr')  # type: ignore
 class PDFMistralOCREndpoint(Resource):
@@ -654,14 +644,15 @@ class PDFMistralOCREndpoint(Resource):
                 upload_dir = Path("cache") / "uploads"
                 upload_dir.mkdir(parents=True, exist_ok=True)
                 temp_file_path = str(upload_dir / f"upload_{uuid.uuid4()}.pdf")
-                uploaded_file.save(temp_file_path)
+                # Speichern, Hash und Größe in einem Durchlauf
+                upload = ingest_upload(uploaded_file, temp_file_path)
                 temp_file_path = os.path.abspath(temp_file_path)
                 try:
                     temp_file_path = Path(temp_file_path).as_posix()
                 except Exception:
                     temp_file_path = temp_file_path.replace('\\', '/')
                 
-                file_hash = calculate_file_hash(temp_file_path)
+                file_hash = upload.md5
                 
                 wait_ms: int = 0
                 try:
@@ -742,7 +733,8 @@ class PDFMistralOCREndpoint(Resource):
                     )
                     return ack, 202
                 
-                if wait_ms > 0:
+                # Bei Sättigung (Admission Control, auto_queue) nicht im Request-Thread warten
+                if wait_ms > 0 and not sync_call_deferred():
                     deadline = time.time() + (wait_ms / 1000.0)
                     while time.time() < deadline:
                         job = job_repo.get_job(created_job_id)
@@ -798,7 +790,7 @@ class PDFMistralOCREndpoint(Resource):
                         except Exception as e:
                             logger.warning(f"Konnte temporäre Datei nicht löschen: {str(e)}")
         
-        return asyncio.run(process_request())
+        return run_async(process_request())
 
 @pdf_ns.route('/process-url')  # type: ignore
 class PDFUrlEndpoint(Resource):
@@ -892,7 +884,7 @@ class PDFUrlEndpoint(Resource):
                 created_job_id: str = job_repo.create_job(job_data)
                 try:
                     enq_job = job_repo.get_job(created_job_id)
-                    pending_after = len(job_repo.get_jobs(status=JobStatus.PENDING))
+                    pending_after = job_repo.count_jobs(status=JobStatus.PENDING)
                     print(f"[PDF-ROUTE] SecretaryJob(URL) erstellt: {created_job_id}, status={getattr(enq_job,'status',None)}")
                     print(f"[PDF-ROUTE] Pending nach Enqueue (URL): {pending_after}")
                 except Exception as _diag_err:
@@ -915,7 +907,8 @@ class PDFUrlEndpoint(Resource):
                     logger.info("Webhook-ACK gesendet (Job enqueued)", process_id=process_id, job_id=created_job_id, callback_url=callback_url)
                     return ack, 202
 
-                if wait_ms > 0:
+                # Bei Sättigung (Admission Control, auto_queue) nicht im Request-Thread warten
+                if wait_ms > 0 and not sync_call_deferred():
                     deadline = time.time() + (wait_ms / 1000.0)
                     while time.time() < deadline:
                         job = job_repo.get_job(created_job_id)
@@ -965,7 +958,7 @@ class PDFUrlEndpoint(Resource):
                 }, 400
         
         # Führe die asynchrone Verarbeitung aus
-        return asyncio.run(process_request())
+        return run_async(process_request())
 
 @pdf_ns.route('/text-content/<path:file_path>')  # type: ignore
 class PDFTextContentEndpoint(Resource):
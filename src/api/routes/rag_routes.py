@@ -33,13 +33,13 @@ Features:
 
 from flask_restx import Model, Namespace, OrderedModel, Resource, fields
 from typing import Dict, Any, Union, Optional
-import asyncio
 import uuid
 
 from src.processors.rag_processor import RAGProcessor
 from src.core.models.rag import RAGResponse
 from src.core.exceptions import ProcessingError
 from src.core.resource_tracking import ResourceCalculator
+from src.utils.async_runtime import run_async
 from src.utils.logger import get_logger, ProcessingLogger
 
 # Initialisiere Logger
@@ -201,7 +201,7 @@ class RAGEmbedTextEndpoint(Resource):
             
             # Embedding durchführen (ohne Speicherung)
             # Typ-Annotationen für Parameter (markdown_text ist bereits validiert, daher nicht None)
-            embedding_result = asyncio.run(
+            embedding_result = run_async(
                 processor.embed_document_for_client(
                     text=str(markdown_text),  # Nach Validierung sicher str
                     document_id=document_id if document_id else None,  # type: ignore
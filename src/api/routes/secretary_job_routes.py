@@ -7,11 +7,16 @@ Get job, Get batch. This file defines REST API endpoints for generic job managem
 with Flask-RESTX, including job enqueue, status query, and batch management.
 
 Main endpoints:
+- GET /api/jobs/: List jobs (keyset pagination via next_cursor, without results/logs)
 - POST /api/jobs/enqueue: Enqueue single job
 - POST /api/jobs/enqueue-batch: Enqueue batch of jobs
-- GET /api/jobs/{job_id}: Retrieve job status
+- POST /api/jobs/bulk: Bulk batch submission (validated, chunked insert_many)
+- GET /api/jobs/{job_id}: Retrieve job status (ETag, 304 bei If-None-Match)
 - GET /api/jobs/{job_id}/stream: SSE-Stream fuer Echtzeit-Job-Updates (fuer Offline-Clients)
 - GET /api/jobs/batch/{batch_id}: Retrieve batch status
+- GET /api/jobs/queue-stats: Queue depth and wait time per job_type pool
+- GET /api/jobs/{job_id}/logs: Paginated job log entries
+- GET /api/jobs/{job_id}/download-archive: ZIP der Job-Bilder (ETag, 304 bei If-None-Match)
 - GET /api/jobs/health: Health check for secretary job service
 
 Features:
@@ -20,13 +25,14 @@ Features:
 - Batch job management
 - Job status tracking
 - Server-Sent Events (SSE) fuer Echtzeit-Updates ohne Webhook
+- Bedingte GETs: der ETag stammt aus Status, updated_at und Lease des Jobs;
+  bei passendem If-None-Match wird ohne Laden der Ergebnisse 304 geliefert
 - Swagger UI documentation
 
 @module api.routes.secretary_job_routes
 
 @exports
 - secretary_ns: Namespace - Flask-RESTX namespace for secretary job endpoints
-- DateTimeEncoder: Class - JSON encoder for datetime objects
 - get_repo(): SecretaryJobRepository - Factory function for repository
 
 @usedIn
@@ -36,15 +42,16 @@ Features:
 - External: flask_restx - REST API framework with Swagger UI
 - Internal: src.core.mongodb - SecretaryJobRepository
 - Internal: src.api.sse - SSE-Event-Stream-Generator
+- Internal: src.api.conditional - ETag und 304
 """
 from typing import Any, Dict, List, Optional, Union, Tuple, cast
 
 from flask import request, Response
 from flask_restx import Namespace, Resource, fields  # type: ignore
 
+from src.api.conditional import cache_headers, if_none_match, make_etag, not_modified
 from src.core.mongodb import SecretaryJobRepository
-import json
-from datetime import datetime
+from src.core.models.job_models import Job, JobStatus
 import os
 import io
 import zipfile
@@ -62,6 +69,7 @@ enqueue_job_model = secretary_ns.model('EnqueueJob', {  # type: ignore
 
 enqueue_batch_model = secretary_ns.model('EnqueueBatch', {  # type: ignore
     'batch_name': fields.String(required=False),
+    'user_id': fields.String(required=False),
     'jobs': fields.List(fields.Nested(enqueue_job_model), required=True),
 })
 
@@ -70,19 +78,86 @@ def get_repo() -> SecretaryJobRepository:
     return SecretaryJobRepository()
 
 
-class DateTimeEncoder(json.JSONEncoder):
-    def default(self, o: Any) -> Any:
-        if isinstance(o, datetime):
-            return o.isoformat()
-        return super().default(o)
+def json_response(data: Dict[str, Any], status_code: int = 200) -> Tuple[Dict[str, Any], int]:
+    # datetime-Werte serialisiert die API-Representation (src.utils.serialization.output_json)
+    return data, status_code
 
 
-def json_response(data: Dict[str, Any], status_code: int = 200) -> Tuple[Dict[str, Any], int]:
-    json_data = json.loads(json.dumps(data, cls=DateTimeEncoder))
-    return json_data, status_code
+def _job_etag(version: Dict[str, Any], variant: str = "json") -> str:
+    """ETag aus den Feldern von SecretaryJobRepository.get_job_version()."""
+    return make_etag(
+        version.get("job_id"), variant, version.get("status"),
+        version.get("updated_at"), version.get("lease_expires_at"),
+    )
+
+
+def _job_version(job: Job) -> Dict[str, Any]:
+    return {
+        "job_id": job.job_id,
+        "status": job.status.value,
+        "updated_at": job.updated_at,
+        "lease_expires_at": job.lease_expires_at,
+    }
+
+
+def _unchanged_job_etag(repo: SecretaryJobRepository, job_id: str, variant: str = "json") -> Optional[str]:
+    """
+    ETag des Jobs, wenn der Client diese Darstellung laut If-None-Match
+    bereits hat; lädt dafür nur die Versionsfelder, nicht die Ergebnisse.
+    """
+    if not request.if_none_match:
+        return None
+    version = repo.get_job_version(job_id)
+    if version is None:
+        return None
+    if variant == "archive" and version.get("status") != "completed":
+        return None
+    etag = _job_etag(version, variant)
+    return etag if if_none_match(etag) else None
+
+
+def _job_summary(job: Job) -> Dict[str, Any]:
+    """
+    Listeneintrag eines Jobs: ohne Parameter, die Webhook-Tokens enthalten
+    können (nicht geladen, siehe get_jobs_page).
+    """
+    data = job.to_dict()
+    data.pop('parameters', None)
+    return data
 
 @secretary_ns.route('/')  # type: ignore
 class SecretaryJobCreateEndpoint(Resource):
+    @secretary_ns.doc(
+        description='Jobs seitenweise auflisten (ohne Ergebnisse und Logs), neueste zuerst.',
+        params={
+            'status': 'Optional: pending, processing, completed, failed',
+            'batch_id': 'Optional: nur Jobs dieses Batches',
+            'limit': 'Jobs pro Seite (Standard 50, max. 1000)',
+            'after': 'Cursor (next_cursor der vorherigen Seite)',
+            'order': "'desc' (neueste zuerst, Standard) oder 'asc'",
+        },
+    )
+    def get(self) -> Union[Dict[str, Any], tuple[Dict[str, Any], int]]:
+        try:
+            limit = int(request.args.get('limit', 50))
+        except ValueError:
+            return json_response({'status': 'error', 'error': {'message': 'limit muss eine Zahl sein'}}, 400)
+        status = request.args.get('status') or None
+        if status is not None and status not in {s.value for s in JobStatus}:
+            return json_response({'status': 'error', 'error': {'message': f'Unbekannter Status: {status}'}}, 400)
+        try:
+            page = get_repo().get_jobs_page(
+                status=status,
+                batch_id=request.args.get('batch_id') or None,
+                limit=limit,
+                after=request.args.get('after') or None,
+                newest_first=request.args.get('order', 'desc').lower() != 'asc',
+            )
+        except ValueError as e:
+            return json_response({'status': 'error', 'error': {'message': str(e)}}, 400)
+        data = {'jobs': [_job_summary(job) for job in page['jobs']], 'next_cursor': page['next_cursor']}
+        return json_response({'status': 'success', 'data': data})
+
     @secretary_ns.expect(enqueue_job_model)  # type: ignore
     def post(self) -> Union[Dict[str, Any], tuple[Dict[str, Any], int]]:
         data = request.get_json(force=True)
@@ -99,35 +174,101 @@ class SecretaryJobCreateEndpoint(Resource):
         return json_response({'status': 'success', 'data': {'job_id': job_id, 'job': job.to_dict() if job else None}})
 
 
+def _create_bulk_batch(data: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
+    """Legt Batch und Jobs über SecretaryJobRepository.create_jobs_bulk an."""
+    # Verzögerter Import, um zirkuläre Importe zu vermeiden
+    from src.core.config import Config
+    from src.core.processing import available_job_types
+    jobs = data.get('jobs')
+    if not isinstance(jobs, list) or not jobs:
+        return json_response({'status': 'error', 'error': {'message': 'jobs must be a non-empty list'}}, 400)
+    max_jobs = int(Config().get('generic_worker.bulk.max_jobs', 10000))
+    if len(jobs) > max_jobs:
+        return json_response({'status': 'error', 'error': {'message': f'too many jobs (max {max_jobs})'}}, 413)
+    repo = get_repo()
+    result = repo.create_jobs_bulk(
+        cast(List[Dict[str, Any]], jobs),
+        batch_name=data.get('batch_name'),
+        user_id=data.get('user_id'),
+        # Leere Registry (Handler nicht importierbar) -> keine Prüfung des job_type
+        known_job_types=set(available_job_types()) or None,
+        chunk_size=int(Config().get('generic_worker.bulk.chunk_size', 500)),
+    )
+    if result['batch_id'] is None:
+        return json_response({'status': 'error', 'error': {'message': 'no valid jobs', 'details': result['errors']}}, 400)
+    batch = repo.get_batch(result['batch_id'])
+    return json_response({'status': 'success', 'data': {
+        **result,
+        'batch': batch.to_dict() if batch else None,
+        'accepted': len(result['job_ids']),
+        'rejected': len(result['errors']),
+    }})
+
+
 @secretary_ns.route('/batch')  # type: ignore
 class SecretaryBatchCreateEndpoint(Resource):
     @secretary_ns.expect(enqueue_batch_model)  # type: ignore
     def post(self) -> Union[Dict[str, Any], tuple[Dict[str, Any], int]]:
-        data = request.get_json(force=True)
-        jobs: List[Dict[str, Any]] = data.get('jobs', [])
-        batch_name: Optional[str] = data.get('batch_name')
-        repo = get_repo()
-        batch_id = repo.create_batch({'batch_name': batch_name, 'total_jobs': len(jobs)})
-        job_ids: List[str] = []
-        for j in jobs:
-            job_data = {
-                'job_type': j.get('job_type'),
-                'parameters': j.get('parameters', {}),
-                'batch_id': batch_id,
-            }
-            job_ids.append(repo.create_job(job_data))
-        batch = repo.get_batch(batch_id)
-        return json_response({'status': 'success', 'data': {'batch_id': batch_id, 'job_ids': job_ids, 'batch': batch.to_dict() if batch else None}})
+        return _create_bulk_batch(request.get_json(force=True) or {})
+
+
+@secretary_ns.route('/bulk')
+class SecretaryBulkCreateEndpoint(Resource):
+    @secretary_ns.expect(enqueue_batch_model)
+    @secretary_ns.doc(description='Legt einen Batch mit vielen Jobs an (insert_many in Blöcken). Ungültige Jobs werden mit Index in errors gemeldet.')
+    def post(self) -> Union[Dict[str, Any], tuple[Dict[str, Any], int]]:
+        return _create_bulk_batch(request.get_json(force=True) or {})
+
+
+@secretary_ns.route('/queue-stats')
+class SecretaryQueueStatsEndpoint(Resource):
+    @secretary_ns.doc(description='Wartende/laufende Jobs und älteste Wartezeit pro job_type-Pool (generic_worker.job_types)')
+    def get(self) -> Union[Dict[str, Any], tuple[Dict[str, Any], int]]:
+        from src.core.config import Config
+        from src.core.mongodb.secretary_worker_manager import build_queue_stats, load_job_type_pools
+
+        pools = load_job_type_pools(Config().get('generic_worker', {}))
+        stats = build_queue_stats(get_repo().get_queue_stats(), pools)
+        return json_response({'status': 'success', 'data': stats})
 
 
 @secretary_ns.route('/<string:job_id>')  # type: ignore
 class SecretaryJobGetEndpoint(Resource):
-    def get(self, job_id: str) -> Union[Dict[str, Any], tuple[Dict[str, Any], int]]:
+    def get(self, job_id: str) -> Union[Response, Tuple[Dict[str, Any], int], Tuple[Dict[str, Any], int, Dict[str, str]]]:
         repo = get_repo()
+        unchanged = _unchanged_job_etag(repo, job_id)
+        if unchanged:
+            return not_modified(unchanged)
         job = repo.get_job(job_id)
         if not job:
             return json_response({'status': 'error', 'error': {'message': 'job not found'}}, 404)
-        return json_response({'status': 'success', 'data': job.to_dict()})
+        return {'status': 'success', 'data': job.to_dict()}, 200, cache_headers(_job_etag(_job_version(job)))
+
+
+@secretary_ns.route('/<string:job_id>/logs')
+class SecretaryJobLogsEndpoint(Resource):
+    @secretary_ns.doc(
+        description='Log-Einträge eines Jobs, seitenweise. Das Job-Dokument enthält nur die letzten Einträge.',
+        params={
+            'job_id': 'Job-ID',
+            'limit': 'Einträge pro Seite (Standard 100, max. 1000)',
+            'after': 'Cursor (next_cursor der vorherigen Seite)',
+            'order': "'asc' (älteste zuerst, Standard) oder 'desc'",
+        },
+    )
+    def get(self, job_id: str) -> Union[Dict[str, Any], tuple[Dict[str, Any], int]]:
+        try:
+            limit = int(request.args.get('limit', 100))
+        except ValueError:
+            return json_response({'status': 'error', 'error': {'message': 'limit muss eine Zahl sein'}}, 400)
+        after = request.args.get('after') or None
+        newest_first = request.args.get('order', 'asc').lower() == 'desc'
+        repo = get_repo()
+        try:
+            page = repo.get_job_logs(job_id, limit=limit, after=after, newest_first=newest_first)
+        except ValueError as e:
+            return json_response({'status': 'error', 'error': {'message': str(e)}}, 400)
+        return json_response({'status': 'success', 'data': page})
 
 
 @secretary_ns.route('/batch/<string:batch_id>')  # type: ignore
@@ -146,7 +287,10 @@ class SecretaryJobStreamEndpoint(Resource):
         description='SSE-Stream fuer Echtzeit-Job-Updates. Ideal fuer Offline-Clients, '
                     'die keinen Webhook-Endpunkt bereitstellen koennen. Der Client oeffnet '
                     'eine langlebige HTTP-Verbindung und empfaengt Events bei Statusaenderungen.',
-        params={'job_id': 'Job-ID fuer die Updates gestreamt werden sollen'},
+        params={
+            'job_id': 'Job-ID fuer die Updates gestreamt werden sollen',
+            'last_event_id': 'Alternative zum Last-Event-ID-Header: nur neuere Zustaende senden',
+        },
         responses={
             200: 'SSE-Event-Stream (Content-Type: text/event-stream)',
             404: 'Job nicht gefunden'
@@ -161,8 +305,10 @@ class SecretaryJobStreamEndpoint(Resource):
         """
         from src.api.sse import job_event_stream
 
+        # EventSource sendet Last-Event-ID beim Reconnect als Header; Query-Parameter fuer Polyfills
+        last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
         return Response(
-            job_event_stream(job_id),
+            job_event_stream(job_id, last_event_id),
             mimetype='text/event-stream',
             headers={
                 'Cache-Control': 'no-cache',
@@ -178,9 +324,17 @@ class SecretaryJobArchiveDownloadEndpoint(Resource):
         """Lädt das ZIP-Archiv eines Secretary-Jobs herunter (falls vorhanden)."""
         try:
             repo = get_repo()
+            unchanged = _unchanged_job_etag(repo, job_id, "archive")
+            if unchanged:
+                return not_modified(unchanged)
             job = repo.get_job(job_id)
             if not job:
                 return json_response({"error": "Job nicht gefunden"}, 404)
+            # Nur abgeschlossene Jobs haben ein unveränderliches Archiv
+            archive_headers: Dict[str, str] = (
+                cache_headers(_job_etag(_job_version(job), "archive"))
+                if job.status.value == "completed" else {}
+            )
             if not job.results:
                 # Wenn der Job noch läuft, signalisiere dem Client: später erneut versuchen
                 status_any: Any = getattr(job, 'status', 'processing')
@@ -233,7 +387,8 @@ class SecretaryJobArchiveDownloadEndpoint(Resource):
                         mimetype='application/zip',
                         headers={
                             'Content-Disposition': f'attachment; filename="{filename}"',
-                            'Content-Length': str(len(archive_bytes))
+                            'Content-Length': str(len(archive_bytes)),
+                            **archive_headers,
                         }
                     )
                 except Exception:
@@ -277,7 +432,8 @@ class SecretaryJobArchiveDownloadEndpoint(Resource):
                 mimetype='application/zip',
                 headers={
                     'Content-Disposition': f'attachment; filename="{filename}"',
-                    'Content-Length': str(len(archive_bytes))
+                    'Content-Length': str(len(archive_bytes)),
+                    **archive_headers,
                 }
             )
         except Exception as e:
@@ -38,12 +38,12 @@ from flask import request
 from flask_restx import Model, Namespace, OrderedModel, Resource, fields  # type: ignore
 from typing import Dict, Any, Union, Optional, TypeVar, cast
 import traceback
-import asyncio
 import uuid
 
 from src.processors.session_processor import SessionProcessor
 from src.core.exceptions import ProcessingError
 from src.core.resource_tracking import ResourceCalculator
+from src.utils.async_runtime import run_async
 from src.utils.logger import get_logger
 from src.utils.performance_tracker import get_performance_tracker, PerformanceTracker
 
@@ -221,7 +221,7 @@ class SessionProcessEndpoint(Resource):
                 raise ProcessingError("Pflichtfelder fehlen: event, session, url, filename, track")
             
             # Verarbeite die Session
-            result: SessionResponse = asyncio.run(session_processor.process_session(
+            result: SessionResponse = run_async(session_processor.process_session(
                 event=event,
                 session=session,
                 url=url,
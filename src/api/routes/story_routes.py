@@ -22,47 +22,33 @@ Features:
 
 @exports
 - story_ns: Namespace - Flask-RESTX namespace for story endpoints
-- CustomJSONEncoder: Class - JSON encoder for complex objects
 
 @usedIn
 - src.api.routes.__init__: Registers story_ns namespace
 
 @dependencies
 - External: flask_restx - REST API framework with Swagger UI
-- External: bson - ObjectId for MongoDB
 - Internal: src.processors.story_processor - StoryProcessor
 - Internal: src.core.models.story - StoryProcessorInput, StoryResponse
+- Internal: src.utils.serialization - to_jsonable
 """
 from flask import request
 from flask_restx import Namespace, Resource, fields  # type: ignore
-import json
 from typing import Any, Dict, Union, Tuple, Literal
-from bson import ObjectId  # type: ignore
-from datetime import datetime
 
 from src.core.models.story import StoryProcessorInput, StoryResponse
 from src.core.resource_tracking import ResourceCalculator
 from src.processors.story_processor import StoryProcessor
+from src.utils.async_runtime import run_async
+from src.utils.serialization import to_jsonable
 
 # Erstelle einen neuen Namespace für Story-Routen
 story_ns = Namespace('story', description='Story Generierung und Verwaltung')
 
-# Benutzerdefinierter JSONEncoder für komplexe Objekte
-class CustomJSONEncoder(json.JSONEncoder):
-    """JSONEncoder, der Objekte mit to_dict-Methode, ObjectId und datetime korrekt serialisiert."""
-    def default(self, o: Any) -> Any:
-        if isinstance(o, ObjectId):
-            return str(o)
-        if isinstance(o, datetime):
-            return o.isoformat()
-        if hasattr(o, 'to_dict') and callable(getattr(o, 'to_dict')):
-            return o.to_dict()
-        return super().default(o)
-
 # Hilfsfunktion für JSON-Serialisierung
 def jsonify(data: Any) -> Dict[str, Any]:
-    """Serialisiert komplexe Objekte in JSON-serialisierbare Dictionarys."""
-    return json.loads(json.dumps(data, cls=CustomJSONEncoder))
+    """Serialisiert komplexe Objekte (to_dict, ObjectId, datetime) in JSON-serialisierbare Dictionarys."""
+    return to_jsonable(data)
 
 # Definiere Request-Modelle für die API-Dokumentation
 story_input_model = story_ns.model('StoryInput', {  # type: ignore
@@ -121,9 +107,8 @@ class StoryGenerationEndpoint(Resource):
             resource_calculator = ResourceCalculator()
             processor = StoryProcessor(resource_calculator=resource_calculator)
             
-            # Synchron aufrufen mit asyncio.run
-            import asyncio
-            response: StoryResponse = asyncio.run(processor.process_story(input_data))
+            # Synchron auf dem Event-Loop des Request-Threads ausführen
+            response: StoryResponse = run_async(processor.process_story(input_data))
             
             # Antwort serialisieren
             return jsonify(response)
@@ -35,13 +35,13 @@ Features:
 # type: ignore
 from flask_restx import Model, Namespace, OrderedModel, Resource, fields, inputs
 from typing import Dict, Any, Union, Optional, cast
-import asyncio
 import uuid
 
 from src.processors.text2image_processor import Text2ImageProcessor
 from src.core.models.text2image import Text2ImageResponse
 from src.core.exceptions import ProcessingError
 from src.core.resource_tracking import ResourceCalculator
+from src.utils.async_runtime import run_async
 from src.utils.logger import get_logger
 from src.utils.logger import ProcessingLogger
 
@@ -215,7 +215,7 @@ class Text2ImageGenerateEndpoint(Resource):
             processor: Text2ImageProcessor = get_text2image_processor(process_id)
             
             # Verarbeite die Anfrage
-            result: Text2ImageResponse = asyncio.run(processor.process(
+            result: Text2ImageResponse = run_async(processor.process(
                 prompt=prompt,
                 size=size,
                 quality=quality,
@@ -43,6 +43,7 @@ from src.core.exceptions import ProcessingError, ValidationError
 from src.core.models.track import TrackResponse
 from src.core.resource_tracking import ResourceCalculator
 from src.processors.track_processor import TrackProcessor
+from src.utils.async_runtime import run_async
 from src.utils.logger import get_logger
 from src.utils.logger import ProcessingLogger
 
@@ -178,34 +179,12 @@ class TrackSummaryEndpoint(Resource):
             )
             
             # Track-Zusammenfassung erstellen (asynchron)
-            import asyncio
-            try:
-                # Versuche, den bestehenden Event-Loop zu verwenden
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # Wenn der Loop bereits läuft, erstelle einen neuen
-                    track_response = asyncio.run(processor.create_track_summary(
-                        track_name=track_name,
-                        template=template,
-                        target_language=target_language,
-                        use_cache=use_cache
-                    ))
-                else:
-                    # Verwende den bestehenden Loop
-                    track_response = loop.run_until_complete(processor.create_track_summary(
-                        track_name=track_name,
-                        template=template,
-                        target_language=target_language,
-                        use_cache=use_cache
-                    ))
-            except RuntimeError:
-                # Fallback, wenn kein Event-Loop verfügbar ist
-                track_response: TrackResponse = asyncio.run(processor.create_track_summary(
-                    track_name=track_name,
-                    template=template,
-                    target_language=target_language,
-                    use_cache=use_cache
-                ))
+            track_response: TrackResponse = run_async(processor.create_track_summary(
+                track_name=track_name,
+                template=template,
+                target_language=target_language,
+                use_cache=use_cache
+            ))
             
             # Response in Dictionary umwandeln
             return track_response.to_dict()
@@ -267,19 +246,7 @@ class AvailableTracksEndpoint(Resource):
             )
             
             # Verfügbare Tracks abrufen (asynchron)
-            import asyncio
-            try:
-                # Versuche, den bestehenden Event-Loop zu verwenden
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # Wenn der Loop bereits läuft, erstelle einen neuen
-                    tracks_data = asyncio.run(processor.get_available_tracks())
-                else:
-                    # Verwende den bestehenden Loop
-                    tracks_data = loop.run_until_complete(processor.get_available_tracks())
-            except RuntimeError:
-                # Fallback, wenn kein Event-Loop verfügbar ist
-                tracks_data = asyncio.run(processor.get_available_tracks())
+            tracks_data = run_async(processor.get_available_tracks())
             
             # Response erstellen
             response = {
@@ -367,34 +334,12 @@ class SummarizeAllTracksEndpoint(Resource):
             track_filter = None if track_name == '*' else track_name
             
             # Alle Tracks zusammenfassen (asynchron)
-            import asyncio
-            try:
-                # Versuche, den bestehenden Event-Loop zu verwenden
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # Wenn der Loop bereits läuft, erstelle einen neuen
-                    result = asyncio.run(processor.create_all_track_summaries(
-                        track_filter=track_filter,
-                        template=template,
-                        target_language=target_language,
-                        use_cache=use_cache
-                    ))
-                else:
-                    # Verwende den bestehenden Loop
-                    result = loop.run_until_complete(processor.create_all_track_summaries(
-                        track_filter=track_filter,
-                        template=template,
-                        target_language=target_language,
-                        use_cache=use_cache
-                    ))
-            except RuntimeError:
-                # Fallback, wenn kein Event-Loop verfügbar ist
-                result = asyncio.run(processor.create_all_track_summaries(
-                    track_filter=track_filter,
-                    template=template,
-                    target_language=target_language,
-                    use_cache=use_cache
-                ))
+            result = run_async(processor.create_all_track_summaries(
+                track_filter=track_filter,
+                template=template,
+                target_language=target_language,
+                use_cache=use_cache
+            ))
             
             return result
             
@@ -50,7 +50,6 @@ from typing import Dict, Any, Union, Optional, List
 import traceback
 import uuid
 import json
-import asyncio
 import hashlib
 
 from flask import request
@@ -63,6 +62,7 @@ from src.processors.metadata_processor import MetadataProcessor
 from src.core.exceptions import ProcessingError, FileSizeLimitExceeded, RateLimitExceeded
 from werkzeug.exceptions import RequestEntityTooLarge
 from src.core.resource_tracking import ResourceCalculator
+from src.utils.async_runtime import run_async
 from src.utils.logger import get_logger
 from src.utils.performance_tracker import get_performance_tracker
 from src.utils.logger import ProcessingLogger
@@ -2125,8 +2125,8 @@ class MetadataEndpoint(Resource):
             # MetadataProcessor verwenden
             processor = get_metadata_processor(process_id)
             
-            # Metadaten extrahieren - mit asyncio.run ausführen, da die Methode asynchron ist
-            result = asyncio.run(processor.process(
+            # Metadaten extrahieren - mit run_async ausführen, da die Methode asynchron ist
+            result = run_async(processor.process(
                 binary_data=uploaded_file,
                 content=content,
                 context=context,
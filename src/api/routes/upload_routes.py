@@ -0,0 +1,241 @@
+"""
+@fileoverview Resumable Upload API Routes - tus-style chunked uploads feeding secretary jobs
+
+@description
+Große Audio-/Video-/Dokument-Uploads in kurzen, fortsetzbaren Requests statt
+einem einzigen multipart-Request. Die Header folgen dem tus-Protokoll (Core,
+Version 1.0.0), sodass tus-Clients ohne Anpassung hochladen können; der
+Abschluss mit Job-Anlage ist ein eigener Endpunkt.
+
+Main endpoints:
+- POST /api/uploads/: Upload anlegen (Header `Upload-Length`, optional `Upload-Metadata`
+  mit `filename`/`filetype`; alternativ JSON `{length, filename, filetype}`) -> 201 + Location
+- HEAD /api/uploads/{upload_id}: Aktueller Offset (`Upload-Offset`, `Upload-Length`)
+- GET /api/uploads/{upload_id}: Zustand als JSON
+- PATCH /api/uploads/{upload_id}: Block anhängen (`Content-Type: application/offset+octet-stream`,
+  `Upload-Offset` = aktueller Offset) -> 204 + neuer `Upload-Offset`
+- POST /api/uploads/{upload_id}/complete: Upload abschließen und Secretary-Job anlegen
+  (JSON `{job_type, parameters, user_id, md5}`) -> 202 + job_id
+- DELETE /api/uploads/{upload_id}: Upload verwerfen
+
+Der Job erhält `filename` (Pfad der zusammengesetzten Datei) und `file_hash`
+(beim Hochladen berechnet); `context` wird um Dateiname, Größe und Typ ergänzt.
+
+@module api.routes.upload_routes
+
+@exports
+- upload_ns: Namespace - Flask-RESTX namespace für resumable Uploads
+
+@usedIn
+- src.api.routes.__init__: Registriert upload_ns unter /uploads
+
+@dependencies
+- External: flask_restx - REST API framework with Swagger UI
+- Internal: src.core.resumable_uploads - ResumableUploadStore
+- Internal: src.core.mongodb - SecretaryJobRepository
+- Internal: src.core.config - Erlaubte job_types
+"""
+
+import base64
+import binascii
+import os
+from typing import Any, Dict, Optional, Tuple, Union
+
+from flask import Response, request
+from flask_restx import Namespace, Resource, fields
+
+from src.core.mongodb import SecretaryJobRepository
+from src.core.resumable_uploads import (
+    ResumableUpload,
+    UploadProtocolError,
+    get_resumable_upload_store,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(process_id="upload-api")
+
+upload_ns = Namespace('uploads', description='Fortsetzbare Uploads in Blöcken (tus-kompatibel)')
+
+TUS_VERSION = "1.0.0"
+_OFFSET_CONTENT_TYPE = "application/offset+octet-stream"
+_DEFAULT_JOB_TYPES = ["audio", "video", "pdf", "office", "office_via_pdf"]
+
+create_upload_model = upload_ns.model('CreateUpload', {
+    'length': fields.Integer(required=True, description='Gesamtgröße in Bytes (alternativ Header Upload-Length)'),
+    'filename': fields.String(required=False),
+    'filetype': fields.String(required=False, description='MIME-Type laut Client'),
+})
+
+complete_upload_model = upload_ns.model('CompleteUpload', {
+    'job_type': fields.String(required=True, description='z.B. audio, video, pdf, office'),
+    'parameters': fields.Raw(required=False, description='Job-Parameter; filename/file_hash werden gesetzt'),
+    'user_id': fields.String(required=False),
+    'md5': fields.String(required=False, description='Optional: MD5 zur Prüfung der Übertragung'),
+})
+
+
+def _tus_headers(upload: Optional[ResumableUpload] = None) -> Dict[str, str]:
+    headers = {"Tus-Resumable": TUS_VERSION, "Cache-Control": "no-store"}
+    if upload is not None:
+        headers["Upload-Offset"] = str(upload.offset)
+        headers["Upload-Length"] = str(upload.length)
+    return headers
+
+
+def _error(e: UploadProtocolError) -> Tuple[Dict[str, Any], int, Dict[str, str]]:
+    headers = _tus_headers()
+    if e.offset is not None:
+        headers["Upload-Offset"] = str(e.offset)
+    body = {'status': 'error', 'error': {'code': e.code, 'message': str(e), 'details': {'offset': e.offset}}}
+    return body, e.status_code, headers
+
+
+def _parse_upload_metadata(raw: str) -> Dict[str, str]:
+    """Parst `Upload-Metadata` (tus): `key base64wert,key2 base64wert`."""
+    metadata: Dict[str, str] = {}
+    for pair in raw.split(","):
+        parts = pair.strip().split(" ", 1)
+        if not parts[0]:
+            continue
+        value = ""
+        if len(parts) == 2:
+            try:
+                value = base64.b64decode(parts[1], validate=True).decode("utf-8")
+            except (binascii.Error, UnicodeDecodeError):
+                raise UploadProtocolError(400, "INVALID_METADATA", f"Upload-Metadata '{parts[0]}' ist kein gültiges Base64")
+        metadata[parts[0]] = value
+    return metadata
+
+
+def _int_header(name: str) -> Optional[int]:
+    raw = request.headers.get(name)
+    if raw is None or raw == "":
+        return None
+    try:
+        value = int(raw)
+    except ValueError:
+        value = -1
+    if value < 0:
+        raise UploadProtocolError(400, f"INVALID_{name.upper().replace('-', '_')}", f"{name} muss eine Zahl >= 0 sein")
+    return value
+
+
+def _allowed_job_types() -> set[str]:
+    # Verzögerter Import, um zirkuläre Importe zu vermeiden
+    from src.core.config import Config
+    from src.core.processing import available_job_types
+    configured = Config().get("resumable_uploads.job_types", _DEFAULT_JOB_TYPES) or _DEFAULT_JOB_TYPES
+    return set(configured) & set(available_job_types().keys())
+
+
+def _enqueue_job(upload: ResumableUpload, data: Dict[str, Any]) -> str:
+    """Legt den Secretary-Job für die zusammengesetzte Datei an."""
+    params: Dict[str, Any] = dict(data.get('parameters') or {})
+    params["filename"] = upload.path
+    params["file_hash"] = upload.md5
+    context: Dict[str, Any] = dict(params.get("context") or {})
+    context.setdefault("original_filename", upload.filename)
+    context.setdefault("file_size_bytes", upload.length)
+    context.setdefault("file_type", upload.declared_mime_type or upload.mime_type)
+    context.setdefault("file_ext", os.path.splitext(upload.filename)[1].lstrip(".").lower())
+    params["context"] = context
+    repo = SecretaryJobRepository()
+    return repo.create_job(
+        {"job_type": str(data.get('job_type')), "parameters": params},
+        user_id=data.get('user_id'),
+    )
+
+
+@upload_ns.route('/')
+class UploadCreateEndpoint(Resource):
+    @upload_ns.expect(create_upload_model)
+    @upload_ns.doc(description='Legt einen fortsetzbaren Upload an (tus: Creation)')
+    def post(self) -> Union[Tuple[Dict[str, Any], int], Tuple[Dict[str, Any], int, Dict[str, str]]]:
+        try:
+            body: Dict[str, Any] = request.get_json(silent=True) or {}
+            metadata = _parse_upload_metadata(request.headers.get("Upload-Metadata", ""))
+            length = _int_header("Upload-Length")
+            if length is None:
+                try:
+                    length = int(body.get('length') or 0)
+                except (TypeError, ValueError):
+                    length = 0
+            filename = str(body.get('filename') or metadata.get("filename") or metadata.get("name") or "")
+            filetype = body.get('filetype') or metadata.get("filetype") or metadata.get("type")
+            upload = get_resumable_upload_store().create(length, filename, filetype, metadata)
+        except UploadProtocolError as e:
+            return _error(e)
+        headers = _tus_headers(upload)
+        headers["Location"] = f"{request.base_url.rstrip('/')}/{upload.upload_id}"
+        logger.info("Upload angelegt", upload_id=upload.upload_id, length=upload.length, filename=upload.filename)
+        return {'status': 'success', 'data': upload.to_dict()}, 201, headers
+
+
+@upload_ns.route('/<string:upload_id>')
+class UploadEndpoint(Resource):
+    @upload_ns.doc(description='Aktueller Offset eines Uploads (tus: HEAD)')
+    def head(self, upload_id: str) -> Any:
+        try:
+            upload = get_resumable_upload_store().get(upload_id)
+        except UploadProtocolError as e:
+            return Response(status=e.status_code, headers=_tus_headers())
+        return Response(status=200, headers=_tus_headers(upload))
+
+    @upload_ns.doc(description='Zustand eines Uploads')
+    def get(self, upload_id: str) -> Union[Tuple[Dict[str, Any], int], Tuple[Dict[str, Any], int, Dict[str, str]]]:
+        try:
+            upload = get_resumable_upload_store().get(upload_id)
+        except UploadProtocolError as e:
+            return _error(e)
+        return {'status': 'success', 'data': upload.to_dict()}, 200, _tus_headers(upload)
+
+    @upload_ns.doc(description='Hängt einen Block ab Upload-Offset an (tus: PATCH)')
+    def patch(self, upload_id: str) -> Any:
+        try:
+            if (request.mimetype or "") != _OFFSET_CONTENT_TYPE:
+                raise UploadProtocolError(415, "UNSUPPORTED_MEDIA_TYPE", f"Content-Type muss {_OFFSET_CONTENT_TYPE} sein")
+            offset = _int_header("Upload-Offset")
+            if offset is None:
+                raise UploadProtocolError(400, "MISSING_UPLOAD_OFFSET", "Header Upload-Offset fehlt")
+            upload = get_resumable_upload_store().append(upload_id, offset, request.stream)
+        except UploadProtocolError as e:
+            return _error(e)
+        return Response(status=204, headers=_tus_headers(upload))
+
+    @upload_ns.doc(description='Verwirft einen Upload (tus: Termination)')
+    def delete(self, upload_id: str) -> Any:
+        try:
+            get_resumable_upload_store().terminate(upload_id)
+        except UploadProtocolError as e:
+            return _error(e)
+        return Response(status=204, headers=_tus_headers())
+
+
+@upload_ns.route('/<string:upload_id>/complete')
+class UploadCompleteEndpoint(Resource):
+    @upload_ns.expect(complete_upload_model)
+    @upload_ns.doc(description='Schließt den Upload ab und legt den Secretary-Job an')
+    def post(self, upload_id: str) -> Union[Tuple[Dict[str, Any], int], Tuple[Dict[str, Any], int, Dict[str, str]]]:
+        data: Dict[str, Any] = request.get_json(silent=True) or {}
+        job_type = str(data.get('job_type') or '')
+        allowed = _allowed_job_types()
+        if job_type not in allowed:
+            return {
+                'status': 'error',
+                'error': {'code': 'INVALID_JOB_TYPE', 'message': f"job_type muss einer von {sorted(allowed)} sein"},
+            }, 400
+        store = get_resumable_upload_store()
+        try:
+            def _create_job(done: ResumableUpload) -> str:
+                job_id = _enqueue_job(done, data)
+                logger.info("Upload abgeschlossen, Job angelegt", upload_id=upload_id, job_id=job_id, job_type=job_type, size=done.length)
+                return job_id
+
+            # Job unter dem Lock des Uploads anlegen: parallele Abschluss-Aufrufe erzeugen keinen zweiten Job
+            upload = store.complete(upload_id, expected_md5=data.get('md5'), create_job=_create_job)
+        except UploadProtocolError as e:
+            return _error(e)
+        return {
+            'status': 'accepted',
+            'data': {'job_id': upload.job_id, 'upload': upload.to_dict()},
+        }, 202, _tus_headers(upload)
@@ -46,7 +46,6 @@ from flask import request
 from flask_restx import Model, Namespace, OrderedModel, Resource, fields
 from typing import Dict, Any, Union, Optional
 import traceback
-import asyncio
 import uuid
 from werkzeug.datastructures import FileStorage
 import time
@@ -54,13 +53,14 @@ from datetime import datetime
 import os
 from pathlib import Path
 
-from src.processors.video_processor import VideoProcessor
+from src.processors.video_processor import FRAME_MODES, VideoProcessor
 from src.processors.youtube_processor import YoutubeProcessor
 from src.core.models.video import VideoSource, VideoResponse, VideoFramesResponse
 from src.core.models.youtube import YoutubeResponse
 from src.core.exceptions import ProcessingError
 from src.core.resource_tracking import ResourceCalculator
 from src.core.mongodb.secretary_repository import SecretaryJobRepository
+from src.utils.async_runtime import run_async
 from src.utils.logger import get_logger
 from src.utils.performance_tracker import get_performance_tracker, PerformanceTracker
 
@@ -96,6 +96,9 @@ frames_form_parser.add_argument('width', location='form', type=int, required=Fal
 frames_form_parser.add_argument('height', location='form', type=int, required=False, help='Zielhöhe der Bilder (optional)')
 frames_form_parser.add_argument('format', location='form', type=str, default='jpg', required=False, help='Bildformat (jpg/png)')
 frames_form_parser.add_argument('useCache', location='form', type=str, default='true', required=False, help='Cache verwenden (true/false)')
+frames_form_parser.add_argument('mode', location='form', type=str, default='interval', choices=FRAME_MODES, required=False, help="Frame-Auswahl: 'interval' (festes Intervall) oder 'keyframes' (Szenenwechsel + Duplikat-Filter)")
+frames_form_parser.add_argument('scene_threshold', location='form', type=float, required=False, help='Keyframe-Modus: Szenenwechsel-Schwelle (0-1, Default aus Konfiguration)')
+frames_form_parser.add_argument('hash_distance', location='form', type=int, required=False, help='Keyframe-Modus: maximale dHash-Hamming-Distanz für Duplikate (Default aus Konfiguration)')
 
 # Parser für JSON-Anfragen
 video_json_parser = video_ns.parser()
@@ -114,6 +117,9 @@ frames_json_parser.add_argument('width', location='json', type=int, required=Fal
 frames_json_parser.add_argument('height', location='json', type=int, required=False, help='Zielhöhe der Bilder (optional)')
 frames_json_parser.add_argument('format', location='json', type=str, default='jpg', required=False, help='Bildformat (jpg/png)')
 frames_json_parser.add_argument('useCache', location='json', type=bool, default=True, required=False, help='Cache verwenden (default: True)')
+frames_json_parser.add_argument('mode', location='json', type=str, default='interval', choices=FRAME_MODES, required=False, help="Frame-Auswahl: 'interval' (festes Intervall) oder 'keyframes' (Szenenwechsel + Duplikat-Filter)")
+frames_json_parser.add_argument('scene_threshold', location='json', type=float, required=False, help='Keyframe-Modus: Szenenwechsel-Schwelle (0-1, Default aus Konfiguration)')
+frames_json_parser.add_argument('hash_distance', location='json', type=int, required=False, help='Keyframe-Modus: maximale dHash-Hamming-Distanz für Duplikate (Default aus Konfiguration)')
 
 # Parser für YouTube-Anfragen
 youtube_parser = video_ns.parser()
@@ -309,7 +315,10 @@ async def process_video_frames(source: VideoSource, binary_data: Optional[bytes]
                                height: Optional[int] = None,
                                image_format: str = 'jpg',
                                use_cache: bool = True,
-                               process_id: Optional[str] = None) -> VideoFramesResponse:
+                               process_id: Optional[str] = None,
+                               mode: str = 'interval',
+                               scene_threshold: Optional[float] = None,
+                               hash_distance: Optional[int] = None) -> VideoFramesResponse:
     if not process_id:
         process_id = str(uuid.uuid4())
     processor: VideoProcessor = get_video_processor(process_id)
@@ -321,7 +330,10 @@ async def process_video_frames(source: VideoSource, binary_data: Optional[bytes]
         height=height,
         image_format=image_format,
         use_cache=use_cache,
-        binary_data=binary_data
+        binary_data=binary_data,
+        mode=mode,
+        scene_threshold=scene_threshold,
+        hash_distance=hash_distance
     )
     return result
 
@@ -410,7 +422,7 @@ class YoutubeEndpoint(Resource):
                 return ack, 202
             
             # Sync: Verarbeite YouTube-Video mit der Hilfsfunktion
-            result = asyncio.run(process_youtube(
+            result = run_async(process_youtube(
                 url=url,
                 source_language=source_language,
                 target_language=target_language,
@@ -604,7 +616,7 @@ class VideoProcessEndpoint(Resource):
                 return ack, 202
 
             # Sync: Verarbeite Video mit Hilfsfunktion
-            result: VideoResponse = asyncio.run(process_video(
+            result: VideoResponse = run_async(process_video(
                 source=source,
                 binary_data=binary_data,  # Übergebe die Binärdaten separat
                 source_language=source_language,
@@ -648,7 +660,7 @@ class VideoProcessEndpoint(Resource):
 # Video-Frames Endpunkt
 @video_ns.route('/frames')
 class VideoFramesEndpoint(Resource):
-    @video_ns.doc(id='extract_video_frames', description='Extrahiert Frames aus einem Video in festem Intervall und speichert sie lokal.')
+    @video_ns.doc(id='extract_video_frames', description='Extrahiert Frames aus einem Video in festem Intervall oder als Keyframes (Szenenwechsel, Duplikate per Perceptual Hash entfernt) und speichert sie lokal.')
     @video_ns.response(200, 'Erfolg')
     @video_ns.response(400, 'Validierungsfehler', error_model)
     @video_ns.expect(frames_form_parser)
@@ -661,6 +673,9 @@ class VideoFramesEndpoint(Resource):
             height: Optional[int] = None
             image_format: str = 'jpg'
             use_cache: bool = True
+            mode: str = 'interval'
+            scene_threshold: Optional[float] = None
+            hash_distance: Optional[int] = None
             process_id = str(uuid.uuid4())
 
             # Datei-Upload?
@@ -680,6 +695,9 @@ class VideoFramesEndpoint(Resource):
                 height = int(request.form['height']) if 'height' in request.form and request.form['height'] else None
                 image_format = request.form.get('format', 'jpg')
                 use_cache = (request.form.get('useCache', 'true').lower() == 'true')
+                mode = request.form.get('mode', 'interval')
+                scene_threshold = float(request.form['scene_threshold']) if request.form.get('scene_threshold') else None
+                hash_distance = int(request.form['hash_distance']) if request.form.get('hash_distance') else None
             elif request.form and 'url' in request.form and request.form['url']:
                 # URL per form-data
                 url = request.form.get('url')
@@ -689,6 +707,9 @@ class VideoFramesEndpoint(Resource):
                 height = int(request.form['height']) if 'height' in request.form and request.form['height'] else None
                 image_format = request.form.get('format', 'jpg')
                 use_cache = (request.form.get('useCache', 'true').lower() == 'true')
+                mode = request.form.get('mode', 'interval')
+                scene_threshold = float(request.form['scene_threshold']) if request.form.get('scene_threshold') else None
+                hash_distance = int(request.form['hash_distance']) if request.form.get('hash_distance') else None
             else:
                 # JSON Request
                 data = request.get_json() or {}
@@ -702,11 +723,19 @@ class VideoFramesEndpoint(Resource):
                 height = int(data['height']) if 'height' in data and data['height'] is not None else None
                 image_format = data.get('format', 'jpg')
                 use_cache = bool(data.get('useCache', True))
+                mode = str(data.get('mode', 'interval'))
+                scene_threshold = float(data['scene_threshold']) if data.get('scene_threshold') is not None else None
+                hash_distance = int(data['hash_distance']) if data.get('hash_distance') is not None else None
 
             if not source:
                 raise ProcessingError("Keine gültige Video-Quelle gefunden")
+            if mode not in FRAME_MODES:
+                raise ProcessingError(
+                    f"Ungültiger Modus '{mode}'. Erlaubt: {', '.join(FRAME_MODES)}",
+                    details={'error_type': 'INVALID_MODE', 'allowed': list(FRAME_MODES)}
+                )
 
-            result: VideoFramesResponse = asyncio.run(process_video_frames(
+            result: VideoFramesResponse = run_async(process_video_frames(
                 source=source,
                 binary_data=binary_data,
                 interval_seconds=interval_seconds,
@@ -714,7 +743,10 @@ class VideoFramesEndpoint(Resource):
                 height=height,
                 image_format=image_format,
                 use_cache=use_cache,
-                process_id=process_id
+                process_id=process_id,
+                mode=mode,
+                scene_threshold=scene_threshold,
+                hash_distance=hash_distance
             ))
 
             return result.to_dict()
@@ -7,6 +7,10 @@ Job-Updates in Echtzeit zu empfangen, ohne dass der Client per Webhook erreichba
 sein muss. Der Client oeffnet eine langlebige HTTP-Verbindung, der Server pusht
 Events bei Statusaenderungen.
 
+Updates kommen aus dem prozessweiten JobEventHub (eine gebuendelte,
+projizierte Abfrage fuer alle Clients, geweckt durch Schreibpfade und Change
+Stream). Events tragen eine `id`; Reconnects setzen per `Last-Event-ID` fort.
+
 Das SSE-Event-Format orientiert sich am bestehenden Webhook-Payload-Schema,
 damit Clients ein einheitliches Datenformat verarbeiten koennen.
 
@@ -14,58 +18,61 @@ damit Clients ein einheitliches Datenformat verarbeiten koennen.
 
 @exports
 - format_sse: Formatiert ein SSE-Event als String
-- job_event_stream: Generator fuer Job-Updates via MongoDB-Polling
+- job_event_stream: Generator fuer Job-Updates aus dem gemeinsamen JobEventHub
 
 @usedIn
 - src.api.routes.secretary_job_routes: SSE-Stream-Endpoint
 
 @dependencies
-- Internal: src.core.mongodb - SecretaryJobRepository
+- Internal: src.core.mongodb.job_event_hub - JobEventHub
 - Internal: src.core.models.job_models - Job, JobStatus
+- Internal: src.utils.serialization - dumps_str (orjson)
 """
-import json
 import time
 import logging
 from typing import Any, Dict, Generator, Optional
-from datetime import datetime
 
-from src.core.mongodb import SecretaryJobRepository
+from src.core.mongodb.job_event_hub import event_id_for, get_job_event_hub
 from src.core.models.job_models import Job, JobStatus
+from src.utils.serialization import dumps_str
 
 logger = logging.getLogger(__name__)
 
 # Maximale Wartezeit bevor der Stream geschlossen wird (5 Minuten)
 MAX_STREAM_DURATION_SEC = 300
 
-# Polling-Intervall fuer MongoDB-Abfragen (Sekunden)
-POLL_INTERVAL_SEC = 2
+# Reconnect-Wartezeit fuer EventSource-Clients (Millisekunden)
+RETRY_MS = 3000
 
 # Heartbeat-Intervall um die Verbindung offen zu halten (Sekunden)
 HEARTBEAT_INTERVAL_SEC = 15
 
 
-class DateTimeEncoder(json.JSONEncoder):
-    """JSON-Encoder fuer datetime-Objekte."""
-    def default(self, o: Any) -> Any:
-        if isinstance(o, datetime):
-            return o.isoformat()
-        return super().default(o)
-
-
-def format_sse(data: Dict[str, Any], event: Optional[str] = None) -> str:
+def format_sse(
+    data: Dict[str, Any],
+    event: Optional[str] = None,
+    event_id: Optional[str] = None,
+    retry_ms: Optional[int] = None,
+) -> str:
     """Formatiert ein SSE-Event als String gemaess SSE-Spezifikation.
 
     Args:
         data: Payload als Dictionary (wird zu JSON serialisiert)
         event: Optionaler Event-Typ (z.B. 'progress', 'completed', 'error')
+        event_id: Optionale Event-ID (kommt beim Reconnect als Last-Event-ID zurueck)
+        retry_ms: Optionale Reconnect-Wartezeit fuer den Client
 
     Returns:
         SSE-formatierter String mit abschliessendem Doppel-Newline
     """
     lines: list[str] = []
+    if retry_ms is not None:
+        lines.append(f"retry: {retry_ms}")
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
     if event:
         lines.append(f"event: {event}")
-    json_str = json.dumps(data, cls=DateTimeEncoder, ensure_ascii=False)
+    json_str = dumps_str(data)
     lines.append(f"data: {json_str}")
     lines.append("")  # Leerzeile als Event-Trenner
     lines.append("")
@@ -218,89 +225,95 @@ def event_type_for_status(status: JobStatus) -> str:
     return mapping.get(status, "progress")
 
 
-def job_event_stream(job_id: str) -> Generator[str, None, None]:
+def _parse_event_id(value: Optional[str]) -> Optional[int]:
+    """Liest eine Last-Event-ID (updated_at in ms); ungueltige Werte werden ignoriert."""
+    if not value:
+        return None
+    try:
+        return int(value.strip())
+    except ValueError:
+        return None
+
+
+def job_event_stream(job_id: str, last_event_id: Optional[str] = None) -> Generator[str, None, None]:
     """Generator fuer SSE-Events eines Jobs.
 
-    Pollt MongoDB in regelmaessigen Intervallen und sendet Events
-    bei Statusaenderungen. Schliesst den Stream wenn der Job
-    abgeschlossen oder fehlgeschlagen ist, oder nach MAX_STREAM_DURATION_SEC.
+    Abonniert den prozessweiten JobEventHub: Alle Clients eines Jobs teilen
+    sich eine gebuendelte, projizierte Abfrage statt eigener Polls. Jedes
+    Event traegt als `id` den Zeitstempel des Job-Zustands; ein Reconnect mit
+    `Last-Event-ID` erhaelt nur neuere Zustaende (zwischenzeitliche
+    Fortschrittsstaende sind im aktuellen Zustand zusammengefasst).
+
+    Schliesst den Stream bei Endstatus oder nach MAX_STREAM_DURATION_SEC;
+    der Client verbindet sich dann (per `retry`) mit Last-Event-ID neu.
 
     Args:
         job_id: Die Job-ID fuer die Updates gestreamt werden sollen
+        last_event_id: Wert des Last-Event-ID-Headers bei einem Reconnect
 
     Yields:
         SSE-formatierte Strings
     """
-    repo = SecretaryJobRepository()
+    hub = get_job_event_hub()
+    resume_after = _parse_event_id(last_event_id)
     start_time = time.monotonic()
-    last_status: Optional[str] = None
-    last_progress_percent: Optional[int] = None
-    last_heartbeat = time.monotonic()
-
-    logger.info(f"SSE-Stream gestartet fuer Job {job_id}")
-
-    # Initialen Job-Status senden
-    job = repo.get_job(job_id)
-    if not job:
-        yield format_sse(
-            {"phase": "error", "message": "Job nicht gefunden", "job": {"id": job_id}},
-            event="error"
-        )
-        return
-
-    # Initialen Status senden
-    event_data = build_event_from_job(job)
-    event_type = event_type_for_status(job.status)
-    yield format_sse(event_data, event=event_type)
-    last_status = job.status.value
-    last_progress_percent = job.progress.percent if job.progress else None
-
-    # Sofort beenden wenn Job bereits fertig ist
-    if job.status in (JobStatus.COMPLETED, JobStatus.FAILED):
-        logger.info(f"SSE-Stream fuer Job {job_id}: Job bereits {job.status.value}")
-        return
-
-    # Polling-Loop
-    while True:
-        elapsed = time.monotonic() - start_time
-        if elapsed > MAX_STREAM_DURATION_SEC:
-            yield format_sse(
-                {"phase": "timeout", "message": f"Stream-Timeout nach {MAX_STREAM_DURATION_SEC}s", "job": {"id": job_id}},
-                event="timeout"
-            )
-            logger.warning(f"SSE-Stream Timeout fuer Job {job_id} nach {MAX_STREAM_DURATION_SEC}s")
-            break
-
-        time.sleep(POLL_INTERVAL_SEC)
-
-        # Heartbeat senden um Proxy-Timeouts zu vermeiden
-        now = time.monotonic()
-        if now - last_heartbeat >= HEARTBEAT_INTERVAL_SEC:
-            yield ": heartbeat\n\n"
-            last_heartbeat = now
-
-        job = repo.get_job(job_id)
+    sub = hub.subscribe(job_id)
+    logger.info(f"SSE-Stream gestartet fuer Job {job_id}" + (f" (Resume nach {resume_after})" if resume_after else ""))
+    try:
+        job = hub.current(job_id)
         if not job:
             yield format_sse(
-                {"phase": "error", "message": "Job nicht mehr gefunden", "job": {"id": job_id}},
+                {"phase": "error", "message": "Job nicht gefunden", "job": {"id": job_id}},
                 event="error"
             )
-            break
-
-        current_status = job.status.value
-        current_progress = job.progress.percent if job.progress else None
+            return
 
-        # Nur senden wenn sich etwas geaendert hat
-        if current_status != last_status or current_progress != last_progress_percent:
-            event_data = build_event_from_job(job)
-            event_type = event_type_for_status(job.status)
-            yield format_sse(event_data, event=event_type)
-            last_status = current_status
-            last_progress_percent = current_progress
+        last_sent: Optional[Job] = None
+        if resume_after is None or int(event_id_for(job)) > resume_after:
+            yield format_sse(
+                build_event_from_job(job), event=event_type_for_status(job.status),
+                event_id=event_id_for(job), retry_ms=RETRY_MS,
+            )
+            last_sent = job
+        else:
+            yield f"retry: {RETRY_MS}\n\n"
 
-        # Stream beenden wenn Job abgeschlossen
         if job.status in (JobStatus.COMPLETED, JobStatus.FAILED):
-            logger.info(f"SSE-Stream fuer Job {job_id} beendet: {job.status.value}")
-            break
-
-    logger.info(f"SSE-Stream fuer Job {job_id} geschlossen nach {time.monotonic() - start_time:.1f}s")
+            logger.info(f"SSE-Stream fuer Job {job_id}: Job bereits {job.status.value}")
+            return
+
+        while True:
+            remaining = MAX_STREAM_DURATION_SEC - (time.monotonic() - start_time)
+            if remaining <= 0:
+                yield format_sse(
+                    {"phase": "timeout", "message": f"Stream-Timeout nach {MAX_STREAM_DURATION_SEC}s", "job": {"id": job_id}},
+                    event="timeout"
+                )
+                logger.info(f"SSE-Stream Timeout fuer Job {job_id} nach {MAX_STREAM_DURATION_SEC}s")
+                break
+
+            update = sub.next(min(HEARTBEAT_INTERVAL_SEC, remaining))
+            if sub.missing:
+                yield format_sse(
+                    {"phase": "error", "message": "Job nicht mehr gefunden", "job": {"id": job_id}},
+                    event="error"
+                )
+                break
+            if update is None:
+                # Heartbeat senden um Proxy-Timeouts zu vermeiden
+                yield ": heartbeat\n\n"
+                continue
+
+            # Nur senden wenn sich etwas geaendert hat
+            if last_sent is not None and update.status == last_sent.status and update.progress == last_sent.progress:
+                continue
+            yield format_sse(build_event_from_job(update), event=event_type_for_status(update.status), event_id=event_id_for(update))
+            last_sent = update
+
+            # Stream beenden wenn Job abgeschlossen
+            if update.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+                logger.info(f"SSE-Stream fuer Job {job_id} beendet: {update.status.value}")
+                break
+    finally:
+        hub.unsubscribe(sub)
+        logger.info(f"SSE-Stream fuer Job {job_id} geschlossen nach {time.monotonic() - start_time:.1f}s")
@@ -0,0 +1,288 @@
+"""
+@fileoverview Admission Control - Per-endpoint concurrency and queue-depth limits
+
+@description
+Schützt den Server bei Überlast. Für konfigurierte Endpunkte gilt:
+
+- `max_concurrent`: Anzahl gleichzeitig laufender Requests.
+- `max_queue` / `queue_timeout_sec`: Darüber hinaus warten höchstens
+  `max_queue` Requests bis zu `queue_timeout_sec` auf einen freien Slot.
+  Ist auch die Warteschlange voll, wird sofort mit 429 abgewiesen; läuft die
+  Wartezeit ab, mit 503.
+- `max_pending_jobs`: Obergrenze der Secretary-Job-Warteschlange (Status
+  PENDING, alle Knoten). Darüber wird mit 503 abgewiesen.
+- `auto_queue`: Statt abzuweisen wird der Request als "zurückgestellt"
+  zugelassen; die Route legt dann einen Job an und antwortet mit 202,
+  statt synchron zu verarbeiten bzw. auf den Job zu warten.
+
+`Retry-After` wird aus dem aktuellen Durchsatz berechnet: abgeschlossene
+Requests des Endpunkts bzw. abgeschlossene Jobs im Fenster `window_sec`.
+
+@module core.admission_control
+
+@exports
+- EndpointLimit: Dataclass - Limits eines Endpunkts
+- AdmissionRejected: Exception - Abweisung mit HTTP-Status und Retry-After
+- Admission: Dataclass - Zugelassener Request (Slot oder zurückgestellt)
+- AdmissionController: Class - Vergibt Slots und prüft die Job-Warteschlange
+- load_admission_controller(): Optional[AdmissionController] - Aus Konfiguration `admission_control`
+
+@usedIn
+- src.api.admission: Flask-Middleware für den API-Blueprint
+
+@dependencies
+- Standard: threading, collections.deque - Slots und Durchsatzfenster
+- Internal: src.core.config - Config
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+# (pending_jobs, finished_jobs_im_fenster)
+JobQueueStatsFn = Callable[[float], Tuple[int, int]]
+
+
+@dataclass
+class EndpointLimit:
+    """Limits eines Endpunkts (Pfad-Präfix unterhalb von /api)."""
+    name: str
+    path: str
+    max_concurrent: int = 0
+    max_queue: int = 0
+    queue_timeout_sec: float = 0.0
+    max_pending_jobs: int = 0
+    auto_queue: bool = False
+
+
+class AdmissionRejected(Exception):
+    """Request wird abgewiesen (429 oder 503)."""
+
+    def __init__(self, status_code: int, code: str, message: str, retry_after: int) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.code = code
+        self.retry_after = retry_after
+
+
+@dataclass
+class Admission:
+    """Zugelassener Request; `deferred` bedeutet: als Job einreihen statt synchron arbeiten."""
+    limit: EndpointLimit
+    started: float
+    deferred: bool = False
+    holds_slot: bool = True
+
+
+class _EndpointState:
+    def __init__(self) -> None:
+        self.running = 0
+        self.waiting = 0
+        self.cond = threading.Condition()
+        # (Ende, Dauer) abgeschlossener Requests im Fenster
+        self.finished: Deque[Tuple[float, float]] = deque()
+
+
+class AdmissionController:
+    """Vergibt Slots pro Endpunkt und prüft die Tiefe der Job-Warteschlange."""
+
+    def __init__(
+        self,
+        limits: List[EndpointLimit],
+        window_sec: float = 60.0,
+        default_retry_after_sec: int = 5,
+        max_retry_after_sec: int = 300,
+        job_queue_stats: Optional[JobQueueStatsFn] = None,
+        stats_ttl_sec: float = 5.0,
+    ) -> None:
+        # Längster Präfix gewinnt (z.B. /pdf/process-mistral-ocr vor /pdf/process)
+        self.limits = sorted(limits, key=lambda lim: len(lim.path), reverse=True)
+        self.window_sec = window_sec
+        self.default_retry_after_sec = default_retry_after_sec
+        self.max_retry_after_sec = max_retry_after_sec
+        self._job_queue_stats = job_queue_stats
+        self._stats_ttl_sec = stats_ttl_sec
+        self._stats_cache: Optional[Tuple[float, int, int]] = None
+        self._stats_lock = threading.Lock()
+        self._states: Dict[str, _EndpointState] = {lim.name: _EndpointState() for lim in limits}
+
+    def limit_for(self, path: str) -> Optional[EndpointLimit]:
+        """Sucht die Limits zu einem Pfad (ohne /api-Präfix)."""
+        for lim in self.limits:
+            if path == lim.path or path.startswith(lim.path.rstrip("/") + "/"):
+                return lim
+        return None
+
+    def _clamp(self, seconds: float) -> int:
+        return int(max(1, min(self.max_retry_after_sec, math.ceil(seconds))))
+
+    def _prune(self, state: _EndpointState, now: float) -> None:
+        while state.finished and state.finished[0][0] < now - self.window_sec:
+            state.finished.popleft()
+
+    def retry_after(self, name: str) -> int:
+        """Geschätzte Sekunden bis ein Slot frei wird (aus dem Durchsatz im Fenster)."""
+        state = self._states[name]
+        with state.cond:
+            now = time.monotonic()
+            self._prune(state, now)
+            ahead = state.waiting + 1
+            if state.finished:
+                window = max(1.0, now - state.finished[0][0])
+                rate = len(state.finished) / window
+                return self._clamp(ahead / rate)
+        return self._clamp(self.default_retry_after_sec)
+
+    def acquire(self, limit: EndpointLimit) -> Admission:
+        """
+        Lässt einen Request zu.
+
+        Raises:
+            AdmissionRejected: 429 (Warteschlange voll), 503 (Wartezeit abgelaufen
+                oder Job-Warteschlange zu tief)
+        """
+        self.check_job_queue(limit)
+        now = time.monotonic()
+        if limit.max_concurrent <= 0:
+            return Admission(limit=limit, started=now, holds_slot=False)
+        state = self._states[limit.name]
+        with state.cond:
+            if state.running < limit.max_concurrent:
+                state.running += 1
+                return Admission(limit=limit, started=now)
+            if limit.auto_queue:
+                # Route reiht als Job ein; belegt keinen Slot
+                return Admission(limit=limit, started=now, deferred=True, holds_slot=False)
+            if state.waiting >= limit.max_queue or limit.queue_timeout_sec <= 0:
+                full = True
+            else:
+                full = False
+                state.waiting += 1
+                deadline = now + limit.queue_timeout_sec
+                try:
+                    while state.running >= limit.max_concurrent:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        state.cond.wait(remaining)
+                    if state.running < limit.max_concurrent:
+                        state.running += 1
+                        return Admission(limit=limit, started=time.monotonic())
+                finally:
+                    state.waiting -= 1
+        retry = self.retry_after(limit.name)
+        if full:
+            raise AdmissionRejected(429, "TOO_MANY_REQUESTS", f"Endpunkt {limit.name} ist ausgelastet", retry)
+        raise AdmissionRejected(503, "SERVICE_BUSY", f"Kein freier Slot für {limit.name} innerhalb von {limit.queue_timeout_sec}s", retry)
+
+    def release(self, admission: Admission) -> None:
+        """Gibt den Slot frei und verbucht die Dauer für den Durchsatz."""
+        if not admission.holds_slot:
+            return
+        state = self._states[admission.limit.name]
+        now = time.monotonic()
+        with state.cond:
+            state.running = max(0, state.running - 1)
+            state.finished.append((now, now - admission.started))
+            self._prune(state, now)
+            state.cond.notify()
+
+    def _job_stats(self) -> Optional[Tuple[int, int]]:
+        if self._job_queue_stats is None:
+            return None
+        now = time.monotonic()
+        with self._stats_lock:
+            if self._stats_cache is None or now - self._stats_cache[0] > self._stats_ttl_sec:
+                pending, finished = self._job_queue_stats(self.window_sec)
+                self._stats_cache = (now, pending, finished)
+            return self._stats_cache[1], self._stats_cache[2]
+
+    def check_job_queue(self, limit: EndpointLimit) -> None:
+        """
+        Raises:
+            AdmissionRejected: 503, wenn mehr als `max_pending_jobs` Jobs warten
+        """
+        if limit.max_pending_jobs <= 0:
+            return
+        stats = self._job_stats()
+        if stats is None:
+            return
+        pending, finished = stats
+        if pending < limit.max_pending_jobs:
+            return
+        excess = pending - limit.max_pending_jobs + 1
+        retry = excess / (finished / self.window_sec) if finished else self.default_retry_after_sec
+        raise AdmissionRejected(
+            503,
+            "JOB_QUEUE_FULL",
+            f"Job-Warteschlange ist voll ({pending} wartende Jobs)",
+            self._clamp(retry),
+        )
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Aktuelle Belegung pro Endpunkt (Diagnose)."""
+        result: Dict[str, Dict[str, Any]] = {}
+        for lim in self.limits:
+            state = self._states[lim.name]
+            with state.cond:
+                result[lim.name] = {
+                    "running": state.running,
+                    "waiting": state.waiting,
+                    "max_concurrent": lim.max_concurrent,
+                    "max_queue": lim.max_queue,
+                }
+        return result
+
+
+def _default_job_queue_stats() -> JobQueueStatsFn:
+    repo: List[Any] = []
+
+    def _stats(window_sec: float) -> Tuple[int, int]:
+        if not repo:
+            # Verzögerter Import, um zirkuläre Importe zu vermeiden
+            from src.core.mongodb.secretary_repository import SecretaryJobRepository
+            repo.append(SecretaryJobRepository())
+        stats: Tuple[int, int] = repo[0].get_admission_stats(window_sec)
+        return stats
+
+    return _stats
+
+
+def load_admission_controller() -> Optional[AdmissionController]:
+    """
+    Erstellt den AdmissionController aus der Konfiguration `admission_control`.
+
+    Returns:
+        Optional[AdmissionController]: None, wenn deaktiviert oder keine Endpunkte konfiguriert
+    """
+    from src.core.config import Config
+    cfg: Dict[str, Any] = Config().get("admission_control", {}) or {}
+    if not cfg.get("enabled", False):
+        return None
+    limits: List[EndpointLimit] = []
+    for name, raw in (cfg.get("endpoints") or {}).items():
+        entry: Dict[str, Any] = raw or {}
+        limits.append(
+            EndpointLimit(
+                name=str(name),
+                path=str(entry.get("path", name)),
+                max_concurrent=int(entry.get("max_concurrent", 0)),
+                max_queue=int(entry.get("max_queue", 0)),
+                queue_timeout_sec=float(entry.get("queue_timeout_sec", 0)),
+                max_pending_jobs=int(entry.get("max_pending_jobs", 0)),
+                auto_queue=bool(entry.get("auto_queue", False)),
+            )
+        )
+    if not limits:
+        return None
+    return AdmissionController(
+        limits,
+        window_sec=float(cfg.get("window_sec", 60)),
+        default_retry_after_sec=int(cfg.get("default_retry_after_sec", 5)),
+        max_retry_after_sec=int(cfg.get("max_retry_after_sec", 300)),
+        job_queue_stats=_default_job_queue_stats(),
+        stats_ttl_sec=float(cfg.get("stats_ttl_sec", 5)),
+    )
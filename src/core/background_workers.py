@@ -0,0 +1,147 @@
+"""
+@fileoverview Background Workers - Start and graceful shutdown of the job worker managers
+
+@description
+Gemeinsamer Lebenszyklus der Hintergrund-Worker (SessionWorkerManager und
+SecretaryWorkerManager) für alle Startarten: Flask-Entwicklungsserver,
+gunicorn (`src.gunicorn_conf`) und reiner Worker-Prozess (`src.worker`).
+
+Die Rolle eines Prozesses bestimmt, ob er Jobs verarbeitet:
+- `all`: API und Worker im selben Prozess (Standard, bisheriges Verhalten)
+- `api`: nur API; Jobs werden angelegt, aber von anderen Knoten verarbeitet
+- `worker`: nur Jobverarbeitung (`python -m src.worker`)
+
+Beim Herunterfahren übernimmt der SecretaryWorkerManager keine neuen Jobs mehr
+und wartet bis `drain_timeout_sec` auf laufende Jobs; danach noch laufende
+Jobs gehen an die Warteschlange zurück. Anschließend werden offene Webhooks
+zugestellt und gepufferte Job-Logs geschrieben.
+
+@module core.background_workers
+
+@exports
+- ROLES: Tuple[str, ...] - Gültige Prozessrollen
+- server_role(): str - Rolle des Prozesses (SERVER_ROLE oder `server.role`)
+- start_background_workers(): None - Startet die Worker-Manager (idempotent)
+- stop_background_workers(): int - Fährt die Worker-Manager geordnet herunter
+
+@usedIn
+- src.dashboard.app: Lazy-Start im ersten Request, Signal-Handler und atexit
+- src.gunicorn_conf: Start nach dem Fork, Drain beim Beenden eines Workers
+- src.worker: Reiner Worker-Prozess
+
+@dependencies
+- Internal: src.core.config - Config
+- Internal: src.core.mongodb - Worker-Manager, Job-Log-Puffer
+- Internal: src.utils.webhook_dispatcher - shutdown_webhook_dispatcher
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+ROLES: Tuple[str, ...] = ("all", "api", "worker")
+
+_lock = threading.Lock()
+_started = False
+_session_manager: Optional[Any] = None
+_secretary_manager: Optional[Any] = None
+
+
+def server_role() -> str:
+    """
+    Rolle dieses Prozesses: Umgebungsvariable `SERVER_ROLE`, sonst `server.role`.
+
+    Returns:
+        str: `all`, `api` oder `worker`
+
+    Raises:
+        ValueError: Bei einer unbekannten Rolle
+    """
+    role = os.environ.get("SERVER_ROLE", "").strip().lower()
+    if not role:
+        # Verzögerter Import, um zirkuläre Importe zu vermeiden
+        from src.core.config import Config
+        role = str(Config().get("server.role", "all") or "all").strip().lower()
+    if role not in ROLES:
+        raise ValueError(f"Unbekannte Server-Rolle '{role}' (erlaubt: {', '.join(ROLES)})")
+    return role
+
+
+def start_background_workers() -> None:
+    """Startet SessionWorkerManager und SecretaryWorkerManager, sofern aktiviert (nur einmal pro Prozess)."""
+    global _started, _session_manager, _secretary_manager
+    from src.core.mongodb import get_secretary_worker_manager, get_worker_manager
+
+    with _lock:
+        if _started:
+            return
+        _started = True
+        try:
+            _session_manager = get_worker_manager()
+            if _session_manager is not None:
+                _session_manager.start()
+                logger.info("Worker-Manager gestartet")
+            else:
+                logger.info("Worker-Manager ist deaktiviert (session_worker.active=False in config.yaml)")
+        except Exception as e:
+            logger.error(f"Fehler beim Starten des Worker-Managers: {str(e)}")
+        try:
+            _secretary_manager = get_secretary_worker_manager()
+            if _secretary_manager is not None:
+                _secretary_manager.start()
+                logger.info("SecretaryWorkerManager gestartet")
+            else:
+                logger.info("SecretaryWorkerManager ist deaktiviert (generic_worker.active=False in config.yaml)")
+        except Exception as e:
+            logger.error(f"Fehler beim Starten des SecretaryWorkerManager: {str(e)}")
+
+
+def stop_background_workers(drain_timeout_sec: Optional[float] = None) -> int:
+    """
+    Fährt die gestarteten Worker-Manager geordnet herunter (idempotent).
+
+    Args:
+        drain_timeout_sec: Wartezeit auf laufende Secretary-Jobs; None liest
+            `server.drain_timeout_sec` (Standard 60)
+
+    Returns:
+        int: Anzahl der an die Warteschlange zurückgegebenen Jobs
+    """
+    global _started, _session_manager, _secretary_manager
+    with _lock:
+        if not _started:
+            return 0
+        _started = False
+        session_manager, _session_manager = _session_manager, None
+        secretary_manager, _secretary_manager = _secretary_manager, None
+
+    if drain_timeout_sec is None:
+        from src.core.config import Config
+        drain_timeout_sec = float(Config().get("server.drain_timeout_sec", 60))
+
+    released = 0
+    if secretary_manager is not None:
+        try:
+            released = secretary_manager.drain(drain_timeout_sec)
+            logger.info("SecretaryWorkerManager beendet")
+        except Exception as e:
+            logger.error(f"Fehler beim Beenden des SecretaryWorkerManager: {str(e)}")
+    if session_manager is not None:
+        try:
+            session_manager.stop()
+            logger.info("Worker-Manager beendet")
+        except Exception as e:
+            logger.error(f"Fehler beim Beenden des Worker-Managers: {str(e)}")
+
+    from src.core.mongodb.job_log_repository import flush_job_logs
+    from src.utils.webhook_dispatcher import shutdown_webhook_dispatcher
+    try:
+        shutdown_webhook_dispatcher()
+        flush_job_logs()
+    except Exception as e:
+        logger.error(f"Fehler beim Abschluss von Webhooks und Job-Logs: {str(e)}")
+    return released
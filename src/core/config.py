@@ -41,7 +41,7 @@ Features:
 - External: dotenv - Loading environment variables
 - Internal: src.core.config_utils - replace_env_vars, load_dotenv
 """
-from typing import Dict, Any, Optional, TypedDict, cast, Union
+from typing import Dict, Any, List, Optional, TypedDict, cast, Union
 from pathlib import Path
 import os
 import yaml
@@ -78,10 +78,15 @@ class ProcessorsConfig(TypedDict):
     youtube: YoutubeConfig
     audio: AudioConfig
 
-class RateLimitingConfig(TypedDict):
+class RateLimitingConfig(TypedDict, total=False):
     """Rate-Limiting Konfiguration."""
     enabled: bool
     requests_per_minute: int
+    backend: str
+    methods: List[str]
+    exempt_paths: List[str]
+    trust_forwarded_for: bool
+    max_keys: int
 
 class LoggingConfig(TypedDict):
     """Logging-Konfiguration."""
@@ -145,7 +150,7 @@ class Config:
             }
         },
         'rate_limiting': {
-            'enabled': True,
+            'enabled': False,
             'requests_per_minute': 60
         },
         'logging': {
@@ -0,0 +1,541 @@
+"""
+@fileoverview LLM Concurrency - Adaptive per-provider/model concurrency limits (AIMD)
+
+@description
+Begrenzt die gleichzeitigen Aufrufe pro Provider und Modell prozessweit, über
+alle Prozessoren, Jobs und Threads hinweg. Das Limit passt sich an:
+
+- Additive Increase: Jeder erfolgreiche Aufruf bei ausgelastetem Limit erhöht
+  es um `additive_increase / limit` (also um `additive_increase` pro voller Runde).
+- Multiplicative Decrease: 429, 5xx und Timeouts senken es auf
+  `limit * decrease_factor`. Pro Runde wird höchstens einmal gesenkt: Aufrufe,
+  die vor der letzten Senkung gestartet sind, lösen keine weitere aus.
+- Optional (`latency_tolerance` > 0, standardmäßig aus): Eine Latenz über
+  `latency_tolerance` mal der Basislatenz senkt es sanfter
+  (`latency_decrease_factor`). Die Latenz hängt bei LLMs stark von der
+  Antwortlänge ab; nur für Modelle mit gleichförmigen Aufrufen geeignet.
+- `Retry-After` (bzw. `retry-after-ms`) einer Antwort sperrt den Schlüssel bis
+  zum angegebenen Zeitpunkt (höchstens `max_retry_after_seconds`).
+
+Wartende Aufrufe stehen in einer gemeinsamen FIFO-Warteschlange pro Schlüssel,
+egal ob sie aus einem Thread (`call`) oder einer Coroutine (`acall`) kommen.
+Wer länger als `queue_timeout_seconds` wartet, erhält einen ProcessingError.
+
+`ProviderManager.get_provider()` liefert Provider als `LimitedProvider`, der
+alle LLM-Aufrufe (transcribe, chat_completion, vision, embedding, text2image)
+durch den Limiter leitet.
+
+@module core.llm.concurrency
+
+@exports
+- LimitSettings: Dataclass - Grenzen und AIMD-Parameter eines Schlüssels
+- ConcurrencyLimiter: Class - Prozessweiter adaptiver Limiter mit Metriken
+- LimitedProvider: Class - Provider-Wrapper, der Aufrufe durch den Limiter leitet
+- load_concurrency_limiter(): ConcurrencyLimiter - Aus Konfiguration `llm_concurrency`
+
+@usedIn
+- src.core.llm.provider_manager: Wrapper um alle Provider-Instanzen
+- src.processors.pdf_processor: Mistral OCR (direkter HTTP-Aufruf)
+- src.api.routes.health_routes: Metriken unter /api/health/llm-concurrency
+
+@dependencies
+- Standard: asyncio, threading, collections.deque - Warteschlangen über Threads und Event-Loops
+- Internal: src.core.exceptions - ProcessingError bei Wartezeit-Überschreitung
+- Internal: src.core.config - Config
+"""
+
+import asyncio
+import email.utils
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, fields, replace
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, Mapping, Optional, Tuple, TypeVar
+
+from ..exceptions import ProcessingError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Statuscodes, die auf Überlast des Providers hindeuten (529: Anthropic "overloaded")
+_OVERLOAD_STATUS = frozenset({429, 500, 502, 503, 504, 529})
+
+
+@dataclass(frozen=True)
+class LimitSettings:
+    """Grenzen und AIMD-Parameter für einen Provider/Modell-Schlüssel."""
+    initial_limit: int = 4
+    min_limit: int = 1
+    max_limit: int = 32
+    additive_increase: float = 1.0
+    decrease_factor: float = 0.5
+    # 0 schaltet das Latenzsignal ab (Standard: nur 429/5xx/Timeouts senken)
+    latency_tolerance: float = 0.0
+    latency_decrease_factor: float = 0.9
+    queue_timeout_seconds: float = 300.0
+    max_retry_after_seconds: float = 120.0
+
+    def merged(self, overrides: Optional[Mapping[str, Any]]) -> "LimitSettings":
+        """Übernimmt bekannte Felder aus `overrides` (z.B. Provider-Abschnitt der Konfiguration)."""
+        if not overrides:
+            return self
+        values: Dict[str, Any] = {}
+        for f in fields(self):
+            if f.name in overrides:
+                values[f.name] = type(getattr(self, f.name))(overrides[f.name])
+        return replace(self, **values)
+
+
+def _exception_chain(exc: BaseException) -> Iterator[BaseException]:
+    seen = set()
+    current: Optional[BaseException] = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        yield current
+        current = current.__cause__ or current.__context__
+
+
+def _retry_after_seconds(headers: Any) -> Optional[float]:
+    if headers is None:
+        return None
+    try:
+        millis = headers.get("retry-after-ms")
+        if millis:
+            return float(millis) / 1000.0
+        value = headers.get("retry-after")
+    except Exception:
+        return None
+    if not value:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    # HTTP-Datum statt Sekunden
+    try:
+        when = email.utils.parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def classify_outcome(error: Optional[BaseException] = None, result: Any = None) -> Tuple[Optional[int], Optional[float], bool]:
+    """
+    Liest Statuscode, Retry-After und Timeout aus einem Fehler oder einer HTTP-Antwort.
+
+    Provider verpacken SDK-Fehler in ProcessingError; die Ursachenkette
+    (`__cause__`) wird daher mit durchsucht.
+
+    Returns:
+        Tuple[Optional[int], Optional[float], bool]: (Statuscode, Retry-After in Sekunden, Timeout)
+    """
+    if error is None:
+        status = getattr(result, "status_code", None)
+        if not isinstance(status, int):
+            return None, None, False
+        return status, _retry_after_seconds(getattr(result, "headers", None)), False
+    timed_out = False
+    for exc in _exception_chain(error):
+        if "Timeout" in type(exc).__name__:
+            timed_out = True
+        response = getattr(exc, "response", None) or getattr(exc, "raw_response", None)
+        status = getattr(exc, "status_code", None)
+        if not isinstance(status, int):
+            status = getattr(response, "status_code", None)
+        if isinstance(status, int):
+            return status, _retry_after_seconds(getattr(response, "headers", None)), timed_out
+    return None, None, timed_out
+
+
+class _Waiter:
+    """Wartender Aufruf; wird geweckt, sobald ihm ein Slot zugeteilt ist."""
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        self.granted = False
+        self.loop = loop
+        self.event = threading.Event()
+        self.future: Optional["asyncio.Future[None]"] = loop.create_future() if loop is not None else None
+
+    def grant(self) -> bool:
+        """Teilt den Slot zu; False, wenn der Loop des Wartenden nicht mehr existiert."""
+        if self.future is not None and self.loop is not None:
+            try:
+                self.loop.call_soon_threadsafe(_resolve, self.future)
+            except RuntimeError:
+                return False
+        else:
+            self.event.set()
+        self.granted = True
+        return True
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class _KeyState:
+    """Zustand und Zähler eines Provider/Modell-Schlüssels (nur unter der Sperre ändern)."""
+
+    def __init__(self, settings: LimitSettings) -> None:
+        self.settings = settings
+        self.limit = float(max(settings.min_limit, min(settings.initial_limit, settings.max_limit)))
+        self.in_flight = 0
+        self.waiters: Deque[_Waiter] = deque()
+        self.blocked_until = 0.0
+        self.last_decrease = 0.0
+        self.baseline_latency: Optional[float] = None
+        self.avg_latency: Optional[float] = None
+        self.calls = 0
+        self.successes = 0
+        self.throttled = 0
+        self.server_errors = 0
+        self.timeouts = 0
+        self.queue_timeouts = 0
+        self.decreases = 0
+        self.queued_calls = 0
+        self.wait_seconds = 0.0
+        self.max_queued = 0
+
+    def capacity(self) -> int:
+        return max(self.settings.min_limit, int(self.limit))
+
+
+@dataclass
+class Slot:
+    """Belegter Platz eines Aufrufs; mit `ConcurrencyLimiter.release()` zurückgeben."""
+    key: str
+    started: float
+    waited: float = 0.0
+
+
+class ConcurrencyLimiter:
+    """Prozessweiter adaptiver Limiter pro Provider und Modell."""
+
+    def __init__(
+        self,
+        defaults: Optional[LimitSettings] = None,
+        provider_settings: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            defaults: Standardwerte für alle Schlüssel
+            provider_settings: Abweichungen pro Provider; ein Unterabschnitt
+                `models` enthält Abweichungen pro Modell
+            enabled: False reicht alle Aufrufe ohne Begrenzung durch
+            clock: Zeitquelle (Tests)
+        """
+        self.defaults = defaults or LimitSettings()
+        self.provider_settings: Dict[str, Mapping[str, Any]] = dict(provider_settings or {})
+        self.enabled = enabled
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._states: Dict[str, _KeyState] = {}
+
+    @staticmethod
+    def key_for(provider: str, model: Optional[str]) -> str:
+        return f"{provider}:{model or 'default'}"
+
+    def settings_for(self, provider: str, model: Optional[str]) -> LimitSettings:
+        """Einstellungen eines Schlüssels: Standard, dann Provider, dann Modell."""
+        provider_cfg: Mapping[str, Any] = self.provider_settings.get(provider) or {}
+        models_cfg: Mapping[str, Any] = provider_cfg.get("models") or {}
+        return self.defaults.merged(provider_cfg).merged(models_cfg.get(model or "") or {})
+
+    def _state(self, provider: str, model: Optional[str]) -> Tuple[str, _KeyState]:
+        key = self.key_for(provider, model)
+        state = self._states.get(key)
+        if state is None:
+            state = _KeyState(self.settings_for(provider, model))
+            self._states[key] = state
+        return key, state
+
+    def _dispatch(self, state: _KeyState, now: float) -> None:
+        # Freie Slots in FIFO-Reihenfolge vergeben (nicht während einer Retry-After-Sperre)
+        while state.waiters and state.in_flight < state.capacity() and now >= state.blocked_until:
+            waiter = state.waiters.popleft()
+            state.in_flight += 1
+            if not waiter.grant():
+                state.in_flight -= 1
+
+    def _try_acquire(self, state: _KeyState, now: float) -> bool:
+        if not state.waiters and state.in_flight < state.capacity() and now >= state.blocked_until:
+            state.in_flight += 1
+            return True
+        return False
+
+    def _enqueue(self, state: _KeyState, waiter: _Waiter) -> None:
+        state.waiters.append(waiter)
+        state.queued_calls += 1
+        state.max_queued = max(state.max_queued, len(state.waiters))
+
+    def _next_wake(self, state: _KeyState, deadline: float, now: float) -> float:
+        # Nach Ablauf einer Retry-After-Sperre weckt niemand die Wartenden; selbst nachsehen
+        if state.blocked_until > now:
+            return min(deadline, state.blocked_until) - now
+        return deadline - now
+
+    def _give_up(self, state: _KeyState, waiter: _Waiter) -> bool:
+        """Entfernt einen Wartenden; True, wenn ihm inzwischen doch ein Slot zugeteilt wurde."""
+        if waiter.granted:
+            return True
+        try:
+            state.waiters.remove(waiter)
+        except ValueError:
+            pass
+        state.queue_timeouts += 1
+        return False
+
+    def _timeout_error(self, key: str, state: _KeyState) -> ProcessingError:
+        return ProcessingError(
+            f"Kein freier LLM-Slot für {key} innerhalb von {state.settings.queue_timeout_seconds:.0f}s "
+            f"(Limit {state.capacity()}, {len(state.waiters)} wartend)",
+            details={"error_type": "LLM_CONCURRENCY_TIMEOUT", "key": key, "limit": state.capacity()},
+        )
+
+    def acquire(self, provider: str, model: Optional[str]) -> Slot:
+        """
+        Belegt einen Slot; blockiert den Thread, bis einer frei ist.
+
+        Raises:
+            ProcessingError: Wartezeit `queue_timeout_seconds` überschritten
+        """
+        start = self._clock()
+        with self._lock:
+            key, state = self._state(provider, model)
+            if self._try_acquire(state, start):
+                return Slot(key=key, started=start)
+            waiter = _Waiter()
+            self._enqueue(state, waiter)
+            deadline = start + state.settings.queue_timeout_seconds
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._dispatch(state, now)
+                if waiter.granted:
+                    break
+                if now >= deadline:
+                    if self._give_up(state, waiter):
+                        break
+                    raise self._timeout_error(key, state)
+                wake = self._next_wake(state, deadline, now)
+            waiter.event.wait(max(0.0, wake))
+        now = self._clock()
+        with self._lock:
+            state.wait_seconds += now - start
+        return Slot(key=key, started=now, waited=now - start)
+
+    async def aacquire(self, provider: str, model: Optional[str]) -> Slot:
+        """
+        Belegt einen Slot, ohne den Event-Loop zu blockieren.
+
+        Raises:
+            ProcessingError: Wartezeit `queue_timeout_seconds` überschritten
+        """
+        start = self._clock()
+        with self._lock:
+            key, state = self._state(provider, model)
+            if self._try_acquire(state, start):
+                return Slot(key=key, started=start)
+            waiter = _Waiter(asyncio.get_running_loop())
+            self._enqueue(state, waiter)
+            deadline = start + state.settings.queue_timeout_seconds
+        assert waiter.future is not None
+        try:
+            while True:
+                with self._lock:
+                    now = self._clock()
+                    self._dispatch(state, now)
+                    if waiter.granted:
+                        break
+                    if now >= deadline:
+                        if self._give_up(state, waiter):
+                            break
+                        raise self._timeout_error(key, state)
+                    wake = self._next_wake(state, deadline, now)
+                await asyncio.wait({waiter.future}, timeout=max(0.0, wake))
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    state.in_flight -= 1
+                    self._dispatch(state, self._clock())
+                else:
+                    try:
+                        state.waiters.remove(waiter)
+                    except ValueError:
+                        pass
+            raise
+        now = self._clock()
+        with self._lock:
+            state.wait_seconds += now - start
+        return Slot(key=key, started=now, waited=now - start)
+
+    def release(self, slot: Slot, error: Optional[BaseException] = None, result: Any = None) -> None:
+        """
+        Gibt den Slot frei und passt das Limit an das Ergebnis an.
+
+        Args:
+            slot: Slot aus `acquire`/`aacquire`
+            error: Exception des Aufrufs (None bei Erfolg)
+            result: Rückgabewert; HTTP-Antworten werden nach Statuscode bewertet
+        """
+        now = self._clock()
+        latency = now - slot.started
+        status, retry_after, timed_out = classify_outcome(error, result)
+        with self._lock:
+            state = self._states[slot.key]
+            settings = state.settings
+            saturated = state.in_flight >= state.capacity() or bool(state.waiters)
+            state.in_flight = max(0, state.in_flight - 1)
+            state.calls += 1
+            overloaded = timed_out or status in _OVERLOAD_STATUS
+            if status == 429:
+                state.throttled += 1
+            elif status is not None and status >= 500:
+                state.server_errors += 1
+            elif timed_out:
+                state.timeouts += 1
+            if overloaded:
+                self._decrease(slot, state, settings.decrease_factor, now, f"HTTP {status}" if status else "Timeout")
+                if retry_after:
+                    state.blocked_until = max(state.blocked_until, now + min(retry_after, settings.max_retry_after_seconds))
+            elif error is None and (status is None or status < 400):
+                state.successes += 1
+                self._observe_latency(slot, state, latency, saturated, now)
+            self._dispatch(state, now)
+
+    def _decrease(self, slot: Slot, state: _KeyState, factor: float, now: float, reason: str) -> None:
+        # Pro Runde nur einmal senken: ältere Aufrufe sahen noch das alte Limit
+        if slot.started < state.last_decrease:
+            return
+        previous = state.limit
+        state.limit = max(float(state.settings.min_limit), state.limit * factor)
+        state.last_decrease = now
+        state.decreases += 1
+        logger.warning(f"LLM-Limit {slot.key}: {previous:.1f} -> {state.limit:.1f} ({reason})")
+
+    def _observe_latency(self, slot: Slot, state: _KeyState, latency: float, saturated: bool, now: float) -> None:
+        settings = state.settings
+        state.avg_latency = latency if state.avg_latency is None else 0.8 * state.avg_latency + 0.2 * latency
+        baseline = state.baseline_latency
+        # Basislatenz folgt schnellen Antworten sofort, langsamen nur träge
+        if baseline is None or latency < baseline:
+            state.baseline_latency = latency
+        else:
+            state.baseline_latency = baseline + 0.05 * (latency - baseline)
+        if settings.latency_tolerance > 0 and baseline is not None and latency > settings.latency_tolerance * baseline:
+            self._decrease(slot, state, settings.latency_decrease_factor, now, f"Latenz {latency:.1f}s")
+            return
+        if saturated:
+            state.limit = min(float(settings.max_limit), state.limit + settings.additive_increase / state.limit)
+
+    def call(self, provider: str, model: Optional[str], fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Führt `fn(*args, **kwargs)` in einem Slot aus (blockierend); `kwargs` darf `model` enthalten."""
+        if not self.enabled:
+            return fn(*args, **kwargs)
+        slot = self.acquire(provider, model)
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            self.release(slot, error=exc)
+            raise
+        self.release(slot, result=result)
+        return result
+
+    async def acall(self, provider: str, model: Optional[str], fn: Callable[..., Awaitable[T]], /, *args: Any, **kwargs: Any) -> T:
+        """Führt `await fn(*args, **kwargs)` in einem Slot aus."""
+        if not self.enabled:
+            return await fn(*args, **kwargs)
+        slot = await self.aacquire(provider, model)
+        try:
+            result = await fn(*args, **kwargs)
+        except BaseException as exc:
+            self.release(slot, error=exc)
+            raise
+        self.release(slot, result=result)
+        return result
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Aktuelle Limits, Belegung und Zähler pro Schlüssel (Metriken)."""
+        now = self._clock()
+        result: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for key, state in sorted(self._states.items()):
+                result[key] = {
+                    "limit": round(state.limit, 2),
+                    "in_flight": state.in_flight,
+                    "queued": len(state.waiters),
+                    "max_queued": state.max_queued,
+                    "min_limit": state.settings.min_limit,
+                    "max_limit": state.settings.max_limit,
+                    "calls": state.calls,
+                    "successes": state.successes,
+                    "throttled": state.throttled,
+                    "server_errors": state.server_errors,
+                    "timeouts": state.timeouts,
+                    "queue_timeouts": state.queue_timeouts,
+                    "decreases": state.decreases,
+                    "avg_wait_ms": round(1000 * state.wait_seconds / state.queued_calls) if state.queued_calls else 0,
+                    "avg_latency_ms": round(1000 * state.avg_latency) if state.avg_latency is not None else None,
+                    "baseline_latency_ms": round(1000 * state.baseline_latency) if state.baseline_latency is not None else None,
+                    "retry_after_remaining_s": round(max(0.0, state.blocked_until - now), 1),
+                }
+        return result
+
+
+class LimitedProvider:
+    """
+    Provider-Wrapper: LLM-Aufrufe laufen durch den ConcurrencyLimiter,
+    alle anderen Attribute (get_client, health_check, ...) werden durchgereicht.
+    """
+
+    def __init__(self, provider: Any, provider_name: str, limiter: ConcurrencyLimiter) -> None:
+        self._provider = provider
+        self._provider_name = provider_name
+        self._limiter = limiter
+
+    @property
+    def wrapped(self) -> Any:
+        """Der ursprüngliche Provider."""
+        return self._provider
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._provider, name)
+
+    def __repr__(self) -> str:
+        return f"LimitedProvider({self._provider!r})"
+
+    def transcribe(self, audio_data: Any, model: str, *args: Any, **kwargs: Any) -> Any:
+        return self._limiter.call(self._provider_name, model, self._provider.transcribe, audio_data, model, *args, **kwargs)
+
+    def chat_completion(self, messages: Any, model: str, *args: Any, **kwargs: Any) -> Any:
+        return self._limiter.call(self._provider_name, model, self._provider.chat_completion, messages, model, *args, **kwargs)
+
+    def vision(self, image_data: Any, prompt: str, model: str, *args: Any, **kwargs: Any) -> Any:
+        return self._limiter.call(self._provider_name, model, self._provider.vision, image_data, prompt, model, *args, **kwargs)
+
+    def embedding(self, texts: Any, model: str, *args: Any, **kwargs: Any) -> Any:
+        return self._limiter.call(self._provider_name, model, self._provider.embedding, texts, model, *args, **kwargs)
+
+    def text2image(self, prompt: str, model: str, *args: Any, **kwargs: Any) -> Any:
+        return self._limiter.call(self._provider_name, model, self._provider.text2image, prompt, model, *args, **kwargs)
+
+
+def load_concurrency_limiter() -> ConcurrencyLimiter:
+    """
+    Erstellt den Limiter aus der Konfiguration `llm_concurrency`.
+
+    Returns:
+        ConcurrencyLimiter: Bei `enabled: false` ein Limiter, der nur durchreicht
+    """
+    from src.core.config import Config
+    cfg: Dict[str, Any] = Config().get("llm_concurrency", {}) or {}
+    return ConcurrencyLimiter(
+        defaults=LimitSettings().merged(cfg),
+        provider_settings=cfg.get("providers") or {},
+        enabled=bool(cfg.get("enabled", True)),
+    )
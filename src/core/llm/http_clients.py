@@ -0,0 +1,94 @@
+"""
+@fileoverview LLM HTTP Clients - Tuned httpx clients shared by LLM providers
+
+@description
+Erzeugt die httpx-Clients, über die Provider mit den LLM-APIs sprechen
+(OpenAI-SDK, OpenRouter-Endpunkte, Mistral OCR). Ein Client hält einen
+Connection-Pool mit Keep-Alive; wiederverwendet spart jeder Aufruf den
+TCP- und TLS-Handshake. Mit HTTP/2 laufen parallele Anfragen an denselben
+Host über eine Verbindung.
+
+Die Clients enthalten keine Zugangsdaten; Header wie `Authorization` setzt
+der Aufrufer pro Anfrage. `ProviderManager` hält pro Provider einen
+synchronen Client und pro Event-Loop einen async Client.
+
+HTTP/2 benötigt das Paket `h2` (`httpx[http2]`); ohne das Paket wird
+HTTP/1.1 mit Keep-Alive verwendet.
+
+@module core.llm.http_clients
+
+@exports
+- http2_available(): bool - Ob HTTP/2 nutzbar ist
+- create_http_client(): httpx.Client - Synchroner Client mit Pool-Einstellungen
+- create_async_http_client(): httpx.AsyncClient - Async Client mit Pool-Einstellungen
+
+@usedIn
+- src.core.llm.provider_manager: Gemeinsame Clients pro Provider
+
+@dependencies
+- External: httpx - HTTP-Client mit Connection-Pool
+- Optional: h2 - HTTP/2
+- Internal: src.core.config - Abschnitt `llm_http`
+"""
+
+import importlib.util
+from typing import Any, Dict, Optional
+
+import httpx
+
+from ..config import Config
+
+
+def http2_available() -> bool:
+    """Prüft, ob das Paket `h2` für HTTP/2 installiert ist."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _client_options(settings: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    cfg: Dict[str, Any] = settings if settings is not None else (Config().get("llm_http", {}) or {})
+    limits = httpx.Limits(
+        max_connections=int(cfg.get("max_connections", 100)),
+        max_keepalive_connections=int(cfg.get("max_keepalive_connections", 20)),
+        keepalive_expiry=float(cfg.get("keepalive_expiry_seconds", 30)),
+    )
+    # Der Read-Timeout gilt pro Lesevorgang; das OpenAI-SDK setzt eigene Timeouts pro Anfrage
+    timeout = httpx.Timeout(
+        float(cfg.get("read_timeout_seconds", 600)),
+        connect=float(cfg.get("connect_timeout_seconds", 10)),
+    )
+    return {
+        "limits": limits,
+        "timeout": timeout,
+        "http2": bool(cfg.get("http2", True)) and http2_available(),
+        "follow_redirects": True,
+    }
+
+
+def create_http_client(settings: Optional[Dict[str, Any]] = None, **kwargs: Any) -> httpx.Client:
+    """
+    Erzeugt einen synchronen Client mit den Pool-Einstellungen aus `llm_http`.
+
+    Args:
+        settings: Optionale Einstellungen; sonst `llm_http` aus der Konfiguration
+        **kwargs: Weitere httpx-Parameter (z.B. transport in Tests)
+
+    Returns:
+        httpx.Client: Thread-sicherer Client mit Connection-Pool
+    """
+    return httpx.Client(**{**_client_options(settings), **kwargs})
+
+
+def create_async_http_client(settings: Optional[Dict[str, Any]] = None, **kwargs: Any) -> httpx.AsyncClient:
+    """
+    Erzeugt einen async Client mit den Pool-Einstellungen aus `llm_http`.
+
+    Der Client ist an den Event-Loop gebunden, auf dem er zuerst benutzt wird.
+
+    Args:
+        settings: Optionale Einstellungen; sonst `llm_http` aus der Konfiguration
+        **kwargs: Weitere httpx-Parameter (z.B. transport in Tests)
+
+    Returns:
+        httpx.AsyncClient: Client mit Connection-Pool
+    """
+    return httpx.AsyncClient(**{**_client_options(settings), **kwargs})
@@ -5,14 +5,32 @@
 Manages LLM provider instances and provides factory methods for creating
 provider instances based on configuration.
 
+Hält außerdem die HTTP-Clients der Provider: pro Provider (Name + Base-URL)
+einen synchronen httpx-Client für die Provider-SDKs und pro Event-Loop einen
+async Client für direkte HTTP-Aufrufe aus Coroutinen (Mistral-OCR im
+PDFProcessor). Provider, Prozessoren und Jobs teilen sich damit
+Connection-Pools und Keep-Alive-Verbindungen, statt pro Aufruf neue
+TLS-Verbindungen aufzubauen.
+
+`get_provider()` liefert Provider hinter dem prozessweiten
+`ConcurrencyLimiter` (siehe `concurrency.py`): alle LLM-Aufrufe teilen sich
+adaptive Limits pro Provider und Modell.
+
 @module core.llm.provider_manager
 
 @exports
 - ProviderManager: Class - Central provider management
 """
 
-from typing import Dict, Optional, Type, Any
+import threading
+from typing import Dict, Optional, Type, Any, cast
+
+import httpx
+
+from src.utils.async_runtime import loop_resource
 from ..exceptions import ProcessingError
+from .concurrency import ConcurrencyLimiter, LimitedProvider, load_concurrency_limiter
+from .http_clients import create_async_http_client, create_http_client
 from .protocols import LLMProvider
 from .use_cases import UseCase
 
@@ -28,6 +46,9 @@ class ProviderManager:
     _instance: Optional['ProviderManager'] = None
     _providers: Dict[str, LLMProvider] = {}
     _provider_classes: Dict[str, Type[LLMProvider]] = {}
+    _http_clients: Dict[str, httpx.Client] = {}
+    _http_lock = threading.Lock()
+    _limiter: Optional[ConcurrencyLimiter] = None
     
     def __new__(cls) -> 'ProviderManager':
         """Singleton-Pattern für ProviderManager."""
@@ -79,6 +100,9 @@ class ProviderManager:
         
         provider_class = self._provider_classes[provider_name]
         
+        # Gemeinsamer HTTP-Client (Connection-Pool pro Provider)
+        kwargs.setdefault("http_client", self.get_http_client(provider_name, base_url))
+        
         # Erstelle Provider-Instanz mit API-Key und optionaler Base-URL
         try:
             if base_url:
@@ -109,21 +133,79 @@ class ProviderManager:
             **kwargs: Zusätzliche Provider-spezifische Parameter
             
         Returns:
-            LLMProvider: Provider-Instanz
+            LLMProvider: Provider-Instanz; LLM-Aufrufe laufen durch den ConcurrencyLimiter
         """
-        # Erstelle Cache-Key basierend auf Provider-Name und Base-URL
-        cache_key = f"{provider_name}:{base_url or 'default'}"
+        cache_key = self._cache_key(provider_name, base_url)
         
         if cache_key not in self._providers:
-            self._providers[cache_key] = self.create_provider(
+            provider = self.create_provider(
                 provider_name=provider_name,
                 api_key=api_key,
                 base_url=base_url,
                 **kwargs
             )
+            limiter = self.get_concurrency_limiter()
+            if limiter.enabled:
+                provider = cast(LLMProvider, LimitedProvider(provider, provider_name, limiter))
+            self._providers[cache_key] = provider
         
         return self._providers[cache_key]
     
+    @staticmethod
+    def _cache_key(provider_name: str, base_url: Optional[str]) -> str:
+        # Cache-Key basierend auf Provider-Name und Base-URL
+        return f"{provider_name}:{base_url or 'default'}"
+    
+    def get_http_client(self, provider_name: str, base_url: Optional[str] = None) -> httpx.Client:
+        """
+        Gibt den gemeinsamen synchronen HTTP-Client eines Providers zurück.
+        
+        Der Client ist thread-sicher und wird von allen Threads geteilt.
+        
+        Args:
+            provider_name: Name des Providers
+            base_url: Optional, benutzerdefinierte Base-URL
+            
+        Returns:
+            httpx.Client: Client mit Connection-Pool (Einstellungen aus `llm_http`)
+        """
+        cache_key = self._cache_key(provider_name, base_url)
+        with self._http_lock:
+            client = self._http_clients.get(cache_key)
+            if client is None or client.is_closed:
+                client = create_http_client()
+                self._http_clients[cache_key] = client
+            return client
+    
+    def get_async_http_client(self, provider_name: str, base_url: Optional[str] = None) -> httpx.AsyncClient:
+        """
+        Gibt den async HTTP-Client eines Providers für den laufenden Event-Loop zurück.
+        
+        Async Clients sind an ihren Event-Loop gebunden; pro Loop und Provider
+        wird einer erzeugt und wiederverwendet (siehe `run_async`). Nur
+        innerhalb einer Coroutine aufrufen.
+        
+        Args:
+            provider_name: Name des Providers
+            base_url: Optional, benutzerdefinierte Base-URL
+            
+        Returns:
+            httpx.AsyncClient: Client mit Connection-Pool (Einstellungen aus `llm_http`)
+        """
+        return loop_resource(f"llm-http:{self._cache_key(provider_name, base_url)}", create_async_http_client)
+    
+    def get_concurrency_limiter(self) -> ConcurrencyLimiter:
+        """
+        Gibt den prozessweiten Concurrency-Limiter zurück (Konfiguration `llm_concurrency`).
+        
+        Returns:
+            ConcurrencyLimiter: Adaptive Limits pro Provider und Modell
+        """
+        with self._http_lock:
+            if ProviderManager._limiter is None:
+                ProviderManager._limiter = load_concurrency_limiter()
+            return ProviderManager._limiter
+    
     def get_available_providers(self) -> list[str]:
         """
         Gibt die Namen aller registrierten Provider zurück.
@@ -146,8 +228,11 @@ class ProviderManager:
         return provider_name in self._provider_classes
     
     def clear_cache(self) -> None:
-        """Löscht den Provider-Cache."""
+        """Löscht den Provider-Cache und die gemeinsamen synchronen HTTP-Clients."""
         self._providers.clear()
+        # Nicht schließen: bereits ausgegebene Provider nutzen ihren Client weiter
+        with self._http_lock:
+            self._http_clients.clear()
 
 
 
@@ -5,6 +5,8 @@
 Mistral AI provider implementation. Provides access to Mistral's API for
 chat completion and OCR operations.
 
+Aufrufe laufen über den gemeinsamen httpx-Client aus dem `ProviderManager`.
+
 @module core.llm.providers.mistral_provider
 
 @exports
@@ -76,7 +78,8 @@ class MistralProvider:
             api_key: Mistral API-Key
             base_url: Optional, benutzerdefinierte Base-URL
             available_models: Optional, Dictionary mit Use-Case -> Liste von Modell-Namen aus Config
-            **kwargs: Zusätzliche Parameter (werden ignoriert)
+            **kwargs: Zusätzliche Parameter; `http_client` (httpx.Client) setzt
+                der ProviderManager, alle anderen werden ignoriert
         """
         # Nur der Client ist zwingend erforderlich. Schlaegt sein Import fehl,
         # geben wir den ECHTEN Grund mit (z. B. inkompatible Version), statt
@@ -96,9 +99,9 @@ class MistralProvider:
         if not api_key:
             raise ValueError("Mistral API-Key darf nicht leer sein")
         
-        # Mistral Client initialisieren
+        # Mistral Client initialisieren (gemeinsamer HTTP-Client aus dem ProviderManager)
         # base_url wird über server_url Parameter unterstützt, wenn nötig
-        self.client = Mistral(api_key=api_key)
+        self.client = Mistral(api_key=api_key, client=kwargs.get("http_client"))
         if base_url:
             # Mistral unterstützt server_url Parameter für benutzerdefinierte URLs
             # Dies wird bei jedem API-Aufruf übergeben
@@ -188,72 +191,9 @@ class MistralProvider:
         start_time = time.time()
         
         try:
-            # Konvertiere Messages zu Mistral-Format
-            mistral_messages: List[Any] = []
-            for msg in messages:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-                if UserMessage is None or SystemMessage is None or AssistantMessage is None:
-                    raise ImportError(
-                        "mistralai Message-Typen nicht verfuegbar "
-                        "(inkompatible mistralai-Version?). Erwartet: "
-                        "mistralai==1.9.11"
-                    )
-                if role == "system":
-                    mistral_messages.append(SystemMessage(content=content))
-                elif role == "assistant":
-                    mistral_messages.append(AssistantMessage(content=content))
-                else:  # user oder andere Rollen
-                    mistral_messages.append(UserMessage(content=content))
-            
-            # API-Parameter vorbereiten
-            api_params: Dict[str, Any] = {
-                "model": model,
-                "messages": mistral_messages,
-                "temperature": temperature
-            }
-            
-            if max_tokens:
-                api_params["max_tokens"] = max_tokens
-            
-            # API-Aufruf
+            api_params = self._chat_params(messages, model, temperature, max_tokens)
             response = self.client.chat.complete(**api_params)
-            
-            # Dauer berechnen
-            duration = (time.time() - start_time) * 1000
-            
-            # Antwort extrahieren
-            if not response.choices or len(response.choices) == 0:
-                raise ProcessingError("Keine gültige Antwort von Mistral erhalten")
-            
-            # Antwort extrahieren und zu String konvertieren
-            message_content = response.choices[0].message.content if response.choices[0].message else None
-            content = str(message_content) if message_content is not None else ""
-            
-            # Tokens extrahieren
-            tokens: int = 0
-            if hasattr(response, 'usage') and response.usage:
-                total_tokens = getattr(response.usage, 'total_tokens', None)
-                if total_tokens is not None:
-                    tokens = int(total_tokens)
-                else:
-                    tokens = 0
-            
-            # Stelle sicher, dass tokens mindestens 1 ist (eine API-Anfrage verbraucht immer Tokens)
-            if tokens <= 0:
-                tokens = 1  # Mindestwert für eine API-Anfrage
-            
-            # LLMRequest erstellen
-            llm_request = LLMRequest(
-                model=model,
-                purpose="chat_completion",
-                tokens=tokens,
-                duration=duration,
-                processor="MistralProvider"
-            )
-            
-            return content, llm_request
-            
+            return self._completion_result(response, model, "chat_completion", start_time)
         except Exception as e:
             duration = (time.time() - start_time) * 1000
             raise ProcessingError(
@@ -261,6 +201,85 @@ class MistralProvider:
                 details={'error_type': 'CHAT_COMPLETION_ERROR', 'duration_ms': duration}
             ) from e
     
+    def _chat_params(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int]
+    ) -> Dict[str, Any]:
+        # Konvertiere Messages zu Mistral-Format
+        mistral_messages: List[Any] = []
+        for msg in messages:
+            role = msg.get("role", "user")
+            content = msg.get("content", "")
+            if UserMessage is None or SystemMessage is None or AssistantMessage is None:
+                raise ImportError(
+                    "mistralai Message-Typen nicht verfuegbar "
+                    "(inkompatible mistralai-Version?). Erwartet: "
+                    "mistralai==1.9.11"
+                )
+            if role == "system":
+                mistral_messages.append(SystemMessage(content=content))
+            elif role == "assistant":
+                mistral_messages.append(AssistantMessage(content=content))
+            else:  # user oder andere Rollen
+                mistral_messages.append(UserMessage(content=content))
+        
+        # API-Parameter vorbereiten
+        api_params: Dict[str, Any] = {
+            "model": model,
+            "messages": mistral_messages,
+            "temperature": temperature
+        }
+        
+        if max_tokens:
+            api_params["max_tokens"] = max_tokens
+        return api_params
+    
+    def _completion_result(
+        self,
+        response: Any,
+        model: str,
+        purpose: str,
+        start_time: float
+    ) -> tuple[str, LLMRequest]:
+        # Dauer berechnen
+        duration = (time.time() - start_time) * 1000
+        
+        # Antwort extrahieren
+        if not response.choices or len(response.choices) == 0:
+            api_name = "Mistral Vision API" if purpose == "vision" else "Mistral"
+            raise ProcessingError(f"Keine gültige Antwort von {api_name} erhalten")
+        
+        # Antwort extrahieren und zu String konvertieren
+        message_content = response.choices[0].message.content if response.choices[0].message else None
+        content = str(message_content) if message_content is not None else ""
+        
+        # Tokens extrahieren
+        tokens: int = 0
+        if hasattr(response, 'usage') and response.usage:
+            total_tokens = getattr(response.usage, 'total_tokens', None)
+            if total_tokens is not None:
+                tokens = int(total_tokens)
+            else:
+                tokens = 0
+        
+        # Stelle sicher, dass tokens mindestens 1 ist (eine API-Anfrage verbraucht immer Tokens)
+        if tokens <= 0:
+            tokens = 1  # Mindestwert für eine API-Anfrage
+        
+        # LLMRequest erstellen
+        llm_request = LLMRequest(
+            model=model,
+            purpose=purpose,
+            tokens=tokens,
+            duration=duration,
+            processor="MistralProvider"
+        )
+        
+        return content, llm_request
+    
     def vision(
         self,
         image_data: Union[bytes, List[bytes]],
@@ -290,96 +309,12 @@ class MistralProvider:
                 oder wenn Multi-Image angefordert wird.
         """
         start_time = time.time()
-
-        # Eingabe normalisieren: nur Einzelbild zugelassen.
-        if isinstance(image_data, (bytes, bytearray)):
-            img_bytes: bytes = bytes(image_data)
-        else:
-            if len(image_data) != 1:
-                raise ProcessingError(
-                    "Mistral-Provider: Multi-Image-Vision wird nicht unterstützt. "
-                    "Bitte nur ein Bild pro Aufruf übergeben.",
-                    details={'error_type': 'VISION_MULTI_IMAGE_NOT_SUPPORTED'}
-                )
-            img_bytes = image_data[0]
+        img_bytes = self._single_image(image_data)
 
         try:
-            import base64
-
-            image_base64 = base64.b64encode(img_bytes).decode('utf-8')
-            
-            # Mistral unterstützt Bilder über Chat-Completion mit ContentChunks
-            # Erstelle Message mit Bild
-            if UserMessage is None or TextChunk is None or ImageURLChunk is None:
-                raise ImportError(
-                    "mistralai Chunk-Typen (TextChunk/ImageURLChunk) nicht "
-                    "verfuegbar (inkompatible mistralai-Version?). Erwartet: "
-                    "mistralai==1.9.11"
-                )
-            
-            # Erstelle ContentChunks für Mistral
-            from mistralai.models import ImageURL
-            image_url_obj = ImageURL(url=f"data:image/jpeg;base64,{image_base64}")
-            content_parts: List[Any] = [
-                TextChunk(text=prompt),
-                ImageURLChunk(image_url=image_url_obj)  # type: ignore
-            ]
-            
-            # Konvertiere zu Mistral-Format
-            messages = [UserMessage(content=content_parts)]  # type: ignore
-            
-            # API-Parameter vorbereiten
-            api_params: Dict[str, Any] = {
-                "model": model,
-                "messages": messages
-            }
-            
-            if max_tokens:
-                api_params["max_tokens"] = max_tokens
-            
-            if "temperature" in kwargs:
-                api_params["temperature"] = kwargs["temperature"]
-            else:
-                api_params["temperature"] = 0.1
-            
-            # API-Aufruf
+            api_params = self._vision_params(img_bytes, prompt, model, max_tokens, kwargs)
             response = self.client.chat.complete(**api_params)
-            
-            # Dauer berechnen
-            duration = (time.time() - start_time) * 1000
-            
-            # Antwort extrahieren
-            if not response.choices or len(response.choices) == 0:
-                raise ProcessingError("Keine gültige Antwort von Mistral Vision API erhalten")
-            
-            # Antwort extrahieren und zu String konvertieren
-            message_content = response.choices[0].message.content if response.choices[0].message else None
-            content = str(message_content) if message_content is not None else ""
-            
-            # Tokens extrahieren
-            tokens: int = 0
-            if hasattr(response, 'usage') and response.usage:
-                total_tokens = getattr(response.usage, 'total_tokens', None)
-                if total_tokens is not None:
-                    tokens = int(total_tokens)
-                else:
-                    tokens = 0
-            
-            # Stelle sicher, dass tokens mindestens 1 ist (eine API-Anfrage verbraucht immer Tokens)
-            if tokens <= 0:
-                tokens = 1  # Mindestwert für eine API-Anfrage
-            
-            # LLMRequest erstellen
-            llm_request = LLMRequest(
-                model=model,
-                purpose="vision",
-                tokens=tokens,
-                duration=duration,
-                processor="MistralProvider"
-            )
-            
-            return content, llm_request
-            
+            return self._completion_result(response, model, "vision", start_time)
         except Exception as e:
             duration = (time.time() - start_time) * 1000
             raise ProcessingError(
@@ -387,6 +322,65 @@ class MistralProvider:
                 details={'error_type': 'VISION_ERROR', 'duration_ms': duration}
             ) from e
     
+    def _single_image(self, image_data: Union[bytes, List[bytes]]) -> bytes:
+        # Eingabe normalisieren: nur Einzelbild zugelassen.
+        if isinstance(image_data, (bytes, bytearray)):
+            return bytes(image_data)
+        if len(image_data) != 1:
+            raise ProcessingError(
+                "Mistral-Provider: Multi-Image-Vision wird nicht unterstützt. "
+                "Bitte nur ein Bild pro Aufruf übergeben.",
+                details={'error_type': 'VISION_MULTI_IMAGE_NOT_SUPPORTED'}
+            )
+        return image_data[0]
+    
+    def _vision_params(
+        self,
+        img_bytes: bytes,
+        prompt: str,
+        model: str,
+        max_tokens: Optional[int],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        import base64
+
+        image_base64 = base64.b64encode(img_bytes).decode('utf-8')
+        
+        # Mistral unterstützt Bilder über Chat-Completion mit ContentChunks
+        # Erstelle Message mit Bild
+        if UserMessage is None or TextChunk is None or ImageURLChunk is None:
+            raise ImportError(
+                "mistralai Chunk-Typen (TextChunk/ImageURLChunk) nicht "
+                "verfuegbar (inkompatible mistralai-Version?). Erwartet: "
+                "mistralai==1.9.11"
+            )
+        
+        # Erstelle ContentChunks für Mistral
+        from mistralai.models import ImageURL
+        image_url_obj = ImageURL(url=f"data:image/jpeg;base64,{image_base64}")
+        content_parts: List[Any] = [
+            TextChunk(text=prompt),
+            ImageURLChunk(image_url=image_url_obj)  # type: ignore
+        ]
+        
+        # Konvertiere zu Mistral-Format
+        messages = [UserMessage(content=content_parts)]  # type: ignore
+        
+        # API-Parameter vorbereiten
+        api_params: Dict[str, Any] = {
+            "model": model,
+            "messages": messages
+        }
+        
+        if max_tokens:
+            api_params["max_tokens"] = max_tokens
+        
+        if "temperature" in kwargs:
+            api_params["temperature"] = kwargs["temperature"]
+        else:
+            api_params["temperature"] = 0.1
+        return api_params
+    
     def get_available_models(self, use_case: UseCase) -> List[str]:
         """
         Gibt die verfügbaren Modelle für einen Use-Case zurück.
@@ -6,6 +6,8 @@ Ollama provider implementation. Ollama is a local LLM server that provides
 an OpenAI-compatible API. This provider connects to a local Ollama instance
 running on the default port (11434).
 
+Aufrufe laufen über den gemeinsamen httpx-Client aus dem `ProviderManager`.
+
 @module core.llm.providers.ollama_provider
 
 @exports
@@ -51,7 +53,8 @@ class OllamaProvider:
             api_key: API-Key (kann leer sein oder "ollama" als Placeholder, wird nicht verwendet)
             base_url: Optional, benutzerdefinierte Base-URL (Standard: http://localhost:11434/v1)
             available_models: Optional, Dictionary mit Use-Case -> Liste von Modell-Namen aus Config
-            **kwargs: Zusätzliche Parameter (werden ignoriert)
+            **kwargs: Zusätzliche Parameter; `http_client` (httpx.Client) setzt
+                der ProviderManager, alle anderen werden ignoriert
         """
         # Ollama benötigt keinen echten API-Key, aber der OpenAI-Client erwartet einen
         # Wir verwenden "ollama" als Placeholder, wenn keiner angegeben wurde
@@ -67,7 +70,8 @@ class OllamaProvider:
         # Erstelle OpenAI-kompatiblen Client für Ollama
         self.client = OpenAI(
             api_key=api_key,
-            base_url=api_base_url
+            base_url=api_base_url,
+            http_client=kwargs.get("http_client")
         )
         
         self._api_key = api_key
@@ -158,53 +162,9 @@ class OllamaProvider:
         start_time = time.time()
         
         try:
-            # API-Parameter vorbereiten
-            api_params: Dict[str, Any] = {
-                "model": model,
-                "messages": messages,
-                "temperature": temperature
-            }
-            
-            if max_tokens:
-                api_params["max_tokens"] = max_tokens
-            
-            # Zusätzliche Parameter hinzufügen
-            for key, value in kwargs.items():
-                if key not in ['model', 'messages', 'temperature', 'max_tokens']:
-                    api_params[key] = value
-            
-            # API-Aufruf
+            api_params = self._chat_params(messages, model, temperature, max_tokens, kwargs)
             response: ChatCompletion = self.client.chat.completions.create(**api_params)
-            
-            # Dauer berechnen
-            duration = (time.time() - start_time) * 1000
-            
-            # Antwort extrahieren
-            if not response.choices or not response.choices[0].message:
-                raise ProcessingError("Keine gültige Antwort von Ollama erhalten")
-            
-            content = response.choices[0].message.content or ""
-            
-            # Tokens extrahieren
-            tokens = 0
-            if response.usage:
-                tokens = response.usage.total_tokens if hasattr(response.usage, 'total_tokens') else 0
-            
-            # Stelle sicher, dass tokens mindestens 1 ist (eine API-Anfrage verbraucht immer Tokens)
-            if tokens <= 0:
-                tokens = 1  # Mindestwert für eine API-Anfrage
-            
-            # LLMRequest erstellen
-            llm_request = LLMRequest(
-                model=model,
-                purpose="chat_completion",
-                tokens=tokens,
-                duration=duration,
-                processor="OllamaProvider"
-            )
-            
-            return content, llm_request
-            
+            return self._completion_result(response, model, "chat_completion", start_time)
         except Exception as e:
             duration = (time.time() - start_time) * 1000
             raise ProcessingError(
@@ -212,6 +172,67 @@ class OllamaProvider:
                 details={'error_type': 'CHAT_COMPLETION_ERROR', 'duration_ms': duration}
             ) from e
     
+    def _chat_params(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        # API-Parameter vorbereiten
+        api_params: Dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature
+        }
+        
+        if max_tokens:
+            api_params["max_tokens"] = max_tokens
+        
+        # Zusätzliche Parameter hinzufügen
+        for key, value in kwargs.items():
+            if key not in ['model', 'messages', 'temperature', 'max_tokens']:
+                api_params[key] = value
+        return api_params
+    
+    def _completion_result(
+        self,
+        response: ChatCompletion,
+        model: str,
+        purpose: str,
+        start_time: float
+    ) -> tuple[str, LLMRequest]:
+        # Dauer berechnen
+        duration = (time.time() - start_time) * 1000
+        
+        # Antwort extrahieren
+        if not response.choices or not response.choices[0].message:
+            api_name = "Ollama Vision API" if purpose == "vision" else "Ollama"
+            raise ProcessingError(f"Keine gültige Antwort von {api_name} erhalten")
+        
+        content = response.choices[0].message.content or ""
+        
+        # Tokens extrahieren
+        tokens = 0
+        if response.usage:
+            tokens = response.usage.total_tokens if hasattr(response.usage, 'total_tokens') else 0
+        
+        # Stelle sicher, dass tokens mindestens 1 ist (eine API-Anfrage verbraucht immer Tokens)
+        if tokens <= 0:
+            tokens = 1  # Mindestwert für eine API-Anfrage
+        
+        # LLMRequest erstellen
+        llm_request = LLMRequest(
+            model=model,
+            purpose=purpose,
+            tokens=tokens,
+            duration=duration,
+            processor="OllamaProvider"
+        )
+        
+        return content, llm_request
+    
     def vision(
         self,
         image_data: Union[bytes, List[bytes]],
@@ -243,85 +264,12 @@ class OllamaProvider:
                 oder wenn Multi-Image angefordert wird.
         """
         start_time = time.time()
-
-        # Eingabe normalisieren: nur Einzelbild zugelassen.
-        if isinstance(image_data, (bytes, bytearray)):
-            img_bytes: bytes = bytes(image_data)
-        else:
-            if len(image_data) != 1:
-                raise ProcessingError(
-                    "Ollama-Provider: Multi-Image-Vision wird nicht unterstützt. "
-                    "Bitte nur ein Bild pro Aufruf übergeben.",
-                    details={'error_type': 'VISION_MULTI_IMAGE_NOT_SUPPORTED'}
-                )
-            img_bytes = image_data[0]
+        img_bytes = self._single_image(image_data)
 
         try:
-            import base64
-
-            image_base64 = base64.b64encode(img_bytes).decode('utf-8')
-            
-            # API-Parameter vorbereiten
-            api_params: Dict[str, Any] = {
-                "model": model,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": prompt
-                            },
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/jpeg;base64,{image_base64}",
-                                    "detail": kwargs.get("detail", "high")
-                                }
-                            }
-                        ]
-                    }
-                ]
-            }
-            
-            if max_tokens:
-                api_params["max_tokens"] = max_tokens
-            
-            if "temperature" in kwargs:
-                api_params["temperature"] = kwargs["temperature"]
-            
-            # API-Aufruf
+            api_params = self._vision_params(img_bytes, prompt, model, max_tokens, kwargs)
             response: ChatCompletion = self.client.chat.completions.create(**api_params)
-            
-            # Dauer berechnen
-            duration = (time.time() - start_time) * 1000
-            
-            # Antwort extrahieren
-            if not response.choices or not response.choices[0].message:
-                raise ProcessingError("Keine gültige Antwort von Ollama Vision API erhalten")
-            
-            content = response.choices[0].message.content or ""
-            
-            # Tokens extrahieren
-            tokens = 0
-            if response.usage:
-                tokens = response.usage.total_tokens if hasattr(response.usage, 'total_tokens') else 0
-            
-            # Stelle sicher, dass tokens mindestens 1 ist (eine API-Anfrage verbraucht immer Tokens)
-            if tokens <= 0:
-                tokens = 1  # Mindestwert für eine API-Anfrage
-            
-            # LLMRequest erstellen
-            llm_request = LLMRequest(
-                model=model,
-                purpose="vision",
-                tokens=tokens,
-                duration=duration,
-                processor="OllamaProvider"
-            )
-            
-            return content, llm_request
-            
+            return self._completion_result(response, model, "vision", start_time)
         except Exception as e:
             duration = (time.time() - start_time) * 1000
             raise ProcessingError(
@@ -329,6 +277,60 @@ class OllamaProvider:
                 details={'error_type': 'VISION_ERROR', 'duration_ms': duration}
             ) from e
     
+    def _single_image(self, image_data: Union[bytes, List[bytes]]) -> bytes:
+        # Eingabe normalisieren: nur Einzelbild zugelassen.
+        if isinstance(image_data, (bytes, bytearray)):
+            return bytes(image_data)
+        if len(image_data) != 1:
+            raise ProcessingError(
+                "Ollama-Provider: Multi-Image-Vision wird nicht unterstützt. "
+                "Bitte nur ein Bild pro Aufruf übergeben.",
+                details={'error_type': 'VISION_MULTI_IMAGE_NOT_SUPPORTED'}
+            )
+        return image_data[0]
+    
+    def _vision_params(
+        self,
+        img_bytes: bytes,
+        prompt: str,
+        model: str,
+        max_tokens: Optional[int],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        import base64
+
+        image_base64 = base64.b64encode(img_bytes).decode('utf-8')
+        
+        # API-Parameter vorbereiten
+        api_params: Dict[str, Any] = {
+            "model": model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": prompt
+                        },
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": f"data:image/jpeg;base64,{image_base64}",
+                                "detail": kwargs.get("detail", "high")
+                            }
+                        }
+                    ]
+                }
+            ]
+        }
+        
+        if max_tokens:
+            api_params["max_tokens"] = max_tokens
+        
+        if "temperature" in kwargs:
+            api_params["temperature"] = kwargs["temperature"]
+        return api_params
+    
     def get_available_models(self, use_case: UseCase) -> List[str]:
         """
         Gibt die verfügbaren Modelle für einen Use-Case zurück.
@@ -5,17 +5,20 @@
 OpenAI provider implementation. Provides access to OpenAI's API including
 Whisper transcription, GPT chat completion, and Vision API.
 
+Aufrufe laufen über den gemeinsamen httpx-Client aus dem `ProviderManager`.
+
 @module core.llm.providers.openai_provider
 
 @exports
 - OpenAIProvider: Class - OpenAI provider implementation
 """
 
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, cast
 from pathlib import Path
 import io
 import time
 
+import httpx
 from openai import OpenAI
 from openai.types.chat import ChatCompletion
 
@@ -48,15 +51,15 @@ class OpenAIProvider:
             api_key: OpenAI API-Key
             base_url: Optional, benutzerdefinierte Base-URL
             available_models: Optional, Dictionary mit Use-Case -> Liste von Modell-Namen aus Config
-            **kwargs: Zusätzliche Parameter (werden ignoriert)
+            **kwargs: Zusätzliche Parameter; `http_client` (httpx.Client) setzt
+                der ProviderManager, alle anderen werden ignoriert
         """
         if not api_key:
             raise ValueError("OpenAI API-Key darf nicht leer sein")
         
-        if base_url:
-            self.client = OpenAI(api_key=api_key, base_url=base_url)
-        else:
-            self.client = OpenAI(api_key=api_key)
+        http_client: Optional[httpx.Client] = kwargs.get("http_client")
+        # Das SDK typisiert nur httpx2.Client, akzeptiert aber auch httpx.Client
+        self.client = OpenAI(api_key=api_key, base_url=base_url or None, http_client=cast(Any, http_client))
         
         self._api_key = api_key
         self._available_models = available_models or {}
@@ -260,53 +263,9 @@ class OpenAIProvider:
         start_time = time.time()
         
         try:
-            # API-Parameter vorbereiten
-            api_params: Dict[str, Any] = {
-                "model": model,
-                "messages": messages,
-                "temperature": temperature
-            }
-            
-            if max_tokens:
-                api_params["max_tokens"] = max_tokens
-            
-            # Zusätzliche Parameter hinzufügen (functions, function_call, etc.)
-            for key, value in kwargs.items():
-                if key not in ['model', 'messages', 'temperature', 'max_tokens']:
-                    api_params[key] = value
-            
-            # API-Aufruf
+            api_params = self._chat_params(messages, model, temperature, max_tokens, kwargs)
             response: ChatCompletion = self.client.chat.completions.create(**api_params)
-            
-            # Dauer berechnen
-            duration = (time.time() - start_time) * 1000
-            
-            # Antwort extrahieren
-            if not response.choices or not response.choices[0].message:
-                raise ProcessingError("Keine gültige Antwort von OpenAI erhalten")
-            
-            content = response.choices[0].message.content or ""
-            
-            # Tokens extrahieren
-            tokens = 0
-            if response.usage:
-                tokens = response.usage.total_tokens if hasattr(response.usage, 'total_tokens') else 0
-            
-            # Stelle sicher, dass tokens mindestens 1 ist (eine API-Anfrage verbraucht immer Tokens)
-            if tokens <= 0:
-                tokens = 1  # Mindestwert für eine API-Anfrage
-            
-            # LLMRequest erstellen
-            llm_request = LLMRequest(
-                model=model,
-                purpose="chat_completion",
-                tokens=tokens,
-                duration=duration,
-                processor="OpenAIProvider"
-            )
-            
-            return content, llm_request
-            
+            return self._completion_result(response, model, "chat_completion", start_time)
         except Exception as e:
             duration = (time.time() - start_time) * 1000
             raise ProcessingError(
@@ -314,6 +273,67 @@ class OpenAIProvider:
                 details={'error_type': 'CHAT_COMPLETION_ERROR', 'duration_ms': duration}
             ) from e
     
+    def _chat_params(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        # API-Parameter vorbereiten
+        api_params: Dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature
+        }
+        
+        if max_tokens:
+            api_params["max_tokens"] = max_tokens
+        
+        # Zusätzliche Parameter hinzufügen (functions, function_call, etc.)
+        for key, value in kwargs.items():
+            if key not in ['model', 'messages', 'temperature', 'max_tokens']:
+                api_params[key] = value
+        return api_params
+    
+    def _completion_result(
+        self,
+        response: ChatCompletion,
+        model: str,
+        purpose: str,
+        start_time: float
+    ) -> tuple[str, LLMRequest]:
+        # Dauer berechnen
+        duration = (time.time() - start_time) * 1000
+        
+        # Antwort extrahieren
+        if not response.choices or not response.choices[0].message:
+            api_name = "OpenAI Vision API" if purpose == "vision" else "OpenAI"
+            raise ProcessingError(f"Keine gültige Antwort von {api_name} erhalten")
+        
+        content = response.choices[0].message.content or ""
+        
+        # Tokens extrahieren
+        tokens = 0
+        if response.usage:
+            tokens = response.usage.total_tokens if hasattr(response.usage, 'total_tokens') else 0
+        
+        # Stelle sicher, dass tokens mindestens 1 ist (eine API-Anfrage verbraucht immer Tokens)
+        if tokens <= 0:
+            tokens = 1  # Mindestwert für eine API-Anfrage
+        
+        # LLMRequest erstellen
+        llm_request = LLMRequest(
+            model=model,
+            purpose=purpose,
+            tokens=tokens,
+            duration=duration,
+            processor="OpenAIProvider"
+        )
+        
+        return content, llm_request
+    
     def vision(
         self,
         image_data: Union[bytes, List[bytes]],
@@ -345,85 +365,12 @@ class OpenAIProvider:
                 oder wenn Multi-Image angefordert wird.
         """
         start_time = time.time()
-
-        # Eingabe normalisieren: nur Einzelbild zugelassen.
-        if isinstance(image_data, (bytes, bytearray)):
-            img_bytes: bytes = bytes(image_data)
-        else:
-            if len(image_data) != 1:
-                raise ProcessingError(
-                    "OpenAI-Provider: Multi-Image-Vision wird nicht unterstützt. "
-                    "Bitte nur ein Bild pro Aufruf übergeben.",
-                    details={'error_type': 'VISION_MULTI_IMAGE_NOT_SUPPORTED'}
-                )
-            img_bytes = image_data[0]
+        img_bytes = self._single_image(image_data)
 
         try:
-            import base64
-
-            image_base64 = base64.b64encode(img_bytes).decode('utf-8')
-            
-            # API-Parameter vorbereiten
-            api_params: Dict[str, Any] = {
-                "model": model,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": prompt
-                            },
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/jpeg;base64,{image_base64}",
-                                    "detail": kwargs.get("detail", "high")
-                                }
-                            }
-                        ]
-                    }
-                ]
-            }
-            
-            if max_tokens:
-                api_params["max_tokens"] = max_tokens
-            
-            if "temperature" in kwargs:
-                api_params["temperature"] = kwargs["temperature"]
-            
-            # API-Aufruf
+            api_params = self._vision_params(img_bytes, prompt, model, max_tokens, kwargs)
             response: ChatCompletion = self.client.chat.completions.create(**api_params)
-            
-            # Dauer berechnen
-            duration = (time.time() - start_time) * 1000
-            
-            # Antwort extrahieren
-            if not response.choices or not response.choices[0].message:
-                raise ProcessingError("Keine gültige Antwort von OpenAI Vision API erhalten")
-            
-            content = response.choices[0].message.content or ""
-            
-            # Tokens extrahieren
-            tokens = 0
-            if response.usage:
-                tokens = response.usage.total_tokens if hasattr(response.usage, 'total_tokens') else 0
-            
-            # Stelle sicher, dass tokens mindestens 1 ist (eine API-Anfrage verbraucht immer Tokens)
-            if tokens <= 0:
-                tokens = 1  # Mindestwert für eine API-Anfrage
-            
-            # LLMRequest erstellen
-            llm_request = LLMRequest(
-                model=model,
-                purpose="vision",
-                tokens=tokens,
-                duration=duration,
-                processor="OpenAIProvider"
-            )
-            
-            return content, llm_request
-            
+            return self._completion_result(response, model, "vision", start_time)
         except Exception as e:
             duration = (time.time() - start_time) * 1000
             raise ProcessingError(
@@ -431,6 +378,60 @@ class OpenAIProvider:
                 details={'error_type': 'VISION_ERROR', 'duration_ms': duration}
             ) from e
     
+    def _single_image(self, image_data: Union[bytes, List[bytes]]) -> bytes:
+        # Eingabe normalisieren: nur Einzelbild zugelassen.
+        if isinstance(image_data, (bytes, bytearray)):
+            return bytes(image_data)
+        if len(image_data) != 1:
+            raise ProcessingError(
+                "OpenAI-Provider: Multi-Image-Vision wird nicht unterstützt. "
+                "Bitte nur ein Bild pro Aufruf übergeben.",
+                details={'error_type': 'VISION_MULTI_IMAGE_NOT_SUPPORTED'}
+            )
+        return image_data[0]
+    
+    def _vision_params(
+        self,
+        img_bytes: bytes,
+        prompt: str,
+        model: str,
+        max_tokens: Optional[int],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        import base64
+
+        image_base64 = base64.b64encode(img_bytes).decode('utf-8')
+        
+        # API-Parameter vorbereiten
+        api_params: Dict[str, Any] = {
+            "model": model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": prompt
+                        },
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": f"data:image/jpeg;base64,{image_base64}",
+                                "detail": kwargs.get("detail", "high")
+                            }
+                        }
+                    ]
+                }
+            ]
+        }
+        
+        if max_tokens:
+            api_params["max_tokens"] = max_tokens
+        
+        if "temperature" in kwargs:
+            api_params["temperature"] = kwargs["temperature"]
+        return api_params
+    
     def get_available_models(self, use_case: UseCase) -> List[str]:
         """
         Gibt die verfügbaren Modelle für einen Use-Case zurück.
@@ -5,6 +5,9 @@
 OpenRouter provider implementation. OpenRouter provides access to multiple
 LLM providers through a unified API that is compatible with OpenAI's API.
 
+Alle Aufrufe (SDK, Guthaben, Modellliste, Bildgenerierung) laufen über den
+gemeinsamen httpx-Client aus dem `ProviderManager`.
+
 @module core.llm.providers.openrouter_provider
 
 @exports
@@ -20,12 +23,14 @@ LLM providers through a unified API that is compatible with OpenAI's API.
 from typing import List, Optional, Dict, Any, Union, cast
 import time
 
+import httpx
 from openai import OpenAI
 from openai.types.chat import ChatCompletion
 
 from src.utils.logger import get_logger
 from ...exceptions import ProcessingError
 from ...models.llm import LLMRequest
+from ..http_clients import create_http_client
 from ..use_cases import UseCase
 
 logger = get_logger(process_id="openrouter-provider")
@@ -54,7 +59,8 @@ class OpenRouterProvider:
             api_key: OpenRouter API-Key
             base_url: Optional, benutzerdefinierte Base-URL (Standard: OpenRouter API)
             available_models: Optional, Dictionary mit Use-Case -> Liste von Modell-Namen aus Config
-            **kwargs: Zusätzliche Parameter (werden ignoriert)
+            **kwargs: Zusätzliche Parameter (http_referer, app_name); `http_client`
+                (httpx.Client) setzt der ProviderManager
         """
         if not api_key:
             raise ValueError("OpenRouter API-Key darf nicht leer sein")
@@ -66,13 +72,19 @@ class OpenRouterProvider:
         else:
             api_base_url = "https://openrouter.ai/api/v1"
         
+        self._default_headers = {
+            "HTTP-Referer": kwargs.get("http_referer", "https://github.com/your-repo"),
+            "X-Title": kwargs.get("app_name", "Common Secretary Services")
+        }
+        # Ohne ProviderManager eigener Client, damit auch direkte HTTP-Aufrufe Keep-Alive nutzen
+        http_client: Optional[httpx.Client] = kwargs.get("http_client")
+        self._http = http_client if http_client is not None else create_http_client()
         self.client = OpenAI(
             api_key=api_key,
             base_url=api_base_url,
-            default_headers={
-                "HTTP-Referer": kwargs.get("http_referer", "https://github.com/your-repo"),
-                "X-Title": kwargs.get("app_name", "Common Secretary Services")
-            }
+            default_headers=self._default_headers,
+            # Das SDK typisiert nur httpx2.Client, akzeptiert aber auch httpx.Client
+            http_client=cast(Any, self._http)
         )
         
         self._api_key = api_key
@@ -104,8 +116,6 @@ class OpenRouterProvider:
             Dict mit reachable, remaining_usd, limit_usd, usage_usd,
             is_free_tier, detail.
         """
-        import requests
-
         base = "https://openrouter.ai/api/v1"
         headers = {"Authorization": f"Bearer {self._api_key}"}
         result: Dict[str, Any] = {
@@ -117,7 +127,7 @@ class OpenRouterProvider:
             "detail": "",
         }
         try:
-            resp = requests.get(f"{base}/key", headers=headers, timeout=timeout)
+            resp = self._http.get(f"{base}/key", headers=headers, timeout=timeout)
             if resp.status_code == 401:
                 result["detail"] = "401 Unauthorized (ungültiger API-Key)"
                 return result
@@ -136,8 +146,8 @@ class OpenRouterProvider:
                 return result
 
             # Kein eigenes Key-Limit -> Account-Kontostand über /credits.
-            credits_resp = requests.get(f"{base}/credits", headers=headers, timeout=timeout)
-            if credits_resp.ok:
+            credits_resp = self._http.get(f"{base}/credits", headers=headers, timeout=timeout)
+            if credits_resp.is_success:
                 cdata = (credits_resp.json() or {}).get("data", {}) or {}
                 total_credits = cdata.get("total_credits")
                 total_usage = cdata.get("total_usage")
@@ -152,7 +162,7 @@ class OpenRouterProvider:
                     f"evtl. Management-Key nötig)"
                 )
             return result
-        except requests.exceptions.RequestException as exc:
+        except httpx.HTTPError as exc:
             result["detail"] = f"nicht erreichbar: {type(exc).__name__}"
             return result
         except Exception as exc:  # defensiv: Probe darf nie hart fehlschlagen
@@ -363,93 +373,9 @@ class OpenRouterProvider:
         start_time = time.time()
         
         try:
-            # API-Parameter vorbereiten
-            api_params: Dict[str, Any] = {
-                "model": model,
-                "messages": messages,
-                "temperature": temperature
-            }
-            
-            if max_tokens:
-                api_params["max_tokens"] = max_tokens
-            
-            # response_format explizit behandeln (OpenAI-kompatibel)
-            if 'response_format' in kwargs:
-                response_format_value = kwargs['response_format']
-                # OpenAI erwartet response_format als Dict mit {"type": "json_object"}
-                # oder als String "json_object"
-                if isinstance(response_format_value, dict):
-                    api_params["response_format"] = response_format_value
-                elif isinstance(response_format_value, str):
-                    # Konvertiere String zu Dict für OpenAI-kompatible API
-                    if response_format_value == "json_object":
-                        api_params["response_format"] = {"type": "json_object"}
-                    else:
-                        api_params["response_format"] = response_format_value
-            
-            # Zusätzliche Parameter hinzufügen (außer response_format, das bereits behandelt wurde)
-            for key, value in kwargs.items():
-                if key not in ['model', 'messages', 'temperature', 'max_tokens', 'response_format']:
-                    api_params[key] = value
-            
-            # API-Aufruf
+            api_params = self._chat_params(messages, model, temperature, max_tokens, kwargs)
             response: ChatCompletion = self.client.chat.completions.create(**api_params)
-            
-            # Dauer berechnen
-            duration = (time.time() - start_time) * 1000
-            
-            # Antwort extrahieren
-            if not response.choices or not response.choices[0].message:
-                raise ProcessingError("Keine gültige Antwort von OpenRouter erhalten")
-            
-            content = str(response.choices[0].message.content or "")
-
-            # Debug-Logging (mit Guardrails):
-            # - Keine API Keys/Secrets
-            # - Content nur gekürzt, damit die Console nicht explodiert
-            choice0 = cast(Any, response.choices[0])
-            finish_reason = getattr(choice0, "finish_reason", None)
-            prompt_chars = sum(len(str(m.get("content") or "")) for m in messages)
-            content_chars = len(content)
-            tail = content[-240:] if content_chars > 240 else content
-
-            usage = getattr(response, "usage", None)
-            prompt_tokens = int(getattr(usage, "prompt_tokens", 0) or 0)
-            completion_tokens = int(getattr(usage, "completion_tokens", 0) or 0)
-            total_tokens = int(getattr(usage, "total_tokens", 0) or 0)
-
-            logger.info(
-                "OpenRouter chat_completion",
-                model=model,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                finish_reason=finish_reason,
-                prompt_chars=prompt_chars,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                total_tokens=total_tokens,
-                content_chars=content_chars,
-                content_tail=tail,
-            )
-            
-            # Tokens extrahieren
-            tokens = total_tokens
-            
-            # Stelle sicher, dass tokens mindestens 1 ist (eine API-Anfrage verbraucht immer Tokens)
-            if tokens <= 0:
-                tokens = 1  # Mindestwert für eine API-Anfrage
-            
-            # LLMRequest erstellen
-            llm_request = LLMRequest(
-                model=model,
-                purpose="chat_completion",
-                tokens=tokens,
-                duration=duration,
-                processor="OpenRouterProvider"
-            )
-            
-            return content, llm_request
-            
+            return self._chat_result(response, messages, model, temperature, max_tokens, start_time)
         except Exception as e:
             duration = (time.time() - start_time) * 1000
             raise ProcessingError(
@@ -457,6 +383,108 @@ class OpenRouterProvider:
                 details={'error_type': 'CHAT_COMPLETION_ERROR', 'duration_ms': duration}
             ) from e
     
+    def _chat_params(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        # API-Parameter vorbereiten
+        api_params: Dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature
+        }
+        
+        if max_tokens:
+            api_params["max_tokens"] = max_tokens
+        
+        # response_format explizit behandeln (OpenAI-kompatibel)
+        if 'response_format' in kwargs:
+            response_format_value = kwargs['response_format']
+            # OpenAI erwartet response_format als Dict mit {"type": "json_object"}
+            # oder als String "json_object"
+            if isinstance(response_format_value, dict):
+                api_params["response_format"] = response_format_value
+            elif isinstance(response_format_value, str):
+                # Konvertiere String zu Dict für OpenAI-kompatible API
+                if response_format_value == "json_object":
+                    api_params["response_format"] = {"type": "json_object"}
+                else:
+                    api_params["response_format"] = response_format_value
+        
+        # Zusätzliche Parameter hinzufügen (außer response_format, das bereits behandelt wurde)
+        for key, value in kwargs.items():
+            if key not in ['model', 'messages', 'temperature', 'max_tokens', 'response_format']:
+                api_params[key] = value
+        return api_params
+    
+    def _chat_result(
+        self,
+        response: ChatCompletion,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int],
+        start_time: float
+    ) -> tuple[str, LLMRequest]:
+        # Dauer berechnen
+        duration = (time.time() - start_time) * 1000
+        
+        # Antwort extrahieren
+        if not response.choices or not response.choices[0].message:
+            raise ProcessingError("Keine gültige Antwort von OpenRouter erhalten")
+        
+        content = str(response.choices[0].message.content or "")
+
+        # Debug-Logging (mit Guardrails):
+        # - Keine API Keys/Secrets
+        # - Content nur gekürzt, damit die Console nicht explodiert
+        choice0 = cast(Any, response.choices[0])
+        finish_reason = getattr(choice0, "finish_reason", None)
+        prompt_chars = sum(len(str(m.get("content") or "")) for m in messages)
+        content_chars = len(content)
+        tail = content[-240:] if content_chars > 240 else content
+
+        usage = getattr(response, "usage", None)
+        prompt_tokens = int(getattr(usage, "prompt_tokens", 0) or 0)
+        completion_tokens = int(getattr(usage, "completion_tokens", 0) or 0)
+        total_tokens = int(getattr(usage, "total_tokens", 0) or 0)
+
+        logger.info(
+            "OpenRouter chat_completion",
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            finish_reason=finish_reason,
+            prompt_chars=prompt_chars,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=total_tokens,
+            content_chars=content_chars,
+            content_tail=tail,
+        )
+        
+        # Tokens extrahieren
+        tokens = total_tokens
+        
+        # Stelle sicher, dass tokens mindestens 1 ist (eine API-Anfrage verbraucht immer Tokens)
+        if tokens <= 0:
+            tokens = 1  # Mindestwert für eine API-Anfrage
+        
+        # LLMRequest erstellen
+        llm_request = LLMRequest(
+            model=model,
+            purpose="chat_completion",
+            tokens=tokens,
+            duration=duration,
+            processor="OpenRouterProvider"
+        )
+        
+        return content, llm_request
+    
     def vision(
         self,
         image_data: Union[bytes, List[bytes]],
@@ -488,7 +516,20 @@ class OpenRouterProvider:
                 oder wenn die Bild-Liste leer ist.
         """
         start_time = time.time()
+        image_list = self._image_list(image_data)
 
+        try:
+            api_params = self._vision_params(image_list, prompt, model, max_tokens, kwargs)
+            response: ChatCompletion = self.client.chat.completions.create(**api_params)
+            return self._vision_result(response, image_list, prompt, model, max_tokens, kwargs, start_time)
+        except Exception as e:
+            duration = (time.time() - start_time) * 1000
+            raise ProcessingError(
+                f"Fehler bei der OpenRouter Vision API: {str(e)}",
+                details={'error_type': 'VISION_ERROR', 'duration_ms': duration}
+            ) from e
+    
+    def _image_list(self, image_data: Union[bytes, List[bytes]]) -> List[bytes]:
         # Eingabe normalisieren: Single-Bytes -> 1-elementige Liste.
         # So bleibt der restliche Code einheitlich.
         if isinstance(image_data, (bytes, bytearray)):
@@ -501,108 +542,116 @@ class OpenRouterProvider:
                 "Vision-API: Keine Bilder übergeben (leere Liste).",
                 details={'error_type': 'VISION_NO_IMAGES'}
             )
+        return image_list
+    
+    def _vision_params(
+        self,
+        image_list: List[bytes],
+        prompt: str,
+        model: str,
+        max_tokens: Optional[int],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        import base64
 
-        try:
-            import base64
-
-            # Detail-Stufe gilt für alle Bilder gleichermaßen.
-            detail = kwargs.get("detail", "high")
-
-            # Content-Liste aufbauen: zuerst der Prompt-Text, dann N Bilder.
-            content_parts: List[Dict[str, Any]] = [
-                {"type": "text", "text": prompt}
-            ]
-            total_image_bytes = 0
-            for img_bytes in image_list:
-                total_image_bytes += len(img_bytes)
-                image_base64 = base64.b64encode(img_bytes).decode('utf-8')
-                content_parts.append({
-                    "type": "image_url",
-                    "image_url": {
-                        "url": f"data:image/jpeg;base64,{image_base64}",
-                        "detail": detail,
-                    },
-                })
-
-            api_params: Dict[str, Any] = {
-                "model": model,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": content_parts,
-                    }
-                ],
-            }
-
-            if max_tokens:
-                api_params["max_tokens"] = max_tokens
-
-            if "temperature" in kwargs:
-                api_params["temperature"] = kwargs["temperature"]
-
-            response: ChatCompletion = self.client.chat.completions.create(**api_params)
-
-            duration = (time.time() - start_time) * 1000
-
-            if not response.choices or not response.choices[0].message:
-                raise ProcessingError("Keine gültige Antwort von OpenRouter Vision API erhalten")
-
-            content = str(response.choices[0].message.content or "")
+        # Detail-Stufe gilt für alle Bilder gleichermaßen.
+        detail = kwargs.get("detail", "high")
 
-            # Debug-Logging analog zu chat_completion (mit Guardrails):
-            # - Keine Bilddaten/Base64 im Log (nur Anzahl + Bytes)
-            # - Antwort nur als Tail (letzte 240 Zeichen), damit das Log lesbar bleibt
-            # - finish_reason hilft, Token-Limits oder Content-Filter zu erkennen
-            choice0 = cast(Any, response.choices[0])
-            finish_reason = getattr(choice0, "finish_reason", None)
-            content_chars = len(content)
-            tail = content[-240:] if content_chars > 240 else content
+        # Content-Liste aufbauen: zuerst der Prompt-Text, dann N Bilder.
+        content_parts: List[Dict[str, Any]] = [
+            {"type": "text", "text": prompt}
+        ]
+        for img_bytes in image_list:
+            image_base64 = base64.b64encode(img_bytes).decode('utf-8')
+            content_parts.append({
+                "type": "image_url",
+                "image_url": {
+                    "url": f"data:image/jpeg;base64,{image_base64}",
+                    "detail": detail,
+                },
+            })
+
+        api_params: Dict[str, Any] = {
+            "model": model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": content_parts,
+                }
+            ],
+        }
 
-            usage = getattr(response, "usage", None)
-            prompt_tokens = int(getattr(usage, "prompt_tokens", 0) or 0)
-            completion_tokens = int(getattr(usage, "completion_tokens", 0) or 0)
-            total_tokens = int(getattr(usage, "total_tokens", 0) or 0)
+        if max_tokens:
+            api_params["max_tokens"] = max_tokens
 
-            logger.info(
-                "OpenRouter vision",
-                model=model,
-                temperature=kwargs.get("temperature"),
-                max_tokens=max_tokens,
-                detail=detail,
-                image_count=len(image_list),
-                total_image_bytes=total_image_bytes,
-                prompt_chars=len(prompt),
-                finish_reason=finish_reason,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                total_tokens=total_tokens,
-                duration_ms=round(duration, 2),
-                content_chars=content_chars,
-                content_tail=tail,
-            )
+        if "temperature" in kwargs:
+            api_params["temperature"] = kwargs["temperature"]
+        return api_params
+    
+    def _vision_result(
+        self,
+        response: ChatCompletion,
+        image_list: List[bytes],
+        prompt: str,
+        model: str,
+        max_tokens: Optional[int],
+        kwargs: Dict[str, Any],
+        start_time: float
+    ) -> tuple[str, LLMRequest]:
+        duration = (time.time() - start_time) * 1000
 
-            # Tokens für LLMRequest – mindestens 1, weil jede API-Anfrage Tokens verbraucht.
-            tokens = total_tokens
-            if tokens <= 0:
-                tokens = 1
+        if not response.choices or not response.choices[0].message:
+            raise ProcessingError("Keine gültige Antwort von OpenRouter Vision API erhalten")
+
+        content = str(response.choices[0].message.content or "")
+
+        # Debug-Logging analog zu chat_completion (mit Guardrails):
+        # - Keine Bilddaten/Base64 im Log (nur Anzahl + Bytes)
+        # - Antwort nur als Tail (letzte 240 Zeichen), damit das Log lesbar bleibt
+        # - finish_reason hilft, Token-Limits oder Content-Filter zu erkennen
+        choice0 = cast(Any, response.choices[0])
+        finish_reason = getattr(choice0, "finish_reason", None)
+        content_chars = len(content)
+        tail = content[-240:] if content_chars > 240 else content
+
+        usage = getattr(response, "usage", None)
+        prompt_tokens = int(getattr(usage, "prompt_tokens", 0) or 0)
+        completion_tokens = int(getattr(usage, "completion_tokens", 0) or 0)
+        total_tokens = int(getattr(usage, "total_tokens", 0) or 0)
+
+        logger.info(
+            "OpenRouter vision",
+            model=model,
+            temperature=kwargs.get("temperature"),
+            max_tokens=max_tokens,
+            detail=kwargs.get("detail", "high"),
+            image_count=len(image_list),
+            total_image_bytes=sum(len(img) for img in image_list),
+            prompt_chars=len(prompt),
+            finish_reason=finish_reason,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=total_tokens,
+            duration_ms=round(duration, 2),
+            content_chars=content_chars,
+            content_tail=tail,
+        )
 
-            # LLMRequest erstellen
-            llm_request = LLMRequest(
-                model=model,
-                purpose="vision",
-                tokens=tokens,
-                duration=duration,
-                processor="OpenRouterProvider"
-            )
-            
-            return content, llm_request
-            
-        except Exception as e:
-            duration = (time.time() - start_time) * 1000
-            raise ProcessingError(
-                f"Fehler bei der OpenRouter Vision API: {str(e)}",
-                details={'error_type': 'VISION_ERROR', 'duration_ms': duration}
-            ) from e
+        # Tokens für LLMRequest – mindestens 1, weil jede API-Anfrage Tokens verbraucht.
+        tokens = total_tokens
+        if tokens <= 0:
+            tokens = 1
+
+        # LLMRequest erstellen
+        llm_request = LLMRequest(
+            model=model,
+            purpose="vision",
+            tokens=tokens,
+            duration=duration,
+            processor="OpenRouterProvider"
+        )
+        
+        return content, llm_request
     
     def fetch_models_from_api(self) -> Optional[List[Dict[str, Any]]]:
         """
@@ -612,8 +661,6 @@ class OpenRouterProvider:
             Optional[List[Dict[str, Any]]]: Liste der verfügbaren Modelle oder None bei Fehler
         """
         try:
-            import requests
-            
             # OpenRouter Models API Endpoint
             url = "https://openrouter.ai/api/v1/models"
             headers = {
@@ -622,7 +669,7 @@ class OpenRouterProvider:
                 "X-Title": "Common Secretary Services"
             }
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self._http.get(url, headers=headers, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 if isinstance(data, dict) and 'data' in data:
@@ -751,7 +798,6 @@ class OpenRouterProvider:
                 # Chat-Endpoint mit modalities für Bildgenerierung (OpenRouter-Doku)
                 # WICHTIG: Wir verwenden direkte HTTP-Anfrage statt OpenAI-Client,
                 # da der OpenAI-Client den 'modalities'-Parameter nicht korrekt weiterleitet
-                import requests as http_requests
                 
                 # Payload gemäß OpenRouter-Dokumentation
                 payload: Dict[str, Any] = {
@@ -774,8 +820,8 @@ class OpenRouterProvider:
                     "X-Title": "Common Secretary Services"
                 }
                 
-                http_response = http_requests.post(
-                    url=api_url,
+                http_response = self._http.post(
+                    api_url,
                     headers=headers,
                     json=payload,
                     timeout=120
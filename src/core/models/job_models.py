@@ -17,7 +17,7 @@ Main classes:
 
 Features:
 - Validation of all fields in __post_init__
-- Serialization to dictionary (to_dict, asdict)
+- Serialization to dictionary (to_dict, without deep copies of large results)
 - Deserialization from dictionary (from_dict)
 - Access control with visibility and access lists
 - Logging integration for job tracking
@@ -44,13 +44,16 @@ Features:
 - Standard: enum - Enum definitions
 - Standard: datetime - Timestamps
 - Standard: uuid - Unique job IDs
+- Internal: src.utils.serialization - dataclass_to_dict (asdict ohne tiefe Kopie)
 """
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Literal, cast
 from datetime import datetime, UTC
 import uuid
 from enum import Enum
 
+from src.utils.serialization import dataclass_to_dict
+
 
 class JobStatus(str, Enum):
     """Status eines Jobs."""
@@ -96,7 +99,7 @@ class LogEntry:
     
     def to_dict(self) -> Dict[str, Any]:
         """Konvertiert den Log-Eintrag in ein Dictionary."""
-        return asdict(self)
+        return dataclass_to_dict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "LogEntry":
@@ -122,7 +125,7 @@ class JobProgress:
     
     def to_dict(self) -> Dict[str, Any]:
         """Konvertiert den Fortschritt in ein Dictionary."""
-        return asdict(self)
+        return dataclass_to_dict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "JobProgress":
@@ -165,7 +168,7 @@ class JobParameters:
     def to_dict(self) -> Dict[str, Any]:
         """Konvertiert die Parameter in ein Dictionary."""
         # Alle Felder einschließen, auch mit None-Werten, damit sie in der UI angezeigt werden
-        return asdict(self)
+        return dataclass_to_dict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "JobParameters":
@@ -248,7 +251,7 @@ class JobResults:
     def to_dict(self) -> Dict[str, Any]:
         """Konvertiert die Ergebnisse in ein Dictionary."""
         # Alle Felder einschließen, auch mit None-Werten und leeren Listen
-        return asdict(self)
+        return dataclass_to_dict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "JobResults":
@@ -281,7 +284,7 @@ class JobError:
     def to_dict(self) -> Dict[str, Any]:
         """Konvertiert den Fehler in ein Dictionary."""
         # Alle Felder einschließen, auch mit None-Werten
-        return asdict(self)
+        return dataclass_to_dict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "JobError":
@@ -314,6 +317,15 @@ class Job:
     batch_id: Optional[str] = None
     log_entries: List[Dict[str, Any]] = field(default_factory=list)
     archived: bool = False
+    # Lease-Felder: welcher Worker-Knoten den Job hält und bis wann
+    worker_id: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+    attempts: int = 0
+    # Duplikaterkennung: Hash aus Eingabeinhalt und normalisierten Parametern
+    fingerprint: Optional[str] = None
+    # Webhooks von Duplikat-Anfragen, die sich an diesen Job angehängt haben.
+    # Enthalten Tokens: nur vom Repository geschrieben, nie in to_dict()/API
+    attached_webhooks: List[Dict[str, Any]] = field(default_factory=list)
     
     def __post_init__(self) -> None:
         """Validiert den Job nach der Initialisierung."""
@@ -363,7 +375,7 @@ class Job:
             job_dict["user_id"] = self.user_id
         
         if self.access_control:
-            access_dict = asdict(self.access_control)
+            access_dict = dataclass_to_dict(self.access_control)
             # Konvertiere Enum-Werte zu Strings
             access_dict["visibility"] = self.access_control.visibility.value
             job_dict["access_control"] = access_dict
@@ -389,6 +401,18 @@ class Job:
         if self.batch_id:
             job_dict["batch_id"] = self.batch_id
         
+        if self.worker_id:
+            job_dict["worker_id"] = self.worker_id
+        
+        if self.lease_expires_at:
+            job_dict["lease_expires_at"] = self.lease_expires_at
+        
+        if self.attempts:
+            job_dict["attempts"] = self.attempts
+        
+        if self.fingerprint:
+            job_dict["fingerprint"] = self.fingerprint
+        
         return job_dict
     
     @classmethod
@@ -478,7 +502,12 @@ class Job:
             batch_id=data.get("batch_id"),
             job_name=data.get("job_name"),
             archived=data.get("archived", False),
-            job_type=data.get("job_type", "")
+            job_type=data.get("job_type", ""),
+            worker_id=data.get("worker_id"),
+            lease_expires_at=data.get("lease_expires_at"),
+            attempts=int(data.get("attempts", 0) or 0),
+            fingerprint=data.get("fingerprint"),
+            attached_webhooks=list(data.get("attached_webhooks") or [])
         )
 
 
@@ -542,7 +571,7 @@ class Batch:
             batch_dict["user_id"] = self.user_id
         
         if self.access_control:
-            access_dict = asdict(self.access_control)
+            access_dict = dataclass_to_dict(self.access_control)
             # Konvertiere Enum-Werte zu Strings
             access_dict["visibility"] = self.access_control.visibility.value
             batch_dict["access_control"] = access_dict  # type: ignore
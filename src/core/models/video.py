@@ -298,14 +298,23 @@ class FrameInfo:
     file_path: str
     width: Optional[int] = None
     height: Optional[int] = None
+    # Ende der Zeitspanne, die dieser Frame repräsentiert (Keyframe-Modus: bis zum nächsten Keyframe)
+    end_s: Optional[float] = None
+    # dHash als Hex-String (nur im Keyframe-Modus gesetzt)
+    frame_hash: Optional[str] = None
+    # Anzahl der zusammengefassten Kandidaten-Frames (inkl. diesem)
+    merged_count: int = 1
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             'index': self.index,
             'timestamp_s': self.timestamp_s,
+            'end_s': self.end_s,
             'file_path': self.file_path,
             'width': self.width,
             'height': self.height,
+            'frame_hash': self.frame_hash,
+            'merged_count': self.merged_count,
         }
 
     @classmethod
@@ -316,6 +325,9 @@ class FrameInfo:
             file_path=str(data.get('file_path', '')),
             width=data.get('width'),
             height=data.get('height'),
+            end_s=float(data['end_s']) if data.get('end_s') is not None else None,
+            frame_hash=data.get('frame_hash'),
+            merged_count=int(data.get('merged_count', 1)),
         )
 
 @dataclass
@@ -327,6 +339,8 @@ class VideoFramesResult(CacheableResult):
     interval_seconds: int
     frame_count: int
     frames: List[FrameInfo] = field(default_factory=list)
+    # 'interval' (feste Abtastrate) oder 'keyframes' (Szenenwechsel + Duplikat-Filter)
+    mode: str = "interval"
 
     @property
     def status(self) -> ProcessingStatus:
@@ -341,6 +355,7 @@ class VideoFramesResult(CacheableResult):
             'interval_seconds': self.interval_seconds,
             'frame_count': self.frame_count,
             'frames': [f.to_dict() for f in self.frames],
+            'mode': self.mode,
         }
 
     @classmethod
@@ -360,6 +375,7 @@ class VideoFramesResult(CacheableResult):
             interval_seconds=int(data.get('interval_seconds', 0)),
             frame_count=int(data.get('frame_count', 0)),
             frames=frames_typed,
+            mode=str(data.get('mode', 'interval')),
         )
 
 @dataclass(frozen=True, init=False)
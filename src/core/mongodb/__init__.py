@@ -7,11 +7,17 @@ from .connection import get_mongodb_client, get_mongodb_database, close_mongodb_
 from .repository import SessionJobRepository
 from .secretary_repository import SecretaryJobRepository
 from .metrics_repository import RequestMetricsRepository
+from .video_info_repository import VideoInfoCacheRepository
+from .job_notifier import JobNotifier, get_job_notifier
+from .job_event_hub import JobEventHub, get_job_event_hub
+from .job_log_repository import JobLogRepository, get_job_log_repository
 
 # Singleton-Instanz des Repositories
 _job_repository = None
 # Singleton-Instanz des Metrik-Repositories
 _metrics_repository: "RequestMetricsRepository | None" = None
+# Singleton-Instanz des Video-Info-Caches
+_video_info_repository: "VideoInfoCacheRepository | None" = None
 
 def get_job_repository() -> SessionJobRepository:
     """
@@ -41,6 +47,20 @@ def get_metrics_repository() -> RequestMetricsRepository:
 
     return _metrics_repository
 
+def get_video_info_cache_repository() -> VideoInfoCacheRepository:
+    """
+    Gibt eine Singleton-Instanz des VideoInfoCacheRepository zurück.
+
+    Returns:
+        VideoInfoCacheRepository: Repository-Instanz für gecachte yt-dlp-Metadaten
+    """
+    global _video_info_repository
+
+    if _video_info_repository is None:
+        _video_info_repository = VideoInfoCacheRepository()
+
+    return _video_info_repository
+
 # Importiere worker_manager erst nach der Definition von get_job_repository
 from .worker_manager import SessionWorkerManager, get_worker_manager
 from .secretary_worker_manager import SecretaryWorkerManager, get_secretary_worker_manager
@@ -49,10 +69,18 @@ __all__ = [
     'SessionJobRepository',
     'SecretaryJobRepository',
     'RequestMetricsRepository',
+    'VideoInfoCacheRepository',
+    'JobNotifier',
+    'JobEventHub',
+    'JobLogRepository',
     'SessionWorkerManager',
     'SecretaryWorkerManager',
     'get_job_repository',
     'get_metrics_repository',
+    'get_video_info_cache_repository',
+    'get_job_notifier',
+    'get_job_event_hub',
+    'get_job_log_repository',
     'get_worker_manager',
     'get_secretary_worker_manager',
     'get_mongodb_client',
@@ -0,0 +1,296 @@
+"""
+@fileoverview Job Event Hub - Shared in-process fan-out of job state changes
+
+@description
+Versorgt alle SSE-Verbindungen eines Prozesses aus einer gemeinsamen Quelle,
+statt dass jeder Client MongoDB selbst pollt:
+
+- Ein Hintergrund-Thread lädt den Zustand aller abonnierten Jobs mit *einer*
+  Abfrage (`$in`, ohne `results` und `log_entries`) und verteilt Änderungen an
+  alle Abonnenten eines Jobs.
+- Geweckt wird er von den Schreibpfaden des Repositorys in diesem Prozess
+  (`notify`) und von einem Change Stream auf Status- und Fortschritts-
+  änderungen in `jobs` (andere Prozesse und Knoten). Ohne Replica Set pollt er im Intervall
+  `poll_interval_sec`, mit Change Stream nur im Sicherheitsintervall.
+- Erreicht ein Job einen Endstatus, wird er einmal vollständig geladen und
+  an alle Abonnenten verteilt (Ergebnisdaten für das completed-Event).
+
+Abonnenten erhalten nur den jeweils neuesten Zustand; ein langsamer Client
+überspringt veraltete Fortschrittsstände, statt einen Rückstau aufzubauen.
+
+@module core.mongodb.job_event_hub
+
+@exports
+- JobSubscription: Class - Abonnement eines Jobs (neuester Zustand)
+- JobEventHub: Class - Gemeinsame Quelle und Fan-out
+- event_id_for(): str - SSE-Event-ID eines Job-Zustands (updated_at in ms)
+- get_job_event_hub(): JobEventHub - Prozessweiter Hub
+
+@usedIn
+- src.api.sse: job_event_stream
+- src.core.mongodb.secretary_repository: notify() nach Statusänderungen
+
+@dependencies
+- Standard: threading - Hintergrund-Threads und Signale
+- Internal: src.core.models.job_models - Job, JobStatus
+"""
+
+import datetime
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from src.core.models.job_models import Job, JobStatus
+
+
+logger = logging.getLogger(__name__)
+
+SnapshotLoader = Callable[[List[str]], List[Job]]
+JobLoader = Callable[[str], Optional[Job]]
+# (on_update(job_id), should_stop, on_ready) -> False, wenn keine Change Streams verfügbar
+UpdateWatcher = Callable[[Callable[[str], None], Callable[[], bool], Callable[[], None]], bool]
+
+_TERMINAL = (JobStatus.COMPLETED, JobStatus.FAILED)
+
+
+def event_id_for(job: Job) -> str:
+    """SSE-Event-ID eines Job-Zustands: `updated_at` in Millisekunden (knotenübergreifend gleich)."""
+    updated_at = job.updated_at
+    if updated_at.tzinfo is None:
+        # MongoDB liefert naive UTC-Zeitstempel
+        updated_at = updated_at.replace(tzinfo=datetime.UTC)
+    return str(int(updated_at.timestamp() * 1000))
+
+
+def _state_key(job: Job) -> Tuple[str, Optional[Tuple[Any, ...]]]:
+    progress = job.progress
+    return job.status.value, (progress.step, progress.percent, progress.message) if progress else None
+
+
+class JobSubscription:
+    """Abonnement eines Jobs; hält nur den neuesten, noch nicht abgeholten Zustand."""
+
+    def __init__(self, job_id: str) -> None:
+        self.job_id = job_id
+        self.missing = False
+        self._cond = threading.Condition()
+        self._latest: Optional[Job] = None
+
+    def _push(self, job: Optional[Job]) -> None:
+        with self._cond:
+            if job is None:
+                self.missing = True
+            else:
+                self._latest = job
+            self._cond.notify_all()
+
+    def next(self, timeout: float) -> Optional[Job]:
+        """
+        Wartet auf den nächsten Zustand.
+
+        Returns:
+            Optional[Job]: Neuester Zustand oder None (Timeout bzw. Job gelöscht, siehe `missing`)
+        """
+        with self._cond:
+            if self._latest is None and not self.missing:
+                self._cond.wait(timeout)
+            job, self._latest = self._latest, None
+            return job
+
+
+class JobEventHub:
+    """Lädt abonnierte Jobs gebündelt und verteilt Änderungen an alle Abonnenten."""
+
+    def __init__(
+        self,
+        load_snapshots: SnapshotLoader,
+        load_job: JobLoader,
+        watch_updates: Optional[UpdateWatcher] = None,
+        poll_interval_sec: float = 2.0,
+        safety_poll_interval_sec: float = 30.0,
+    ) -> None:
+        self._load_snapshots = load_snapshots
+        self._load_job = load_job
+        self._watch_updates = watch_updates
+        self.poll_interval_sec = poll_interval_sec
+        self.safety_poll_interval_sec = safety_poll_interval_sec
+        self._lock = threading.Lock()
+        self._subs: Dict[str, Set[JobSubscription]] = {}
+        self._last: Dict[str, Job] = {}
+        self._dirty: Set[str] = set()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._stream_active = False
+        self._threads: List[threading.Thread] = []
+
+    def subscribe(self, job_id: str) -> JobSubscription:
+        """Abonniert einen Job; startet die Hintergrund-Threads beim ersten Aufruf."""
+        sub = JobSubscription(job_id)
+        with self._lock:
+            self._subs.setdefault(job_id, set()).add(sub)
+            if not self._threads:
+                self._start()
+        return sub
+
+    def unsubscribe(self, sub: JobSubscription) -> None:
+        with self._lock:
+            subs = self._subs.get(sub.job_id)
+            if subs is None:
+                return
+            subs.discard(sub)
+            if not subs:
+                del self._subs[sub.job_id]
+                self._last.pop(sub.job_id, None)
+                self._dirty.discard(sub.job_id)
+
+    def notify(self, job_id: str) -> None:
+        """Meldet eine Änderung an einem Job (Schreibpfad); ohne Abonnenten ein No-op."""
+        with self._lock:
+            if job_id not in self._subs:
+                return
+            self._dirty.add(job_id)
+        self._wake.set()
+
+    def current(self, job_id: str) -> Optional[Job]:
+        """
+        Aktueller Zustand eines Jobs (aus dem Hub-Cache oder einer projizierten Abfrage).
+
+        Returns:
+            Optional[Job]: Ohne `results`/Logs, bei Endstatus vollständig; None, wenn es den Job nicht gibt
+        """
+        with self._lock:
+            cached = self._last.get(job_id)
+        if cached is not None:
+            return cached
+        snapshots = self._load_snapshots([job_id])
+        if not snapshots:
+            return None
+        job = self._complete(snapshots[0])
+        with self._lock:
+            if job_id in self._subs and job_id not in self._last:
+                self._last[job_id] = job
+        return job
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subs) for subs in self._subs.values())
+
+    def shutdown(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout=5)
+
+    def _start(self) -> None:
+        poller = threading.Thread(target=self._run, name="job-event-hub", daemon=True)
+        self._threads.append(poller)
+        if self._watch_updates is not None:
+            self._threads.append(threading.Thread(target=self._watch, name="job-event-hub-watch", daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def _complete(self, job: Job) -> Job:
+        """Lädt Jobs im Endstatus vollständig (Ergebnis für das completed-Event)."""
+        if job.status in _TERMINAL:
+            return self._load_job(job.job_id) or job
+        return job
+
+    def _run(self) -> None:
+        last_full = time.monotonic()
+        while not self._stop.is_set():
+            interval = self.safety_poll_interval_sec if self._stream_active else self.poll_interval_sec
+            self._wake.wait(max(0.0, interval - (time.monotonic() - last_full)))
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            now = time.monotonic()
+            with self._lock:
+                if now - last_full >= interval:
+                    ids = list(self._subs)
+                    last_full = now
+                else:
+                    ids = [job_id for job_id in self._dirty if job_id in self._subs]
+                self._dirty.clear()
+            if not ids:
+                continue
+            try:
+                self._refresh(ids)
+            except Exception as e:
+                logger.warning(f"Job-Event-Hub: Abfrage von {len(ids)} Jobs fehlgeschlagen: {e}")
+
+    def _refresh(self, job_ids: List[str]) -> None:
+        found: Set[str] = set()
+        for snapshot in self._load_snapshots(job_ids):
+            found.add(snapshot.job_id)
+            with self._lock:
+                previous = self._last.get(snapshot.job_id)
+            if previous is not None and _state_key(previous) == _state_key(snapshot):
+                continue
+            job = self._complete(snapshot)
+            with self._lock:
+                if snapshot.job_id not in self._subs:
+                    continue
+                self._last[snapshot.job_id] = job
+                subs = list(self._subs[snapshot.job_id])
+            for sub in subs:
+                sub._push(job)
+        for job_id in set(job_ids) - found:
+            with self._lock:
+                subs = list(self._subs.get(job_id, ()))
+            for sub in subs:
+                sub._push(None)
+
+    def _on_stream_ready(self) -> None:
+        # Änderungen vor dem Öffnen des Streams mit einer vollständigen Abfrage nachholen
+        self._stream_active = True
+        with self._lock:
+            self._dirty.update(self._subs)
+        self._wake.set()
+
+    def _watch(self) -> None:
+        assert self._watch_updates is not None
+        while not self._stop.is_set():
+            try:
+                supported = self._watch_updates(self.notify, self._stop.is_set, self._on_stream_ready)
+                if not supported:
+                    self._stream_active = False
+                    return
+            except Exception as e:
+                logger.warning(f"Change Stream für Job-Events unterbrochen: {e}; neuer Versuch in 5s")
+            self._stream_active = False
+            self._wake.set()
+            self._stop.wait(5)
+
+
+_hub: Optional[JobEventHub] = None
+_hub_lock = threading.Lock()
+
+
+def get_job_event_hub() -> JobEventHub:
+    """Gibt den prozessweiten JobEventHub zurück (Konfiguration `sse`)."""
+    global _hub
+    with _hub_lock:
+        if _hub is None:
+            # Verzögerter Import, um zirkuläre Importe zu vermeiden
+            from src.core.config import Config
+            cfg: Dict[str, Any] = Config().get("sse", {}) or {}
+            repo: List[Any] = []
+
+            def _repo() -> Any:
+                if not repo:
+                    from src.core.mongodb.secretary_repository import SecretaryJobRepository
+                    repo.append(SecretaryJobRepository())
+                return repo[0]
+
+            watch: Optional[UpdateWatcher] = None
+            if cfg.get("change_stream", True):
+                watch = lambda on_update, should_stop, on_ready: _repo().watch_job_updates(on_update, should_stop, on_ready)
+            _hub = JobEventHub(
+                load_snapshots=lambda ids: _repo().get_job_snapshots(ids),
+                load_job=lambda job_id: _repo().get_job(job_id),
+                watch_updates=watch,
+                poll_interval_sec=float(cfg.get("poll_interval_sec", 2.0)),
+                safety_poll_interval_sec=float(cfg.get("safety_poll_interval_sec", 30.0)),
+            )
+        return _hub
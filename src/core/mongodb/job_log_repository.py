@@ -0,0 +1,240 @@
+"""
+@fileoverview Job Log Repository - Buffered job log storage outside the job document
+
+@description
+Speichert die Log-Einträge der Secretary-Jobs in einer eigenen Collection
+`job_logs` (optional als Capped Collection) statt per `$push` im Job-Dokument.
+Das Job-Dokument behält nur die letzten Einträge (`logs`, per `$slice`
+begrenzt) für die schnelle Anzeige; `get_job` und SSE-Polling laden damit
+keine unbegrenzte Historie mehr.
+
+Schreibzugriffe laufen über einen prozessweiten Puffer (JobLogBuffer): Einträge
+werden pro Job gesammelt und periodisch bzw. ab einer Mindestanzahl mit einem
+`insert_many` plus einem Update pro Job geschrieben. Beim Abschluss eines Jobs
+wird dessen Puffer sofort geleert.
+
+@module core.mongodb.job_log_repository
+
+@exports
+- JobLogRepository: Class - Log-Collection und Tail im Job-Dokument
+- JobLogBuffer: Class - Prozessweiter Schreibpuffer pro Job
+- get_job_log_repository(): JobLogRepository - Singleton, konfiguriert über `generic_worker.job_logs`
+- get_job_log_buffer(): JobLogBuffer - Singleton-Puffer, schreibt über get_job_log_repository()
+- flush_job_logs(): None - Leert den Puffer eines Jobs, falls einer existiert
+
+@usedIn
+- src.core.mongodb.secretary_repository: add_log_entry puffert über JobLogBuffer
+- src.api.routes.secretary_job_routes: Paginierte Log-API
+
+@dependencies
+- External: pymongo - MongoDB driver for Python
+- External: bson - ObjectId als Paginierungs-Cursor
+- Internal: src.core.mongodb.connection - get_mongodb_database
+"""
+
+import atexit
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ASCENDING, DESCENDING
+from pymongo.collection import Collection
+from pymongo.database import Database
+
+from .connection import get_mongodb_database
+
+
+logger = logging.getLogger(__name__)
+
+LogBatches = Dict[str, List[Dict[str, Any]]]
+
+
+class JobLogRepository:
+    """Repository für Job-Logs (Collection `job_logs`)."""
+
+    def __init__(self, capped_size_mb: int = 0, keep_on_job: int = 20) -> None:
+        self.db: Database[Any] = get_mongodb_database()
+        self.keep_on_job = keep_on_job
+        if capped_size_mb > 0 and "job_logs" not in self.db.list_collection_names():
+            # Capped: älteste Einträge fallen automatisch weg, Schreiben bleibt O(1)
+            self.db.create_collection("job_logs", capped=True, size=capped_size_mb * 1024 * 1024)
+        self.logs: Collection[Any] = self.db.job_logs
+        self.jobs: Collection[Any] = self.db.jobs
+        self._create_indexes()
+
+    def _create_indexes(self) -> None:
+        self.logs.create_index([("job_id", ASCENDING), ("_id", ASCENDING)])
+
+    def write_batches(self, batches: LogBatches) -> None:
+        """
+        Schreibt gepufferte Einträge: ein `insert_many` für alle Jobs und
+        ein `$push` mit `$slice` pro Job für den Tail im Job-Dokument.
+        """
+        docs = [{"job_id": job_id, **entry} for job_id, entries in batches.items() for entry in entries]
+        if not docs:
+            return
+        self.logs.insert_many(docs, ordered=True)
+        if self.keep_on_job <= 0:
+            return
+        for job_id, entries in batches.items():
+            tail = entries[-self.keep_on_job:]
+            self.jobs.update_one(
+                {"job_id": job_id},
+                {
+                    "$push": {"logs": {"$each": tail, "$slice": -self.keep_on_job}},
+                    "$set": {"updated_at": tail[-1]["timestamp"]},
+                },
+            )
+
+    def get_logs(
+        self,
+        job_id: str,
+        limit: int = 100,
+        after: Optional[str] = None,
+        newest_first: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Liefert eine Seite Log-Einträge eines Jobs (Keyset-Paginierung über `_id`).
+
+        Args:
+            job_id: Job-ID
+            limit: Maximale Anzahl Einträge (1-1000)
+            after: Cursor aus `next_cursor` der vorherigen Seite
+            newest_first: Neueste Einträge zuerst
+
+        Returns:
+            Dict[str, Any]: {"entries": [...], "next_cursor": str | None}
+
+        Raises:
+            ValueError: Ungültiger Cursor
+        """
+        limit = max(1, min(int(limit), 1000))
+        query: Dict[str, Any] = {"job_id": job_id}
+        if after:
+            try:
+                cursor_id = ObjectId(after)
+            except (InvalidId, TypeError):
+                raise ValueError(f"Ungültiger Cursor: {after}")
+            query["_id"] = {"$lt": cursor_id} if newest_first else {"$gt": cursor_id}
+        order = DESCENDING if newest_first else ASCENDING
+        # Eine Zeile mehr lesen, um zu wissen, ob es eine weitere Seite gibt
+        rows = list(self.logs.find(query, {"job_id": 0}).sort("_id", order).limit(limit + 1))
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        entries = [{k: v for k, v in row.items() if k != "_id"} for row in rows]
+        next_cursor = str(rows[-1]["_id"]) if has_more and rows else None
+        return {"entries": entries, "next_cursor": next_cursor}
+
+
+class JobLogBuffer:
+    """
+    Schreibpuffer für Job-Logs.
+
+    Einträge werden pro Job gesammelt und von einem Hintergrund-Thread alle
+    `flush_interval_sec` geschrieben, bei `max_entries` gepufferten Einträgen
+    sofort. flush() ist auch direkt aufrufbar (z.B. beim Job-Abschluss).
+    """
+
+    def __init__(
+        self,
+        write_fn: Callable[[LogBatches], None],
+        flush_interval_sec: float = 1.0,
+        max_entries: int = 50,
+    ) -> None:
+        self._write_fn = write_fn
+        self.flush_interval_sec = flush_interval_sec
+        self.max_entries = max_entries
+        self._pending: LogBatches = {}
+        self._count = 0
+        self._lock = threading.Lock()
+        # Serialisiert Schreibvorgänge, damit Einträge eines Jobs in Reihenfolge landen
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, job_id: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._pending.setdefault(job_id, []).append(entry)
+            self._count += 1
+            full = self._count >= self.max_entries
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="job-log-flush", daemon=True)
+                self._thread.start()
+        if full:
+            self._wakeup.set()
+
+    def flush(self, job_id: Optional[str] = None) -> None:
+        """Schreibt gepufferte Einträge (alle oder nur die eines Jobs)."""
+        with self._write_lock:
+            with self._lock:
+                if job_id is None:
+                    batches, self._pending = self._pending, {}
+                    self._count = 0
+                else:
+                    entries = self._pending.pop(job_id, [])
+                    batches = {job_id: entries} if entries else {}
+                    self._count -= len(entries)
+            if not batches:
+                return
+            try:
+                self._write_fn(batches)
+            except Exception as e:
+                # Logs dürfen den Job nicht stören; verlorene Einträge werden protokolliert
+                lost = sum(len(v) for v in batches.values())
+                logger.error(f"Job-Logs konnten nicht geschrieben werden ({lost} Einträge): {e}")
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.flush_interval_sec)
+            self._wakeup.clear()
+            self.flush()
+
+
+_job_log_repository: Optional[JobLogRepository] = None
+_job_log_buffer: Optional[JobLogBuffer] = None
+_singleton_lock = threading.Lock()
+
+
+def _job_logs_config() -> Dict[str, Any]:
+    from src.core.config import Config
+    return Config().get("generic_worker.job_logs", {}) or {}
+
+
+def get_job_log_repository() -> JobLogRepository:
+    """Gibt das prozessweite JobLogRepository zurück."""
+    global _job_log_repository
+    if _job_log_repository is None:
+        with _singleton_lock:
+            if _job_log_repository is None:
+                cfg = _job_logs_config()
+                _job_log_repository = JobLogRepository(
+                    capped_size_mb=int(cfg.get("capped_size_mb", 0)),
+                    keep_on_job=int(cfg.get("keep_on_job", 20)),
+                )
+    return _job_log_repository
+
+
+def get_job_log_buffer() -> JobLogBuffer:
+    """Gibt den prozessweiten JobLogBuffer zurück (Konfiguration: `generic_worker.job_logs`)."""
+    global _job_log_buffer
+    if _job_log_buffer is None:
+        repo = get_job_log_repository()
+        with _singleton_lock:
+            if _job_log_buffer is None:
+                cfg = _job_logs_config()
+                buffer = JobLogBuffer(
+                    repo.write_batches,
+                    flush_interval_sec=float(cfg.get("flush_interval_sec", 1.0)),
+                    max_entries=int(cfg.get("max_buffered_entries", 50)),
+                )
+                atexit.register(buffer.flush)
+                _job_log_buffer = buffer
+    return _job_log_buffer
+
+
+def flush_job_logs(job_id: Optional[str] = None) -> None:
+    """Schreibt gepufferte Einträge sofort; ohne bisherigen Puffer ist nichts zu tun."""
+    if _job_log_buffer is not None:
+        _job_log_buffer.flush(job_id)
@@ -0,0 +1,63 @@
+"""
+@fileoverview Job Notifier - Wake-up signal for push-based secretary job dispatch
+
+@description
+In-process signal that wakes the SecretaryWorkerManager as soon as there is new
+work: a job was created in this process (SecretaryJobRepository.create_job), a
+change stream reported an insert into `jobs`, or a worker slot became free.
+The notifier only carries "something changed"; the manager still claims jobs
+atomically from MongoDB, so spurious or coalesced wake-ups are harmless.
+
+@module core.mongodb.job_notifier
+
+@exports
+- JobNotifier: Class - Coalescing wake-up signal
+- get_job_notifier(): JobNotifier - Process-wide singleton
+
+@usedIn
+- src.core.mongodb.secretary_repository: Notifies after create_job
+- src.core.mongodb.secretary_worker_manager: Waits for notifications, forwards change stream inserts
+
+@dependencies
+- Standard: threading - Event
+"""
+
+import threading
+
+
+class JobNotifier:
+    """
+    Zusammenfassendes Wecksignal für den Job-Dispatch.
+
+    Mehrere notify()-Aufrufe vor dem nächsten wait() ergeben genau ein
+    Aufwachen; ein notify() zwischen wait() und dem Claim geht nicht
+    verloren, weil der Monitor das Signal vor dem Claim zurücksetzt.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def notify(self) -> None:
+        """Signalisiert neue Arbeit (oder einen frei gewordenen Slot)."""
+        self._event.set()
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Wartet auf ein Signal.
+
+        Returns:
+            bool: True bei Signal, False bei Timeout
+        """
+        return self._event.wait(timeout)
+
+    def clear(self) -> None:
+        """Setzt das Signal zurück; vor jedem Claim-Durchlauf aufrufen."""
+        self._event.clear()
+
+
+_job_notifier = JobNotifier()
+
+
+def get_job_notifier() -> JobNotifier:
+    """Gibt den prozessweiten JobNotifier zurück."""
+    return _job_notifier
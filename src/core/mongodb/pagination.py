@@ -0,0 +1,141 @@
+"""
+@fileoverview Keyset Pagination - Opaque continuation tokens for job and batch listings
+
+@description
+Seitenweises Lesen von Jobs und Batches über den Schlüssel
+(`created_at`, `<id>`) statt `skip/limit`: Jede Seite setzt per Bereichsabfrage
+hinter dem letzten Eintrag der vorherigen Seite fort. Die Kosten einer Seite
+hängen damit nicht von ihrer Tiefe ab, und neu angelegte Jobs verschieben
+keine Einträge zwischen Seiten.
+
+Der Cursor ist ein undurchsichtiges Token (URL-sicheres Base64 aus Zeitstempel
+in Millisekunden und ID); Clients reichen `next_cursor` unverändert als
+`after` zurück.
+
+Passende Indizes: (`created_at`, `<id>`) bzw. mit vorangestelltem
+Gleichheitsfilter, z.B. (`status`, `created_at`, `job_id`).
+
+@module core.mongodb.pagination
+
+@exports
+- encode_cursor(): str - Token aus Zeitstempel und ID
+- decode_cursor(): Tuple[datetime, str] - Token zurück in Zeitstempel und ID
+- keyset_page(): Tuple[List[Dict], Optional[str]] - Eine Seite Dokumente plus next_cursor
+
+@usedIn
+- src.core.mongodb.secretary_repository: get_jobs_page
+- src.core.mongodb.repository: get_jobs_page, get_batches_page
+
+@dependencies
+- External: pymongo - Collection, Sortierrichtung
+"""
+
+import base64
+import binascii
+import datetime
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from pymongo import ASCENDING, DESCENDING
+from pymongo.collection import Collection
+
+MAX_PAGE_SIZE = 1000
+
+_SORT_FIELD = "created_at"
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+_MILLISECOND = datetime.timedelta(milliseconds=1)
+
+
+def _to_millis(value: datetime.datetime) -> int:
+    # MongoDB liefert naive UTC-Zeitstempel mit Millisekunden-Genauigkeit
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.UTC)
+    return (value - _EPOCH) // _MILLISECOND
+
+
+def encode_cursor(created_at: datetime.datetime, key: str) -> str:
+    """
+    Bildet das Fortsetzungs-Token für einen Eintrag.
+
+    Args:
+        created_at: Zeitstempel des letzten Eintrags der Seite
+        key: Eindeutige ID des Eintrags (job_id, batch_id)
+
+    Returns:
+        str: URL-sicheres Token ohne Padding
+    """
+    raw = f"{_to_millis(created_at)}:{key}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Tuple[datetime.datetime, str]:
+    """
+    Liest ein Token aus `encode_cursor`.
+
+    Raises:
+        ValueError: Ungültiger Cursor
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode("utf-8")
+        millis, key = raw.split(":", 1)
+        created_at = _EPOCH + int(millis) * _MILLISECOND
+    except (binascii.Error, UnicodeDecodeError, ValueError, OverflowError):
+        raise ValueError(f"Ungültiger Cursor: {token}")
+    if not key:
+        raise ValueError(f"Ungültiger Cursor: {token}")
+    return created_at, key
+
+
+def keyset_page(
+    collection: Collection[Any],
+    query: Mapping[str, Any],
+    key_field: str,
+    limit: int = 100,
+    after: Optional[str] = None,
+    newest_first: bool = True,
+    projection: Optional[Mapping[str, Any]] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Liest eine Seite sortiert nach (`created_at`, `key_field`).
+
+    Args:
+        collection: Collection mit den Dokumenten
+        query: Filter (z.B. status, batch_id)
+        key_field: Eindeutiges Feld als zweiter Sortierschlüssel
+        limit: Einträge pro Seite (1-1000)
+        after: Token aus `next_cursor` der vorherigen Seite
+        newest_first: Neueste zuerst (Standard) oder älteste zuerst
+        projection: Optionale Feldauswahl; `key_field` und `created_at` werden ergänzt
+
+    Returns:
+        Tuple[List[Dict[str, Any]], Optional[str]]: Dokumente und next_cursor (None auf der letzten Seite)
+
+    Raises:
+        ValueError: Ungültiger Cursor
+    """
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    full_query: Dict[str, Any] = dict(query)
+    if after:
+        created_at, key = decode_cursor(after)
+        op, op_or_equal = ("$lt", "$lte") if newest_first else ("$gt", "$gte")
+        # Die äußere Bedingung begrenzt den Indexbereich; $or entscheidet bei gleichem Zeitstempel
+        keyset = {
+            _SORT_FIELD: {op_or_equal: created_at},
+            "$or": [{_SORT_FIELD: {op: created_at}}, {key_field: {op: key}}],
+        }
+        full_query = {"$and": [full_query, keyset]} if full_query else keyset
+    fields: Optional[Dict[str, Any]] = dict(projection) if projection is not None else None
+    if fields is not None and any(v for k, v in fields.items() if k != "_id"):
+        # Inklusions-Projektion: Sortierschlüssel werden für den Cursor gebraucht
+        fields.update({_SORT_FIELD: 1, key_field: 1})
+    order = DESCENDING if newest_first else ASCENDING
+    # Eine Zeile mehr lesen, um zu wissen, ob es eine weitere Seite gibt
+    rows = list(
+        collection.find(full_query, fields)
+        .sort([(_SORT_FIELD, order), (key_field, order)])
+        .limit(limit + 1)
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(rows[-1][_SORT_FIELD], str(rows[-1][key_field])) if has_more and rows else None
+    return rows, next_cursor
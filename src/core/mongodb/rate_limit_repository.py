@@ -0,0 +1,101 @@
+"""
+@fileoverview Rate Limit Repository - Shared sliding-window counters in MongoDB
+
+@description
+MongoDB-Backend für den RateLimiter (src/core/rate_limiting.py). Ein Dokument
+pro Schlüssel in der Collection `rate_limits` hält das aktuelle Fenster
+(`window_start`), dessen Zähler (`count`) und den Zähler des vorherigen
+Fensters (`previous`).
+
+Eine Prüfung ist ein einziges `find_one_and_update` mit Aggregation-Pipeline
+(upsert): Beginnt ein neues Fenster, wird der alte Zähler in derselben
+atomaren Operation zu `previous` (bzw. 0, wenn das letzte Fenster länger
+zurückliegt). Damit stimmen die Limits über alle gunicorn-Prozesse und Knoten.
+Ein TTL-Index auf `expires_at` entfernt Schlüssel, die zwei Fenster lang
+keinen Request hatten.
+
+Legen zwei Prozesse denselben Schlüssel gleichzeitig an, scheitert einer der
+Upserts mit DuplicateKeyError; er wird wiederholt und trifft dann das
+vorhandene Dokument.
+
+Die Verbindung wird erst bei der ersten Prüfung aufgebaut.
+
+@module core.mongodb.rate_limit_repository
+
+@exports
+- MongoRateLimitBackend: Class - RateLimitBackend auf MongoDB
+
+@usedIn
+- src.core.rate_limiting: load_rate_limiter() mit `rate_limiting.backend: mongodb`
+
+@dependencies
+- External: pymongo - MongoDB driver for Python (Pipeline-Updates ab MongoDB 4.2)
+- Internal: src.core.mongodb.connection - get_mongodb_database
+- Internal: src.core.rate_limiting - RateLimitBackend
+"""
+
+import threading
+from datetime import datetime, timezone
+from typing import Any, Optional, Tuple
+
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.collection import Collection
+from pymongo.errors import DuplicateKeyError
+
+from src.core.rate_limiting import RateLimitBackend
+
+from .connection import get_mongodb_database
+
+# Wiederholungen bei gleichzeitigem ersten Upsert (DuplicateKeyError)
+_UPSERT_ATTEMPTS = 3
+
+
+class MongoRateLimitBackend(RateLimitBackend):
+    """Zähler in der Collection `rate_limits`, geteilt über Prozesse und Knoten."""
+
+    def __init__(self, collection: Optional[Collection[Any]] = None) -> None:
+        self._collection = collection
+        self._lock = threading.Lock()
+
+    @property
+    def collection(self) -> Collection[Any]:
+        if self._collection is None:
+            with self._lock:
+                if self._collection is None:
+                    collection: Collection[Any] = get_mongodb_database().rate_limits
+                    # expireAfterSeconds=0: Dokument verfällt exakt zum Zeitpunkt expires_at
+                    collection.create_index([("expires_at", ASCENDING)], expireAfterSeconds=0)
+                    self._collection = collection
+        return self._collection
+
+    def increment(self, key: str, window_start: int, window_sec: int, cost: int = 1) -> Tuple[int, int]:
+        same_window = {"$eq": ["$window_start", window_start]}
+        previous_window = {"$eq": ["$window_start", window_start - window_sec]}
+        expires_at = datetime.fromtimestamp(window_start + 2 * window_sec, tz=timezone.utc)
+        # Alle Ausdrücke einer $set-Stufe sehen den Stand vor dem Update
+        pipeline = [{"$set": {
+            "previous": {"$cond": [same_window, "$previous", {"$cond": [previous_window, "$count", 0]}]},
+            "count": {"$cond": [same_window, {"$add": ["$count", cost]}, cost]},
+            "window_start": window_start,
+            "expires_at": expires_at,
+        }}]
+        for attempt in range(_UPSERT_ATTEMPTS):
+            try:
+                doc = self.collection.find_one_and_update(
+                    {"_id": key},
+                    pipeline,
+                    upsert=True,
+                    return_document=ReturnDocument.AFTER,
+                )
+                break
+            except DuplicateKeyError:
+                # Ein anderer Prozess hat das Dokument gerade angelegt; jetzt existiert es
+                if attempt == _UPSERT_ATTEMPTS - 1:
+                    raise
+        return int(doc.get("count") or 0), int(doc.get("previous") or 0)
+
+    def decrement(self, key: str, window_start: int, cost: int = 1) -> None:
+        self.collection.update_one(
+            {"_id": key, "window_start": window_start, "count": {"$gte": cost}},
+            {"$inc": {"count": -cost}},
+        )
@@ -13,6 +13,8 @@ Main functionality:
 - Result storage and retrieval (Markdown files, ZIP archives)
 - Log entry management
 - Index creation for performance optimization
+- Keyset-paginated job and batch listings (get_jobs_page, get_batches_page)
+- Atomic claiming of pending jobs for the worker manager (claim_next_job)
 
 Features:
 - Typed dataclass models (Job, Batch) for type safety
@@ -34,9 +36,10 @@ Features:
 - External: pymongo - MongoDB driver for Python
 - Internal: src.core.models.job_models - Job, Batch, JobStatus models
 - Internal: src.core.mongodb.connection - get_mongodb_database
+- Internal: src.core.mongodb.pagination - Keyset pagination
 """
 
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, ReturnDocument
 from pymongo.collection import Collection
 from pymongo.cursor import Cursor
 from pymongo.database import Database
@@ -49,10 +52,14 @@ import time
 
 from src.core.models.job_models import Job, Batch, JobStatus, LogEntry, JobProgress, JobError, JobResults
 from .connection import get_mongodb_database
+from .pagination import keyset_page
 
 # Logger initialisieren
 logger = logging.getLogger(__name__)
 
+# Listenansichten: ohne Ergebnisse und Logs
+_JOB_LIST_PROJECTION: Dict[str, int] = {"results": 0, "logs": 0, "log_entries": 0}
+
 class SessionJobRepository:
     """
     Repository für die Verwaltung von Session-Jobs in MongoDB.
@@ -79,15 +86,18 @@ class SessionJobRepository:
         """
         # Indizes für Jobs
         self.jobs.create_index([("job_id", ASCENDING)], unique=True)
-        self.jobs.create_index([("status", ASCENDING)])
-        self.jobs.create_index([("batch_id", ASCENDING)])
-        self.jobs.create_index([("created_at", ASCENDING)])
         self.jobs.create_index([("user_id", ASCENDING)])
+        # Keyset-Paginierung über (created_at, job_id), auch mit Status- oder Batch-Filter
+        self.jobs.create_index([("created_at", ASCENDING), ("job_id", ASCENDING)])
+        self.jobs.create_index([("status", ASCENDING), ("created_at", ASCENDING), ("job_id", ASCENDING)])
+        self.jobs.create_index([("batch_id", ASCENDING), ("created_at", ASCENDING), ("job_id", ASCENDING)])
+        # Status-Zählungen pro Batch
+        self.jobs.create_index([("batch_id", ASCENDING), ("status", ASCENDING)])
         
         # Indizes für Batches
         self.batches.create_index([("batch_id", ASCENDING)], unique=True)
-        self.batches.create_index([("status", ASCENDING)])
-        self.batches.create_index([("created_at", ASCENDING)])
+        self.batches.create_index([("created_at", ASCENDING), ("batch_id", ASCENDING)])
+        self.batches.create_index([("status", ASCENDING), ("created_at", ASCENDING), ("batch_id", ASCENDING)])
         self.batches.create_index([("user_id", ASCENDING)])
         
         logger.debug("MongoDB-Indizes erstellt")
@@ -122,7 +132,8 @@ class SessionJobRepository:
         self.jobs.insert_one(job_dict)
         
         logger.info(f"Job erstellt: {job.job_id}")
-        logger.debug(f"Job-Daten: {json.dumps(job_dict, default=str)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Job-Daten: {json.dumps(job_dict, default=str)}")
         
         return job.job_id
     
@@ -206,6 +217,43 @@ class SessionJobRepository:
             
         return success
     
+    def claim_next_job(self, worker_id: str) -> Optional[Job]:
+        """
+        Übernimmt atomar den ältesten PENDING-Job.
+
+        Status, Worker-ID und Startzeit werden in einem einzigen
+        `find_one_and_update` gesetzt. Laufen mehrere Worker-Manager (z. B.
+        mehrere Gunicorn-Worker oder Worker-Knoten), erhält so jeder Job
+        genau einen Worker.
+
+        Args:
+            worker_id: Kennung des Worker-Managers
+
+        Returns:
+            Optional[Job]: Der übernommene Job oder None, wenn nichts ansteht
+        """
+        now = datetime.datetime.now(datetime.UTC)
+        doc = self.jobs.find_one_and_update(
+            {"status": JobStatus.PENDING.value},
+            {
+                "$set": {
+                    "status": JobStatus.PROCESSING.value,
+                    "worker_id": worker_id,
+                    "processing_started_at": now,
+                    "updated_at": now,
+                    "progress": JobProgress(step="initializing", percent=0, message="Job wird initialisiert").to_dict(),
+                }
+            },
+            sort=[("created_at", ASCENDING)],
+            return_document=ReturnDocument.AFTER,
+        )
+        if not doc:
+            return None
+        job = Job.from_dict(doc)
+        if job.batch_id:
+            self.update_batch_progress(job.batch_id)
+        return job
+
     def add_log_entry(self, job_id: str, level: str, message: str) -> bool:
         """
         Fügt einen Log-Eintrag zu einem Job hinzu.
@@ -364,7 +412,8 @@ class SessionJobRepository:
         self.batches.insert_one(batch_dict)
         
         logger.info(f"Batch erstellt: {batch.batch_id}")
-        logger.debug(f"Batch-Daten: {json.dumps(batch_dict, default=str)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Batch-Daten: {json.dumps(batch_dict, default=str)}")
         
         return batch.batch_id
     
@@ -503,6 +552,8 @@ class SessionJobRepository:
             
         Returns:
             List[Job]: Liste von Job-Objekten
+            
+        Für Listenansichten und tiefe Seiten get_jobs_page() verwenden.
         """
         # Filter erstellen
         filter_dict: Dict[str, Any] = {}
@@ -531,6 +582,49 @@ class SessionJobRepository:
         
         return jobs
     
+    def get_jobs_page(
+        self,
+        status: Optional[Union[str, JobStatus]] = None,
+        batch_id: Optional[str] = None,
+        archived: Optional[bool] = None,
+        limit: int = 100,
+        after: Optional[str] = None,
+        newest_first: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Gibt eine Seite Jobs zurück (Keyset-Paginierung über created_at und job_id).
+        
+        Im Gegensatz zu get_jobs() hängen die Kosten nicht von der Seitentiefe ab;
+        `results` und Logs werden für die Listenansicht nicht geladen.
+        
+        Args:
+            status: Optional, filtere nach Status
+            batch_id: Optional, filtere nach Batch-ID
+            archived: Optional, filtere nach dem archived-Flag
+            limit: Jobs pro Seite (1-1000)
+            after: Cursor aus `next_cursor` der vorherigen Seite
+            newest_first: Neueste Jobs zuerst (Standard)
+            
+        Returns:
+            Dict[str, Any]: {"jobs": List[Job], "next_cursor": str | None}
+            
+        Raises:
+            ValueError: Ungültiger Cursor
+        """
+        filter_dict: Dict[str, Any] = {}
+        if status is not None:
+            filter_dict["status"] = status.value if isinstance(status, JobStatus) else status
+        if batch_id is not None:
+            filter_dict["batch_id"] = batch_id
+        if archived is not None:
+            filter_dict["archived"] = archived
+        
+        docs, next_cursor = keyset_page(
+            self.jobs, filter_dict, "job_id",
+            limit=limit, after=after, newest_first=newest_first, projection=_JOB_LIST_PROJECTION
+        )
+        return {"jobs": [Job.from_dict(doc) for doc in docs], "next_cursor": next_cursor}
+    
     def count_jobs(
         self, 
         status: Optional[Union[str, JobStatus]] = None, 
@@ -582,6 +676,8 @@ class SessionJobRepository:
             
         Returns:
             List[Job]: Liste der Jobs
+            
+        Für tiefe Seiten get_jobs_page(batch_id=...) verwenden.
         """
         # Start der Zeitmessung
         start_time = time.time()
@@ -703,6 +799,8 @@ class SessionJobRepository:
             
         Returns:
             List[Batch]: Liste der Batches
+            
+        Für tiefe Seiten get_batches_page() verwenden.
         """
         # Filter erstellen
         filter_dict: Dict[str, Any] = {}
@@ -728,6 +826,41 @@ class SessionJobRepository:
         
         return batches
     
+    def get_batches_page(
+        self,
+        status: Optional[Union[str, JobStatus]] = None,
+        archived: Optional[bool] = None,
+        limit: int = 100,
+        after: Optional[str] = None,
+        newest_first: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Gibt eine Seite Batches zurück (Keyset-Paginierung über created_at und batch_id).
+        
+        Args:
+            status: Optional, Status-Filter
+            archived: Optional, Filtere nach dem archived-Flag
+            limit: Batches pro Seite (1-1000)
+            after: Cursor aus `next_cursor` der vorherigen Seite
+            newest_first: Neueste Batches zuerst (Standard)
+            
+        Returns:
+            Dict[str, Any]: {"batches": List[Batch], "next_cursor": str | None}
+            
+        Raises:
+            ValueError: Ungültiger Cursor
+        """
+        filter_dict: Dict[str, Any] = {}
+        if status:
+            filter_dict["status"] = status.value if isinstance(status, JobStatus) else JobStatus(status).value
+        if archived is not None:
+            filter_dict["archived"] = archived
+        
+        docs, next_cursor = keyset_page(
+            self.batches, filter_dict, "batch_id", limit=limit, after=after, newest_first=newest_first
+        )
+        return {"batches": [Batch.from_dict(doc) for doc in docs], "next_cursor": next_cursor}
+    
     def count_batches(self, status: Optional[Union[str, JobStatus]] = None, archived: Optional[bool] = None) -> int:
         """
         Zählt die Anzahl der Batches.
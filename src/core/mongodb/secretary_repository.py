@@ -13,7 +13,19 @@ Main functionality:
 - Job status tracking (PENDING, PROCESSING, COMPLETED, FAILED)
 - Progress monitoring with percentage tracking
 - Result storage and retrieval
-- Log entry management
+- Log entry management (buffered, stored in `job_logs`; the job keeps a short tail)
+- Atomic lease-based job claiming for multiple worker nodes
+- Release of running jobs back to the queue on graceful shutdown
+- Push notifications for new jobs (in-process notifier, change stream)
+- Job state changes for SSE subscribers (event hub notify, change stream,
+  projected snapshot reads without results/logs)
+- O(1) batch progress via $inc counters driven by status transitions,
+  with a full recount for periodic reconciliation
+- Bulk batch submission: validated jobs inserted with chunked insert_many
+- Job listings with keyset pagination on (created_at, job_id) and opaque
+  continuation tokens; list views skip results and logs
+- Duplicate detection: submissions with the same fingerprint attach to
+  the pending/processing job instead of queueing duplicate work
 - Index creation for performance optimization
 
 Features:
@@ -37,43 +49,103 @@ Features:
 - External: pymongo - MongoDB driver for Python
 - Internal: src.core.models.job_models - Job, Batch, JobStatus models
 - Internal: src.core.mongodb.connection - get_mongodb_database
+- Internal: src.core.mongodb.job_notifier - get_job_notifier
+- Internal: src.core.mongodb.job_event_hub - get_job_event_hub
+- Internal: src.core.mongodb.job_log_repository - Buffered job log storage
+- Internal: src.core.mongodb.pagination - Keyset pagination
+- Internal: src.utils.job_fingerprint - compute_job_fingerprint
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import AbstractSet, Any, Callable, Dict, List, Optional, Tuple, Union, cast
 import datetime
 import logging
 
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, ReturnDocument
 from pymongo.collection import Collection
 from pymongo.database import Database
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
 from pymongo.results import UpdateResult
 
 from src.core.models.job_models import Job, Batch, JobStatus, LogEntry, JobProgress, JobError, JobResults
 from .connection import get_mongodb_database
+from .job_notifier import get_job_notifier
+from .job_event_hub import get_job_event_hub
+from .job_log_repository import flush_job_logs, get_job_log_buffer, get_job_log_repository
+from .pagination import keyset_page
+from src.utils.job_fingerprint import compute_job_fingerprint
 
 
 logger = logging.getLogger(__name__)
 
+# MongoDB-Fehlercode: $changeStream nur auf Replica Sets / Sharded Clusters
+_CHANGE_STREAM_UNSUPPORTED = 40573
+
+# Job-Status -> Zählerfeld im Batch-Dokument
+_BATCH_COUNTER: Dict[str, str] = {
+    JobStatus.PENDING.value: "pending_jobs",
+    JobStatus.PROCESSING.value: "processing_jobs",
+    JobStatus.COMPLETED.value: "completed_jobs",
+    JobStatus.FAILED.value: "failed_jobs",
+}
+
+# Statusanzeigen (SSE) brauchen weder Ergebnis noch Logs
+_SNAPSHOT_PROJECTION: Dict[str, int] = {"results": 0, "log_entries": 0}
+
+# Listenansichten: ohne Ergebnisse und Logs, ohne Parameter und Webhook-Daten
+# (enthalten Callback-Tokens)
+_LIST_PROJECTION: Dict[str, int] = {
+    "results": 0,
+    "log_entries": 0,
+    "logs": 0,
+    "parameters": 0,
+    "attached_webhooks": 0,
+    "final_webhook_payload": 0,
+}
+
+# Felder, aus denen der ETag eines Jobs gebildet wird (src.api.routes.secretary_job_routes)
+_VERSION_PROJECTION: Dict[str, int] = {"_id": 0, "job_id": 1, "status": 1, "updated_at": 1, "lease_expires_at": 1}
+
 
 class SecretaryJobRepository:
     """Repository für generische Secretary-Jobs."""
 
+    # Duplikaterkennung in create_job (generic_worker.deduplicate_jobs, standardmäßig aus)
+    deduplicate_jobs: bool = False
+
     def __init__(self) -> None:
         # Option A: DB-Name ausschließlich aus der URI
         self.db: Database[Any] = get_mongodb_database()
         self.jobs: Collection[Any] = self.db.jobs
         self.batches: Collection[Any] = self.db.batches
+        from src.core.config import Config
+        self.deduplicate_jobs = bool(Config().get("generic_worker.deduplicate_jobs", False))
         self._create_indexes()
         logger.info("SecretaryJobRepository initialisiert")
 
     def _create_indexes(self) -> None:
         self.jobs.create_index([("job_id", ASCENDING)], unique=True)
         self.jobs.create_index([("status", ASCENDING)])
-        self.jobs.create_index([("batch_id", ASCENDING)])
-        self.jobs.create_index([("created_at", DESCENDING)])
+        # Batch-Zähler (Status pro Batch) und Job-Listen eines Batches
+        self.jobs.create_index([("batch_id", ASCENDING), ("status", ASCENDING)])
+        self.jobs.create_index([("batch_id", ASCENDING), ("created_at", ASCENDING), ("job_id", ASCENDING)])
+        # Keyset-Paginierung (get_jobs_page) ohne und mit Statusfilter
+        self.jobs.create_index([("created_at", ASCENDING), ("job_id", ASCENDING)])
+        # Claim: ältester PENDING-Job; Reaper: abgelaufene Leases
+        self.jobs.create_index([("status", ASCENDING), ("created_at", ASCENDING), ("job_id", ASCENDING)])
+        self.jobs.create_index([("status", ASCENDING), ("lease_expires_at", ASCENDING)])
+        # Pool-Claiming und Queue-Statistik pro job_type
+        self.jobs.create_index([("status", ASCENDING), ("job_type", ASCENDING), ("created_at", ASCENDING)])
+        # Admission Control: abgeschlossene Jobs im Zeitfenster
+        self.jobs.create_index([("status", ASCENDING), ("completed_at", DESCENDING)])
+        # Höchstens ein offener Job pro Fingerabdruck; das Feld existiert nur bis zum Endstatus
+        self.jobs.create_index(
+            [("active_fingerprint", ASCENDING)],
+            unique=True,
+            partialFilterExpression={"active_fingerprint": {"$exists": True}},
+        )
         self.batches.create_index([("batch_id", ASCENDING)], unique=True)
-        self.batches.create_index([("status", ASCENDING)])
-        self.batches.create_index([("created_at", DESCENDING)])
+        self.batches.create_index([("status", ASCENDING), ("created_at", ASCENDING), ("batch_id", ASCENDING)])
+        self.batches.create_index([("created_at", ASCENDING), ("batch_id", ASCENDING)])
 
     # CRUD / Listing (API analog SessionJobRepository)
     def create_job(self, job_data: Union[Dict[str, Any], Job], user_id: Optional[str] = None) -> str:
@@ -85,10 +157,90 @@ class SecretaryJobRepository:
             job = job_data
             if user_id and not job.user_id:
                 job.user_id = user_id
-        self.jobs.insert_one(job.to_dict())
+        doc = job.to_dict()
+        # Batch-Jobs werden nie zusammengelegt (Batch-Zähler bleiben exakt)
+        if self.deduplicate_jobs and not job.batch_id and job.status == JobStatus.PENDING:
+            job.fingerprint = compute_job_fingerprint(job)
+            if job.fingerprint:
+                existing_id = self._attach_to_active_job(job)
+                if existing_id:
+                    return existing_id
+                doc["fingerprint"] = job.fingerprint
+                doc["active_fingerprint"] = job.fingerprint
+        try:
+            self.jobs.insert_one(doc)
+        except DuplicateKeyError:
+            if "active_fingerprint" not in doc:
+                raise
+            # Gleichzeitige Anfrage hat denselben Job gerade angelegt
+            existing_id = self._attach_to_active_job(job)
+            if existing_id:
+                return existing_id
+            doc.pop("_id", None)
+            doc.pop("active_fingerprint")
+            self.jobs.insert_one(doc)
         logger.info(f"Job erstellt: {job.job_id}")
+        if job.batch_id:
+            self._inc_batch_counters(job.batch_id, {_BATCH_COUNTER[job.status.value]: 1})
+        # Worker im selben Prozess sofort wecken (Fallback ohne Change Stream)
+        get_job_notifier().notify()
         return job.job_id
 
+    def _attach_to_active_job(self, job: Job) -> Optional[str]:
+        """
+        Hängt eine Duplikat-Anfrage an den offenen Job mit gleichem Fingerabdruck.
+
+        Ein abweichender Webhook der neuen Anfrage wird in `attached_webhooks`
+        registriert und vom Worker nach Abschluss ebenfalls benachrichtigt.
+
+        Returns:
+            Optional[str]: job_id des bestehenden Jobs oder None
+        """
+        webhook = job.parameters.webhook if isinstance(job.parameters.webhook, dict) else None
+        if webhook is not None and not webhook.get("url"):
+            webhook = None
+        active: Dict[str, Any] = {"active_fingerprint": job.fingerprint}
+        doc: Optional[Dict[str, Any]] = None
+        if webhook is not None:
+            doc = self.jobs.find_one_and_update(
+                {**active, "parameters.webhook": {"$ne": webhook}},
+                {
+                    "$addToSet": {"attached_webhooks": webhook},
+                    "$set": {"updated_at": datetime.datetime.now(datetime.UTC)},
+                },
+                projection={"job_id": 1},
+            )
+        if doc is None:
+            doc = self.jobs.find_one(active, {"job_id": 1})
+        if doc is None:
+            return None
+        logger.info(f"Duplikat erkannt: Anfrage an offenen Job {doc['job_id']} angehängt")
+        return str(doc["job_id"])
+
+    def store_final_webhook_payload(self, job_id: str, payload: Dict[str, Any]) -> bool:
+        """
+        Merkt sich den Abschluss-Webhook eines Handlers für angehängte Anfragen.
+
+        Nur Jobs mit `attached_webhooks` speichern den Payload; das Feld ist
+        reine Repository-Sache und erscheint weder in `Job.to_dict()` noch in
+        den API-Antworten. Handler rufen dies auch im Prozess-Pool auf, daher
+        der Umweg über MongoDB statt über den Webhook-Dispatcher.
+
+        Returns:
+            bool: True, wenn der Payload gespeichert wurde
+        """
+        result = self.jobs.update_one(
+            {"job_id": job_id, "attached_webhooks.0": {"$exists": True}},
+            {"$set": {"final_webhook_payload": payload}},
+        )
+        return bool(result.modified_count)
+
+    def get_final_webhook_payload(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Liefert den gespeicherten Abschluss-Webhook (siehe store_final_webhook_payload)."""
+        doc = self.jobs.find_one({"job_id": job_id}, {"final_webhook_payload": 1})
+        payload: Any = doc.get("final_webhook_payload") if doc else None
+        return cast(Dict[str, Any], payload) if isinstance(payload, dict) else None
+
     def update_job_status(
         self,
         job_id: str,
@@ -96,7 +248,18 @@ class SecretaryJobRepository:
         progress: Optional[Union[Dict[str, Any], JobProgress]] = None,
         results: Optional[Union[Dict[str, Any], JobResults]] = None,
         error: Optional[Union[Dict[str, Any], JobError]] = None,
+        worker_id: Optional[str] = None,
     ) -> bool:
+        """
+        Setzt Status, Fortschritt, Ergebnisse und Fehler eines Jobs.
+
+        Mit `worker_id` wird nur geschrieben, solange der Job diesem Worker
+        gehört (Lease). Ein Worker, dessen Lease abgelaufen und dessen Job
+        neu vergeben wurde, überschreibt so weder Status noch Ergebnisse.
+
+        Returns:
+            bool: False, wenn der Job fehlt oder einem anderen Worker gehört
+        """
         status_value = status.value if isinstance(status, JobStatus) else JobStatus(status).value
         now = datetime.datetime.now(datetime.UTC)
         update_dict: Dict[str, Any] = {"status": status_value, "updated_at": now}
@@ -110,13 +273,59 @@ class SecretaryJobRepository:
             update_dict["results"] = results if isinstance(results, dict) else results.to_dict()
         if error:
             update_dict["error"] = error if isinstance(error, dict) else error.to_dict()
-        result = self.jobs.update_one({"job_id": job_id}, {"$set": update_dict})
-        ok = result.modified_count > 0
-        if ok:
-            job = self.get_job(job_id)
-            if job and job.batch_id:
-                self.update_batch_progress(job.batch_id)
-        return ok
+        if status_value in (JobStatus.COMPLETED.value, JobStatus.FAILED.value):
+            # Gepufferte Logs vor dem Endstatus sichtbar machen
+            flush_job_logs(job_id)
+        update: Dict[str, Any] = {"$set": update_dict}
+        if status_value in (JobStatus.COMPLETED.value, JobStatus.FAILED.value):
+            # Neue Anfragen mit gleichem Fingerabdruck erzeugen ab jetzt wieder einen Job
+            update["$unset"] = {"active_fingerprint": ""}
+        # Vorheriger Status (BEFORE) treibt die Batch-Zähler; kein Nachladen des Jobs
+        query: Dict[str, Any] = {"job_id": job_id}
+        if worker_id is not None:
+            query["worker_id"] = worker_id
+        before = self.jobs.find_one_and_update(
+            query,
+            update,
+            projection={"status": 1, "batch_id": 1},
+            return_document=ReturnDocument.BEFORE,
+        )
+        if before is None:
+            return False
+        if before.get("batch_id"):
+            self._apply_batch_transition(before["batch_id"], before.get("status"), status_value)
+        get_job_event_hub().notify(job_id)
+        return True
+
+    def _apply_batch_transition(self, batch_id: str, old_status: Optional[str], new_status: str) -> None:
+        """Verschiebt einen Job in den Batch-Zählern von `old_status` nach `new_status`."""
+        if old_status == new_status:
+            return
+        inc: Dict[str, int] = {_BATCH_COUNTER[new_status]: 1}
+        if old_status in _BATCH_COUNTER:
+            inc[_BATCH_COUNTER[old_status]] = -1
+        self._inc_batch_counters(batch_id, inc)
+
+    def _inc_batch_counters(self, batch_id: str, inc: Dict[str, int]) -> None:
+        """
+        Aktualisiert die Zähler eines Batches atomar und schließt ihn ab,
+        sobald alle Jobs abgeschlossen oder fehlgeschlagen sind.
+        """
+        now = datetime.datetime.now(datetime.UTC)
+        doc = self.batches.find_one_and_update(
+            {"batch_id": batch_id},
+            {"$inc": inc, "$set": {"updated_at": now}},
+            projection={"total_jobs": 1, "completed_jobs": 1, "failed_jobs": 1, "status": 1},
+            return_document=ReturnDocument.AFTER,
+        )
+        if not doc or doc.get("status") == JobStatus.COMPLETED.value:
+            return
+        if int(doc.get("completed_jobs", 0)) + int(doc.get("failed_jobs", 0)) >= int(doc.get("total_jobs", 0)):
+            # Bedingtes Update: genau ein Aufrufer schließt den Batch ab
+            self.batches.update_one(
+                {"batch_id": batch_id, "status": {"$ne": JobStatus.COMPLETED.value}},
+                {"$set": {"status": JobStatus.COMPLETED.value, "completed_at": now}},
+            )
 
     def add_log_entry(self, job_id: str, level: str, message: str) -> bool:
         # Level auf gültige Literale mappen
@@ -126,15 +335,346 @@ class SecretaryJobRepository:
         from typing import cast, Literal
         literal_level = cast(Literal["debug", "info", "warning", "error", "critical"], lvl)
         entry = LogEntry(timestamp=datetime.datetime.now(datetime.UTC), level=literal_level, message=message)
+        # Gepuffert: landet gesammelt in `job_logs`, das Job-Dokument behält nur die letzten Einträge
+        get_job_log_buffer().add(job_id, entry.to_dict())
+        return True
+
+    def get_job_logs(
+        self,
+        job_id: str,
+        limit: int = 100,
+        after: Optional[str] = None,
+        newest_first: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Paginierte Log-Einträge eines Jobs (siehe JobLogRepository.get_logs).
+
+        Jobs aus der Zeit vor `job_logs` haben ihre Logs nur im Job-Dokument;
+        für sie wird dieser Bestand als einzelne Seite geliefert.
+        """
+        flush_job_logs(job_id)
+        page = get_job_log_repository().get_logs(job_id, limit=limit, after=after, newest_first=newest_first)
+        if not page["entries"] and not after:
+            doc = self.jobs.find_one({"job_id": job_id}, {"logs": 1})
+            legacy: List[Dict[str, Any]] = list((doc or {}).get("logs") or [])
+            if newest_first:
+                legacy.reverse()
+            page = {"entries": legacy[:limit], "next_cursor": None}
+        return page
+
+    # Lease-basiertes Claiming (mehrere Worker-Knoten auf einer `jobs`-Collection)
+    def claim_next_job(
+        self,
+        worker_id: str,
+        lease_seconds: int,
+        job_types: Optional[List[str]] = None,
+        exclude_job_types: Optional[List[str]] = None,
+    ) -> Optional[Job]:
+        """
+        Übernimmt atomar den ältesten PENDING-Job.
+
+        Statuswechsel, Worker-ID, Lease-Ablauf und Versuchszähler werden in
+        einem einzigen `find_one_and_update` gesetzt. Zwei Knoten können
+        denselben Job daher nicht gleichzeitig erhalten.
+
+        Args:
+            worker_id: Kennung des Worker-Knotens
+            lease_seconds: Gültigkeit der Lease in Sekunden
+            job_types: Nur Jobs dieser Typen übernehmen (Pool eines job_type)
+            exclude_job_types: Jobs dieser Typen auslassen (Default-Pool)
+
+        Returns:
+            Optional[Job]: Der übernommene Job oder None, wenn nichts ansteht
+        """
+        now = datetime.datetime.now(datetime.UTC)
+        query: Dict[str, Any] = {"status": JobStatus.PENDING.value}
+        if job_types is not None:
+            query["job_type"] = {"$in": job_types}
+        elif exclude_job_types:
+            query["job_type"] = {"$nin": exclude_job_types}
+        doc = self.jobs.find_one_and_update(
+            query,
+            {
+                "$set": {
+                    "status": JobStatus.PROCESSING.value,
+                    "worker_id": worker_id,
+                    "lease_expires_at": now + datetime.timedelta(seconds=lease_seconds),
+                    "processing_started_at": now,
+                    "updated_at": now,
+                    "progress": JobProgress(step="initializing", percent=0, message="Job wird initialisiert").to_dict(),
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("created_at", ASCENDING)],
+            return_document=ReturnDocument.AFTER,
+        )
+        if not doc:
+            return None
+        if doc.get("batch_id"):
+            self._apply_batch_transition(doc["batch_id"], JobStatus.PENDING.value, JobStatus.PROCESSING.value)
+        get_job_event_hub().notify(doc["job_id"])
+        return Job.from_dict(doc)
+
+    def renew_lease(self, job_id: str, worker_id: str, lease_seconds: int) -> bool:
+        """
+        Verlängert die Lease eines laufenden Jobs (Heartbeat).
+
+        Returns:
+            bool: False, wenn der Job diesem Worker nicht mehr gehört
+                  (z.B. vom Reaper neu eingereiht oder bereits abgeschlossen)
+        """
+        now = datetime.datetime.now(datetime.UTC)
         result: UpdateResult = self.jobs.update_one(
-            {"job_id": job_id}, {"$push": {"logs": entry.to_dict()}, "$set": {"updated_at": entry.timestamp}}
+            {"job_id": job_id, "worker_id": worker_id, "status": JobStatus.PROCESSING.value},
+            {"$set": {"lease_expires_at": now + datetime.timedelta(seconds=lease_seconds)}},
         )
-        return result.modified_count > 0
+        return result.matched_count > 0
+
+    def requeue_expired_leases(self, max_attempts: int = 3) -> int:
+        """
+        Reiht Jobs mit abgelaufener Lease wieder ein (analog
+        SessionJobRepository.reset_stalled_jobs, aber lease-basiert).
+
+        Jobs, die `max_attempts` erreicht haben, werden als FAILED markiert,
+        damit ein Job, der seinen Worker zuverlässig abstürzen lässt, nicht
+        endlos zwischen den Knoten wandert.
+
+        Args:
+            max_attempts: Maximale Anzahl an Claims pro Job
+
+        Returns:
+            int: Anzahl der neu eingereihten oder abgebrochenen Jobs
+        """
+        now = datetime.datetime.now(datetime.UTC)
+        expired: Dict[str, Any] = {
+            "status": JobStatus.PROCESSING.value,
+            "lease_expires_at": {"$lt": now},
+        }
+        try:
+            candidates = list(self.jobs.find(expired, {"job_id": 1, "attempts": 1, "batch_id": 1}))
+            requeued = 0
+            failed = 0
+            for doc in candidates:
+                # Einzeln und bedingt: ein gleichzeitiger Heartbeat gewinnt
+                guard: Dict[str, Any] = {**expired, "job_id": doc["job_id"]}
+                if int(doc.get("attempts", 0)) >= max_attempts:
+                    new_status = JobStatus.FAILED.value
+                    update: Dict[str, Any] = {
+                        "$set": {
+                            "status": new_status,
+                            "updated_at": now,
+                            "completed_at": now,
+                            "error": JobError(
+                                code="LEASE_EXPIRED",
+                                message=f"Die Lease des Jobs ist nach {max_attempts} Versuchen abgelaufen.",
+                                details={"max_attempts": max_attempts},
+                            ).to_dict(),
+                        },
+                        "$unset": {"lease_expires_at": "", "worker_id": "", "active_fingerprint": ""},
+                    }
+                else:
+                    new_status = JobStatus.PENDING.value
+                    update = {
+                        "$set": {
+                            "status": new_status,
+                            "updated_at": now,
+                            "progress": JobProgress(step="requeued", percent=0, message="Lease abgelaufen, Job neu eingereiht").to_dict(),
+                        },
+                        "$unset": {"lease_expires_at": "", "worker_id": "", "processing_started_at": ""},
+                    }
+                result: UpdateResult = self.jobs.update_one(guard, update)
+                if result.modified_count == 0:
+                    continue
+                if new_status == JobStatus.FAILED.value:
+                    failed += 1
+                else:
+                    requeued += 1
+                if doc.get("batch_id"):
+                    self._apply_batch_transition(doc["batch_id"], JobStatus.PROCESSING.value, new_status)
+            count = failed + requeued
+            if count > 0:
+                logger.info(
+                    f"Abgelaufene Leases: {requeued} Jobs neu eingereiht, "
+                    f"{failed} Jobs abgebrochen (max_attempts={max_attempts})"
+                )
+            return count
+        except Exception as e:
+            logger.error(f"Fehler beim Neueinreihen abgelaufener Leases: {str(e)}", exc_info=True)
+            return 0
+
+    def release_job(self, job_id: str, worker_id: str) -> bool:
+        """
+        Gibt einen laufenden Job beim geordneten Herunterfahren an die
+        Warteschlange zurück, statt auf den Ablauf der Lease zu warten.
+
+        Der Claim zählt nicht als Versuch (`attempts` wird zurückgesetzt),
+        da der Job nicht am Worker gescheitert ist.
+
+        Returns:
+            bool: False, wenn der Job diesem Worker nicht mehr gehört
+        """
+        now = datetime.datetime.now(datetime.UTC)
+        doc = self.jobs.find_one_and_update(
+            {"job_id": job_id, "worker_id": worker_id, "status": JobStatus.PROCESSING.value},
+            {
+                "$set": {
+                    "status": JobStatus.PENDING.value,
+                    "updated_at": now,
+                    "progress": JobProgress(step="requeued", percent=0, message="Worker beendet, Job neu eingereiht").to_dict(),
+                },
+                "$inc": {"attempts": -1},
+                "$unset": {"lease_expires_at": "", "worker_id": "", "processing_started_at": ""},
+            },
+            projection={"batch_id": 1},
+        )
+        if doc is None:
+            return False
+        if doc.get("batch_id"):
+            self._apply_batch_transition(doc["batch_id"], JobStatus.PROCESSING.value, JobStatus.PENDING.value)
+        get_job_event_hub().notify(job_id)
+        return True
+
+    def watch_job_inserts(self, on_insert: Callable[[], None], should_stop: Callable[[], bool]) -> bool:
+        """
+        Ruft `on_insert` für jeden neu eingefügten Job auf (MongoDB Change Stream).
+
+        Blockiert, bis `should_stop()` True liefert. Der Stream wird
+        sekündlich abgefragt, damit ein Stopp zeitnah greift.
+
+        Returns:
+            bool: False, wenn der Server keine Change Streams unterstützt
+                  (Standalone ohne Replica Set)
+        """
+        pipeline: List[Dict[str, Any]] = [{"$match": {"operationType": "insert"}}]
+        try:
+            with self.jobs.watch(pipeline, max_await_time_ms=1000) as stream:
+                while not should_stop() and stream.alive:
+                    if stream.try_next() is not None:
+                        on_insert()
+            return True
+        except OperationFailure as e:
+            if e.code == _CHANGE_STREAM_UNSUPPORTED:
+                logger.info("Change Streams nicht verfügbar (kein Replica Set) – nur In-Process-Benachrichtigung")
+                return False
+            raise
+
+    def watch_job_updates(
+        self,
+        on_update: Callable[[str], None],
+        should_stop: Callable[[], bool],
+        on_ready: Optional[Callable[[], None]] = None,
+    ) -> bool:
+        """
+        Ruft `on_update(job_id)` für jede Status- oder Fortschrittsänderung eines Jobs auf
+        (MongoDB Change Stream).
+
+        Reine Fortschritts-Updates (Prozess-Pool, `src.worker`-Knoten,
+        update_job_status mit gleichem Status) ändern nur `progress` bzw.
+        `updated_at` und müssen den Hub ebenfalls wecken.
+
+        Das Event enthält nur die job_id; den Zustand lädt der Aufrufer
+        gebündelt nach (get_job_snapshots). Blockiert wie watch_job_inserts.
+
+        Args:
+            on_update: Callback mit der job_id
+            should_stop: Abbruchbedingung, sekündlich geprüft
+            on_ready: Wird aufgerufen, sobald der Stream geöffnet ist
+
+        Returns:
+            bool: False, wenn der Server keine Change Streams unterstützt
+        """
+        pipeline: List[Dict[str, Any]] = [
+            {"$match": {
+                "operationType": "update",
+                "$or": [
+                    {f"updateDescription.updatedFields.{field}": {"$exists": True}}
+                    for field in ("status", "progress", "updated_at")
+                ],
+            }},
+            {"$project": {"fullDocument.job_id": 1}},
+        ]
+        try:
+            with self.jobs.watch(pipeline, full_document="updateLookup", max_await_time_ms=1000) as stream:
+                if on_ready is not None:
+                    on_ready()
+                while not should_stop() and stream.alive:
+                    change = stream.try_next()
+                    job_id = ((change or {}).get("fullDocument") or {}).get("job_id")
+                    if job_id:
+                        on_update(str(job_id))
+            return True
+        except OperationFailure as e:
+            if e.code == _CHANGE_STREAM_UNSUPPORTED:
+                logger.info("Change Streams nicht verfügbar (kein Replica Set) – Job-Events per Polling")
+                return False
+            raise
+
+    def get_queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Liefert Warteschlangen-Kennzahlen pro job_type.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: job_type -> {"pending", "processing",
+            "oldest_pending_at"}; Typen ohne offene Jobs fehlen
+        """
+        pipeline: List[Dict[str, Any]] = [
+            {"$match": {"status": {"$in": [JobStatus.PENDING.value, JobStatus.PROCESSING.value]}}},
+            {"$group": {
+                "_id": {"job_type": "$job_type", "status": "$status"},
+                "count": {"$sum": 1},
+                "oldest": {"$min": "$created_at"},
+            }},
+        ]
+        stats: Dict[str, Dict[str, Any]] = {}
+        for row in self.jobs.aggregate(pipeline):
+            job_type = row["_id"].get("job_type") or ""
+            entry = stats.setdefault(job_type, {"pending": 0, "processing": 0, "oldest_pending_at": None})
+            if row["_id"].get("status") == JobStatus.PENDING.value:
+                entry["pending"] = row["count"]
+                entry["oldest_pending_at"] = row["oldest"]
+            else:
+                entry["processing"] = row["count"]
+        return stats
+
+    def get_admission_stats(self, window_sec: float) -> Tuple[int, int]:
+        """
+        Kennzahlen für die Admission Control.
+
+        Returns:
+            Tuple[int, int]: (wartende Jobs, in den letzten `window_sec` abgeschlossene Jobs)
+        """
+        since = datetime.datetime.now(datetime.UTC) - datetime.timedelta(seconds=window_sec)
+        pending = self.jobs.count_documents({"status": JobStatus.PENDING.value})
+        finished = self.jobs.count_documents({
+            "status": {"$in": [JobStatus.COMPLETED.value, JobStatus.FAILED.value]},
+            "completed_at": {"$gte": since},
+        })
+        return pending, finished
 
     def get_job(self, job_id: str) -> Optional[Job]:
         doc = self.jobs.find_one({"job_id": job_id})
         return Job.from_dict(doc) if doc else None
 
+    def get_job_version(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Lädt nur Status, `updated_at` und Lease eines Jobs (für ETag-Vergleiche).
+
+        Returns:
+            Optional[Dict[str, Any]]: Die Felder oder None, wenn der Job fehlt
+        """
+        return self.jobs.find_one({"job_id": job_id}, _VERSION_PROJECTION)
+
+    def get_job_snapshots(self, job_ids: List[str]) -> List[Job]:
+        """
+        Lädt Status und Fortschritt mehrerer Jobs in einer Abfrage.
+
+        `results` und `log_entries` werden nicht übertragen (Projektion).
+        """
+        if not job_ids:
+            return []
+        cursor = self.jobs.find({"job_id": {"$in": job_ids}}, _SNAPSHOT_PROJECTION)
+        return [Job.from_dict(doc) for doc in cursor]
+
     def get_jobs(
         self,
         status: Optional[Union[str, JobStatus]] = None,
@@ -152,6 +692,49 @@ class SecretaryJobRepository:
         cur = self.jobs.find(q).sort(sort_by, sort_order).skip(skip).limit(limit)
         return [Job.from_dict(d) for d in cur]
 
+    def get_jobs_page(
+        self,
+        status: Optional[Union[str, JobStatus]] = None,
+        batch_id: Optional[str] = None,
+        limit: int = 100,
+        after: Optional[str] = None,
+        newest_first: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Listet Jobs seitenweise (Keyset-Paginierung über `created_at` und `job_id`).
+
+        Für Listenansichten: `results` und Logs werden nicht geladen.
+
+        Args:
+            status: Optional, filtere nach Status
+            batch_id: Optional, filtere nach Batch-ID
+            limit: Jobs pro Seite (1-1000)
+            after: Cursor aus `next_cursor` der vorherigen Seite
+            newest_first: Neueste Jobs zuerst (Standard)
+
+        Returns:
+            Dict[str, Any]: {"jobs": List[Job], "next_cursor": str | None}
+
+        Raises:
+            ValueError: Ungültiger Cursor
+        """
+        q: Dict[str, Any] = {}
+        if status is not None:
+            q["status"] = status.value if isinstance(status, JobStatus) else status
+        if batch_id is not None:
+            q["batch_id"] = batch_id
+        docs, next_cursor = keyset_page(
+            self.jobs, q, "job_id", limit=limit, after=after, newest_first=newest_first, projection=_LIST_PROJECTION,
+        )
+        return {"jobs": [Job.from_dict(d) for d in docs], "next_cursor": next_cursor}
+
+    def count_jobs(self, status: Optional[Union[str, JobStatus]] = None) -> int:
+        """Zählt Jobs, optional gefiltert nach Status."""
+        q: Dict[str, Any] = {}
+        if status is not None:
+            q["status"] = status.value if isinstance(status, JobStatus) else status
+        return self.jobs.count_documents(q)
+
     def create_batch(self, batch_data: Union[Dict[str, Any], Batch], user_id: Optional[str] = None) -> str:
         if isinstance(batch_data, dict):
             if user_id and "user_id" not in batch_data:
@@ -164,28 +747,151 @@ class SecretaryJobRepository:
         self.batches.insert_one(batch.to_dict())
         return batch.batch_id
 
+    def create_jobs_bulk(
+        self,
+        jobs_data: List[Dict[str, Any]],
+        batch_name: Optional[str] = None,
+        user_id: Optional[str] = None,
+        known_job_types: Optional[AbstractSet[str]] = None,
+        chunk_size: int = 500,
+    ) -> Dict[str, Any]:
+        """
+        Legt einen Batch mit vielen Jobs in wenigen Round-Trips an.
+
+        Alle Jobs werden vorab validiert und gebaut. Der Batch wird mit
+        `total_jobs` und `pending_jobs` in einem Insert angelegt, danach werden
+        die Jobs per `insert_many(ordered=False)` in Blöcken von `chunk_size`
+        geschrieben. Fehlgeschlagene Inserts werden mit einem einzigen `$inc`
+        aus den Batch-Zählern herausgerechnet. Keine Duplikaterkennung.
+
+        Args:
+            jobs_data: Liste von {"job_type", "parameters", optional "job_name"}
+            batch_name: Anzeigename des Batches
+            user_id: Besitzer von Batch und Jobs
+            known_job_types: Erlaubte job_types (None = keine Prüfung)
+            chunk_size: Jobs pro insert_many
+
+        Returns:
+            Dict[str, Any]: {"batch_id": str | None, "job_ids": [...],
+            "errors": [{"index", "message"}]}; ohne gültige Jobs wird kein Batch angelegt
+        """
+        errors: List[Dict[str, Any]] = []
+        jobs: List[Tuple[int, Job]] = []
+        for index, raw in enumerate(jobs_data):
+            try:
+                jobs.append((index, self._build_bulk_job(raw, user_id, known_job_types)))
+            except (ValueError, TypeError) as e:
+                errors.append({"index": index, "message": str(e)})
+        if not jobs:
+            return {"batch_id": None, "job_ids": [], "errors": errors}
+
+        batch = Batch(total_jobs=len(jobs), pending_jobs=len(jobs), batch_name=batch_name, user_id=user_id)
+        self.batches.insert_one(batch.to_dict())
+        failed_indices: set[int] = set()
+        size = max(1, chunk_size)
+        for start in range(0, len(jobs), size):
+            chunk = jobs[start:start + size]
+            docs = []
+            for _, job in chunk:
+                job.batch_id = batch.batch_id
+                docs.append(job.to_dict())
+            try:
+                self.jobs.insert_many(docs, ordered=False)
+            except BulkWriteError as e:
+                for write_error in e.details.get("writeErrors", []):
+                    index, _ = chunk[int(write_error["index"])]
+                    failed_indices.add(index)
+                    errors.append({"index": index, "message": str(write_error.get("errmsg", "insert failed"))})
+        if failed_indices:
+            failed = len(failed_indices)
+            self._inc_batch_counters(batch.batch_id, {"total_jobs": -failed, "pending_jobs": -failed})
+        job_ids = [job.job_id for index, job in jobs if index not in failed_indices]
+        logger.info(f"Batch {batch.batch_id} erstellt: {len(job_ids)} Jobs, {len(errors)} abgewiesen")
+        get_job_notifier().notify()
+        errors.sort(key=lambda err: err["index"])
+        return {"batch_id": batch.batch_id, "job_ids": job_ids, "errors": errors}
+
+    @staticmethod
+    def _build_bulk_job(
+        raw: Any,
+        user_id: Optional[str],
+        known_job_types: Optional[AbstractSet[str]],
+    ) -> Job:
+        """Validiert einen Eintrag von create_jobs_bulk und baut den Job."""
+        if not isinstance(raw, dict):
+            raise ValueError("Job muss ein Objekt sein")
+        entry = cast(Dict[str, Any], raw)
+        job_type = entry.get("job_type")
+        if not isinstance(job_type, str) or not job_type:
+            raise ValueError("job_type fehlt")
+        if known_job_types is not None and job_type not in known_job_types:
+            raise ValueError(f"Unbekannter job_type: {job_type}")
+        parameters = entry.get("parameters", {})
+        if not isinstance(parameters, dict):
+            raise ValueError("parameters muss ein Objekt sein")
+        job_data: Dict[str, Any] = {"job_type": job_type, "parameters": parameters}
+        if entry.get("job_name"):
+            job_data["job_name"] = str(entry["job_name"])
+        if user_id:
+            job_data["user_id"] = user_id
+        return Job.from_dict(job_data)
+
     def get_batch(self, batch_id: str) -> Optional[Batch]:
         doc = self.batches.find_one({"batch_id": batch_id})
         return Batch.from_dict(doc) if doc else None
 
     def update_batch_progress(self, batch_id: str) -> bool:
+        """
+        Zählt die Jobs eines Batches vollständig neu und überschreibt die Zähler.
+
+        Im laufenden Betrieb pflegen Statuswechsel die Zähler per `$inc`;
+        diese Methode dient dem periodischen Abgleich (reconcile_batch_counters)
+        und der manuellen Reparatur.
+        """
         batch = self.get_batch(batch_id)
         if not batch:
             return False
-        jobs_completed = self.jobs.count_documents({"batch_id": batch_id, "status": JobStatus.COMPLETED.value})
-        jobs_failed = self.jobs.count_documents({"batch_id": batch_id, "status": JobStatus.FAILED.value})
-        status = JobStatus.PROCESSING
+        counts = self._count_batch_jobs(batch_id)
         now = datetime.datetime.now(datetime.UTC)
-        update_data: Dict[str, Any] = {
-            "completed_jobs": jobs_completed,
-            "failed_jobs": jobs_failed,
-            "updated_at": now,
-        }
-        if jobs_completed + jobs_failed >= batch.total_jobs:
-            status = JobStatus.COMPLETED
-            update_data["status"] = status.value
+        update_data: Dict[str, Any] = {**counts, "updated_at": now}
+        if counts["completed_jobs"] + counts["failed_jobs"] >= batch.total_jobs and batch.status != JobStatus.COMPLETED:
+            update_data["status"] = JobStatus.COMPLETED.value
             update_data["completed_at"] = now
         result: UpdateResult = self.batches.update_one({"batch_id": batch_id}, {"$set": update_data})
         return result.modified_count > 0
 
+    def _count_batch_jobs(self, batch_id: str) -> Dict[str, int]:
+        counts: Dict[str, int] = {name: 0 for name in _BATCH_COUNTER.values()}
+        pipeline: List[Dict[str, Any]] = [
+            {"$match": {"batch_id": batch_id}},
+            {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+        ]
+        for row in self.jobs.aggregate(pipeline):
+            counter = _BATCH_COUNTER.get(row["_id"])
+            if counter:
+                counts[counter] = int(row["count"])
+        return counts
+
+    def reconcile_batch_counters(self) -> int:
+        """
+        Gleicht die Zähler aller offenen Batches mit den Jobs ab.
+
+        Fängt Abweichungen auf, z.B. durch einen Absturz zwischen Job- und
+        Batch-Update. Batches mit korrekten Zählern werden nicht geschrieben.
 
+        Returns:
+            int: Anzahl der korrigierten Batches
+        """
+        projection: Dict[str, Any] = {"batch_id": 1, "total_jobs": 1, **{name: 1 for name in _BATCH_COUNTER.values()}}
+        fixed = 0
+        for doc in self.batches.find({"status": {"$ne": JobStatus.COMPLETED.value}}, projection):
+            counts = self._count_batch_jobs(doc["batch_id"])
+            drifted = any(int(doc.get(name, 0)) != value for name, value in counts.items())
+            finished = counts["completed_jobs"] + counts["failed_jobs"] >= int(doc.get("total_jobs", 0))
+            if not drifted and not finished:
+                continue
+            self.update_batch_progress(doc["batch_id"])
+            if drifted:
+                fixed += 1
+                logger.warning(f"Batch-Zähler für {doc['batch_id']} korrigiert: {counts}")
+        return fixed
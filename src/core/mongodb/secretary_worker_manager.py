@@ -7,7 +7,8 @@ and executes handlers via registry based on `job_type`. Parallel processing via
 async workload in respective handlers.
 
 Main functionality:
-- Polls MongoDB for pending jobs
+- Atomically claims pending jobs from MongoDB (lease per worker node)
+- Renews leases via heartbeat and requeues jobs with expired leases
 - Routes jobs to appropriate handlers via processor registry
 - Manages concurrent job processing with thread pool
 - Tracks job progress and status
@@ -18,14 +19,27 @@ Features:
 - Generic job type support (not limited to specific processors)
 - Thread-based parallel processing
 - Configurable concurrency limits
+- Safe horizontal scaling: N worker nodes can share one `jobs` collection
+- Per-job_type concurrency pools with weighted priorities
+- Push dispatch: change stream on `jobs` or in-process notification,
+  with a low-frequency poll as safety net
+- Optional process pool for CPU-heavy job types (registry execution="process")
+- Periodic reconciliation of batch progress counters
+- Queue depth and wait time per job_type
 - Automatic retry logic
+- Graceful drain on shutdown: unfinished jobs are released back to the queue
 - Progress tracking integration
-- Webhook support for job completion notifications
+- Webhook support for job completion notifications (background dispatcher,
+  progress coalesced per job)
 
 @module core.mongodb.secretary_worker_manager
 
 @exports
 - SecretaryWorkerManager: Class - Generic worker manager for secretary jobs
+- JobTypePool: Dataclass - Concurrency limit and priority of a job_type
+- load_job_type_pools(): Dict[str, JobTypePool] - Reads pools from `generic_worker` config
+- select_pool(): Optional[str] - Picks the next pool to fill a free slot
+- build_queue_stats(): Dict[str, Any] - Queue depth and wait time per pool/job_type
 
 @usedIn
 - src.dashboard.app: Starts SecretaryWorkerManager on app initialization
@@ -36,33 +50,240 @@ Features:
 - Internal: src.core.models.job_models - Job, JobStatus, JobProgress models
 - Internal: src.core.processing.registry - Processor registry for job routing
 - Internal: src.core.mongodb.secretary_repository - SecretaryJobRepository
+- Internal: src.core.mongodb.job_notifier - Wake-up signal for push dispatch
+- Internal: src.core.processing.process_pool - JobProcessPool for "process" job types
 - Internal: src.core.resource_tracking - ResourceCalculator
 - Internal: src.utils.logger - Logging system
+- Internal: src.utils.webhook_dispatcher - Background webhook delivery
+- Internal: src.utils.async_runtime - Event loop per job thread
 """
 
 import asyncio
 import logging
+import os
+import socket
 import threading
 import time
 import traceback
+import uuid
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime, UTC
-from typing import Dict, Optional, Any, cast, Callable
-import requests  # type: ignore
-import json
-try:
-    from bson import BSON  # type: ignore
-except Exception:  # pragma: no cover
-    BSON = None  # type: ignore
+from typing import Dict, List, Mapping, Optional, Any, cast, Callable
 
 from src.core.models.job_models import Job, JobStatus, JobProgress, JobError
 from src.core.resource_tracking import ResourceCalculator
 from src.core.processing import registry
+from src.core.processing.process_pool import JobProcessPool
 from .secretary_repository import SecretaryJobRepository
+from .job_notifier import JobNotifier, get_job_notifier
 from src.utils.logger import register_log_observer, unregister_log_observer
+from src.utils.webhook_dispatcher import get_webhook_dispatcher
+from src.utils.async_runtime import close_thread_loop, run_async
 
 
 logger = logging.getLogger(__name__)
 
+# Pool für alle job_types ohne eigenen Eintrag in `generic_worker.job_types`
+DEFAULT_POOL = "default"
+
+
+@dataclass(frozen=True)
+class JobTypePool:
+    """Concurrency-Limit und Gewicht eines job_type (bzw. des Default-Pools)."""
+    name: str
+    max_concurrent: int
+    priority: int = 1
+
+
+def load_job_type_pools(wcfg: Mapping[str, Any]) -> Dict[str, JobTypePool]:
+    """
+    Liest die Pools aus der `generic_worker`-Konfiguration.
+
+    Ohne `job_types` entsteht nur der Default-Pool mit dem globalen
+    `max_concurrent`, das bisherige Verhalten bleibt also erhalten.
+    """
+    global_max = int(wcfg.get("max_concurrent", 3))
+    pools: Dict[str, JobTypePool] = {}
+    job_types_cfg: Any = wcfg.get("job_types") or {}
+    for name, raw_any in cast(Dict[str, Any], job_types_cfg).items():
+        raw: Dict[str, Any] = raw_any if isinstance(raw_any, dict) else {}
+        pools[str(name)] = JobTypePool(
+            name=str(name),
+            max_concurrent=max(1, int(raw.get("max_concurrent", global_max))),
+            priority=max(1, int(raw.get("priority", 1))),
+        )
+    default_any: Any = wcfg.get("default_pool") or {}
+    default_cfg: Dict[str, Any] = default_any if isinstance(default_any, dict) else {}
+    pools[DEFAULT_POOL] = JobTypePool(
+        name=DEFAULT_POOL,
+        max_concurrent=max(1, int(default_cfg.get("max_concurrent", global_max))),
+        priority=max(1, int(default_cfg.get("priority", 1))),
+    )
+    return pools
+
+
+def select_pool(
+    pools: Mapping[str, JobTypePool],
+    running: Mapping[str, int],
+    pending: Mapping[str, int],
+) -> Optional[str]:
+    """
+    Wählt den Pool, der den nächsten freien Slot bekommt.
+
+    Gewichtete Fairness: Es gewinnt der Pool mit dem kleinsten Verhältnis
+    laufender Jobs zu Priorität. Ein Pool mit Priorität 3 bekommt so etwa
+    dreimal so viele Slots wie einer mit Priorität 1, ohne diesen
+    auszuhungern. Pools ohne wartende Jobs oder am Limit scheiden aus.
+    """
+    candidates: List[JobTypePool] = [
+        p for p in pools.values()
+        if pending.get(p.name, 0) > 0 and running.get(p.name, 0) < p.max_concurrent
+    ]
+    if not candidates:
+        return None
+    best = min(candidates, key=lambda p: (running.get(p.name, 0) / p.priority, -p.priority, p.name))
+    return best.name
+
+
+def pool_for_job_type(pools: Mapping[str, JobTypePool], job_type: Optional[str]) -> str:
+    """Ordnet einen job_type seinem Pool zu."""
+    return job_type if job_type and job_type in pools and job_type != DEFAULT_POOL else DEFAULT_POOL
+
+
+def build_queue_stats(
+    type_stats: Mapping[str, Mapping[str, Any]],
+    pools: Mapping[str, JobTypePool],
+    running_local: Optional[Mapping[str, int]] = None,
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """
+    Bereitet Warteschlangen-Kennzahlen pro Pool und job_type auf.
+
+    Args:
+        type_stats: Ergebnis von SecretaryJobRepository.get_queue_stats()
+        pools: Konfigurierte Pools
+        running_local: Laufende Jobs dieses Knotens pro Pool (optional)
+        now: Referenzzeit für die Wartezeit
+
+    Returns:
+        Dict[str, Any]: {"pools": {...}, "job_types": {...}} mit
+        pending, processing und oldest_wait_sec
+    """
+    ref = now or datetime.now(UTC)
+
+    def _wait_sec(oldest: Any) -> Optional[float]:
+        if not isinstance(oldest, datetime):
+            return None
+        # pymongo liefert ohne tz_aware naive UTC-Zeitstempel
+        oldest_utc = oldest if oldest.tzinfo else oldest.replace(tzinfo=UTC)
+        return round(max(0.0, (ref - oldest_utc).total_seconds()), 1)
+
+    job_types: Dict[str, Dict[str, Any]] = {}
+    pool_stats: Dict[str, Dict[str, Any]] = {
+        p.name: {
+            "max_concurrent": p.max_concurrent,
+            "priority": p.priority,
+            "pending": 0,
+            "processing": 0,
+            "oldest_wait_sec": None,
+        }
+        for p in pools.values()
+    }
+    for job_type, st in type_stats.items():
+        wait = _wait_sec(st.get("oldest_pending_at"))
+        pending_n = int(st.get("pending", 0))
+        processing_n = int(st.get("processing", 0))
+        job_types[job_type or "(none)"] = {"pending": pending_n, "processing": processing_n, "oldest_wait_sec": wait}
+        entry = pool_stats[pool_for_job_type(pools, job_type)]
+        entry["pending"] += pending_n
+        entry["processing"] += processing_n
+        if wait is not None and (entry["oldest_wait_sec"] is None or wait > entry["oldest_wait_sec"]):
+            entry["oldest_wait_sec"] = wait
+    if running_local is not None:
+        for name, entry in pool_stats.items():
+            entry["running_local"] = int(running_local.get(name, 0))
+    return {"pools": pool_stats, "job_types": job_types}
+
+
+def build_webhook_log_observer(job: Job) -> Optional[Callable[[str, str, Dict[str, Any]], None]]:
+    """
+    Baut den Log-Observer, der Prozessor-Logs eines Jobs an dessen Webhook weiterleitet.
+
+    Wird im Worker-Thread und in Pool-Prozessen (src.core.processing.process_pool)
+    gleichermaßen registriert.
+
+    Returns:
+        Optional[Callable]: Observer oder None, wenn der Job keinen Webhook hat
+    """
+    # Callback-Infos (falls vorhanden) lesen
+    callback_url: Optional[str] = None
+    callback_token: Optional[str] = None
+    client_job_id: Optional[str] = None
+    webhook_cfg_any: Any = getattr(job.parameters, "webhook", None)
+    if isinstance(webhook_cfg_any, dict):
+        webhook_cfg_dict: Dict[str, Any] = cast(Dict[str, Any], webhook_cfg_any)
+        url_val = webhook_cfg_dict.get("url")
+        token_val = webhook_cfg_dict.get("token")
+        jobid_val = webhook_cfg_dict.get("jobId")
+        callback_url = url_val if isinstance(url_val, str) else None
+        callback_token = token_val if isinstance(token_val, str) else None
+        client_job_id = jobid_val if isinstance(jobid_val, str) else None
+
+    # Ziel-URL gemäß neuer Spezifikation: jobId im Pfad
+    def _build_endpoint(base: str, job_id_client: Optional[str]) -> str:
+        if not job_id_client:
+            return base
+        b = base.rstrip('/')
+        if b.endswith(job_id_client):
+            return b
+        if '{jobId}' in b:
+            return b.replace('{jobId}', job_id_client)
+        return f"{b}/{job_id_client}"
+
+    endpoint_url: Optional[str] = None
+    if callback_url:
+        endpoint_url = _build_endpoint(str(callback_url), client_job_id)
+
+    if not endpoint_url:
+        return None
+
+    dispatcher = get_webhook_dispatcher()
+    dispatcher.open_job(job.job_id)
+
+    def _observer(level: str, message: str, kwargs: Dict[str, Any]) -> None:
+        try:
+            # Nur info/error weiterleiten, debug ignorieren
+            if level not in ("info", "error"):
+                return
+            phase = "running" if level == "info" else "failed"
+            progress_val: Optional[int] = None
+            # einfache Progress-Erkennung (kwargs ist Dict[str, Any])
+            progress_raw = kwargs.get('progress')
+            percent_raw = kwargs.get('percent')
+            if isinstance(progress_raw, (int, float)):
+                progress_val = int(progress_raw)
+            elif isinstance(percent_raw, (int, float)):
+                progress_val = int(percent_raw)
+            headers: Dict[str, str] = {"Content-Type": "application/json", "Accept": "application/json"}
+            if callback_token:
+                headers["Authorization"] = f"Bearer {callback_token}"
+                headers["X-Callback-Token"] = str(callback_token)
+            payload: Dict[str, Any] = {
+                "phase": phase,
+                "message": message,
+                "process": {"id": job.job_id},
+            }
+            if progress_val is not None:
+                payload["progress"] = progress_val
+            # Asynchron und pro Job zusammengefasst; blockiert den Job-Thread nicht
+            dispatcher.post_progress(job.job_id, str(endpoint_url), payload, headers, timeout=10)
+        except Exception:
+            # Log-Weiterleitung darf Job nicht stören
+            pass
+
+    return _observer
+
 
 class SecretaryWorkerManager:
     def __init__(
@@ -71,74 +292,291 @@ class SecretaryWorkerManager:
         resource_calculator: ResourceCalculator,
         max_concurrent_workers: int = 3,
         poll_interval_sec: int = 5,
+        lease_sec: int = 120,
+        heartbeat_interval_sec: int = 30,
+        max_attempts: int = 3,
+        worker_id: Optional[str] = None,
+        job_type_pools: Optional[Dict[str, JobTypePool]] = None,
+        dispatch_mode: str = "poll",
+        safety_poll_interval_sec: int = 30,
+        notifier: Optional[JobNotifier] = None,
+        process_pool: Optional[JobProcessPool] = None,
+        batch_reconcile_interval_sec: int = 300,
     ) -> None:
         self.job_repo = job_repo
         self.resource_calculator = resource_calculator
         self.max_concurrent_workers = max_concurrent_workers
         self.poll_interval_sec = poll_interval_sec
+        self.lease_sec = lease_sec
+        self.heartbeat_interval_sec = heartbeat_interval_sec
+        self.max_attempts = max_attempts
+        # "push": Wecken per Change Stream / create_job, Poll nur als Sicherheitsnetz
+        self.dispatch_mode = dispatch_mode if dispatch_mode in ("push", "poll") else "poll"
+        self.safety_poll_interval_sec = safety_poll_interval_sec
+        self.notifier = notifier or get_job_notifier()
+        # Pool für job_types mit execution="process"; None = alles in Threads
+        self.process_pool = process_pool
+        self.batch_reconcile_interval_sec = batch_reconcile_interval_sec
+        self._last_batch_reconcile = time.monotonic()
+        # Eindeutig pro Prozess, damit Leases mehrerer Knoten unterscheidbar sind
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.job_type_pools: Dict[str, JobTypePool] = job_type_pools or {
+            DEFAULT_POOL: JobTypePool(name=DEFAULT_POOL, max_concurrent=max_concurrent_workers)
+        }
         self.running_workers: Dict[str, threading.Thread] = {}
+        # job_id -> Pool-Name, für die Limits pro job_type
+        self.running_pools: Dict[str, str] = {}
         self.stop_flag = False
         self.monitor_thread = threading.Thread(target=self._monitor_jobs, daemon=True)
+        self.heartbeat_thread = threading.Thread(target=self._heartbeat_loop, daemon=True)
+        self.change_stream_thread = threading.Thread(target=self._watch_job_inserts, daemon=True)
         logger.info(
-            f"SecretaryWorkerManager init (max_workers={max_concurrent_workers}, poll={poll_interval_sec}s)"
+            f"SecretaryWorkerManager init (worker_id={self.worker_id}, max_workers={max_concurrent_workers}, "
+            f"dispatch={self.dispatch_mode}, poll={poll_interval_sec}s, lease={lease_sec}s)"
         )
 
     def start(self) -> None:
         logger.info("Starte SecretaryWorkerManager")
         self.stop_flag = False
         print("[SECRETARY-WORKER] Manager start")
+        if self.process_pool is not None:
+            self.process_pool.start()
         self.monitor_thread.start()
+        self.heartbeat_thread.start()
+        if self.dispatch_mode == "push":
+            self.change_stream_thread.start()
 
     def stop(self) -> None:
-        logger.info("Stoppe SecretaryWorkerManager")
+        self.drain(None)
+
+    def drain(self, timeout_sec: Optional[float] = None) -> int:
+        """
+        Fährt den Manager geordnet herunter: Es werden keine neuen Jobs mehr
+        übernommen, laufende Jobs dürfen bis `timeout_sec` fertig werden.
+        Danach noch laufende Jobs werden an die Warteschlange zurückgegeben,
+        damit ein anderer Knoten sie sofort übernimmt statt erst nach Ablauf
+        der Lease.
+
+        Args:
+            timeout_sec: Maximale Wartezeit auf laufende Jobs (None = unbegrenzt)
+
+        Returns:
+            int: Anzahl der zurückgegebenen Jobs
+        """
+        logger.info(f"Stoppe SecretaryWorkerManager (laufende Jobs: {len(self.running_workers)}, timeout={timeout_sec})")
         self.stop_flag = True
-        self.monitor_thread.join()
-        for t in self.running_workers.values():
-            t.join()
+        self.notifier.notify()
+        if self.monitor_thread.is_alive():
+            self.monitor_thread.join()
+        deadline = None if timeout_sec is None else time.monotonic() + timeout_sec
+        for t in list(self.running_workers.values()):
+            t.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        released = 0
+        for job_id, t in list(self.running_workers.items()):
+            if not t.is_alive():
+                continue
+            try:
+                if self.job_repo.release_job(job_id, self.worker_id):
+                    released += 1
+            except Exception as e:
+                logger.error(f"Job {job_id} konnte nicht zurückgegeben werden: {e}")
+        if released:
+            logger.warning(f"{released} laufende Jobs beim Herunterfahren neu eingereiht (worker_id={self.worker_id})")
+        if self.heartbeat_thread.is_alive():
+            self.heartbeat_thread.join()
+        if self.change_stream_thread.is_alive():
+            self.change_stream_thread.join()
+        if self.process_pool is not None:
+            self.process_pool.shutdown()
+        return released
 
     def _monitor_jobs(self) -> None:
         logger.info("Secretary-Job-Monitor gestartet")
         while not self.stop_flag:
+            # Vor dem Claim zurücksetzen: Signale während des Claims wecken erneut
+            self.notifier.clear()
             try:
                 self._cleanup_workers()
-                if len(self.running_workers) < self.max_concurrent_workers:
-                    pending_jobs = self.job_repo.get_jobs(status=JobStatus.PENDING)
-                    for job in pending_jobs:
-                        if len(self.running_workers) >= self.max_concurrent_workers:
-                            break
-                        if job.job_id not in self.running_workers:
-                            logger.info(f"Starte Worker-Thread für Job {job.job_id} (type={job.job_type})")
-                            self._start_worker(job)
+                self._claim_jobs()
             except Exception as e:
                 logger.error(f"Fehler im Secretary-Job-Monitor: {e}", exc_info=True)
-            for _ in range(self.poll_interval_sec):
+            self._wait_for_work()
+        logger.info("Secretary-Job-Monitor beendet")
+
+    def _wait_for_work(self) -> None:
+        if self.dispatch_mode == "push":
+            self.notifier.wait(self.safety_poll_interval_sec)
+            return
+        for _ in range(self.poll_interval_sec):
+            if self.stop_flag:
+                break
+            time.sleep(1)
+
+    def _watch_job_inserts(self) -> None:
+        """Leitet Inserts in `jobs` (auch von anderen Knoten/Prozessen) an den Notifier weiter."""
+        while not self.stop_flag:
+            try:
+                supported = self.job_repo.watch_job_inserts(self.notifier.notify, lambda: self.stop_flag)
+                if not supported:
+                    # Standalone-MongoDB: create_job-Benachrichtigung und Sicherheits-Poll genügen
+                    return
+            except Exception as e:
+                logger.warning(f"Change Stream auf `jobs` unterbrochen: {e}; neuer Versuch in 5s")
+                for _ in range(5):
+                    if self.stop_flag:
+                        break
+                    time.sleep(1)
+
+    def _claim_jobs(self) -> None:
+        """Füllt freie Slots nach Priorität, ohne die Limits pro job_type zu überschreiten."""
+        if len(self.running_workers) >= self.max_concurrent_workers:
+            return
+        pending: Counter[str] = Counter()
+        for job_type, st in self.job_repo.get_queue_stats().items():
+            pending[pool_for_job_type(self.job_type_pools, job_type)] += int(st.get("pending", 0))
+        running: Counter[str] = Counter(self.running_pools.values())
+        configured = [name for name in self.job_type_pools if name != DEFAULT_POOL]
+
+        while len(self.running_workers) < self.max_concurrent_workers and not self.stop_flag:
+            pool = select_pool(self.job_type_pools, running, pending)
+            if pool is None:
+                break
+            if pool == DEFAULT_POOL:
+                job = self.job_repo.claim_next_job(self.worker_id, self.lease_sec, exclude_job_types=configured)
+            else:
+                job = self.job_repo.claim_next_job(self.worker_id, self.lease_sec, job_types=[pool])
+            if job is None:
+                # Statistik veraltet (andere Knoten waren schneller)
+                pending[pool] = 0
+                continue
+            running[pool] += 1
+            pending[pool] -= 1
+            logger.info(
+                f"Starte Worker-Thread für Job {job.job_id} (type={job.job_type}, pool={pool}, attempt={job.attempts})"
+            )
+            self._start_worker(job)
+
+    def queue_stats(self) -> Dict[str, Any]:
+        """Warteschlangen-Kennzahlen pro Pool und job_type, inkl. der laufenden Jobs dieses Knotens."""
+        stats = build_queue_stats(
+            self.job_repo.get_queue_stats(),
+            self.job_type_pools,
+            running_local=Counter(self.running_pools.values()),
+        )
+        stats["worker_id"] = self.worker_id
+        return stats
+
+    def _heartbeat_loop(self) -> None:
+        """Verlängert die Leases laufender Jobs und reiht verwaiste Jobs anderer Knoten neu ein."""
+        while not self.stop_flag:
+            try:
+                self._renew_leases()
+                if self.job_repo.requeue_expired_leases(max_attempts=self.max_attempts) > 0:
+                    self.notifier.notify()
+                self._maybe_reconcile_batches()
+            except Exception as e:
+                logger.error(f"Fehler im Secretary-Heartbeat: {e}", exc_info=True)
+            for _ in range(self.heartbeat_interval_sec):
                 if self.stop_flag:
                     break
                 time.sleep(1)
-        logger.info("Secretary-Job-Monitor beendet")
+
+    def _maybe_reconcile_batches(self) -> None:
+        """Gleicht die $inc-Batch-Zähler periodisch mit einer Vollzählung ab."""
+        if self.batch_reconcile_interval_sec <= 0:
+            return
+        if time.monotonic() - self._last_batch_reconcile < self.batch_reconcile_interval_sec:
+            return
+        self._last_batch_reconcile = time.monotonic()
+        self.job_repo.reconcile_batch_counters()
+
+    def _renew_leases(self) -> None:
+        for job_id, th in list(self.running_workers.items()):
+            if not th.is_alive():
+                continue
+            if not self.job_repo.renew_lease(job_id, self.worker_id, self.lease_sec):
+                logger.warning(
+                    f"Lease für Job {job_id} verloren (worker_id={self.worker_id}); Job wurde neu vergeben oder ist beendet"
+                )
 
     def _cleanup_workers(self) -> None:
         completed = [jid for jid, th in self.running_workers.items() if not th.is_alive()]
         for jid in completed:
             del self.running_workers[jid]
+            self.running_pools.pop(jid, None)
 
     def _start_worker(self, job: Job) -> None:
-        # Set processing status
-        self.job_repo.update_job_status(
-            job_id=job.job_id,
-            status=JobStatus.PROCESSING,
-            progress=JobProgress(step="initializing", percent=0, message="Job wird initialisiert"),
+        # PROCESSING-Status und Lease wurden bereits atomar in claim_next_job gesetzt
+        self.job_repo.add_log_entry(
+            job.job_id, "info", f"Job-Verarbeitung gestartet (worker={self.worker_id}, attempt={job.attempts})"
         )
-        self.job_repo.add_log_entry(job.job_id, "info", "Job-Verarbeitung gestartet")
         th = threading.Thread(target=self._run_worker, args=(job,), daemon=True)
+        self.running_pools[job.job_id] = pool_for_job_type(self.job_type_pools, job.job_type)
         th.start()
         self.running_workers[job.job_id] = th
 
     def _run_worker(self, job: Job) -> None:
         try:
-            asyncio.run(self._process_job(job))
+            run_async(self._process_job(job))
         except Exception as e:
             logger.error(f"Fehler im Secretary-Worker-Thread: {e}", exc_info=True)
+        finally:
+            # Loop des Job-Threads samt Loop-Ressourcen (async HTTP-Clients) schließen
+            close_thread_loop()
+            # Slot ist frei: Monitor sofort den nächsten Job holen lassen
+            self.notifier.notify()
+
+    def _notify_attached_webhooks(self, job_id: str) -> None:
+        """
+        Benachrichtigt Webhooks von Duplikat-Anfragen, die sich an den Job
+        angehängt haben (siehe SecretaryJobRepository.create_job).
+
+        Angehängte Clients erhalten denselben Abschluss-Payload, den der Handler
+        an den ursprünglichen Webhook gesendet hat (store_final_webhook_payload),
+        jeweils mit eigener `job.id`. Hatte die ursprüngliche Anfrage keinen
+        Webhook, wird ein generischer completed/error-Payload gebaut.
+
+        Der Job ist hier bereits im Endstatus; danach hängt sich keine Anfrage
+        mehr an, die Liste ist also vollständig.
+        """
+        try:
+            final_job = self.job_repo.get_job(job_id)
+            if final_job is None or not final_job.attached_webhooks:
+                return
+            failed = final_job.status == JobStatus.FAILED
+            handler_payload = None if failed else self.job_repo.get_final_webhook_payload(job_id)
+            for webhook in final_job.attached_webhooks:
+                url = webhook.get("url")
+                if not url:
+                    continue
+                token = webhook.get("token")
+                headers: Dict[str, str] = {"Content-Type": "application/json", "Accept": "application/json"}
+                if token:
+                    headers["Authorization"] = f"Bearer {token}"
+                    headers["X-Callback-Token"] = str(token)
+                payload: Dict[str, Any]
+                if handler_payload is not None:
+                    payload = dict(handler_payload)
+                    payload["job"] = {"id": webhook.get("jobId") or job_id}
+                else:
+                    payload = {
+                        "phase": "error" if failed else "completed",
+                        "message": "Verarbeitung fehlgeschlagen" if failed else "Verarbeitung abgeschlossen",
+                        "job": {"id": webhook.get("jobId") or job_id},
+                        "data": None if failed or final_job.results is None else final_job.results.structured_data,
+                    }
+                if failed and final_job.error is not None:
+                    payload["error"] = {
+                        "code": final_job.error.code,
+                        "message": final_job.error.message,
+                    }
+                try:
+                    resp = get_webhook_dispatcher().send_final(job_id, str(url), payload, headers, timeout=30)
+                    self.job_repo.add_log_entry(job_id, "info", f"Webhook (angehängte Anfrage) Antwort: {getattr(resp, 'status_code', None)}")
+                except Exception as post_err:
+                    self.job_repo.add_log_entry(job_id, "error", f"Webhook (angehängte Anfrage) fehlgeschlagen: {str(post_err)}")
+        except Exception as e:
+            logger.error(f"Angehängte Webhooks für Job {job_id} fehlgeschlagen: {e}")
 
     async def _process_job(self, job: Job) -> None:
         start_time = datetime.now(UTC)
@@ -153,6 +591,7 @@ class SecretaryWorkerManager:
         if metric_tracker is not None:
             metric_tracker.set_processor_name(job.job_type or "unknown")
             metric_tracker.set_endpoint_info(f"/jobs/{job.job_type}", "worker", "secretary-worker")
+        lease_held = True
         try:
             logger.info(f"Starte Job {job.job_id} (type={job.job_type})")
             handler = registry.get_handler(job.job_type)
@@ -164,76 +603,28 @@ class SecretaryWorkerManager:
                 job_id=job.job_id,
                 status=JobStatus.PROCESSING,
                 progress=JobProgress(step="processing", percent=10, message="Verarbeitung läuft"),
+                worker_id=self.worker_id,
             )
             logger.info(f"Dispatch an Handler für Job {job.job_id}")
 
-            # Callback-Infos (falls vorhanden) lesen
-            callback_url: Optional[str] = None
-            callback_token: Optional[str] = None
-            client_job_id: Optional[str] = None
-            webhook_cfg_any: Any = getattr(job.parameters, "webhook", None)
-            if isinstance(webhook_cfg_any, dict):
-                webhook_cfg_dict: Dict[str, Any] = cast(Dict[str, Any], webhook_cfg_any)
-                url_val = webhook_cfg_dict.get("url")
-                token_val = webhook_cfg_dict.get("token")
-                jobid_val = webhook_cfg_dict.get("jobId")
-                callback_url = url_val if isinstance(url_val, str) else None
-                callback_token = token_val if isinstance(token_val, str) else None
-                client_job_id = jobid_val if isinstance(jobid_val, str) else None
-
-            # Ziel-URL gemäß neuer Spezifikation: jobId im Pfad
-            def _build_endpoint(base: str, job_id_client: Optional[str]) -> str:
-                if not job_id_client:
-                    return base
-                b = base.rstrip('/')
-                if b.endswith(job_id_client):
-                    return b
-                if '{jobId}' in b:
-                    return b.replace('{jobId}', job_id_client)
-                return f"{b}/{job_id_client}"
-
-            endpoint_url: Optional[str] = None
-            if callback_url:
-                endpoint_url = _build_endpoint(str(callback_url), client_job_id)
-
             # Observer zum Weiterleiten von Prozessor-Logs registrieren
+            # (im Prozess-Modus registriert der Pool-Prozess seinen eigenen)
             observer_ref: Optional[Callable[[str, str, Dict[str, Any]], None]] = None
-            if endpoint_url:
-                def _observer(level: str, message: str, kwargs: Dict[str, Any]) -> None:
-                    try:
-                        # Nur info/error weiterleiten, debug ignorieren
-                        if level not in ("info", "error"):
-                            return
-                        phase = "running" if level == "info" else "failed"
-                        progress_val: Optional[int] = None
-                        # einfache Progress-Erkennung (kwargs ist Dict[str, Any])
-                        progress_raw = kwargs.get('progress')
-                        percent_raw = kwargs.get('percent')
-                        if isinstance(progress_raw, (int, float)):
-                            progress_val = int(progress_raw)
-                        elif isinstance(percent_raw, (int, float)):
-                            progress_val = int(percent_raw)
-                        headers: Dict[str, str] = {"Content-Type": "application/json", "Accept": "application/json"}
-                        if callback_token:
-                            headers["Authorization"] = f"Bearer {callback_token}"
-                            headers["X-Callback-Token"] = str(callback_token)
-                        payload: Dict[str, Any] = {
-                            "phase": phase,
-                            "message": message,
-                            "process": {"id": job.job_id},
-                        }
-                        if progress_val is not None:
-                            payload["progress"] = progress_val
-                        requests.post(url=str(endpoint_url), json=payload, headers=headers, timeout=10)
-                    except Exception:
-                        # Log-Weiterleitung darf Job nicht stören
-                        pass
-
-                observer_ref = _observer
-                register_log_observer(job.job_id, observer_ref)
+            run_in_pool = (
+                self.process_pool is not None and registry.get_execution_mode(job.job_type) == "process"
+            )
+            if not run_in_pool:
+                observer_ref = build_webhook_log_observer(job)
+                if observer_ref is not None:
+                    register_log_observer(job.job_id, observer_ref)
 
             try:
-                await handler(job, self.job_repo, self.resource_calculator)
+                if run_in_pool and self.process_pool is not None:
+                    # CPU-lastiger Handler im Pool-Prozess; Fortschritt und Logs
+                    # schreibt der Pool-Prozess selbst ins SecretaryJobRepository
+                    await asyncio.to_thread(self.process_pool.run, job)
+                else:
+                    await handler(job, self.job_repo, self.resource_calculator)
             finally:
                 # Observer deregistrieren
                 if observer_ref is not None:
@@ -242,61 +633,18 @@ class SecretaryWorkerManager:
                     except Exception:
                         pass
 
-            # Vor Persistenz: Größe und größte Felder messen
-            try:
-                update_doc: Dict[str, Any] = {
-                    "status": JobStatus.COMPLETED,
-                    "progress": JobProgress(step="completed", percent=100, message="Verarbeitung abgeschlossen"),
-                }
-                # Heuristik: Hole aktuelles Resultat aus Repo, wenn vorhanden, um Feldergrößen abzuschätzen
-                current_doc = self.job_repo.get_job(job.job_id)  # type: ignore[attr-defined]
-                field_sizes: list[tuple[str, int]] = []
-                def _measure_field(path: str, val: Any) -> None:
-                    try:
-                        if val is None:
-                            size = 0
-                        elif isinstance(val, (str, bytes)):
-                            size = len(val)
-                        else:
-                            size = len(json.dumps(val))
-                        field_sizes.append((path, size))
-                    except Exception:
-                        pass
-                if isinstance(current_doc, dict):
-                    # Potentiell große Felder
-                    for key in ["data", "data.extracted_text", "data.images_archive_data", "data.metadata.text_contents"]:
-                        parts = key.split(".")
-                        ref: Any = current_doc
-                        for p in parts:
-                            if isinstance(ref, dict) and p in ref:
-                                ref = ref[p]
-                            else:
-                                ref = None
-                                break
-                        _measure_field(key, ref)
-                bson_size: Optional[int] = None
-                if BSON is not None:
-                    try:
-                        # Simuliertes $set für Schätzung
-                        bson_size = len(BSON.encode({"$set": update_doc}))
-                    except Exception:
-                        bson_size = None
-                largest = sorted(field_sizes, key=lambda x: x[1], reverse=True)[:5]
-                logger.info(
-                    f"Job {job.job_id} Persistenz-Check: bson_size={bson_size} largest_fields={largest}"
-                )
-            except Exception:
-                # Messfehler sollen Persistenz nicht verhindern
-                pass
-
-            self.job_repo.update_job_status(
+            lease_held = self.job_repo.update_job_status(
                 job_id=job.job_id,
                 status=JobStatus.COMPLETED,
                 progress=JobProgress(step="completed", percent=100, message="Verarbeitung abgeschlossen"),
+                worker_id=self.worker_id,
             )
-            logger.info(f"Job {job.job_id} erfolgreich abgeschlossen")
-            if job.batch_id:
-                self.job_repo.update_batch_progress(job.batch_id)
+            if lease_held:
+                logger.info(f"Job {job.job_id} erfolgreich abgeschlossen")
+            else:
+                logger.warning(
+                    f"Job {job.job_id} beendet, aber Lease verloren (worker_id={self.worker_id}); Abschluss verworfen"
+                )
         except Exception as e:
             logger.error(f"Fehler in Job {job.job_id}: {e}")
             if metric_tracker is not None:
@@ -306,14 +654,18 @@ class SecretaryWorkerManager:
                 message=str(e),
                 details={"traceback": traceback.format_exc(), "duration_ms": int((datetime.now(UTC) - start_time).total_seconds() * 1000)},
             )
-            self.job_repo.update_job_status(
+            lease_held = self.job_repo.update_job_status(
                 job_id=job.job_id,
                 status=JobStatus.FAILED,
                 progress=JobProgress(step="error", percent=0, message=str(e)),
                 error=error_info,
+                worker_id=self.worker_id,
             )
-            if job.batch_id:
-                self.job_repo.update_batch_progress(job.batch_id)
+            if not lease_held:
+                logger.warning(
+                    f"Fehler in Job {job.job_id} nicht gespeichert: Lease verloren (worker_id={self.worker_id})"
+                )
+                return
             # Fehler-Webhook senden, falls konfiguriert
             try:
                 extra_any: Any = getattr(job.parameters, "extra", {}) or {}
@@ -348,7 +700,7 @@ class SecretaryWorkerManager:
                             headers["X-Callback-Token"] = str(callback_token)
                         try:
                             self.job_repo.add_log_entry(job.job_id, "info", f"Sende Error-Webhook an {callback_url}")
-                            resp = requests.post(url=str(callback_url), json=payload, headers=headers, timeout=30)
+                            resp = get_webhook_dispatcher().send_final(job.job_id, str(callback_url), payload, headers, timeout=30)
                             self.job_repo.add_log_entry(job.job_id, "info", f"Error-Webhook Antwort: {getattr(resp, 'status_code', None)} ok={getattr(resp, 'ok', None)}")
                         except Exception as post_err:
                             self.job_repo.add_log_entry(job.job_id, "error", f"Error-Webhook-POST fehlgeschlagen: {str(post_err)}")
@@ -356,6 +708,9 @@ class SecretaryWorkerManager:
                 # Webhook-Fehler nicht weiter eskalieren
                 pass
         finally:
+            # Den Abschluss meldet nur der Worker, dem der Job noch gehört
+            if lease_held:
+                self._notify_attached_webhooks(job.job_id)
             # Messung abschließen + in MongoDB persistieren, danach das
             # Thread-Local aufräumen (verhindert Vermischung zwischen Jobs).
             if metric_tracker is not None:
@@ -384,11 +739,27 @@ def get_secretary_worker_manager() -> Optional[SecretaryWorkerManager]:
         # Sanity check Mongo URI existiert implizit in get_mongodb_database
         job_repo = SecretaryJobRepository()
         res_calc = ResourceCalculator()
+        pcfg: Dict[str, Any] = wcfg.get("process_pool", {}) or {}
+        process_pool: Optional[JobProcessPool] = None
+        if pcfg.get("enabled", False):
+            process_pool = JobProcessPool(
+                size=int(pcfg.get("workers", 2)),
+                max_jobs_per_worker=int(pcfg.get("max_jobs_per_worker", 50)),
+                max_memory_mb=int(pcfg.get("max_memory_mb", 2048)),
+            )
         _secretary_manager = SecretaryWorkerManager(
             job_repo=job_repo,
             resource_calculator=res_calc,
             max_concurrent_workers=wcfg.get("max_concurrent", 3),
             poll_interval_sec=wcfg.get("poll_interval_sec", 5),
+            lease_sec=wcfg.get("lease_sec", 120),
+            heartbeat_interval_sec=wcfg.get("heartbeat_interval_sec", 30),
+            max_attempts=wcfg.get("max_attempts", 3),
+            job_type_pools=load_job_type_pools(wcfg),
+            dispatch_mode=wcfg.get("dispatch_mode", "push"),
+            safety_poll_interval_sec=wcfg.get("safety_poll_interval_sec", 30),
+            process_pool=process_pool,
+            batch_reconcile_interval_sec=wcfg.get("batch_reconcile_interval_sec", 300),
         )
     return _secretary_manager
 
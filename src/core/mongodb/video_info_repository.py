@@ -0,0 +1,167 @@
+"""
+@fileoverview Video Info Cache Repository - MongoDB cache for yt-dlp metadata
+
+@description
+Speichert die Metadaten, die yt-dlp per `extract_info(download=False)` liefert,
+in MongoDB. Wiederholte oder gebündelte Einreichungen desselben Videos sparen
+damit den Extraktor-Roundtrip (bzw. den `yt-dlp --dump-json`-Subprozess).
+
+Der Schlüssel ist eine normalisierte Video-Kennung (`youtube:<id>`,
+`vimeo:<id>` oder die bereinigte URL). Abgelaufene Einträge entfernt MongoDB
+über einen TTL-Index auf `expires_at`.
+
+Die Normalisierung (normalize_video_key) und das Entschlacken der Info
+(slim_video_info) sind reine Funktionen ohne DB-Zugriff.
+
+@module core.mongodb.video_info_repository
+
+@exports
+- VideoInfoCacheRepository: Class - Repository für gecachte Video-Metadaten
+- normalize_video_key(): str - Normalisierter Cache-Schlüssel für eine Video-URL
+- slim_video_info(): Dict - Entfernt große/kurzlebige Felder aus der yt-dlp-Info
+"""
+
+from pymongo import ASCENDING
+from pymongo.collection import Collection
+from pymongo.database import Database
+from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+import logging
+import re
+
+from .connection import get_mongodb_database
+
+logger = logging.getLogger(__name__)
+
+# Felder mit signierten (ablaufenden) Stream-URLs oder großem Volumen.
+# Sie werden für die Info-Extraktion nicht benötigt und nicht gecacht.
+_VOLATILE_INFO_FIELDS: List[str] = [
+    "formats",
+    "requested_formats",
+    "requested_downloads",
+    "thumbnails",
+    "automatic_captions",
+    "subtitles",
+    "heatmap",
+    "http_headers",
+    "url",
+    "manifest_url",
+    "fragments",
+]
+
+_YOUTUBE_ID_PATTERNS: List[str] = [
+    r'(?:https?://)?(?:www\.|m\.)?youtube\.com/watch\?(?:.*&)?v=([a-zA-Z0-9_-]{11})',
+    r'(?:https?://)?(?:www\.)?youtu\.be/([a-zA-Z0-9_-]{11})',
+    r'(?:https?://)?(?:www\.)?youtube\.com/(?:embed|shorts|live)/([a-zA-Z0-9_-]{11})',
+]
+
+_VIMEO_ID_PATTERNS: List[str] = [
+    r'https?://player\.vimeo\.com/video/(\d+)',
+    r'https?://(?:www\.)?vimeo\.com/(?:video/)?(\d+)',
+]
+
+# Tracking-Parameter, die die Identität eines Videos nicht verändern
+_TRACKING_PARAMS = {"si", "feature", "pp", "fbclid", "gclid"}
+
+
+def normalize_video_key(url: str) -> str:
+    """
+    Liefert einen stabilen Cache-Schlüssel für eine Video-URL.
+
+    YouTube- und Vimeo-URLs werden auf ihre Video-ID reduziert, sodass
+    Kurz-, Player- und Embed-Varianten denselben Eintrag treffen. Andere URLs
+    werden bereinigt (Schema/Host klein, Fragment und Tracking-Parameter weg).
+    """
+    raw = (url or "").strip()
+    for pattern in _YOUTUBE_ID_PATTERNS:
+        match = re.match(pattern, raw)
+        if match:
+            return f"youtube:{match.group(1)}"
+    for pattern in _VIMEO_ID_PATTERNS:
+        match = re.match(pattern, raw)
+        if match:
+            return f"vimeo:{match.group(1)}"
+
+    parsed = urlparse(raw)
+    query = [
+        (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if k not in _TRACKING_PARAMS and not k.startswith("utm_")
+    ]
+    normalized = parsed._replace(
+        scheme=parsed.scheme.lower(),
+        netloc=parsed.netloc.lower(),
+        query=urlencode(sorted(query)),
+        fragment="",
+    )
+    return f"url:{urlunparse(normalized)}"
+
+
+def slim_video_info(info: Dict[str, Any]) -> Dict[str, Any]:
+    """Entfernt Stream-URLs und große Listen aus einer (sanitisierten) yt-dlp-Info."""
+    return {k: v for k, v in info.items() if k not in _VOLATILE_INFO_FIELDS}
+
+
+class VideoInfoCacheRepository:
+    """
+    Repository für gecachte yt-dlp-Metadaten mit TTL.
+    """
+
+    def __init__(self) -> None:
+        """Initialisiert das Repository und stellt die Indizes sicher."""
+        self.db: Database[Any] = get_mongodb_database()
+        self.entries: Collection[Any] = self.db.video_info_cache
+        self._create_indexes()
+        logger.info("VideoInfoCacheRepository initialisiert")
+
+    def _create_indexes(self) -> None:
+        """Erstellt den eindeutigen Schlüssel-Index und den TTL-Index auf expires_at."""
+        try:
+            self.entries.create_index([("key", ASCENDING)], unique=True)
+            # expireAfterSeconds=0: Dokument verfällt exakt zum Zeitpunkt expires_at
+            self.entries.create_index([("expires_at", ASCENDING)], expireAfterSeconds=0)
+        except Exception as e:
+            logger.error(f"Fehler beim Erstellen der Video-Info-Indizes: {str(e)}")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Liefert die gecachte Info oder None.
+
+        Der TTL-Monitor von MongoDB läuft nur minütlich; abgelaufene Einträge
+        werden deshalb zusätzlich über die Query ausgeschlossen.
+        """
+        try:
+            now = datetime.now(timezone.utc)
+            doc = self.entries.find_one({"key": key, "expires_at": {"$gt": now}}, {"info": 1})
+            if doc and isinstance(doc.get("info"), dict):
+                return dict(doc["info"])
+        except Exception as e:
+            logger.error(f"Fehler beim Lesen des Video-Info-Cache: {str(e)}")
+        return None
+
+    def put(self, key: str, info: Dict[str, Any], ttl_seconds: int) -> None:
+        """Speichert bzw. ersetzt einen Eintrag. Fehler werden geloggt, nie geworfen."""
+        try:
+            now = datetime.now(timezone.utc)
+            self.entries.update_one(
+                {"key": key},
+                {"$set": {
+                    "key": key,
+                    "video_id": info.get("id"),
+                    "extractor": info.get("extractor_key") or info.get("extractor"),
+                    "info": info,
+                    "updated_at": now,
+                    "expires_at": now + timedelta(seconds=max(1, int(ttl_seconds))),
+                }},
+                upsert=True,
+            )
+        except Exception as e:
+            logger.error(f"Fehler beim Speichern im Video-Info-Cache: {str(e)}")
+
+    def invalidate(self, key: str) -> bool:
+        """Entfernt einen Eintrag (z.B. nach geänderter Video-Verfügbarkeit)."""
+        try:
+            return self.entries.delete_one({"key": key}).deleted_count > 0
+        except Exception as e:
+            logger.error(f"Fehler beim Löschen aus dem Video-Info-Cache: {str(e)}")
+            return False
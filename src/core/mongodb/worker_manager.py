@@ -7,7 +7,7 @@ for each job and monitors their execution. This manager specifically handles ses
 processing jobs using the SessionProcessor.
 
 Main functionality:
-- Polls MongoDB for pending session jobs
+- Polls MongoDB for pending session jobs and claims them atomically
 - Creates worker threads for each job
 - Manages concurrent job processing
 - Tracks job progress and status
@@ -37,13 +37,16 @@ Features:
 - Internal: src.core.models.job_models - Job, JobStatus, JobProgress models
 - Internal: src.core.mongodb.repository - SessionJobRepository
 - Internal: src.core.resource_tracking - ResourceCalculator
+- Internal: src.utils.async_runtime - Event loop per job thread
 """
 
-import asyncio
 import logging
+import os
+import socket
 import threading
 import time
 import traceback
+import uuid
 from datetime import datetime, UTC
 from typing import Dict, Optional
 
@@ -51,6 +54,7 @@ from src.processors.session_processor import SessionProcessor
 from src.core.models.job_models import Job, JobStatus, JobProgress, JobError, JobResults
 from src.core.resource_tracking import ResourceCalculator
 from .repository import SessionJobRepository
+from src.utils.async_runtime import close_thread_loop, run_async
 
 # Logger initialisieren
 logger = logging.getLogger(__name__)
@@ -84,13 +88,15 @@ class SessionWorkerManager:
         
         self.running_workers: Dict[str, threading.Thread] = {}
         self.stop_flag = False
+        # Kennung für das atomare Claiming (mehrere Prozesse/Knoten)
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
         
         # Monitoring-Thread starten
         self.monitor_thread = threading.Thread(target=self._monitor_jobs)
         self.monitor_thread.daemon = True
         
         logger.info(
-            f"Worker-Manager initialisiert (max_workers={max_concurrent_workers}, "
+            f"Worker-Manager initialisiert (worker_id={self.worker_id}, max_workers={max_concurrent_workers}, "
             f"poll_interval={poll_interval_sec}s)"
         )
     
@@ -119,17 +125,12 @@ class SessionWorkerManager:
                 # Entferne beendete Worker
                 self._cleanup_workers()
                 
-                # Prüfe, ob neue Worker gestartet werden können
-                if len(self.running_workers) < self.max_concurrent_workers:
-                    # Hole ausstehende Jobs
-                    pending_jobs = self.job_repo.get_jobs(status=JobStatus.PENDING)
-                    
-                    for job in pending_jobs:
-                        if len(self.running_workers) >= self.max_concurrent_workers:
-                            break
-                            
-                        if job.job_id not in self.running_workers:
-                            self._start_worker(job)
+                # Freie Slots mit atomar übernommenen Jobs füllen
+                while len(self.running_workers) < self.max_concurrent_workers:
+                    job = self.job_repo.claim_next_job(self.worker_id)
+                    if job is None:
+                        break
+                    self._start_worker(job)
                             
             except Exception as e:
                 logger.error(f"Fehler im Job-Monitor: {str(e)}", exc_info=True)
@@ -156,7 +157,7 @@ class SessionWorkerManager:
         Startet einen neuen Worker für einen Job.
         
         Args:
-            job: Job-Objekt
+            job: Job-Objekt, bereits per claim_next_job auf PROCESSING gesetzt
         """
         job_id = job.job_id
         
@@ -165,17 +166,6 @@ class SessionWorkerManager:
             logger.warning(f"Worker für Job {job_id} läuft bereits")
             return
         
-        # Aktualisiere den Job-Status
-        self.job_repo.update_job_status(
-            job_id=job_id,
-            status=JobStatus.PROCESSING,
-            progress=JobProgress(
-                step="initializing",
-                percent=0,
-                message="Job wird initialisiert"
-            )
-        )
-        
         # Füge einen Log-Eintrag hinzu
         self.job_repo.add_log_entry(
             job_id=job_id,
@@ -396,7 +386,7 @@ class SessionWorkerManager:
         """
         try:
             # Führe die Session-Verarbeitung in einer asyncio Event-Loop aus
-            asyncio.run(self._process_session(job))
+            run_async(self._process_session(job))
             
             # Aktualisiere den Batch-Status, falls vorhanden
             if job.batch_id:
@@ -404,6 +394,9 @@ class SessionWorkerManager:
                 
         except Exception as e:
             logger.error(f"Fehler im Worker-Prozess: {str(e)}", exc_info=True)
+        finally:
+            # Loop des Job-Threads samt Loop-Ressourcen (async HTTP-Clients) schließen
+            close_thread_loop()
 
 # Singleton-Instanz des Worker-Managers
 _worker_manager = None
@@ -1,11 +1,11 @@
 """Initialisierung der Processing-Registry und Standard-Handler."""
 
-from .registry import register, get_handler, available_job_types  # re-export
+from .registry import register, get_handler, get_execution_mode, available_job_types  # re-export
 
 # Standard-Handler registrieren (on import)
 try:
     from .handlers.pdf_handler import handle_pdf_job
-    register("pdf", handle_pdf_job)
+    register("pdf", handle_pdf_job, execution="process")
 except Exception:  # defensive, Registry muss auch ohne PDF funktionieren
     pass
 
@@ -23,13 +23,13 @@ except Exception:
 
 try:
     from .handlers.office_handler import handle_office_job
-    register("office", handle_office_job)
+    register("office", handle_office_job, execution="process")
 except Exception:
     pass
 
 try:
     from .handlers.office_via_pdf_handler import handle_office_via_pdf_job
-    register("office_via_pdf", handle_office_via_pdf_job)
+    register("office_via_pdf", handle_office_via_pdf_job, execution="process")
 except Exception:
     pass
 
@@ -53,6 +53,6 @@ try:
 except Exception:
     pass
 
-__all__ = ["register", "get_handler", "available_job_types"]
+__all__ = ["register", "get_handler", "get_execution_mode", "available_job_types"]
 
 
@@ -19,12 +19,11 @@ from typing import Any, Dict, Optional, cast
 import os
 import traceback
 
-import requests  # type: ignore
-
 from src.core.models.enums import ProcessingStatus
 from src.core.models.job_models import Job, JobProgress, JobResults
 from src.core.resource_tracking import ResourceCalculator
 from src.processors.audio_processor import AudioProcessor
+from src.utils.webhook_dispatcher import get_webhook_dispatcher
 
 
 def _is_transcription_error_text(text: Optional[str]) -> bool:
@@ -105,7 +104,7 @@ async def handle_audio_job(job: Job, repo: Any, resource_calculator: ResourceCal
         }
         try:
             repo.add_log_entry(job.job_id, "info", f"Webhook-Progress: progress={progress}")
-            requests.post(url=str(callback_url), json=payload, headers=headers, timeout=15)
+            get_webhook_dispatcher().post_progress(job.job_id, str(callback_url), payload, headers)
         except Exception:
             # Progress-Fehler nicht fatal
             pass
@@ -113,6 +112,7 @@ async def handle_audio_job(job: Job, repo: Any, resource_calculator: ResourceCal
     # Initialer Fortschritt
     repo.update_job_status(
         job_id=job.job_id,
+        worker_id=job.worker_id,
         status="processing",
         progress=JobProgress(step="initializing", percent=5, message="Job initialisiert"),
     )
@@ -123,6 +123,7 @@ async def handle_audio_job(job: Job, repo: Any, resource_calculator: ResourceCal
     try:
         repo.update_job_status(
             job_id=job.job_id,
+            worker_id=job.worker_id,
             status="processing",
             progress=JobProgress(step="processing", percent=20, message="Audio-Verarbeitung gestartet"),
         )
@@ -162,6 +163,7 @@ async def handle_audio_job(job: Job, repo: Any, resource_calculator: ResourceCal
 
         repo.update_job_status(
             job_id=job.job_id,
+            worker_id=job.worker_id,
             status="processing",
             progress=JobProgress(step="postprocessing", percent=95, message="Ergebnisse werden gespeichert"),
             results=JobResults(
@@ -206,7 +208,9 @@ async def handle_audio_job(job: Job, repo: Any, resource_calculator: ResourceCal
             }
             try:
                 repo.add_log_entry(job.job_id, "info", f"Sende Webhook-Callback an {callback_url}")
-                resp = requests.post(url=str(callback_url), json=payload_final, headers=headers_final, timeout=30)
+                # Für angehängte Duplikat-Anfragen merken (generic_worker.deduplicate_jobs)
+                repo.store_final_webhook_payload(job.job_id, payload_final)
+                resp = get_webhook_dispatcher().send_final(job.job_id, str(callback_url), payload_final, headers_final, timeout=30)
                 repo.add_log_entry(
                     job.job_id,
                     "info",
@@ -235,7 +239,7 @@ async def handle_audio_job(job: Job, repo: Any, resource_calculator: ResourceCal
                     "data": None,
                 }
                 repo.add_log_entry(job.job_id, "info", f"Sende Error-Webhook an {callback_url}")
-                resp = requests.post(url=str(callback_url), json=error_payload, headers=error_headers, timeout=30)
+                resp = get_webhook_dispatcher().send_final(job.job_id, str(callback_url), error_payload, error_headers, timeout=30)
                 repo.add_log_entry(job.job_id, "info", f"Error-Webhook Antwort: {getattr(resp, 'status_code', None)}")
             except Exception as webhook_err:
                 repo.add_log_entry(job.job_id, "error", f"Error-Webhook fehlgeschlagen: {str(webhook_err)}")
@@ -16,14 +16,13 @@ import zipfile
 from datetime import datetime, UTC
 from typing import Any, Dict, Optional, cast, List
 
-import requests  # type: ignore
-
 from src.core.models.base import RequestInfo, ProcessInfo
 from src.core.models.enums import ProcessingStatus
 from src.core.models.job_models import Job, JobProgress, JobResults
 from src.core.resource_tracking import ResourceCalculator
 from src.core.exceptions import ProcessingError
 from src.processors.office_processor import OfficeProcessor
+from src.utils.webhook_dispatcher import get_webhook_dispatcher
 
 
 async def handle_office_job(job: Job, repo: Any, resource_calculator: ResourceCalculator) -> None:
@@ -55,6 +54,7 @@ async def handle_office_job(job: Job, repo: Any, resource_calculator: ResourceCa
     # Fortschritt initialisieren
     repo.update_job_status(
         job_id=job.job_id,
+        worker_id=job.worker_id,
         status="processing",
         progress=JobProgress(step="initializing", percent=5, message="Office-Job initialisiert"),
     )
@@ -82,13 +82,14 @@ async def handle_office_job(job: Job, repo: Any, resource_calculator: ResourceCa
             "process": {"id": job.job_id},
         }
         try:
-            requests.post(url=str(callback_url), json=payload, headers=headers, timeout=15)
+            get_webhook_dispatcher().post_progress(job.job_id, str(callback_url), payload, headers)
         except Exception:
             pass
 
     _post_progress("initializing", 5, "Office-Verarbeitung startet")
     repo.update_job_status(
         job_id=job.job_id,
+        worker_id=job.worker_id,
         status="processing",
         progress=JobProgress(step="processing", percent=30, message="Office wird in Markdown transformiert"),
     )
@@ -100,6 +101,7 @@ async def handle_office_job(job: Job, repo: Any, resource_calculator: ResourceCa
         include_previews=include_previews,
         use_cache=use_cache,
         force_overwrite=force_refresh,
+        file_hash=getattr(params, "file_hash", None),
     )
 
     _post_progress("postprocessing", 90, "Artefakte werden gepackt/gespeichert")
@@ -165,6 +167,7 @@ async def handle_office_job(job: Job, repo: Any, resource_calculator: ResourceCa
 
     repo.update_job_status(
         job_id=job.job_id,
+        worker_id=job.worker_id,
         status="processing",
         progress=JobProgress(step="postprocessing", percent=95, message="Ergebnisse werden gespeichert"),
         results=JobResults(
@@ -195,7 +198,9 @@ async def handle_office_job(job: Job, repo: Any, resource_calculator: ResourceCa
             },
         }
         try:
-            requests.post(url=str(callback_url), json=payload_final, headers=headers, timeout=30)
+            # Für angehängte Duplikat-Anfragen merken (generic_worker.deduplicate_jobs)
+            repo.store_final_webhook_payload(job.job_id, payload_final)
+            get_webhook_dispatcher().send_final(job.job_id, str(callback_url), payload_final, headers, timeout=30)
         except Exception as e:
             repo.add_log_entry(job.job_id, "error", f"Webhook-POST fehlgeschlagen: {str(e)}")
 
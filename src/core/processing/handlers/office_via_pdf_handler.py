@@ -23,14 +23,13 @@ from datetime import datetime, UTC
 from pathlib import Path
 from typing import Any, Dict, Optional, cast, List
 
-import requests  # type: ignore
-
 from src.core.exceptions import ProcessingError
 from src.core.models.enums import ProcessingStatus
 from src.core.models.job_models import Job, JobProgress, JobResults
 from src.core.resource_tracking import ResourceCalculator
 from src.processors.pdf_processor import PDFProcessor
 from src.processors.office._common import guess_soffice_path
+from src.utils.webhook_dispatcher import get_webhook_dispatcher
 
 
 def _convert_office_to_pdf(input_path: Path, output_dir: Path) -> Path:
@@ -121,6 +120,7 @@ async def handle_office_via_pdf_job(job: Job, repo: Any, resource_calculator: Re
     # Fortschritt initialisieren
     repo.update_job_status(
         job_id=job.job_id,
+        worker_id=job.worker_id,
         status="processing",
         progress=JobProgress(step="initializing", percent=5, message="Office-via-PDF Job initialisiert"),
     )
@@ -148,7 +148,7 @@ async def handle_office_via_pdf_job(job: Job, repo: Any, resource_calculator: Re
             "process": {"id": job.job_id},
         }
         try:
-            requests.post(url=str(callback_url), json=payload, headers=headers, timeout=15)
+            get_webhook_dispatcher().post_progress(job.job_id, str(callback_url), payload, headers)
         except Exception:
             pass
 
@@ -258,6 +258,7 @@ async def handle_office_via_pdf_job(job: Job, repo: Any, resource_calculator: Re
     duration_ms = int((time.time() - start) * 1000)
     repo.update_job_status(
         job_id=job.job_id,
+        worker_id=job.worker_id,
         status="processing",
         progress=JobProgress(step="postprocessing", percent=95, message="Ergebnisse werden gespeichert"),
         results=JobResults(
@@ -292,7 +293,9 @@ async def handle_office_via_pdf_job(job: Job, repo: Any, resource_calculator: Re
             "data": data_section,
         }
         try:
-            requests.post(url=str(callback_url), json=payload_final, headers=headers, timeout=30)
+            # Für angehängte Duplikat-Anfragen merken (generic_worker.deduplicate_jobs)
+            repo.store_final_webhook_payload(job.job_id, payload_final)
+            get_webhook_dispatcher().send_final(job.job_id, str(callback_url), payload_final, headers, timeout=30)
         except Exception:
             repo.add_log_entry(job.job_id, "error", "Webhook-POST fehlgeschlagen")
 
@@ -32,14 +32,13 @@ Features:
 - src.core.mongodb.secretary_worker_manager: Executed by SecretaryWorkerManager
 
 @dependencies
-- External: requests - HTTP requests for webhook notifications
+- Internal: src.utils.webhook_dispatcher - Background webhook delivery
 - Internal: src.processors.pdf_processor - PDFProcessor for PDF processing
 - Internal: src.core.models.job_models - Job, JobProgress, JobResults models
 - Internal: src.core.resource_tracking - ResourceCalculator
 """
 
 from typing import Any, Dict, Optional, cast
-import requests  # type: ignore
 import os
 import base64
 import zipfile
@@ -48,6 +47,7 @@ from src.core.models.job_models import Job, JobProgress, JobResults
 from src.core.resource_tracking import ResourceCalculator
 from src.core.models.enums import ProcessingStatus
 from src.processors.pdf_processor import PDFProcessor
+from src.utils.webhook_dispatcher import get_webhook_dispatcher
 
 
 async def handle_pdf_job(job: Job, repo: Any, resource_calculator: ResourceCalculator) -> None:
@@ -112,6 +112,7 @@ async def handle_pdf_job(job: Job, repo: Any, resource_calculator: ResourceCalcu
 	# Fortschritt aktualisieren
 	repo.update_job_status(
 		job_id=job.job_id,
+		worker_id=job.worker_id,
 		status="processing",
 		progress=JobProgress(step="downloading_or_opening", percent=5, message="Öffne Datei/URL"),
 	)
@@ -146,7 +147,7 @@ async def handle_pdf_job(job: Job, repo: Any, resource_calculator: ResourceCalcu
 		}
 		try:
 			repo.add_log_entry(job.job_id, "info", f"Webhook-Progress: phase={phase} progress={progress}")
-			requests.post(url=str(callback_url), json=payload, headers=headers, timeout=15)
+			get_webhook_dispatcher().post_progress(job.job_id, str(callback_url), payload, headers)
 		except Exception as _:
 			# Progress-Fehler nicht fatal
 			pass
@@ -301,6 +302,7 @@ async def handle_pdf_job(job: Job, repo: Any, resource_calculator: ResourceCalcu
 	try:
 		repo.update_job_status(
 			job_id=job.job_id,
+			worker_id=job.worker_id,
 			status="processing",
 			progress=JobProgress(step="postprocessing", percent=95, message="Ergebnisse werden gespeichert"),
 			results=JobResults(
@@ -350,7 +352,7 @@ async def handle_pdf_job(job: Job, repo: Any, resource_calculator: ResourceCalcu
 					error_headers["Authorization"] = f"Bearer {callback_token}"
 					error_headers["X-Callback-Token"] = str(callback_token)
 				repo.add_log_entry(job.job_id, "info", f"Sende Error-Webhook an {callback_url}")
-				resp = requests.post(url=str(callback_url), json=error_payload, headers=error_headers, timeout=30)
+				resp = get_webhook_dispatcher().send_final(job.job_id, str(callback_url), error_payload, error_headers, timeout=30)
 				repo.add_log_entry(job.job_id, "info", f"Error-Webhook Antwort: {getattr(resp, 'status_code', None)}")
 			except Exception as webhook_err:
 				repo.add_log_entry(job.job_id, "error", f"Error-Webhook fehlgeschlagen: {str(webhook_err)}")
@@ -409,7 +411,9 @@ async def handle_pdf_job(job: Job, repo: Any, resource_calculator: ResourceCalcu
 		}
 		try:
 			repo.add_log_entry(job.job_id, "info", f"Sende Webhook-Callback an {callback_url}")
-			resp = requests.post(url=str(callback_url), json=payload_final, headers=headers, timeout=30)
+			# Für angehängte Duplikat-Anfragen merken (generic_worker.deduplicate_jobs)
+			repo.store_final_webhook_payload(job.job_id, payload_final)
+			resp = get_webhook_dispatcher().send_final(job.job_id, str(callback_url), payload_final, headers, timeout=30)
 			repo.add_log_entry(job.job_id, "info", f"Webhook Antwort: {getattr(resp, 'status_code', None)} ok={getattr(resp, 'ok', None)}")
 		except Exception as post_err:
 			repo.add_log_entry(job.job_id, "error", f"Webhook-POST fehlgeschlagen: {str(post_err)}")
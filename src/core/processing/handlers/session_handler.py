@@ -78,6 +78,7 @@ async def handle_session_job(job: Job, repo: Any, resource_calculator: ResourceC
     # Fortschritt aktualisieren
     repo.update_job_status(
         job_id=job.job_id,
+        worker_id=job.worker_id,
         status="processing",
         progress=JobProgress(step="processing", percent=20, message="Session-Verarbeitung gestartet"),
     )
@@ -125,6 +126,7 @@ async def handle_session_job(job: Job, repo: Any, resource_calculator: ResourceC
     # Fortschritt/Ergebnisse speichern
     repo.update_job_status(
         job_id=job.job_id,
+        worker_id=job.worker_id,
         status="processing",
         progress=JobProgress(step="postprocessing", percent=95, message="Ergebnisse werden gespeichert"),
         results=JobResults(
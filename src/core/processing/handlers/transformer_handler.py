@@ -31,19 +31,19 @@ Features:
 - src.core.mongodb.secretary_worker_manager: Executed by SecretaryWorkerManager
 
 @dependencies
-- External: requests - HTTP requests for webhook notifications
+- Internal: src.utils.webhook_dispatcher - Background webhook delivery
 - Internal: src.processors.transformer_processor - TransformerProcessor for text transformation
 - Internal: src.core.models.job_models - Job, JobProgress models
 - Internal: src.core.resource_tracking - ResourceCalculator
 """
 
 from typing import Any, Dict, Optional, cast
-import requests  # type: ignore
 
 from src.core.models.job_models import Job, JobProgress
 from src.core.resource_tracking import ResourceCalculator
 from src.core.models.enums import ProcessingStatus
 from src.processors.transformer_processor import TransformerProcessor
+from src.utils.webhook_dispatcher import get_webhook_dispatcher
 
 
 async def handle_transformer_template_job(job: Job, repo: Any, resource_calculator: ResourceCalculator) -> None:
@@ -66,6 +66,7 @@ async def handle_transformer_template_job(job: Job, repo: Any, resource_calculat
     # Fortschritt initialisieren
     repo.update_job_status(
         job_id=job.job_id,
+        worker_id=job.worker_id,
         status="processing",
         progress=JobProgress(step="initializing", percent=5, message="Job initialisiert"),
     )
@@ -99,7 +100,7 @@ async def handle_transformer_template_job(job: Job, repo: Any, resource_calculat
         }
         try:
             repo.add_log_entry(job.job_id, "info", f"Webhook-Progress: phase={phase} progress={progress}")
-            requests.post(url=str(callback_url), json=payload, headers=headers, timeout=15)
+            get_webhook_dispatcher().post_progress(job.job_id, str(callback_url), payload, headers)
         except Exception:
             # Progress-Fehler nicht fatal
             pass
@@ -164,6 +165,7 @@ async def handle_transformer_template_job(job: Job, repo: Any, resource_calculat
 
     repo.update_job_status(
         job_id=job.job_id,
+        worker_id=job.worker_id,
         status="processing",
         progress=JobProgress(step="postprocessing", percent=95, message="Ergebnisse werden gespeichert"),
         results={
@@ -184,7 +186,9 @@ async def handle_transformer_template_job(job: Job, repo: Any, resource_calculat
         }
         try:
             repo.add_log_entry(job.job_id, "info", f"Sende Webhook-Callback an {callback_url}")
-            requests.post(url=str(callback_url), json=payload_final, headers=headers, timeout=30)
+            # Für angehängte Duplikat-Anfragen merken (generic_worker.deduplicate_jobs)
+            repo.store_final_webhook_payload(job.job_id, payload_final)
+            get_webhook_dispatcher().send_final(job.job_id, str(callback_url), payload_final, headers, timeout=30)
         except Exception:
             repo.add_log_entry(job.job_id, "error", "Webhook-POST fehlgeschlagen")
 
@@ -18,12 +18,11 @@ from __future__ import annotations
 import traceback
 from typing import Any, Dict, Optional, cast
 
-import requests  # type: ignore
-
 from src.core.models.enums import ProcessingStatus
 from src.core.models.job_models import Job, JobProgress, JobResults
 from src.core.resource_tracking import ResourceCalculator
 from src.processors.youtube_processor import YoutubeProcessor
+from src.utils.webhook_dispatcher import get_webhook_dispatcher
 
 
 async def handle_youtube_job(job: Job, repo: Any, resource_calculator: ResourceCalculator) -> None:
@@ -77,12 +76,13 @@ async def handle_youtube_job(job: Job, repo: Any, resource_calculator: ResourceC
         }
         try:
             repo.add_log_entry(job.job_id, "info", f"Webhook-Progress: progress={progress}")
-            requests.post(url=str(callback_url), json=payload, headers=headers, timeout=15)
+            get_webhook_dispatcher().post_progress(job.job_id, str(callback_url), payload, headers)
         except Exception:
             pass
 
     repo.update_job_status(
         job_id=job.job_id,
+        worker_id=job.worker_id,
         status="processing",
         progress=JobProgress(step="initializing", percent=5, message="YouTube-Job initialisiert"),
     )
@@ -93,6 +93,7 @@ async def handle_youtube_job(job: Job, repo: Any, resource_calculator: ResourceC
     try:
         repo.update_job_status(
             job_id=job.job_id,
+            worker_id=job.worker_id,
             status="processing",
             progress=JobProgress(step="processing", percent=20, message="YouTube-Verarbeitung gestartet"),
         )
@@ -129,6 +130,7 @@ async def handle_youtube_job(job: Job, repo: Any, resource_calculator: ResourceC
 
         repo.update_job_status(
             job_id=job.job_id,
+            worker_id=job.worker_id,
             status="processing",
             progress=JobProgress(step="postprocessing", percent=95, message="Ergebnisse werden gespeichert"),
             results=JobResults(
@@ -166,7 +168,9 @@ async def handle_youtube_job(job: Job, repo: Any, resource_calculator: ResourceC
             }
             try:
                 repo.add_log_entry(job.job_id, "info", f"Sende Webhook-Callback an {callback_url}")
-                resp = requests.post(url=str(callback_url), json=payload_final, headers=headers_final, timeout=30)
+                # Für angehängte Duplikat-Anfragen merken (generic_worker.deduplicate_jobs)
+                repo.store_final_webhook_payload(job.job_id, payload_final)
+                resp = get_webhook_dispatcher().send_final(job.job_id, str(callback_url), payload_final, headers_final, timeout=30)
                 repo.add_log_entry(
                     job.job_id,
                     "info",
@@ -194,7 +198,7 @@ async def handle_youtube_job(job: Job, repo: Any, resource_calculator: ResourceC
                     "data": None,
                 }
                 repo.add_log_entry(job.job_id, "info", f"Sende Error-Webhook an {callback_url}")
-                requests.post(url=str(callback_url), json=error_payload, headers=error_headers, timeout=30)
+                get_webhook_dispatcher().send_final(job.job_id, str(callback_url), error_payload, error_headers, timeout=30)
             except Exception as webhook_err:
                 repo.add_log_entry(job.job_id, "error", f"Error-Webhook fehlgeschlagen: {str(webhook_err)}")
         raise
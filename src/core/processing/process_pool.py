@@ -0,0 +1,293 @@
+"""
+@fileoverview Job Process Pool - Long-lived worker processes for CPU-heavy job types
+
+@description
+Runs secretary job handlers in separate, long-lived processes instead of worker
+threads. PDF rendering, OCR, audio decoding and ZIP building are CPU-bound and
+compete for one GIL when run as threads; in the pool every job gets its own
+interpreter.
+
+Each pool process imports the handler modules once at start (processors and
+their native libraries are loaded before the first job), keeps one event loop
+for all its jobs and owns its own SecretaryJobRepository, so progress updates
+and log entries are written to MongoDB exactly as in thread mode. A process is
+recycled after `max_jobs_per_worker` jobs or when its RSS exceeds
+`max_memory_mb`; a crashed process is replaced and the job is reported failed.
+
+Which job types run here is registry metadata (`register(..., execution="process")`).
+
+@module core.processing.process_pool
+
+@exports
+- JobProcessPool: Class - Pool of long-lived job processes
+- ProcessJobError: Exception - Job failure inside a pool process
+
+@usedIn
+- src.core.mongodb.secretary_worker_manager: Dispatches "process" job types to the pool
+
+@dependencies
+- Standard: multiprocessing - Processes and pipes (spawn context)
+- External: psutil - RSS measurement for recycling (optional, falls back to resource)
+- Internal: src.core.processing.registry - Handler lookup in the pool process
+- Internal: src.utils.async_runtime - close_loop for the pool process loop
+"""
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import queue
+import threading
+import traceback
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from src.core.models.job_models import Job
+from src.utils.async_runtime import close_loop
+
+
+logger = logging.getLogger(__name__)
+
+RepoFactory = Callable[[], Any]
+
+# Module, die jeder Pool-Prozess beim Start lädt (registriert alle Handler)
+DEFAULT_PRELOAD = ("src.core.processing",)
+
+
+class ProcessJobError(Exception):
+    """Fehler eines Jobs im Pool-Prozess; Originaltyp und Traceback bleiben erhalten."""
+
+    def __init__(self, error_type: str, message: str, remote_traceback: str = "") -> None:
+        super().__init__(f"{error_type}: {message}")
+        self.error_type = error_type
+        self.remote_traceback = remote_traceback
+
+
+def _default_repo_factory() -> Any:
+    from src.core.mongodb.secretary_repository import SecretaryJobRepository
+    return SecretaryJobRepository()
+
+
+def _current_rss_mb() -> float:
+    try:
+        import psutil
+        return float(psutil.Process().memory_info().rss) / (1024 * 1024)
+    except Exception:
+        import resource
+        # ru_maxrss ist unter Linux in KiB (Spitzenwert, nicht aktuell)
+        return float(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) / 1024
+
+
+def _worker_main(
+    conn: Connection,
+    repo_factory: RepoFactory,
+    max_jobs: int,
+    max_memory_mb: int,
+    preload: Sequence[str],
+    initializer: Optional[Callable[[], None]],
+) -> None:
+    """Hauptschleife eines Pool-Prozesses: Job empfangen, ausführen, Ergebnis melden."""
+    for module_name in preload:
+        importlib.import_module(module_name)
+    if initializer is not None:
+        initializer()
+
+    from src.core.processing import registry
+    from src.core.resource_tracking import ResourceCalculator
+    from src.utils.logger import register_log_observer, unregister_log_observer
+
+    repo = repo_factory()
+    resource_calculator = ResourceCalculator()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    jobs_done = 0
+    try:
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+            if message is None:
+                break
+            job = Job.from_dict(message)
+            observer = None
+            try:
+                # Verzögerter Import, um zirkuläre Importe zu vermeiden
+                from src.core.mongodb.secretary_worker_manager import build_webhook_log_observer
+                observer = build_webhook_log_observer(job)
+                if observer is not None:
+                    register_log_observer(job.job_id, observer)
+                handler = registry.get_handler(job.job_type)
+                if not handler:
+                    raise ValueError(f"Unbekannter job_type: {job.job_type}")
+                loop.run_until_complete(handler(job, repo, resource_calculator))
+                reply: Dict[str, Any] = {"status": "ok"}
+            except Exception as e:
+                reply = {
+                    "status": "error",
+                    "error_type": type(e).__name__,
+                    "message": str(e),
+                    "traceback": traceback.format_exc(),
+                }
+            finally:
+                if observer is not None:
+                    try:
+                        unregister_log_observer(job.job_id, observer)
+                    except Exception:
+                        pass
+                # Log-Puffer dieses Prozesses leeren, bevor der Elternprozess den Endstatus setzt
+                from src.core.mongodb.job_log_repository import flush_job_logs
+                flush_job_logs(job.job_id)
+            jobs_done += 1
+            recycle = bool(
+                (max_jobs and jobs_done >= max_jobs)
+                or (max_memory_mb and _current_rss_mb() > max_memory_mb)
+            )
+            reply["recycle"] = recycle
+            conn.send(reply)
+            if recycle:
+                break
+    finally:
+        # Loop-Ressourcen (async HTTP-Clients) vor dem Loop schließen
+        close_loop(loop)
+        conn.close()
+
+
+@dataclass
+class _PoolWorker:
+    process: Any  # multiprocessing.Process (Kontext-abhängiger Typ)
+    conn: Connection
+
+
+class JobProcessPool:
+    """
+    Pool langlebiger Prozesse für CPU-lastige Job-Typen.
+
+    `run()` ist blockierend und threadsicher: Der aufrufende Worker-Thread
+    leiht sich einen freien Prozess, übergibt den Job und wartet auf das
+    Ergebnis. Es laufen nie mehr Jobs gleichzeitig, als Prozesse existieren.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_jobs_per_worker: int = 50,
+        max_memory_mb: int = 2048,
+        repo_factory: RepoFactory = _default_repo_factory,
+        preload: Sequence[str] = DEFAULT_PRELOAD,
+        initializer: Optional[Callable[[], None]] = None,
+        start_method: str = "spawn",
+    ) -> None:
+        # spawn statt fork: pymongo-Clients und Threads des Elternprozesses sind nicht fork-sicher
+        # Any: BaseContext aus get_context() kennt in typeshed kein Process
+        self._ctx: Any = multiprocessing.get_context(start_method)
+        self.size = max(1, size)
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.max_memory_mb = max_memory_mb
+        self._repo_factory = repo_factory
+        self._preload = tuple(preload)
+        self._initializer = initializer
+        self._idle: "queue.Queue[_PoolWorker]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+
+    def start(self) -> None:
+        """Startet die Pool-Prozesse (idempotent)."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            for _ in range(self.size):
+                self._idle.put(self._spawn())
+        logger.info(
+            f"JobProcessPool gestartet (size={self.size}, max_jobs={self.max_jobs_per_worker}, "
+            f"max_memory_mb={self.max_memory_mb})"
+        )
+
+    def _spawn(self) -> _PoolWorker:
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(
+                child_conn,
+                self._repo_factory,
+                self.max_jobs_per_worker,
+                self.max_memory_mb,
+                self._preload,
+                self._initializer,
+            ),
+            name="secretary-job-pool",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return _PoolWorker(process=process, conn=parent_conn)
+
+    def _retire(self, worker: _PoolWorker) -> None:
+        try:
+            if worker.process.is_alive():
+                worker.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        worker.process.join(timeout=10)
+        if worker.process.is_alive():
+            worker.process.terminate()
+            worker.process.join(timeout=5)
+        worker.conn.close()
+
+    def run(self, job: Job) -> None:
+        """
+        Führt einen Job in einem Pool-Prozess aus.
+
+        Raises:
+            ProcessJobError: Handler-Fehler oder abgestürzter Pool-Prozess
+        """
+        if not self._started:
+            self.start()
+        if self._closed:
+            raise RuntimeError("JobProcessPool ist bereits beendet")
+        worker = self._idle.get()
+        replace = True
+        reply: Dict[str, Any] = {}
+        try:
+            worker.conn.send(job.to_dict())
+            reply = worker.conn.recv()
+            replace = bool(reply.get("recycle"))
+        except (EOFError, OSError) as e:
+            worker.process.join(timeout=1)
+            raise ProcessJobError(
+                "WorkerProcessDied",
+                f"Pool-Prozess {worker.process.pid} beendet (exitcode={worker.process.exitcode}): {e}",
+            )
+        finally:
+            if replace or self._closed:
+                self._retire(worker)
+                if not self._closed:
+                    logger.info(f"Pool-Prozess {worker.process.pid} recycelt (Job-Limit, Speicher oder Absturz)")
+                    self._idle.put(self._spawn())
+            else:
+                self._idle.put(worker)
+        if reply.get("status") != "ok":
+            raise ProcessJobError(
+                str(reply.get("error_type", "Exception")),
+                str(reply.get("message", "")),
+                str(reply.get("traceback", "")),
+            )
+
+    def shutdown(self) -> None:
+        """Beendet alle freien Prozesse; belegte werden nach ihrem Job beendet."""
+        self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._retire(worker)
+
+    @property
+    def pids(self) -> Sequence[Optional[int]]:
+        """PIDs der aktuell freien Prozesse (Diagnose)."""
+        with self._idle.mutex:
+            return [w.process.pid for w in list(self._idle.queue)]
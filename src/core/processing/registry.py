@@ -11,6 +11,7 @@ Main functionality:
 - Retrieve handlers by job_type
 - List available job types
 - Type-safe handler function signatures
+- Execution mode metadata per job type ("thread" or "process")
 
 Handler signature:
     handler(job: Job, repo: Any, resource_calculator: ResourceCalculator) -> Awaitable[None]
@@ -28,6 +29,7 @@ Features:
 - register(): None - Register a handler for a job_type
 - get_handler(): Optional[HandlerType] - Get handler for a job_type
 - available_job_types(): Dict[str, HandlerType] - Get all registered job types
+- get_execution_mode(): str - Execution mode of a job_type ("thread" or "process")
 
 @usedIn
 - src.core.mongodb.secretary_worker_manager: Uses registry to route jobs to handlers
@@ -46,13 +48,28 @@ from src.core.resource_tracking import ResourceCalculator
 
 HandlerType = Callable[[Job, Any, ResourceCalculator], Awaitable[None]]
 
+# "thread": Worker-Thread im Manager-Prozess; "process": langlebiger Pool-Prozess
+EXECUTION_MODES = ("thread", "process")
+
 
 _REGISTRY: Dict[str, HandlerType] = {}
+_EXECUTION: Dict[str, str] = {}
+
 
+def register(job_type: str, handler: HandlerType, execution: str = "thread") -> None:
+    """
+    Registriert einen Handler für einen job_type.
 
-def register(job_type: str, handler: HandlerType) -> None:
-    """Registriert einen Handler für einen job_type."""
+    Args:
+        job_type: Name des Job-Typs
+        handler: Async-Handler
+        execution: "process" für CPU-lastige Handler, die im Prozess-Pool
+                   des Workers laufen sollen (umgeht den GIL)
+    """
+    if execution not in EXECUTION_MODES:
+        raise ValueError(f"Unbekannter Ausführungsmodus: {execution}")
     _REGISTRY[job_type] = handler
+    _EXECUTION[job_type] = execution
 
 
 def get_handler(job_type: Optional[str]) -> Optional[HandlerType]:
@@ -62,6 +79,11 @@ def get_handler(job_type: Optional[str]) -> Optional[HandlerType]:
     return _REGISTRY.get(job_type)
 
 
+def get_execution_mode(job_type: Optional[str]) -> str:
+    """Gibt den registrierten Ausführungsmodus zurück ("thread" als Default)."""
+    return _EXECUTION.get(job_type or "session", "thread")
+
+
 def available_job_types() -> Dict[str, HandlerType]:
     """Liefert die registrierten job_types (readonly Kopie)."""
     return dict(_REGISTRY)
@@ -1,73 +1,192 @@
 """
-@fileoverview Rate Limiting - Limits requests per IP address and file size
+@fileoverview Rate Limiting - Sliding-window counter with pluggable shared backends
 
 @description
-Rate limiting system for Common Secretary Services. This file provides the RateLimiter
-class that limits requests per IP address and file size.
+Begrenzt Requests pro Schlüssel (z.B. Client-IP) auf `limit` pro `window_sec`.
+Verfahren: Sliding-Window-Counter. Pro Schlüssel werden nur zwei Zähler
+gehalten, der des aktuellen und der des vorherigen festen Fensters. Die
+Anzahl im gleitenden Fenster wird geschätzt als
 
-Features:
-- IP-based rate limiting (requests per hour)
-- File size validation
-- Thread-safe implementation with locking
-- Automatic cleanup of old entries
+    vorheriges * (verbleibender Anteil des Fensters) + aktuelles
 
-The class is used to prevent API abuse and protect resources.
+Jede Prüfung ist O(1) und braucht nur ein atomares Inkrement. Abgewiesene
+Requests werden wieder abgezogen und zählen nicht gegen das Limit.
+
+Backends:
+- InMemoryRateLimitBackend: pro Prozess (Tests, Einzelprozess-Betrieb);
+  Schlüssel ohne Requests seit zwei Fenstern werden verdrängt, höchstens
+  `max_keys` Schlüssel.
+- MongoRateLimitBackend (src.core.mongodb.rate_limit_repository): gemeinsame
+  Zähler für alle Prozesse und Knoten, ein atomares Update pro Prüfung,
+  TTL-Index entfernt inaktive Schlüssel.
 
 @module core.rate_limiting
 
 @exports
-- RateLimiter: Class - Rate limiting management
+- RateLimitDecision: Dataclass - Ergebnis einer Prüfung (erlaubt, Rest, Retry-After)
+- RateLimitBackend: Class - Schnittstelle der Zähler-Backends
+- InMemoryRateLimitBackend: Class - Zähler im Prozess
+- RateLimiter: Class - Sliding-Window-Counter über ein Backend
+- load_rate_limiter(): Optional[RateLimiter] - Aus Konfiguration `rate_limiting`
 
 @usedIn
-- API routes: Uses RateLimiter for request limiting (currently not actively used)
-- Can be integrated into middleware
+- src.api.rate_limit: Flask-Middleware für den API-Blueprint
 
 @dependencies
-- Standard: datetime - Timestamps and time calculations
-- Standard: collections - defaultdict for request tracking
-- Standard: threading - Thread-safe implementation
+- Standard: threading, collections.OrderedDict - Zähler im Prozess
+- Internal: src.core.config - Config
+- Internal: src.core.mongodb.rate_limit_repository - MongoRateLimitBackend (verzögert importiert)
 """
-from datetime import datetime, timedelta
-from collections import defaultdict
-from typing import Dict, List
+
+import math
 import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
 
-class RateLimiter:
-    def __init__(self, requests_per_hour: int, max_file_size: int):
-        self.requests_per_hour = requests_per_hour
-        self.max_file_size = max_file_size  # in Bytes
-        self.requests: Dict[str, List[datetime]] = defaultdict(list)
-        self.lock = threading.Lock()
 
-    def is_allowed(self, ip: str) -> bool:
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Ergebnis einer Prüfung."""
+    allowed: bool
+    limit: int
+    remaining: int
+    # Sekunden bis ein Request wieder erlaubt ist (0, wenn erlaubt)
+    retry_after: int = 0
+
+
+class RateLimitBackend:
+    """Zähler pro Schlüssel und festem Fenster (aktuelles und vorheriges)."""
+
+    def increment(self, key: str, window_start: int, window_sec: int, cost: int = 1) -> Tuple[int, int]:
         """
-        Überprüft, ob eine Anfrage von einer bestimmten IP erlaubt ist
+        Erhöht den Zähler des Fensters `window_start` atomar um `cost`.
+
+        Returns:
+            Tuple[int, int]: (Zähler aktuelles Fenster nach dem Erhöhen, Zähler vorheriges Fenster)
         """
-        with self.lock:
-            now = datetime.now()
-            hour_ago = now - timedelta(hours=1)
-            
-            # Alte Einträge entfernen
-            self.requests[ip] = [t for t in self.requests[ip] if t > hour_ago]
-            
-            # Prüfen ob Limit erreicht
-            if len(self.requests[ip]) < self.requests_per_hour:
-                self.requests[ip].append(now)
-                return True
-            return False
+        raise NotImplementedError
+
+    def decrement(self, key: str, window_start: int, cost: int = 1) -> None:
+        """Nimmt ein Inkrement zurück (abgewiesener Request)."""
+        raise NotImplementedError
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Zähler im Prozess; älteste bzw. inaktive Schlüssel werden verdrängt."""
+
+    def __init__(self, max_keys: int = 100_000) -> None:
+        self.max_keys = max_keys
+        # key -> [window_start, aktuell, vorherig]; Reihenfolge = letzter Zugriff
+        self._counters: "OrderedDict[str, list[int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def increment(self, key: str, window_start: int, window_sec: int, cost: int = 1) -> Tuple[int, int]:
+        with self._lock:
+            entry = self._counters.get(key)
+            if entry is None:
+                entry = [window_start, 0, 0]
+                self._counters[key] = entry
+            else:
+                self._counters.move_to_end(key)
+            if entry[0] != window_start:
+                previous = entry[1] if entry[0] == window_start - window_sec else 0
+                entry[:] = [window_start, 0, previous]
+            entry[1] += cost
+            self._evict(window_start - window_sec)
+            return entry[1], entry[2]
+
+    def decrement(self, key: str, window_start: int, cost: int = 1) -> None:
+        with self._lock:
+            entry = self._counters.get(key)
+            if entry is not None and entry[0] == window_start:
+                entry[1] = max(0, entry[1] - cost)
+
+    def _evict(self, oldest_useful_window: int) -> None:
+        # Vorn stehen die am längsten nicht genutzten Schlüssel: amortisiert O(1)
+        while self._counters:
+            key, entry = next(iter(self._counters.items()))
+            if entry[0] >= oldest_useful_window and len(self._counters) <= self.max_keys:
+                break
+            del self._counters[key]
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+
+class RateLimiter:
+    """Sliding-Window-Counter: höchstens `limit` Requests pro `window_sec` und Schlüssel."""
+
+    def __init__(
+        self,
+        limit: int,
+        window_sec: int = 60,
+        backend: Optional[RateLimitBackend] = None,
+        max_file_size: int = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.limit = limit
+        self.window_sec = max(1, int(window_sec))
+        self.backend = backend or InMemoryRateLimitBackend()
+        self.max_file_size = max_file_size  # in Bytes, 0 = unbegrenzt
+        self._clock = clock
+
+    def check(self, key: str, cost: int = 1) -> RateLimitDecision:
+        """Zählt einen Request für `key` und entscheidet, ob er erlaubt ist."""
+        now = self._clock()
+        window = self.window_sec
+        window_start = int(now // window) * window
+        elapsed = now - window_start
+        current, previous = self.backend.increment(key, window_start, window, cost)
+        estimated = previous * (window - elapsed) / window + current
+        if estimated <= self.limit:
+            return RateLimitDecision(True, self.limit, max(0, int(self.limit - estimated)))
+        self.backend.decrement(key, window_start, cost)
+        return RateLimitDecision(False, self.limit, 0, self._retry_after(elapsed, current - cost, previous, cost))
+
+    def _retry_after(self, elapsed: float, current: int, previous: int, cost: int) -> int:
+        window = self.window_sec
+        room = self.limit - current - cost
+        if room >= 0 and previous > 0:
+            # Im laufenden Fenster, sobald der Anteil des vorherigen Fensters genug gesunken ist
+            wait = window * (1 - room / previous) - elapsed
+        else:
+            # Im nächsten Fenster zählt das aktuelle als vorheriges
+            wait = window - elapsed
+            if current > 0 and self.limit - cost < current:
+                wait += window * (1 - max(0, self.limit - cost) / current)
+        return max(1, int(math.ceil(wait)))
+
+    def is_allowed(self, key: str) -> bool:
+        """Überprüft, ob eine Anfrage für `key` (z.B. IP) erlaubt ist, und zählt sie."""
+        return self.check(key).allowed
 
     def check_file_size(self, size: int) -> bool:
-        """
-        Überprüft, ob die Dateigröße innerhalb des Limits liegt
-        """
-        return size <= self.max_file_size
+        """Überprüft, ob die Dateigröße innerhalb des Limits liegt."""
+        return self.max_file_size <= 0 or size <= self.max_file_size
 
-    def get_remaining_requests(self, ip: str) -> int:
-        """
-        Gibt die Anzahl der verbleibenden Anfragen für eine IP zurück
-        """
-        with self.lock:
-            now = datetime.now()
-            hour_ago = now - timedelta(hours=1)
-            current_requests = len([t for t in self.requests[ip] if t > hour_ago])
-            return max(0, self.requests_per_hour - current_requests) 
\ No newline at end of file
+
+def load_rate_limiter() -> Optional[RateLimiter]:
+    """
+    Erstellt den RateLimiter aus `rate_limiting` in config.yaml.
+
+    Returns:
+        Optional[RateLimiter]: None, wenn deaktiviert
+    """
+    # Verzögerter Import, um zirkuläre Importe zu vermeiden
+    from src.core.config import Config
+    cfg = Config().get("rate_limiting", {}) or {}
+    if not cfg.get("enabled", False):
+        return None
+    backend: RateLimitBackend
+    if str(cfg.get("backend", "mongodb")).lower() == "mongodb":
+        from src.core.mongodb.rate_limit_repository import MongoRateLimitBackend
+        backend = MongoRateLimitBackend()
+    else:
+        backend = InMemoryRateLimitBackend(max_keys=int(cfg.get("max_keys", 100_000)))
+    return RateLimiter(
+        limit=int(cfg.get("requests_per_minute", 60)),
+        window_sec=60,
+        backend=backend,
+    )
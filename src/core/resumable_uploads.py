@@ -0,0 +1,393 @@
+"""
+@fileoverview Resumable Uploads - Chunked, resumable file uploads (tus-style)
+
+@description
+Große Medien-Uploads (bis `max_size_mb`) werden in mehreren kurzen Requests
+übertragen statt in einem einzigen multipart-Request. Ablauf nach dem
+tus-Protokoll (Core):
+
+1. `create()`: Upload mit Gesamtlänge anlegen; liefert die Upload-ID.
+2. `append()`: Block ab `offset` anhängen. Der Offset muss der bereits
+   gespeicherten Größe entsprechen, sonst `409`. Nach einem Abbruch fragt
+   der Client den Offset ab (`HEAD`) und setzt dort fort.
+3. `complete()`: Nach dem letzten Block wird die Datei in das Upload-
+   Verzeichnis verschoben und, noch unter dem Lock des Uploads, der
+   Secretary-Job angelegt (Callback der Route).
+
+Zustand liegt im Dateisystem (`<id>.part` + `<id>.json` in `staging_dir`),
+damit mehrere gunicorn-Prozesse bzw. API-Knoten mit gemeinsamem Volume
+denselben Upload fortsetzen können. Der Offset ist immer die Größe der
+`.part`-Datei. MD5 wird beim Schreiben inkrementell berechnet; der Hash-
+Zustand liegt im Prozess. Landet ein Block in einem anderen Prozess, wird
+der vorhandene Teil dort einmal nachgelesen.
+
+Gleichzeitige Schreibzugriffe auf denselben Upload verhindert eine Lock-
+Datei (`<id>.lock`, O_EXCL); verwaiste Locks verfallen nach
+`lock_timeout_sec`. Abgelaufene Uploads (`expire_hours`) werden beim Anlegen
+neuer Uploads entfernt.
+
+@module core.resumable_uploads
+
+@exports
+- ResumableUpload: Dataclass - Zustand eines Uploads
+- UploadProtocolError: Exception - Protokollfehler mit HTTP-Status
+- ResumableUploadStore: Class - Anlegen, Anhängen, Abschließen, Löschen
+- get_resumable_upload_store(): ResumableUploadStore - Prozessweite Instanz aus Konfiguration
+
+@usedIn
+- src.api.routes.upload_routes: /api/uploads
+
+@dependencies
+- Standard: hashlib, os, json - Dateien, Hash, Zustand
+- Internal: src.core.config - Konfiguration `resumable_uploads`
+- Internal: src.utils.upload_ingest - sniff_mime_type
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import IO, Any, Callable, Dict, Iterator, Optional, Tuple
+
+from src.utils.upload_ingest import sniff_mime_type
+
+_UPLOAD_ID = re.compile(r"^[0-9a-f]{32}$")
+_HEAD_BYTES = 8192
+
+
+class UploadProtocolError(Exception):
+    """Ungültige Anfrage an einen Upload (HTTP-Status und Fehlercode)."""
+
+    def __init__(self, status_code: int, code: str, message: str, offset: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.code = code
+        # Aktueller Offset, damit der Client direkt fortsetzen kann
+        self.offset = offset
+
+
+@dataclass
+class ResumableUpload:
+    """Zustand eines Uploads (persistiert als `<id>.json`)."""
+    upload_id: str
+    length: int
+    filename: str
+    created_at: float
+    expires_at: float
+    declared_mime_type: Optional[str] = None
+    metadata: Dict[str, str] = field(default_factory=dict)
+    offset: int = 0
+    # Gesetzt nach complete()
+    path: Optional[str] = None
+    md5: Optional[str] = None
+    mime_type: Optional[str] = None
+    job_id: Optional[str] = None
+
+    @property
+    def is_complete(self) -> bool:
+        return self.path is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ResumableUploadStore:
+    """Verwaltet resumable Uploads in einem Staging-Verzeichnis."""
+
+    def __init__(
+        self,
+        staging_dir: str,
+        upload_dir: str,
+        max_size_bytes: int,
+        chunk_size: int = 1024 * 1024,
+        expire_sec: float = 24 * 3600,
+        lock_timeout_sec: float = 300,
+    ) -> None:
+        self.staging_dir = staging_dir
+        self.upload_dir = upload_dir
+        self.max_size_bytes = max_size_bytes
+        self.chunk_size = chunk_size
+        self.expire_sec = expire_sec
+        self.lock_timeout_sec = lock_timeout_sec
+        # upload_id -> (offset, md5) für Blöcke, die in diesem Prozess ankommen
+        self._digests: Dict[str, Tuple[int, Any]] = {}
+        self._digests_lock = threading.Lock()
+
+    # ----- Pfade und Zustand -----
+
+    def _file(self, upload_id: str, ext: str) -> str:
+        if not _UPLOAD_ID.match(upload_id):
+            raise UploadProtocolError(404, "UPLOAD_NOT_FOUND", f"Upload {upload_id} nicht gefunden")
+        return os.path.join(self.staging_dir, f"{upload_id}.{ext}")
+
+    def _save(self, upload: ResumableUpload) -> None:
+        path = self._file(upload.upload_id, "json")
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(upload.to_dict(), f)
+        os.replace(tmp, path)
+
+    def get(self, upload_id: str) -> ResumableUpload:
+        """Lädt einen Upload; `offset` ist die aktuelle Größe der Teil-Datei."""
+        try:
+            with open(self._file(upload_id, "json"), "r", encoding="utf-8") as f:
+                upload = ResumableUpload(**json.load(f))
+        except FileNotFoundError:
+            raise UploadProtocolError(404, "UPLOAD_NOT_FOUND", f"Upload {upload_id} nicht gefunden")
+        if upload.is_complete:
+            upload.offset = upload.length
+            return upload
+        if upload.expires_at < time.time():
+            self.delete(upload_id)
+            raise UploadProtocolError(410, "UPLOAD_EXPIRED", f"Upload {upload_id} ist abgelaufen")
+        try:
+            upload.offset = os.path.getsize(self._file(upload_id, "part"))
+        except OSError:
+            upload.offset = 0
+        return upload
+
+    @contextmanager
+    def _locked(self, upload_id: str) -> Iterator[str]:
+        """Exklusiver Schreibzugriff (prozessübergreifend über eine Lock-Datei)."""
+        lock_path = self._file(upload_id, "lock")
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                stale = time.time() - os.path.getmtime(lock_path) > self.lock_timeout_sec
+            except OSError:
+                stale = True
+            if not stale:
+                raise UploadProtocolError(423, "UPLOAD_LOCKED", f"Upload {upload_id} wird gerade beschrieben")
+            # Verwaister Lock (abgebrochener Prozess): übernehmen
+            try:
+                os.unlink(lock_path)
+            except OSError:
+                pass
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                raise UploadProtocolError(423, "UPLOAD_LOCKED", f"Upload {upload_id} wird gerade beschrieben")
+        os.close(fd)
+        try:
+            yield lock_path
+        finally:
+            try:
+                os.unlink(lock_path)
+            except OSError:
+                pass
+
+    # ----- Protokoll -----
+
+    def create(
+        self,
+        length: int,
+        filename: str,
+        declared_mime_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> ResumableUpload:
+        """Legt einen leeren Upload mit fester Gesamtlänge an."""
+        if length <= 0:
+            raise UploadProtocolError(400, "INVALID_LENGTH", "Upload-Length muss größer als 0 sein")
+        if length > self.max_size_bytes:
+            raise UploadProtocolError(
+                413, "UPLOAD_TOO_LARGE",
+                f"Upload-Length {length} überschreitet das Maximum von {self.max_size_bytes} Bytes",
+            )
+        os.makedirs(self.staging_dir, exist_ok=True)
+        self.purge_expired()
+        now = time.time()
+        upload = ResumableUpload(
+            upload_id=uuid.uuid4().hex,
+            length=length,
+            filename=os.path.basename(filename or "") or "upload",
+            created_at=now,
+            expires_at=now + self.expire_sec,
+            declared_mime_type=declared_mime_type or None,
+            metadata=dict(metadata or {}),
+        )
+        open(self._file(upload.upload_id, "part"), "wb").close()
+        self._save(upload)
+        return upload
+
+    def _digest_at(self, upload_id: str, offset: int) -> Any:
+        """MD5-Zustand bis `offset`; liest den vorhandenen Teil nur, wenn er nicht im Prozess vorliegt."""
+        with self._digests_lock:
+            cached = self._digests.get(upload_id)
+        if cached is not None and cached[0] == offset:
+            return cached[1]
+        digest = hashlib.md5()
+        remaining = offset
+        with open(self._file(upload_id, "part"), "rb") as f:
+            while remaining > 0:
+                chunk = f.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                digest.update(chunk)
+                remaining -= len(chunk)
+        return digest
+
+    def append(self, upload_id: str, offset: int, stream: IO[bytes]) -> ResumableUpload:
+        """
+        Hängt die Daten aus `stream` an, sofern `offset` der gespeicherten Größe entspricht.
+
+        Bricht der Stream ab, bleiben die bis dahin empfangenen Bytes erhalten;
+        der Client setzt am neuen Offset fort.
+        """
+        with self._locked(upload_id) as lock_path:
+            upload = self.get(upload_id)
+            if upload.is_complete:
+                raise UploadProtocolError(409, "UPLOAD_COMPLETE", "Upload ist bereits abgeschlossen", upload.offset)
+            if offset != upload.offset:
+                raise UploadProtocolError(
+                    409, "OFFSET_MISMATCH",
+                    f"Upload-Offset {offset} passt nicht zum gespeicherten Stand {upload.offset}",
+                    upload.offset,
+                )
+            digest = self._digest_at(upload_id, offset)
+            written = offset
+            try:
+                with open(self._file(upload_id, "part"), "ab") as part:
+                    while written < upload.length:
+                        chunk = stream.read(min(self.chunk_size, upload.length - written))
+                        if not chunk:
+                            break
+                        part.write(chunk)
+                        digest.update(chunk)
+                        written += len(chunk)
+                        # Lock bleibt frisch, solange Daten fließen
+                        os.utime(lock_path)
+                    overflow = written >= upload.length and bool(stream.read(1))
+            finally:
+                with self._digests_lock:
+                    self._digests[upload_id] = (written, digest)
+            if overflow:
+                raise UploadProtocolError(
+                    413, "UPLOAD_TOO_LARGE", "Block überschreitet die angegebene Upload-Length", written,
+                )
+            upload.offset = written
+            return upload
+
+    def complete(
+        self,
+        upload_id: str,
+        expected_md5: Optional[str] = None,
+        create_job: Optional[Callable[[ResumableUpload], str]] = None,
+    ) -> ResumableUpload:
+        """
+        Verschiebt einen vollständig übertragenen Upload nach `upload_dir`.
+
+        Wiederholte Aufrufe liefern den bereits abgeschlossenen Upload. Passt
+        `expected_md5` nicht, wird der Upload verworfen.
+
+        `create_job` legt den Job für die Datei an und läuft unter demselben
+        Lock, solange der Upload noch keinen Job hat. Gleichzeitige
+        Abschluss-Aufrufe erzeugen so genau einen Job.
+        """
+        with self._locked(upload_id):
+            upload = self.get(upload_id)
+            if not upload.is_complete:
+                self._move_complete(upload, expected_md5)
+            if create_job is not None and not upload.job_id:
+                upload.job_id = create_job(upload)
+                self._save(upload)
+            return upload
+
+    def _move_complete(self, upload: ResumableUpload, expected_md5: Optional[str]) -> None:
+        """Prüft und verschiebt die Datei eines Uploads (Aufrufer hält den Lock)."""
+        upload_id = upload.upload_id
+        if upload.offset != upload.length:
+            raise UploadProtocolError(
+                409, "UPLOAD_INCOMPLETE",
+                f"Upload unvollständig: {upload.offset} von {upload.length} Bytes",
+                upload.offset,
+            )
+        digest = self._digest_at(upload_id, upload.offset)
+        if expected_md5 and expected_md5.lower() != digest.hexdigest():
+            self.delete(upload_id)
+            raise UploadProtocolError(409, "CHECKSUM_MISMATCH", "MD5 der übertragenen Datei stimmt nicht überein")
+        part_path = self._file(upload_id, "part")
+        with open(part_path, "rb") as f:
+            head = f.read(_HEAD_BYTES)
+        suffix = os.path.splitext(upload.filename)[1][:16]
+        os.makedirs(self.upload_dir, exist_ok=True)
+        dest = os.path.abspath(os.path.join(self.upload_dir, f"upload_{upload_id}{suffix}"))
+        try:
+            os.replace(part_path, dest)
+        except OSError:
+            # Anderes Dateisystem
+            shutil.move(part_path, dest)
+        upload.path = dest.replace("\\", "/")
+        upload.md5 = digest.hexdigest()
+        upload.mime_type = sniff_mime_type(head, upload.filename)
+        self._save(upload)
+        with self._digests_lock:
+            self._digests.pop(upload_id, None)
+
+    def terminate(self, upload_id: str) -> None:
+        """Verwirft einen Upload auf Wunsch des Clients (nicht während eines Blocks)."""
+        with self._locked(upload_id):
+            self.get(upload_id)
+            self.delete(upload_id)
+
+    def delete(self, upload_id: str) -> None:
+        """Entfernt Zustand und Teil-Datei (die abgeschlossene Datei bleibt für den Job)."""
+        for ext in ("part", "json"):
+            try:
+                os.unlink(self._file(upload_id, ext))
+            except OSError:
+                pass
+        with self._digests_lock:
+            self._digests.pop(upload_id, None)
+
+    def purge_expired(self) -> int:
+        """Entfernt abgelaufene, nicht abgeschlossene Uploads; gibt die Anzahl zurück."""
+        now = time.time()
+        removed = 0
+        try:
+            names = os.listdir(self.staging_dir)
+        except OSError:
+            return 0
+        for name in names:
+            upload_id, ext = os.path.splitext(name)
+            if ext != ".json" or not _UPLOAD_ID.match(upload_id):
+                continue
+            try:
+                with open(os.path.join(self.staging_dir, name), "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if float(data.get("expires_at", now)) < now:
+                self.delete(upload_id)
+                removed += 1
+        return removed
+
+
+_store: Optional[ResumableUploadStore] = None
+_store_lock = threading.Lock()
+
+
+def get_resumable_upload_store() -> ResumableUploadStore:
+    """Prozessweite Instanz mit Einstellungen aus `resumable_uploads`."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                # Verzögerter Import, um zirkuläre Importe zu vermeiden
+                from src.core.config import Config
+                cfg: Dict[str, Any] = Config().get("resumable_uploads", {}) or {}
+                _store = ResumableUploadStore(
+                    staging_dir=str(cfg.get("staging_dir", os.path.join("cache", "uploads", ".resumable"))),
+                    upload_dir=str(cfg.get("upload_dir", os.path.join("cache", "uploads"))),
+                    max_size_bytes=int(cfg.get("max_size_mb", 500)) * 1024 * 1024,
+                    chunk_size=max(64, int(cfg.get("chunk_size_kb", 1024))) * 1024,
+                    expire_sec=float(cfg.get("expire_hours", 24)) * 3600,
+                    lock_timeout_sec=float(cfg.get("lock_timeout_sec", 300)),
+                )
+    return _store
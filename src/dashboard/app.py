@@ -21,8 +21,10 @@ Central Flask application for Common Secretary Services. This file creates and c
 the Flask app instance and manages the entire application lifecycle:
 - Registers all blueprints (API, Dashboard, Config, Logs, Docs)
 - Initializes MongoDB connection and cache setup
-- Starts worker managers for asynchronous job processing
-- Manages signal handlers for clean shutdown (SIGINT, SIGTERM)
+- Starts worker managers for asynchronous job processing (unless the
+  server role is `api`, see src.core.background_workers)
+- Manages signal handlers for clean shutdown (SIGINT, SIGTERM), draining
+  running secretary jobs
 - Configures request handlers for lazy initialization
 
 The app is initialized on the first request (lazy loading) and manages worker managers
@@ -34,15 +36,17 @@ for session and secretary job processing.
 - app: Flask - Main Flask application instance
 
 @usedIn
-- src.main.py: Imports app and starts server
-- Docker container: Loaded as main module
+- src.main.py: Imports app and starts server (development server)
+- src.wsgi: WSGI entry point for gunicorn (production)
 
 @dependencies
 - External: flask - Flask web framework
 - External: dotenv - Loading environment variables
 - Internal: src.api.routes - API route blueprint
 - Internal: src.utils.logger - Logging system
-- Internal: src.core.mongodb - MongoDB connection and worker managers
+- Internal: src.core.mongodb - MongoDB connection
+- Internal: src.core.background_workers - Worker manager lifecycle
+- Internal: src.utils.serialization - JSON provider (orjson)
 - Internal: src.dashboard.routes.* - Dashboard route blueprints
 """
 import os
@@ -67,9 +71,12 @@ except Exception:
 
 from src.api.routes import blueprint as api_blueprint
 from src.utils.logger import get_logger, logger_service
-from src.core.mongodb import get_worker_manager, get_secretary_worker_manager, close_mongodb_connection
+from src.core.mongodb import close_mongodb_connection
+from src.core.background_workers import server_role, start_background_workers, stop_background_workers
 from src.core.mongodb.cache_setup import setup_mongodb_caching
 from src.utils.logger import ProcessingLogger
+from src.utils.upload_ingest import IngestRequest
+from src.utils.serialization import FastJSONProvider
 
 from .routes.log_routes import logs
 from .routes.main_routes import main
@@ -91,6 +98,10 @@ app.config['MAX_CONTENT_LENGTH'] = _max_upload_bytes
 # WICHTIG: Dieses Limit greift bei multipart/form-data unabhängig von MAX_CONTENT_LENGTH
 app.config['MAX_FORM_MEMORY_SIZE'] = _max_upload_bytes
 app.config['PREFERRED_URL_SCHEME'] = 'http'
+# Uploads beim Parsen direkt ins Staging schreiben (Hash/Größe im selben Durchlauf)
+app.request_class = IngestRequest
+# JSON über orjson (jsonify, request.get_json)
+app.json = FastJSONProvider(app)
 
 # Nur Logger initialisieren, wenn es nicht der Reloader-Prozess ist
 app_logger: ProcessingLogger = get_logger(process_id="flask-app")
@@ -200,10 +211,6 @@ app.register_blueprint(llm_config_dashboard)
 
 # Flag für den ersten Request
 _first_request = True
-# Worker-Manager-Instanz (Typ: SessionWorkerManager oder None)
-_worker_manager = None
-# Neuer Secretary Worker
-_secretary_worker = None
 # Cache-Setup durchgeführt
 _cache_setup_done = False
 
@@ -217,14 +224,8 @@ def signal_handler(sig: int, frame: Optional[FrameType]) -> NoReturn:
     if not os.environ.get('WERKZEUG_RUN_MAIN'):
         app_logger.info(f"Signal {sig} empfangen, beende Anwendung...")
         
-        # Worker-Manager beenden
-        global _worker_manager
-        if _worker_manager is not None:
-            try:
-                _worker_manager.stop()
-                app_logger.info("Worker-Manager beendet")
-            except Exception as e:
-                app_logger.error(f"Fehler beim Beenden des Worker-Managers: {str(e)}")
+        # Worker-Manager beenden (laufende Secretary-Jobs werden abgewartet oder neu eingereiht)
+        stop_background_workers()
         
         # MongoDB-Verbindung schließen
         close_mongodb_connection()
@@ -283,7 +284,7 @@ def _maybe_start_request_tracker() -> None:
 @app.before_request
 def before_request() -> None:
     """Wird vor jedem Request ausgeführt"""
-    global _first_request, _worker_manager, _cache_setup_done
+    global _first_request, _cache_setup_done
     
     if _first_request and not os.environ.get('WERKZEUG_RUN_MAIN'):
         app_logger.info("Erste Anfrage an die Anwendung")
@@ -297,28 +298,15 @@ def before_request() -> None:
             except Exception as e:
                 app_logger.error(f"Fehler beim Einrichten der Cache-Collections: {str(e)}")
         
-        # Worker-Manager starten
-        try:
-            _worker_manager = get_worker_manager()
-            if _worker_manager is not None:
-                _worker_manager.start()
-                app_logger.info("Worker-Manager gestartet")
-            else:
-                app_logger.info("Worker-Manager ist deaktiviert (event_worker.active=False in config.yaml)")
-        except Exception as e:
-            app_logger.error(f"Fehler beim Starten des Worker-Managers: {str(e)}")
-        
-        # Neuer Secretary Worker starten (optional separat konfigurierbar)
+        # Worker-Manager starten (nicht auf reinen API-Knoten; unter gunicorn
+        # bereits nach dem Fork gestartet, der Aufruf ist dann ein No-op)
         try:
-            global _secretary_worker
-            _secretary_worker = get_secretary_worker_manager()
-            if _secretary_worker is not None:
-                _secretary_worker.start()
-                app_logger.info("SecretaryWorkerManager gestartet")
+            if server_role() != "api":
+                start_background_workers()
             else:
-                app_logger.info("SecretaryWorkerManager ist deaktiviert (generic_worker.active=False in config.yaml)")
+                app_logger.info("Server-Rolle 'api': Jobs werden von separaten Worker-Prozessen verarbeitet")
         except Exception as e:
-            app_logger.error(f"Fehler beim Starten des SecretaryWorkerManager: {str(e)}")
+            app_logger.error(f"Fehler beim Starten der Worker-Manager: {str(e)}")
         
         _first_request = False
 
@@ -409,13 +397,8 @@ def cleanup() -> None:
     if not os.environ.get('WERKZEUG_RUN_MAIN'):
         app_logger.info("Anwendung wird beendet")
         
-        # Worker-Manager stoppen
-        if _worker_manager:
-            app_logger.info("Worker-Manager wird gestoppt...")
-            _worker_manager.stop()
-        if _secretary_worker:
-            app_logger.info("SecretaryWorkerManager wird gestoppt...")
-            _secretary_worker.stop()
+        # Worker-Manager stoppen (No-op, wenn bereits beendet)
+        stop_background_workers()
         
         # MongoDB-Verbindung schließen
         close_mongodb_connection()
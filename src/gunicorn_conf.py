@@ -0,0 +1,73 @@
+"""
+@fileoverview Gunicorn Configuration - Production multi-worker server
+
+@description
+Gunicorn-Konfiguration für den Produktionsbetrieb. Werte kommen aus
+`server.production` in config.yaml; Kommandozeilen-Optionen von gunicorn
+(auch über GUNICORN_CMD_ARGS) haben Vorrang.
+
+- `preload_app`: Die App wird einmal im Master importiert und per Fork an die
+  Worker-Prozesse weitergegeben (schnellerer Start, geteilte Seiten).
+  MongoDB-Clients sind nicht fork-sicher: Jeder Worker baut seine Verbindung
+  nach dem Fork neu auf.
+- `gthread`: Mehrere Threads pro Prozess. Threads werden wiederverwendet,
+  dadurch bleiben die Event-Loops von `run_async()` über Requests bestehen.
+- Rolle `all` (Standard): Jeder Worker-Prozess startet nach dem Fork seine
+  Job-Worker. Rolle `api`: keine Jobverarbeitung, dafür separate Prozesse mit
+  `python -m src.worker`.
+- Beim Beenden eines Workers (SIGTERM, Neustart nach `max_requests`) werden
+  laufende Secretary-Jobs bis `server.drain_timeout_sec` abgewartet und danach
+  an die Warteschlange zurückgegeben. `graceful_timeout_sec` muss größer sein,
+  sonst beendet der Master den Worker vorher hart.
+
+Start:
+    gunicorn -c python:src.gunicorn_conf src.wsgi:app
+
+@module gunicorn_conf
+
+@usedIn
+- Dockerfile: CMD ["gunicorn", "-c", "python:src.gunicorn_conf", "src.wsgi:app"]
+
+@dependencies
+- External: gunicorn - WSGI-Server (nur zur Laufzeit, kein Import)
+- Internal: src.core.config - Config
+- Internal: src.core.background_workers - Start und Drain der Job-Worker
+"""
+
+from typing import Any, Dict
+
+from src.core.config import Config
+
+_cfg: Dict[str, Any] = Config().get("server.production", {}) or {}
+
+bind = str(_cfg.get("bind", "0.0.0.0:5001"))
+workers = int(_cfg.get("workers", 2))
+threads = int(_cfg.get("threads", 8))
+worker_class = "gthread"
+preload_app = True
+timeout = int(_cfg.get("timeout_sec", 120))
+graceful_timeout = int(_cfg.get("graceful_timeout_sec", 75))
+keepalive = int(_cfg.get("keepalive_sec", 5))
+max_requests = int(_cfg.get("max_requests", 0))
+max_requests_jitter = int(_cfg.get("max_requests_jitter", 0))
+accesslog = _cfg.get("accesslog", "-")
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    """Verwirft den vom Master geerbten MongoDB-Client (nicht fork-sicher)."""
+    from src.core.mongodb import close_mongodb_connection
+    close_mongodb_connection()
+
+
+def post_worker_init(worker: Any) -> None:
+    """Startet die Job-Worker im Worker-Prozess, sofern die Rolle es vorsieht."""
+    from src.core.background_workers import server_role, start_background_workers
+    if server_role() == "all":
+        start_background_workers()
+
+
+def worker_exit(server: Any, worker: Any) -> None:
+    """Lässt laufende Secretary-Jobs auslaufen bzw. gibt sie zurück."""
+    from src.core.background_workers import stop_background_workers
+    released = stop_background_workers()
+    worker.log.info(f"Worker {worker.pid} beendet ({released} Jobs neu eingereiht)")
@@ -33,7 +33,7 @@ The file handles special Windows configurations for SSL/TLS and yt-dlp.
 
 @usedIn
 - Direct execution: python src/main.py
-- Docker container: CMD ["python", "-m", "src.main"]
+- Development server (the Docker image runs gunicorn, see src.gunicorn_conf)
 
 @dependencies
 - External: dotenv - Loading environment variables
@@ -77,6 +77,7 @@ from src.processors.cacheable_processor import CacheableProcessor
 from src.core.models.enums import ProcessorType, ProcessingStatus
 from src.utils.logger import ProcessingLogger
 from src.core.config import Config
+from src.utils.media_store import get_media_store, media_key_for_url
 from src.processors.base_processor import BaseProcessor
 
 try:
@@ -351,35 +352,28 @@ class AudioProcessor(CacheableProcessor[AudioProcessingResult]):
         except Exception as e:
             self.logger.error(f"Fehler beim Löschen des Caches: {str(e)}")
 
-    def _download_audio(self, url: str) -> Path:
+    def _download_audio(self, url: str, use_cache: bool = True) -> Path:
         """Lädt eine Audio-Datei von einer URL herunter und gibt den lokalen Pfad zurück.
         
         Args:
             url: URL der Audio-Datei
+            use_cache: False lädt neu, statt einen Media-Store-Eintrag zu verwenden
             
         Returns:
             Path: Lokaler Pfad zur heruntergeladenen Datei
         """
         try:
-            # Temporären Dateinamen generieren
-            temp_file = self.temp_dir / f"audio_{str(uuid.uuid4())}{self.temp_file_suffix}"
-            
-            # Audio-Datei herunterladen
-            response: requests.Response = requests.get(url, stream=True)
-            if response.status_code != 200:
-                raise ProcessingError(f"Fehler beim Herunterladen der Audio-Datei (Status {response.status_code})")
-            
-            content_length = int(response.headers.get('content-length', 0))
-            if content_length > self.max_file_size:
-                raise ProcessingError(
-                    f"Audio-Datei zu groß: {content_length} Bytes (max: {self.max_file_size} Bytes)",
-                    details={"error_code": 'VALIDATION_ERROR'}
+            # Mit Media-Store wird dieselbe URL nur einmal geladen und per Link bereitgestellt
+            media_store = get_media_store()
+            if media_store is not None:
+                temp_file = media_store.checkout(
+                    key=media_key_for_url(url, "raw"),
+                    dest_dir=self.temp_dir / f"audio_{str(uuid.uuid4())}",
+                    fetch=lambda staging_dir: self._fetch_audio_url(url, staging_dir),
+                    refresh=not use_cache
                 )
-            
-            # In temporäre Datei speichern
-            with open(temp_file, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            else:
+                temp_file = self._fetch_audio_url(url, self.temp_dir)
                 
             self.logger.debug(f"Audio-Datei heruntergeladen: {url} -> {temp_file}")
             return temp_file
@@ -391,6 +385,27 @@ class AudioProcessor(CacheableProcessor[AudioProcessingResult]):
                 details={"error_code": 'FILE_ERROR'}
             )
 
+    def _fetch_audio_url(self, url: str, target_dir: Path) -> Path:
+        """Streamt eine Audio-URL in eine neue Datei in target_dir."""
+        temp_file = target_dir / f"audio_{str(uuid.uuid4())}{self.temp_file_suffix}"
+        
+        response: requests.Response = requests.get(url, stream=True)
+        if response.status_code != 200:
+            raise ProcessingError(f"Fehler beim Herunterladen der Audio-Datei (Status {response.status_code})")
+        
+        content_length = int(response.headers.get('content-length', 0))
+        if content_length > self.max_file_size:
+            raise ProcessingError(
+                f"Audio-Datei zu groß: {content_length} Bytes (max: {self.max_file_size} Bytes)",
+                details={"error_code": 'VALIDATION_ERROR'}
+            )
+        
+        # In temporäre Datei speichern
+        with open(temp_file, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=8192):
+                f.write(chunk)
+        return temp_file
+
     def _process_audio_file(self, file_path: str) -> Optional[AudioSegmentProtocol]:
         """Verarbeitet eine Audio-Datei und gibt ein AudioSegment zurück.
         
@@ -37,6 +37,7 @@ Features:
 - Internal: src.processors.transformer_processor - TransformerProcessor for content analysis
 - Internal: src.core.models.metadata - Metadata models (MetadataResponse, ContentMetadata, etc.)
 - Internal: src.core.exceptions - ProcessingError, UnsupportedMimeTypeError, etc.
+- Internal: src.utils.upload_ingest - Size and disk path of staged uploads
 """
 import fnmatch
 import mimetypes
@@ -59,6 +60,7 @@ from src.core.models.transformer import TransformerResponse
 from src.processors.base_processor import BaseProcessor
 from src.processors.transformer_processor import TransformerProcessor
 from src.core.resource_tracking import ResourceCalculator
+from src.utils.upload_ingest import staged_upload
 
 T = TypeVar('T', bound=AudioSegment)
 from_file = AudioSegment.from_file  # type: ignore
@@ -279,13 +281,18 @@ class MetadataProcessor(BaseProcessor[ContentMetadata]):
         """Extrahiert technische Metadaten aus einer Datei."""
         try:
             # Dateiinformationen extrahieren
+            # Großer Upload liegt bereits auf der Platte: Werte und Pfad ohne erneutes Lesen
+            staged = staged_upload(file_path) if isinstance(file_path, FileStorage) else None
             if isinstance(file_path, FileStorage):
                 # FileStorage Objekt
                 file_name = file_path.filename or 'unknown.tmp'
-                mime_type = file_path.content_type or mimetypes.guess_type(file_name)[0]
-                file_path.seek(0, os.SEEK_END)
-                file_size = file_path.tell()
-                file_path.seek(0)
+                mime_type = file_path.content_type or (staged.mime_type if staged else None) or mimetypes.guess_type(file_name)[0]
+                if staged:
+                    file_size = staged.size
+                else:
+                    file_path.seek(0, os.SEEK_END)
+                    file_size = file_path.tell()
+                    file_path.seek(0)
             elif isinstance(file_path, (str, Path)):
                 # String oder Path Objekt
                 file_path = Path(file_path)
@@ -328,7 +335,7 @@ class MetadataProcessor(BaseProcessor[ContentMetadata]):
 
             if mime_type == "application/pdf":
                 try:
-                    with fitz.open(file_path) as pdf:
+                    with fitz.open(staged.path if staged else file_path) as pdf:
                         doc_pages = len(pdf)
                 except Exception as e:
                     self.logger.warning(
@@ -356,8 +363,8 @@ class MetadataProcessor(BaseProcessor[ContentMetadata]):
                     format_from_ext = file_name.split('.')[-1].lower() if '.' in file_name else None
                     audio_format = format_from_mime or format_from_ext or mime_type.split('/')[-1]
                     
-                    # Für FileStorage Objekte müssen wir den Inhalt in einen temporären BytesIO Buffer lesen
-                    if isinstance(file_path, FileStorage):
+                    # Für FileStorage Objekte im Speicher müssen wir den Inhalt in einen temporären BytesIO Buffer lesen
+                    if isinstance(file_path, FileStorage) and staged is None:
                         from io import BytesIO
                         file_data = BytesIO(file_path.read())
                         file_path.seek(0)  # Position zurücksetzen
@@ -390,19 +397,20 @@ class MetadataProcessor(BaseProcessor[ContentMetadata]):
                                     f"Ursprünglicher Fehler: {str(decode_error)}"
                                 )
                     else:
+                        media_path = staged.path if staged else str(file_path)
                         try:
-                            audio = cast(AudioSegmentProtocol, from_file(str(file_path), format=audio_format))
+                            audio = cast(AudioSegmentProtocol, from_file(media_path, format=audio_format))
                         except Exception as decode_error:
                             self.logger.warning(
                                 "Fehler beim Dekodieren der Audio-Datei",
                                 extra={
                                     "error": str(decode_error),
                                     "format": audio_format,
-                                    "file": str(file_path)
+                                    "file": media_path
                                 }
                             )
                             # Versuche ohne Format-Spezifikation
-                            audio = cast(AudioSegmentProtocol, from_file(str(file_path)))
+                            audio = cast(AudioSegmentProtocol, from_file(media_path))
                     
                     media_duration = float(len(audio)) / 1000.0  # ms to seconds
                     media_bitrate = int(audio.frame_rate * audio.sample_width * 8)
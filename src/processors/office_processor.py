@@ -69,6 +69,7 @@ class OfficeProcessor:
         use_cache: bool = True,
         force_overwrite: bool = False,
         base_cache_dir: Union[str, Path] = "cache/office/temp",
+        file_hash: Optional[str] = None,
     ) -> OfficeProcessResult:
         path = Path(file_path)
         if not path.exists():
@@ -77,7 +78,8 @@ class OfficeProcessor:
         doc_type = _doc_type_from_suffix(path)
 
         # Cache-Key über Dateiinhalt. Das ist einfach, robust und unabhängig vom Dateinamen.
-        file_hash = md5_file(path)
+        # Beim Upload bereits berechnet (MD5), sonst hier. Nur Hex-Werte: der Hash wird Verzeichnisname.
+        file_hash = file_hash if file_hash and file_hash.isalnum() else md5_file(path)
         cache_root = Path(base_cache_dir)
         ensure_dir(cache_root)
         cached_dir = cache_root / file_hash
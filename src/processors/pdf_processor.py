@@ -42,6 +42,7 @@ Features:
 - External: tesseract - OCR functionality
 - External: mistralai - Mistral OCR API
 - External: requests - HTTP requests for external APIs
+- Internal: src.core.llm.ProviderManager - Gemeinsamer async HTTP-Client für Mistral OCR
 - Internal: src.processors.cacheable_processor - CacheableProcessor base class
 - Internal: src.processors.transformer_processor - TransformerProcessor for template transformation
 - Internal: src.processors.imageocr_processor - ImageOCRProcessor for image OCR
@@ -74,7 +75,7 @@ from src.processors.transformer_processor import TransformerProcessor
 from src.processors.imageocr_processor import ImageOCRProcessor  # Neue Import
 from src.core.models.enums import ProcessingStatus
 from src.utils.image2text_utils import Image2TextService
-from src.core.llm import LLMConfigManager, UseCase
+from src.core.llm import LLMConfigManager, ProviderManager, UseCase
 
 # Konstanten für Processor-Typen
 PROCESSOR_TYPE_PDF = "pdf"
@@ -542,10 +543,12 @@ class PDFProcessor(CacheableProcessor[PDFProcessingResult]):
             upload_url=files_url
         )
         
-        with open(file_path, "rb") as fpdf:
-            files = {"file": (file_path.name, fpdf, mime)}
-            data_form = {"purpose": "ocr"}
-            up_resp = requests.post(files_url, headers=headers_up, files=files, data=data_form, timeout=180)
+        # Gemeinsamer async Client (Keep-Alive): Upload und OCR teilen eine Verbindung,
+        # und die parallel laufende Seiten-Extraktion wird nicht blockiert
+        http = ProviderManager().get_async_http_client("mistral")
+        files = {"file": (file_path.name, file_path.read_bytes(), mime)}
+        data_form = {"purpose": "ocr"}
+        up_resp = await http.post(files_url, headers=headers_up, files=files, data=data_form, timeout=180)
         
         self.logger.debug(
             "Mistral-OCR: Upload Response",
@@ -605,7 +608,10 @@ class PDFProcessor(CacheableProcessor[PDFProcessingResult]):
         )
         self.logger.debug("Mistral-OCR: OCR Payload", payload=payload_log)
         
-        ocr_resp = requests.post(ocr_url, headers=headers_json, json=payload, timeout=300)
+        # Direkter HTTP-Aufruf: durch den gemeinsamen Limiter, damit 429/Retry-After
+        # von Mistral auch die übrigen Mistral-Aufrufe drosselt
+        limiter = ProviderManager().get_concurrency_limiter()
+        ocr_resp = await limiter.acall("mistral", ocr_model, http.post, ocr_url, headers=headers_json, json=payload, timeout=300)
         
         self.logger.debug(
             "Mistral-OCR: OCR Response empfangen",
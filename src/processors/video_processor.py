@@ -21,6 +21,7 @@ The VideoProcessor tracks LLM usage on two levels:
 Features:
 - Audio extraction with FFmpeg
 - Frame extraction at specific timestamps
+- Keyframe mode: scene-change selection with perceptual-hash deduplication
 - Integration with AudioProcessor for transcription
 - Support for various video formats
 - Caching of processing results
@@ -30,6 +31,7 @@ Features:
 
 @exports
 - VideoProcessor: Class - Video processing processor
+- FRAME_MODES: Tuple[str, ...] - Gültige Modi der Frame-Extraktion
 
 @usedIn
 - src.processors.session_processor: Uses VideoProcessor for video processing in sessions
@@ -77,10 +79,19 @@ from src.core.models.video import (
 )
 from src.core.resource_tracking import ResourceCalculator
 from src.utils.transcription_utils import WhisperTranscriber
+from src.utils.keyframe_utils import (
+    KeyframeCandidate,
+    build_keyframe_filter,
+    deduplicate_keyframes,
+    parse_showinfo_timestamps,
+)
 from src.core.models.base import ProcessInfo
 from .cacheable_processor import CacheableProcessor
 from .transformer_processor import TransformerProcessor
 from .audio_processor import AudioProcessor
+from .ytdlp_info_extractor import extract_video_info, lookup_video_info, store_video_info
+from .ytdlp_audio_stream import build_ffmpeg_stream_cmd, plan_audio_download
+from src.utils.media_store import get_media_store, media_key_for_url
 
 # Typ-Alias für yt-dlp
 YDLDict = Dict[str, Any]
@@ -89,6 +100,9 @@ from typing import Union as _UnionTypeAlias
 
 VideoAnyResult = _UnionTypeAlias[VideoProcessingResult, VideoFramesResult]
 
+# Modi von extract_frames ('interval' ist der Default)
+FRAME_MODES: Tuple[str, ...] = ("interval", "keyframes")
+
 class VideoProcessor(CacheableProcessor[VideoAnyResult]):
     """
     Prozessor für die Verarbeitung von Video-Dateien.
@@ -118,6 +132,12 @@ class VideoProcessor(CacheableProcessor[VideoAnyResult]):
         
         # Video-spezifische Konfigurationen
         self.max_duration = video_config.get('max_duration', 3600)  # 1 Stunde
+        # Keyframe-Modus: Szenenwechsel-Schwelle (ffmpeg) und dHash-Distanz für Duplikate
+        keyframe_config = video_config.get('keyframes', {}) or {}
+        self.keyframe_scene_threshold: float = float(keyframe_config.get('scene_threshold', 0.3))
+        self.keyframe_hash_distance: int = int(keyframe_config.get('hash_distance', 6))
+        # Audio-only-Pfad: nur Audio-Format laden bzw. Tonspur per ffmpeg aus dem Stream ziehen
+        self.audio_streaming: bool = bool(video_config.get('audio_streaming', True))
         
         # Debug-Logging der Video-Konfiguration
         self.logger.debug("VideoProcessor initialisiert mit Konfiguration", 
@@ -447,6 +467,13 @@ class VideoProcessor(CacheableProcessor[VideoAnyResult]):
         
         title, _duration, download_url = api_result
         
+        # Tonspur direkt aus dem Download-Link streamen (kein vollständiges Video auf Platte)
+        if self.audio_streaming:
+            streamed_file = working_dir / f"{title[:50]}.mp3"
+            if self._stream_audio_with_ffmpeg(download_url, streamed_file):
+                self.logger.info(f"Audio via Vimeo API gestreamt: {streamed_file}")
+                return streamed_file
+        
         try:
             # Lade Video-Datei herunter
             self.logger.info(f"Lade Video via Vimeo API: {title}")
@@ -486,12 +513,158 @@ class VideoProcessor(CacheableProcessor[VideoAnyResult]):
             self.logger.error(f"Vimeo API Download fehlgeschlagen: {str(e)}")
             return None
 
-    def _extract_video_info(self, url: str) -> Tuple[str, int, str]:
+    def _download_audio_file(self, normalized_url: str, target_dir: Path) -> Path:
+        """
+        Lädt die Tonspur eines Videos als MP3 in target_dir.
+
+        Reihenfolge: Vimeo API (Token + Vimeo-URL), yt-dlp CLI (TLS-Workaround),
+        yt-dlp Python-API.
+
+        Returns:
+            Path: Pfad zur MP3-Datei
+        """
+        # Video herunterladen - Vimeo API Fallback zuerst versuchen
+        vimeo_id = self._extract_vimeo_id(normalized_url)
+        download_success = False
+        
+        # Versuch 1: Vimeo API (wenn Token vorhanden und Vimeo-URL)
+        if vimeo_id and os.getenv('VIMEO_ACCESS_TOKEN'):
+            api_audio = self._download_vimeo_via_api(vimeo_id, target_dir)
+            if api_audio and api_audio.exists():
+                self.logger.info("Video erfolgreich via Vimeo API heruntergeladen")
+                return api_audio
+        
+        # Versuch 2: yt-dlp CLI (bei PYTHONHTTPSVERIFY=0)
+        if not download_success and os.getenv('PYTHONHTTPSVERIFY', '').lower() in {'0', 'false'}:
+            try:
+                self.logger.info(f"Versuche Download via CLI (TLS-Workaround): {normalized_url}")
+                
+                import shutil
+                import sys as _sys
+                yt_dlp_exe = shutil.which('yt-dlp')
+                if not yt_dlp_exe:
+                    venv_ytdlp = Path(_sys.executable).parent / 'yt-dlp.exe'
+                    if venv_ytdlp.exists():
+                        yt_dlp_exe = str(venv_ytdlp)
+                
+                if yt_dlp_exe:
+                    cmd = [
+                        yt_dlp_exe, '--no-check-certificate',
+                        '--extract-audio', '--audio-format', 'mp3',
+                        '--output', str(target_dir / "%(title)s.%(ext)s"),
+                        '--retries', '10',
+                        '--socket-timeout', '30'
+                    ]
+                    cookies_file = os.getenv('YTDLP_COOKIES_FILE')
+                    if cookies_file and os.path.isfile(cookies_file):
+                        cmd.extend(['--cookies', cookies_file])
+                    cmd.append(normalized_url)
+                    
+                    # Übergebe ENV-Variablen explizit
+                    env = os.environ.copy()
+                    env['PYTHONHTTPSVERIFY'] = '0'
+                    
+                    subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=300, env=env)
+                    download_success = True
+                    self.logger.info("Video erfolgreich via yt-dlp CLI heruntergeladen")
+            except Exception as cli_err:
+                self.logger.warning(f"CLI-Download fehlgeschlagen: {str(cli_err)}")
+        
+        # Versuch 3: yt-dlp Python API (Standard)
+        if not download_success:
+            download_opts = self.ydl_opts.copy()
+            output_path = str(target_dir / "%(title)s.%(ext)s")
+            download_opts['outtmpl'] = output_path
+            
+            self.logger.info(f"Starte Download via yt-dlp Python-API: {normalized_url}")
+            with yt_dlp.YoutubeDL(cast(Any, download_opts)) as ydl:
+                if not self.audio_streaming:
+                    ydl.download([normalized_url])
+                else:
+                    # Einmal extrahieren, dann den kleinsten Weg zur Tonspur wählen
+                    info: YDLDict = ydl.extract_info(normalized_url, download=False)
+                    if not info:
+                        raise ValueError("Keine Video-Informationen gefunden")
+                    plan = plan_audio_download(info)
+                    if plan is not None and plan.mode == 'ffmpeg_stream' and plan.stream_url:
+                        output_file = Path(ydl.prepare_filename(info)).with_suffix('.mp3')
+                        if self._stream_audio_with_ffmpeg(plan.stream_url, output_file, plan.http_headers, plan.progressive):
+                            self.logger.info("Tonspur direkt per ffmpeg-Stream extrahiert", format_id=plan.format_id)
+                            return output_file
+                    elif plan is not None:
+                        self.logger.info("Lade nur Audio-Format", format_id=plan.format_id)
+                    # bestaudio/best aus ydl_opts; Download aus der bereits extrahierten Info
+                    ydl.process_ie_result(info, download=True)
+
+        mp3_files = list(target_dir.glob("*.mp3"))
+        if not mp3_files:
+            raise ValueError("Keine MP3-Datei gefunden")
+        return mp3_files[0]
+
+    def _stream_audio_with_ffmpeg(
+        self,
+        stream_url: str,
+        output_file: Path,
+        http_headers: Optional[Dict[str, str]] = None,
+        progressive: bool = True,
+    ) -> bool:
+        """
+        Extrahiert die Tonspur per ffmpeg direkt aus der Stream-URL (ohne Video-Zwischendatei).
+
+        Returns:
+            bool: True bei Erfolg; bei False wird der reguläre Download genutzt
+        """
+        cmd = build_ffmpeg_stream_cmd(stream_url, output_file, http_headers, progressive)
+        try:
+            subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=self.max_duration + 600)
+            return output_file.exists() and output_file.stat().st_size > 0
+        except Exception as e:
+            stderr = getattr(e, 'stderr', None)
+            self.logger.warning("ffmpeg-Stream fehlgeschlagen, nutze regulären Download",
+                                error=str(e),
+                                stderr=stderr[:500] if isinstance(stderr, str) else None)
+            try:
+                output_file.unlink()
+            except OSError:
+                pass
+            return False
+
+    def _download_full_video(self, normalized_url: str, target_dir: Path) -> Tuple[Path, YDLDict]:
+        """
+        Lädt das vollständige Video (Bild + Ton) für die Frame-Extraktion in target_dir.
+
+        Returns:
+            Tuple aus (Pfad zur Videodatei, yt-dlp-Info)
+        """
+        with yt_dlp.YoutubeDL({
+            'quiet': True,
+            'no_warnings': True,
+            'format': 'bestvideo+bestaudio/best',
+            'merge_output_format': 'mp4',
+            'outtmpl': str(target_dir / '%(title)s.%(ext)s'),
+            'retries': 10,
+            'socket_timeout': 30,
+            'nocheckcertificate': True,
+        }) as ydl:
+            info: YDLDict = ydl.extract_info(normalized_url, download=True)
+            if not info:
+                raise ValueError("Keine Video-Informationen gefunden")
+        # Eingangsdatei finden
+        candidates = list(target_dir.glob("*.mp4")) + list(target_dir.glob("*.mkv")) + list(target_dir.glob("*.webm"))
+        if not candidates:
+            raise ValueError("Heruntergeladenes Video nicht gefunden")
+        return candidates[0], info
+
+    def _extract_video_info(self, url: str, use_cache: bool = True) -> Tuple[str, int, str]:
         """
         Extrahiert grundlegende Informationen aus einem Video.
         
+        Ergebnisse werden im Video-Info-Cache (MongoDB, TTL) abgelegt; wiederholte
+        Anfragen für dasselbe Video überspringen so die yt-dlp-Extraktion.
+        
         Args:
             url: URL des Videos
+            use_cache: Ob der Video-Info-Cache verwendet werden soll
             
         Returns:
             Tuple mit (Titel, Dauer in Sekunden, Video-ID)
@@ -499,6 +672,12 @@ class VideoProcessor(CacheableProcessor[VideoAnyResult]):
         # URL normalisieren (besonders für Vimeo)
         normalized_url = self._normalize_vimeo_url(url)
         
+        if use_cache:
+            cached_info = lookup_video_info(normalized_url)
+            if cached_info:
+                self.logger.info("Video-Info aus Cache", video_id=cached_info.get('id'))
+                return self._video_info_tuple(cached_info, normalized_url)
+        
         # Windows-TLS-Workaround: Bei PYTHONHTTPSVERIFY=0 nutze yt-dlp CLI statt Python-API
         # weil das CLI besser mit SSL-ENV-Variablen umgeht
         if os.getenv('PYTHONHTTPSVERIFY', '').lower() in {'0', 'false'}:
@@ -530,11 +709,10 @@ class VideoProcessor(CacheableProcessor[VideoAnyResult]):
                 
                 result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30, env=env)
                 info_json = json.loads(result.stdout)
+                if use_cache:
+                    info_json = store_video_info(normalized_url, info_json)
                 
-                video_id = str(info_json.get('id', hashlib.md5(normalized_url.encode()).hexdigest()))
-                title = str(info_json.get('title', 'Unbekanntes Video'))
-                duration = int(info_json.get('duration', 0))
-                
+                title, duration, video_id = self._video_info_tuple(info_json, normalized_url)
                 self.logger.info("Video-Info via CLI extrahiert (TLS-Workaround)", title=title, duration=duration)
                 return title, duration, video_id
             except subprocess.CalledProcessError as cli_error:
@@ -558,21 +736,22 @@ class VideoProcessor(CacheableProcessor[VideoAnyResult]):
                 if api_result:
                     title, duration, _download_url = api_result
                     self.logger.info("Vimeo API Fallback erfolgreich", title=title)
+                    if use_cache:
+                        store_video_info(normalized_url, {'id': vimeo_id, 'title': title, 'duration': duration})
                     return title, duration, vimeo_id
             except Exception as api_error:
                 self.logger.warning("Vimeo API Fallback fehlgeschlagen", error=str(api_error))
         
-        # Standard-Pfad: Python-API
-        with yt_dlp.YoutubeDL(cast(Any, self.ydl_opts)) as ydl:
-            info: YDLDict = ydl.extract_info(normalized_url, download=False)  # type: ignore
-            if not info:
-                raise ValueError("Keine Video-Informationen gefunden")
-            
-            video_id = str(info.get('id', hashlib.md5(normalized_url.encode()).hexdigest()))
-            title = str(info.get('title', 'Unbekanntes Video'))
-            duration = int(info.get('duration', 0))
-            
-            return title, duration, video_id
+        # Standard-Pfad: Python-API über einen wiederverwendeten YoutubeDL pro Worker-Thread
+        info: YDLDict = extract_video_info(normalized_url, cast(Dict[str, Any], self.ydl_opts), use_cache=use_cache)
+        return self._video_info_tuple(info, normalized_url)
+
+    def _video_info_tuple(self, info: YDLDict, normalized_url: str) -> Tuple[str, int, str]:
+        """Bildet (Titel, Dauer, Video-ID) aus einer yt-dlp-Info."""
+        video_id = str(info.get('id') or hashlib.md5(normalized_url.encode()).hexdigest())
+        title = str(info.get('title') or 'Unbekanntes Video')
+        duration = int(info.get('duration') or 0)
+        return title, duration, video_id
 
     def _create_cache_key(self, source: Union[str, VideoSource], target_language: str = 'de', template: Optional[str] = None) -> str:
         """
@@ -666,7 +845,10 @@ class VideoProcessor(CacheableProcessor[VideoAnyResult]):
         interval_seconds: int,
         width: Optional[int],
         height: Optional[int],
-        image_format: str = "jpg"
+        image_format: str = "jpg",
+        mode: str = "interval",
+        scene_threshold: Optional[float] = None,
+        hash_distance: Optional[int] = None
     ) -> str:
         """Erstellt Cache-Key für Frame-Extraktion."""
         if isinstance(source, VideoSource):
@@ -674,9 +856,80 @@ class VideoProcessor(CacheableProcessor[VideoAnyResult]):
         else:
             base_key = source
         size_part = f"size={width}x{height}" if width or height else "size=orig"
-        key_str = f"frames|{base_key}|interval={interval_seconds}|{size_part}|fmt={image_format}"
+        if mode == "keyframes":
+            # Interval spielt im Keyframe-Modus keine Rolle, die Schwellen dagegen schon
+            mode_part = f"keyframes|scene={scene_threshold}|hash={hash_distance}"
+        else:
+            mode_part = f"interval={interval_seconds}"
+        key_str = f"frames|{base_key}|{mode_part}|{size_part}|fmt={image_format}"
         return self.generate_cache_key(key_str)
 
+    def _select_keyframes(
+        self,
+        video_path: Path,
+        frames_dir: Path,
+        image_ext: str,
+        scene_threshold: float,
+        hash_distance: int,
+        duration: int,
+        width: Optional[int],
+        height: Optional[int]
+    ) -> List[FrameInfo]:
+        """
+        Wählt Keyframes per Szenenwechsel aus und verwirft nahezu identische Frames.
+
+        ffmpeg liefert über den showinfo-Filter die Zeitstempel der ausgewählten Frames;
+        anschließend filtert ein dHash-Vergleich Duplikate. Verworfene Dateien werden gelöscht.
+        """
+        output_pattern = frames_dir / f"frame_%06d.{image_ext}"
+        cmd = [
+            'ffmpeg', '-y', '-hide_banner', '-loglevel', 'info',
+            '-i', str(video_path),
+            '-vf', build_keyframe_filter(scene_threshold, width, height),
+            '-vsync', 'vfr',
+            str(output_pattern)
+        ]
+        completed = subprocess.run(cmd, check=True, capture_output=True, text=True)
+
+        files = sorted(frames_dir.glob(f"*.{image_ext}"))
+        timestamps = parse_showinfo_timestamps(completed.stderr)
+        if len(timestamps) != len(files):
+            # Sollte nicht vorkommen; Zuordnung dann nur über die gemeinsame Länge
+            self.logger.warning("Anzahl Zeitstempel weicht von Frame-Dateien ab",
+                                timestamps=len(timestamps), files=len(files))
+        candidates = [
+            KeyframeCandidate(file_path=fpath, timestamp_s=ts)
+            for fpath, ts in zip(files, timestamps)
+        ]
+        keyframes = deduplicate_keyframes(candidates, max_distance=hash_distance, duration_s=float(duration))
+
+        kept_paths = {kf.file_path for kf in keyframes}
+        for fpath in files:
+            if fpath not in kept_paths:
+                try:
+                    fpath.unlink()
+                except OSError:
+                    pass
+
+        self.logger.info("Keyframes ausgewählt",
+                         candidates=len(candidates),
+                         kept=len(keyframes),
+                         scene_threshold=scene_threshold,
+                         hash_distance=hash_distance)
+        return [
+            FrameInfo(
+                index=idx,
+                timestamp_s=kf.start_s,
+                end_s=kf.end_s,
+                file_path=str(kf.file_path),
+                width=width,
+                height=height,
+                frame_hash=kf.frame_hash,
+                merged_count=kf.merged_count
+            )
+            for idx, kf in enumerate(keyframes)
+        ]
+
     async def extract_frames(
         self,
         source: Union[str, VideoSource],
@@ -685,9 +938,24 @@ class VideoProcessor(CacheableProcessor[VideoAnyResult]):
         height: Optional[int] = None,
         image_format: str = "jpg",
         use_cache: bool = True,
-        binary_data: Optional[bytes] = None
+        binary_data: Optional[bytes] = None,
+        mode: str = "interval",
+        scene_threshold: Optional[float] = None,
+        hash_distance: Optional[int] = None
     ) -> VideoFramesResponse:
-        """Extrahiert Frames in festem Intervall und speichert sie lokal."""
+        """
+        Extrahiert Frames und speichert sie lokal.
+
+        Modi:
+        - 'interval': ein Frame alle `interval_seconds` Sekunden
+        - 'keyframes': nur Szenenwechsel, nahezu identische Frames (dHash) werden verworfen;
+          jeder Frame trägt die repräsentierte Zeitspanne (timestamp_s bis end_s)
+
+        Raises:
+            ValueError: Bei unbekanntem `mode`
+        """
+        if mode not in FRAME_MODES:
+            raise ValueError(f"Unbekannter Frame-Modus '{mode}' (erlaubt: {', '.join(FRAME_MODES)})")
         working_dir: Path = Path(self.temp_dir) / "video" / str(uuid.uuid4())
         working_dir.mkdir(parents=True, exist_ok=True)
         frames_dir: Path = working_dir / "frames"
@@ -698,6 +966,27 @@ class VideoProcessor(CacheableProcessor[VideoAnyResult]):
         duration: int = 0
         video_id: str = ""
 
+        # Vor dem try festlegen: auch die Fehlerantwort braucht Modus und Request-Info
+        frames_mode: str = mode
+        effective_scene_threshold: float = (
+            float(scene_threshold) if scene_threshold is not None else self.keyframe_scene_threshold
+        )
+        effective_hash_distance: int = (
+            int(hash_distance) if hash_distance is not None else self.keyframe_hash_distance
+        )
+        request_info: Dict[str, Any] = {
+            'source': source.to_dict() if isinstance(source, VideoSource) else str(source),
+            'interval_seconds': interval_seconds,
+            'width': width,
+            'height': height,
+            'format': image_format,
+            'use_cache': use_cache,
+            'mode': frames_mode,
+        }
+        if frames_mode == "keyframes":
+            request_info['scene_threshold'] = effective_scene_threshold
+            request_info['hash_distance'] = effective_hash_distance
+
         try:
             # Quelle normalisieren
             if isinstance(source, str):
@@ -705,22 +994,19 @@ class VideoProcessor(CacheableProcessor[VideoAnyResult]):
             else:
                 video_source = source
 
-            cache_key = self._create_cache_key_frames(video_source,
-                                                      interval_seconds, width, height, image_format)
+            cache_key = self._create_cache_key_frames(
+                video_source, interval_seconds, width, height, image_format,
+                mode=frames_mode,
+                scene_threshold=effective_scene_threshold,
+                hash_distance=effective_hash_distance
+            )
             if use_cache and self.is_cache_enabled():
                 cache_hit, cached_result = self.get_from_cache(cache_key)
                 if cache_hit and isinstance(cached_result, VideoFramesResult):
                     return self.create_response(
                         processor_name="video",
                         result=cached_result,
-                        request_info={
-                            'source': video_source.to_dict() if hasattr(video_source, 'to_dict') else str(video_source),
-                            'interval_seconds': interval_seconds,
-                            'width': width,
-                            'height': height,
-                            'format': image_format,
-                            'use_cache': use_cache
-                        },
+                        request_info=request_info,
                         response_class=VideoFramesResponse,
                         from_cache=True,
                         cache_key=cache_key
@@ -729,27 +1015,21 @@ class VideoProcessor(CacheableProcessor[VideoAnyResult]):
             # Video vorbereiten (vollständiges Video, nicht nur Audio)
             if video_source.url:
                 normalized_url = self._normalize_vimeo_url(video_source.url)
-                with yt_dlp.YoutubeDL({
-                    'quiet': True,
-                    'no_warnings': True,
-                    'format': 'bestvideo+bestaudio/best',
-                    'merge_output_format': 'mp4',
-                    'outtmpl': str(working_dir / '%(title)s.%(ext)s'),
-                    'retries': 10,
-                    'socket_timeout': 30,
-                    'nocheckcertificate': True,
-                }) as ydl:
-                    info: YDLDict = ydl.extract_info(normalized_url, download=True)  # type: ignore
-                    if not info:
-                        raise ValueError("Keine Video-Informationen gefunden")
+                media_store = get_media_store()
+                if media_store is not None:
+                    # Metadaten kommen aus dem Video-Info-Cache, die Datei aus dem Media-Store
+                    title, duration, video_id = self._extract_video_info(normalized_url, use_cache=use_cache)
+                    temp_video_path = media_store.checkout(
+                        key=media_key_for_url(normalized_url, "video"),
+                        dest_dir=working_dir,
+                        fetch=lambda staging_dir: self._download_full_video(normalized_url, staging_dir)[0],
+                        refresh=not use_cache
+                    )
+                else:
+                    temp_video_path, info = self._download_full_video(normalized_url, working_dir)
                     video_id = str(info.get('id'))
                     title = str(info.get('title', 'video'))
                     duration = int(info.get('duration', 0))
-                # Eingangsdatei finden
-                candidates = list(working_dir.glob("*.mp4")) + list(working_dir.glob("*.mkv")) + list(working_dir.glob("*.webm"))
-                if not candidates:
-                    raise ValueError("Heruntergeladenes Video nicht gefunden")
-                temp_video_path = candidates[0]
             else:
                 # Upload-Fall
                 video_id = hashlib.md5(str(uuid.uuid4()).encode()).hexdigest()
@@ -759,43 +1039,62 @@ class VideoProcessor(CacheableProcessor[VideoAnyResult]):
                 temp_video_path = working_dir / video_source.file_name
                 temp_video_path.write_bytes(binary_data)
 
-            # ffmpeg-Filterkette aufbauen
-            filters: List[str] = []
-            # 1 Frame alle N Sekunden
-            filters.append(f"fps=1/{max(1, int(interval_seconds))}")
-            # Optional skalieren
-            if width or height:
-                w = width if width else -1
-                h = height if height else -1
-                filters.append(f"scale={w}:{h}:flags=lanczos")
-            filter_str = ",".join(filters)
-
-            # Ausgabeformat und Pfad
+            # Ausgabeformat
             image_ext = image_format.lower()
             if image_ext not in {"jpg", "jpeg", "png"}:
                 image_ext = "jpg"
-            output_pattern = frames_dir / f"frame_%06d.{image_ext}"
 
-            # ffmpeg ausführen
-            cmd = [
-                'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
-                '-i', str(temp_video_path),
-                '-vf', filter_str,
-                str(output_pattern)
-            ]
-            subprocess.run(cmd, check=True, capture_output=True, text=True)
-
-            # erzeugte Dateien einsammeln
-            files = sorted(frames_dir.glob(f"*.{image_ext}"))
             frames: List[FrameInfo] = []
-            for idx, fpath in enumerate(files, start=0):
-                frames.append(FrameInfo(
-                    index=idx,
-                    timestamp_s=float(idx * max(1, int(interval_seconds))),
-                    file_path=str(fpath),
+            if frames_mode == "keyframes":
+                frames = self._select_keyframes(
+                    video_path=temp_video_path,
+                    frames_dir=frames_dir,
+                    image_ext=image_ext,
+                    scene_threshold=effective_scene_threshold,
+                    hash_distance=effective_hash_distance,
+                    duration=duration,
                     width=width,
                     height=height
-                ))
+                )
+            else:
+                # ffmpeg-Filterkette aufbauen
+                filters: List[str] = []
+                # 1 Frame alle N Sekunden
+                step = max(1, int(interval_seconds))
+                filters.append(f"fps=1/{step}")
+                # Optional skalieren
+                if width or height:
+                    w = width if width else -1
+                    h = height if height else -1
+                    filters.append(f"scale={w}:{h}:flags=lanczos")
+                filter_str = ",".join(filters)
+
+                output_pattern = frames_dir / f"frame_%06d.{image_ext}"
+
+                # ffmpeg ausführen
+                cmd = [
+                    'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+                    '-i', str(temp_video_path),
+                    '-vf', filter_str,
+                    str(output_pattern)
+                ]
+                subprocess.run(cmd, check=True, capture_output=True, text=True)
+
+                # erzeugte Dateien einsammeln
+                files = sorted(frames_dir.glob(f"*.{image_ext}"))
+                for idx, fpath in enumerate(files, start=0):
+                    start_s = float(idx * step)
+                    end_s = start_s + step
+                    if duration:
+                        end_s = min(end_s, float(duration))
+                    frames.append(FrameInfo(
+                        index=idx,
+                        timestamp_s=start_s,
+                        end_s=end_s,
+                        file_path=str(fpath),
+                        width=width,
+                        height=height
+                    ))
 
             # Metadaten
             metadata = VideoMetadata(
@@ -813,7 +1112,8 @@ class VideoProcessor(CacheableProcessor[VideoAnyResult]):
                 output_dir=str(frames_dir),
                 interval_seconds=int(interval_seconds),
                 frame_count=len(frames),
-                frames=frames
+                frames=frames,
+                mode=frames_mode
             )
 
             # Optional cachen
@@ -823,14 +1123,7 @@ class VideoProcessor(CacheableProcessor[VideoAnyResult]):
             return self.create_response(
                 processor_name="video",
                 result=frames_result,
-                request_info={
-                    'source': video_source.to_dict() if hasattr(video_source, 'to_dict') else str(video_source),
-                    'interval_seconds': interval_seconds,
-                    'width': width,
-                    'height': height,
-                    'format': image_format,
-                    'use_cache': use_cache
-                },
+                request_info=request_info,
                 response_class=VideoFramesResponse,
                 from_cache=False,
                 cache_key=cache_key
@@ -854,16 +1147,10 @@ class VideoProcessor(CacheableProcessor[VideoAnyResult]):
                     output_dir=str(frames_dir),
                     interval_seconds=int(interval_seconds),
                     frame_count=0,
-                    frames=[]
+                    frames=[],
+                    mode=frames_mode
                 ),
-                request_info={
-                    'source': str(source),
-                    'interval_seconds': interval_seconds,
-                    'width': width,
-                    'height': height,
-                    'format': image_format,
-                    'use_cache': use_cache
-                },
+                request_info=request_info,
                 response_class=VideoFramesResponse,
                 from_cache=False,
                 cache_key="",
@@ -948,65 +1235,19 @@ class VideoProcessor(CacheableProcessor[VideoAnyResult]):
             if video_source.url:
                 # URL normalisieren (besonders für Vimeo)
                 normalized_url = self._normalize_vimeo_url(video_source.url)
-                title, duration, video_id = self._extract_video_info(normalized_url)
-                
-                # Video herunterladen - Vimeo API Fallback zuerst versuchen
-                vimeo_id = self._extract_vimeo_id(normalized_url)
-                download_success = False
-                
-                # Versuch 1: Vimeo API (wenn Token vorhanden und Vimeo-URL)
-                if vimeo_id and os.getenv('VIMEO_ACCESS_TOKEN'):
-                    api_audio = self._download_vimeo_via_api(vimeo_id, working_dir)
-                    if api_audio and api_audio.exists():
-                        audio_path = api_audio
-                        download_success = True
-                        self.logger.info("Video erfolgreich via Vimeo API heruntergeladen")
+                title, duration, video_id = self._extract_video_info(normalized_url, use_cache=use_cache)
                 
-                # Versuch 2: yt-dlp CLI (bei PYTHONHTTPSVERIFY=0)
-                if not download_success and os.getenv('PYTHONHTTPSVERIFY', '').lower() in {'0', 'false'}:
-                    try:
-                        self.logger.info(f"Versuche Download via CLI (TLS-Workaround): {normalized_url}")
-                        
-                        import shutil
-                        import sys as _sys
-                        yt_dlp_exe = shutil.which('yt-dlp')
-                        if not yt_dlp_exe:
-                            venv_ytdlp = Path(_sys.executable).parent / 'yt-dlp.exe'
-                            if venv_ytdlp.exists():
-                                yt_dlp_exe = str(venv_ytdlp)
-                        
-                        if yt_dlp_exe:
-                            cmd = [
-                                yt_dlp_exe, '--no-check-certificate',
-                                '--extract-audio', '--audio-format', 'mp3',
-                                '--output', str(working_dir / "%(title)s.%(ext)s"),
-                                '--retries', '10',
-                                '--socket-timeout', '30'
-                            ]
-                            cookies_file = os.getenv('YTDLP_COOKIES_FILE')
-                            if cookies_file and os.path.isfile(cookies_file):
-                                cmd.extend(['--cookies', cookies_file])
-                            cmd.append(normalized_url)
-                            
-                            # Übergebe ENV-Variablen explizit
-                            env = os.environ.copy()
-                            env['PYTHONHTTPSVERIFY'] = '0'
-                            
-                            subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=300, env=env)
-                            download_success = True
-                            self.logger.info("Video erfolgreich via yt-dlp CLI heruntergeladen")
-                    except Exception as cli_err:
-                        self.logger.warning(f"CLI-Download fehlgeschlagen: {str(cli_err)}")
-                
-                # Versuch 3: yt-dlp Python API (Standard)
-                if not download_success:
-                    download_opts = self.ydl_opts.copy()
-                    output_path = str(working_dir / "%(title)s.%(ext)s")
-                    download_opts['outtmpl'] = output_path
-                    
-                    self.logger.info(f"Starte Download via yt-dlp Python-API: {normalized_url}")
-                    with yt_dlp.YoutubeDL(cast(Any, download_opts)) as ydl:
-                        ydl.download([normalized_url])  # type: ignore
+                # Tonspur herunterladen; mit Media-Store nur einmal pro Quelle
+                media_store = get_media_store()
+                if media_store is not None:
+                    audio_path = media_store.checkout(
+                        key=media_key_for_url(normalized_url, "audio.mp3"),
+                        dest_dir=working_dir,
+                        fetch=lambda staging_dir: self._download_audio_file(normalized_url, staging_dir),
+                        refresh=not use_cache
+                    )
+                else:
+                    audio_path = self._download_audio_file(normalized_url, working_dir)
             else:
                 video_id = hashlib.md5(str(uuid.uuid4()).encode()).hexdigest()
                 title = video_source.file_name or "Hochgeladenes Video"
@@ -52,6 +52,7 @@ from datetime import datetime
 import time
 
 import yt_dlp  # type: ignore
+from src.processors.ytdlp_info_extractor import extract_video_info
 from src.processors.ytdlp_youtube_opts import (
     apply_youtube_ytdlp_opts,
     classify_youtube_cookie_error,
@@ -69,6 +70,7 @@ from src.core.resource_tracking import ResourceCalculator
 from src.processors.audio_processor import AudioProcessor
 from src.processors.transformer_processor import TransformerProcessor
 from src.processors.cacheable_processor import CacheableProcessor
+from src.utils.media_store import get_media_store, media_key_for_url
 
 class YoutubeDLInfo(TypedDict, total=True):
     """Type helper für YouTube-DL Info Dictionary."""
@@ -219,11 +221,15 @@ class YoutubeProcessor(CacheableProcessor[YoutubeProcessingResult]):
                             error=e)
             raise ProcessingError(f"Initialisierungsfehler: {str(e)}")
 
-    def _extract_video_info(self, url: str) -> YoutubeDLInfo:
+    def _extract_video_info(self, url: str, use_cache: bool = True) -> YoutubeDLInfo:
         """Extrahiert Informationen aus einem YouTube-Video.
         
+        Nutzt den Video-Info-Cache (MongoDB, TTL) und einen wiederverwendeten
+        YoutubeDL pro Worker-Thread statt einer neuen Instanz pro Anfrage.
+        
         Args:
             url: URL des Videos
+            use_cache: Ob der Video-Info-Cache verwendet werden soll
             
         Returns:
             YoutubeDLInfo: Die extrahierten Video-Informationen
@@ -244,13 +250,10 @@ class YoutubeProcessor(CacheableProcessor[YoutubeProcessingResult]):
                 'youtube_include_dash_manifest': False
             }
             apply_youtube_ytdlp_opts(extract_opts_raw)
-            # yt-dlp._Params ist ein vollstaendiges TypedDict; unsere
-            # Teilmenge ist zur Laufzeit gültig, aber nicht zuweisbar.
-            with yt_dlp.YoutubeDL(cast(Any, extract_opts_raw)) as ydl:
-                info: YoutubeDLInfo = cast(YoutubeDLInfo, ydl.extract_info(url, download=False))  # type: ignore
-                if not info:
-                    raise ProcessingError("Keine Video-Informationen gefunden")
-                return info
+            info: YoutubeDLInfo = cast(YoutubeDLInfo, extract_video_info(url, extract_opts_raw, use_cache=use_cache))
+            if not info:
+                raise ProcessingError("Keine Video-Informationen gefunden")
+            return info
                 
         except Exception as e:
             self.logger.error("Fehler beim Extrahieren der Video-Informationen", error=e)
@@ -265,6 +268,21 @@ class YoutubeProcessor(CacheableProcessor[YoutubeProcessingResult]):
                 details={"error_code": 'EXTRACTION_ERROR'}
             )
 
+    def _download_audio(self, url: str, target_dir: Path) -> Path:
+        """Lädt die Tonspur im Exportformat nach target_dir und gibt den Dateipfad zurück.
+        
+        Raises:
+            ProcessingError: Wenn nach dem Download keine Audio-Datei vorliegt
+        """
+        download_opts = self.ydl_opts.copy()
+        download_opts['outtmpl'] = str(target_dir / "%(title)s.%(ext)s")
+        with yt_dlp.YoutubeDL(cast(Any, download_opts)) as ydl:
+            ydl.download([url])  # type: ignore
+        audio_files = list(target_dir.glob(f"*.{self.export_format}"))
+        if not audio_files:
+            raise ProcessingError("Keine Audio-Datei gefunden")
+        return audio_files[0]
+
     def create_process_dir(self, video_id: str) -> Path:
         """Erstellt ein Verarbeitungsverzeichnis für ein Video.
         
@@ -472,7 +490,7 @@ class YoutubeProcessor(CacheableProcessor[YoutubeProcessingResult]):
                     )
             
             # 2. Wenn kein Cache-Hit: Video-Informationen extrahieren
-            info = self._extract_video_info(url)
+            info = self._extract_video_info(url, use_cache=use_cache)
             
             # 3. Video-ID extrahieren (jetzt erst für die tatsächliche Verarbeitung)
             video_id = info['id']
@@ -483,20 +501,17 @@ class YoutubeProcessor(CacheableProcessor[YoutubeProcessingResult]):
             # 5. Verarbeitungsverzeichnis erstellen
             process_dir = self.create_process_dir(video_id)
             
-            # 6. Download-Optionen anpassen
-            download_opts = self.ydl_opts.copy()
-            output_path = str(process_dir / "%(title)s.%(ext)s")
-            download_opts['outtmpl'] = output_path
-            
-            # 7. Video herunterladen
-            with yt_dlp.YoutubeDL(cast(Any, download_opts)) as ydl:
-                ydl.download([url])  # type: ignore
-            
-            # 8. Audio-Datei finden
-            audio_files = list(process_dir.glob(f"*.{self.export_format}"))
-            if not audio_files:
-                raise ProcessingError("Keine Audio-Datei gefunden")
-            audio_file = audio_files[0]
+            # 6.-8. Audio herunterladen; mit Media-Store nur einmal pro Video
+            media_store = get_media_store()
+            if media_store is not None:
+                audio_file = media_store.checkout(
+                    key=media_key_for_url(url, f"audio.{self.export_format}"),
+                    dest_dir=process_dir,
+                    fetch=lambda staging_dir: self._download_audio(url, staging_dir),
+                    refresh=not use_cache
+                )
+            else:
+                audio_file = self._download_audio(url, process_dir)
             
             # 9. Metadaten erstellen
             metadata = YoutubeMetadata(
@@ -0,0 +1,140 @@
+"""
+Audio-only-Download für Video-URLs.
+
+Für reine Transkription wurde bisher der komplette Video-Container geladen
+und erst danach per ffmpeg in MP3 umgewandelt. Diese Hilfsfunktionen planen
+stattdessen den kleinsten Weg zur Tonspur:
+
+1. Bietet die Quelle ein reines Audio-Format an, lädt yt-dlp nur dieses
+   (`bestaudio`), die FFmpegExtractAudio-Nachbearbeitung bleibt gleich.
+2. Sonst bekommt ffmpeg die Stream-URL direkt als Eingabe. ffmpeg extrahiert
+   die Tonspur, während der Download läuft; es gibt keine Zwischendatei mit
+   dem vollständigen Video. (Bewusst URL statt stdin-Pipe: MP4-Dateien mit
+   `moov`-Atom am Ende lassen sich nur mit Range-Requests demuxen.)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+# Protokolle, die ffmpeg selbst streamen kann
+_FFMPEG_STREAMABLE_PROTOCOLS = {"http", "https", "m3u8", "m3u8_native"}
+
+# Progressive Downloads (eine Datei per HTTP); HLS-Playlists (m3u8) gehören nicht dazu
+_PROGRESSIVE_PROTOCOLS = {"http", "https"}
+
+
+@dataclass(frozen=True, slots=True)
+class AudioDownloadPlan:
+    """
+    Geplanter Weg zur Tonspur.
+
+    Attributes:
+        mode: 'audio_only' (yt-dlp lädt bestaudio) oder 'ffmpeg_stream'
+        format_id: gewähltes yt-dlp-Format
+        stream_url: Eingabe-URL für ffmpeg (nur 'ffmpeg_stream')
+        http_headers: HTTP-Header, die die Quelle für die Stream-URL verlangt
+        progressive: True, wenn die Stream-URL eine einzelne Datei per HTTP ist
+            (nicht HLS); nur dann setzt ffmpeg die Reconnect-Optionen
+    """
+
+    mode: str
+    format_id: Optional[str] = None
+    stream_url: Optional[str] = None
+    http_headers: Optional[Dict[str, str]] = None
+    progressive: bool = True
+
+
+def _has_audio(fmt: Mapping[str, Any]) -> bool:
+    acodec = fmt.get("acodec")
+    # Unbekannter acodec (None) bei progressiven Formaten: Tonspur wahrscheinlich vorhanden
+    return acodec != "none"
+
+
+def _is_audio_only(fmt: Mapping[str, Any]) -> bool:
+    return fmt.get("vcodec") == "none" and fmt.get("acodec") not in (None, "none")
+
+
+def _bitrate(fmt: Mapping[str, Any]) -> float:
+    """Gesamtbitrate in kbit/s; 0, wenn yt-dlp keine meldet."""
+    return float(fmt.get("tbr") or (fmt.get("abr") or 0) + (fmt.get("vbr") or 0) or 0)
+
+
+def _smallest_format(formats: List[Mapping[str, Any]]) -> Mapping[str, Any]:
+    """
+    Format mit der kleinsten Datenmenge.
+
+    Bitrate (kbit/s) und Dateigröße (Bytes) sind nicht vergleichbar: Gerankt
+    wird nach Bitrate; nur wenn kein Format eine Bitrate meldet, nach
+    Dateigröße.
+    """
+    with_bitrate = [f for f in formats if _bitrate(f) > 0]
+    if with_bitrate:
+        return min(with_bitrate, key=_bitrate)
+    return min(formats, key=lambda f: float(f.get("filesize") or f.get("filesize_approx") or float("inf")))
+
+
+def plan_audio_download(info: Mapping[str, Any]) -> Optional[AudioDownloadPlan]:
+    """
+    Wählt anhand der yt-dlp-Info den Weg zur Tonspur.
+
+    Returns:
+        AudioDownloadPlan oder None, wenn weder ein Audio-Format noch eine
+        streambare URL vorliegt (dann bleibt es beim regulären Download).
+    """
+    formats: List[Mapping[str, Any]] = [f for f in (info.get("formats") or []) if isinstance(f, Mapping)]
+    if not formats and info.get("url"):
+        # Einzelformat-Info (z.B. generischer Extraktor für direkte Dateilinks)
+        formats = [info]
+
+    audio_only = [f for f in formats if _is_audio_only(f)]
+    if audio_only:
+        best = max(audio_only, key=lambda f: float(f.get("abr") or f.get("tbr") or 0))
+        return AudioDownloadPlan(mode="audio_only", format_id=str(best.get("format_id") or "bestaudio"))
+
+    streamable = [
+        f for f in formats
+        if f.get("url") and _has_audio(f) and str(f.get("protocol") or "https") in _FFMPEG_STREAMABLE_PROTOCOLS
+    ]
+    if not streamable:
+        return None
+    # Kleinste Gesamtbitrate: ffmpeg verwirft das Bild, die Bytes müssen trotzdem übertragen werden
+    smallest = _smallest_format(streamable)
+    headers_raw = smallest.get("http_headers") or info.get("http_headers") or {}
+    headers = {str(k): str(v) for k, v in dict(headers_raw).items()}
+    return AudioDownloadPlan(
+        mode="ffmpeg_stream",
+        format_id=str(smallest.get("format_id") or ""),
+        stream_url=str(smallest["url"]),
+        http_headers=headers or None,
+        progressive=str(smallest.get("protocol") or "https") in _PROGRESSIVE_PROTOCOLS,
+    )
+
+
+def build_ffmpeg_stream_cmd(
+    stream_url: str,
+    output_path: Path,
+    http_headers: Optional[Mapping[str, str]] = None,
+    progressive: bool = True,
+) -> List[str]:
+    """
+    Baut den ffmpeg-Aufruf, der die Tonspur direkt aus einer Stream-URL als MP3 schreibt.
+
+    Die Reconnect-Optionen gelten nur für progressive HTTP-Eingaben; bei
+    HLS lädt ffmpeg die Segmente selbst nach.
+    """
+    cmd: List[str] = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error"]
+    if progressive:
+        # Abbrüche langer Konferenz-Streams überbrücken
+        cmd.extend(["-reconnect", "1", "-reconnect_streamed", "1", "-reconnect_delay_max", "5"])
+    if http_headers:
+        header_blob = "".join(f"{k}: {v}\r\n" for k, v in http_headers.items())
+        cmd.extend(["-headers", header_blob])
+    cmd.extend([
+        "-i", stream_url,
+        "-vn", "-acodec", "libmp3lame", "-q:a", "4",
+        str(output_path),
+    ])
+    return cmd
@@ -0,0 +1,158 @@
+"""
+Wiederverwendbare yt-dlp-Info-Extraktion mit MongoDB-Cache.
+
+Bisher baute jede Anfrage einen neuen `YoutubeDL` (bzw. startete einen
+`yt-dlp --dump-json`-Subprozess), auch wenn dasselbe Video kurz zuvor schon
+verarbeitet wurde. Dieses Modul bündelt zwei Maßnahmen:
+
+1. Ein langlebiger `YoutubeDL` pro Worker-Thread und Options-Satz.
+   YoutubeDL ist nicht thread-sicher, daher thread-lokal statt global.
+2. Ein Metadaten-Cache in MongoDB (`video_info_cache`), Schlüssel ist die
+   normalisierte Video-Kennung, Ablauf über TTL (`cache.video_info.ttl_hours`).
+
+Ist MongoDB nicht erreichbar, wird ohne Cache weitergearbeitet.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+import yt_dlp  # type: ignore
+
+from src.core.config import Config
+
+if TYPE_CHECKING:
+    from src.core.mongodb.video_info_repository import VideoInfoCacheRepository
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_TTL_HOURS: int = 24
+
+_thread_state = threading.local()
+_repo_lock = threading.Lock()
+_repo: Optional["VideoInfoCacheRepository"] = None
+_repo_unavailable: bool = False
+
+
+def _cache_settings() -> tuple[bool, int]:
+    """Liest (enabled, ttl_seconds) aus `cache.video_info`."""
+    cfg: Any = Config().get("cache.video_info", {}) or {}
+    enabled = bool(cfg.get("enabled", True)) if isinstance(cfg, dict) else True
+    ttl_hours = int(cfg.get("ttl_hours", _DEFAULT_TTL_HOURS)) if isinstance(cfg, dict) else _DEFAULT_TTL_HOURS
+    return enabled, ttl_hours * 3600
+
+
+def _get_repository() -> Optional["VideoInfoCacheRepository"]:
+    """Liefert das Cache-Repository oder None, wenn MongoDB nicht verfügbar ist."""
+    global _repo, _repo_unavailable
+    if _repo is not None or _repo_unavailable:
+        return _repo
+    with _repo_lock:
+        if _repo is None and not _repo_unavailable:
+            try:
+                from src.core.mongodb import get_video_info_cache_repository
+                _repo = get_video_info_cache_repository()
+            except Exception as e:
+                # Nur einmal melden; danach ohne Cache weiterarbeiten
+                _repo_unavailable = True
+                logger.warning(f"Video-Info-Cache nicht verfügbar, arbeite ohne Cache: {e}")
+    return _repo
+
+
+def _normalize_video_key(url: str) -> str:
+    """Verzögerter Import, um zirkuläre Importe (src.core.mongodb -> Prozessoren) zu vermeiden."""
+    from src.core.mongodb.video_info_repository import normalize_video_key
+    return normalize_video_key(url)
+
+
+def _slim_video_info(info: Dict[str, Any]) -> Dict[str, Any]:
+    """Verzögerter Import, siehe _normalize_video_key."""
+    from src.core.mongodb.video_info_repository import slim_video_info
+    return slim_video_info(info)
+
+
+def _opts_fingerprint(opts: Dict[str, Any]) -> str:
+    """Stabiler Schlüssel für einen Options-Satz (Werte wie Tuples via str)."""
+    return json.dumps(opts, sort_keys=True, default=str)
+
+
+def get_reusable_ydl(opts: Dict[str, Any]) -> Any:
+    """
+    Liefert einen langlebigen YoutubeDL für den aktuellen Thread und diese Optionen.
+
+    Die Instanz wird bewusst nicht per `with` geschlossen, damit Extraktor-Objekte,
+    Cookie-Jar und HTTP-Handler zwischen Aufrufen erhalten bleiben.
+    """
+    instances: Optional[Dict[str, Any]] = getattr(_thread_state, "instances", None)
+    if instances is None:
+        instances = {}
+        _thread_state.instances = instances
+    key = _opts_fingerprint(opts)
+    ydl = instances.get(key)
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL(dict(opts))
+        instances[key] = ydl
+    return ydl
+
+
+def lookup_video_info(url: str) -> Optional[Dict[str, Any]]:
+    """Liefert gecachte Metadaten für eine URL oder None."""
+    enabled, _ttl = _cache_settings()
+    if not enabled:
+        return None
+    repo = _get_repository()
+    if repo is None:
+        return None
+    return repo.get(_normalize_video_key(url))
+
+
+def store_video_info(url: str, info: Dict[str, Any]) -> Dict[str, Any]:
+    """Speichert (entschlackte) Metadaten für eine URL und gibt sie zurück."""
+    slim = _slim_video_info(info)
+    enabled, ttl_seconds = _cache_settings()
+    if enabled:
+        repo = _get_repository()
+        if repo is not None:
+            repo.put(_normalize_video_key(url), slim, ttl_seconds)
+    return slim
+
+
+def extract_video_info(
+    url: str,
+    opts: Dict[str, Any],
+    use_cache: bool = True,
+    ydl_factory: Callable[[Dict[str, Any]], Any] = get_reusable_ydl,
+) -> Dict[str, Any]:
+    """
+    Extrahiert Video-Metadaten über den Cache bzw. einen wiederverwendeten YoutubeDL.
+
+    Args:
+        url: Video-URL
+        opts: yt-dlp-Optionen für die Info-Extraktion
+        use_cache: Ob der MongoDB-Cache gelesen/geschrieben werden soll
+        ydl_factory: Liefert die YoutubeDL-Instanz (für Tests austauschbar)
+
+    Returns:
+        Dict[str, Any]: Sanitisierte Info ohne Stream-URLs und Format-Listen
+
+    Raises:
+        ValueError: Wenn yt-dlp keine Informationen liefert
+    """
+    if use_cache:
+        cached = lookup_video_info(url)
+        if cached:
+            logger.debug(f"Video-Info-Cache-Hit: {_normalize_video_key(url)}")
+            return cached
+
+    ydl = ydl_factory(opts)
+    raw_info: Any = ydl.extract_info(url, download=False)
+    if not raw_info:
+        raise ValueError("Keine Video-Informationen gefunden")
+    # sanitize_info macht die Info JSON/BSON-serialisierbar
+    info: Dict[str, Any] = ydl.sanitize_info(raw_info)
+    if use_cache:
+        return store_video_info(url, info)
+    return _slim_video_info(info)
@@ -192,82 +192,93 @@ class TestEventTypeForStatus(unittest.TestCase):
         self.assertEqual(event_type_for_status(JobStatus.FAILED), "error")
 
 
+def _job(job_id: str, status: JobStatus, updated_ms: int, **kwargs: object) -> Job:
+    job = Job(job_id=job_id, job_type="pdf", status=status, **kwargs)  # type: ignore[arg-type]
+    job.updated_at = datetime.fromtimestamp(updated_ms / 1000, UTC)
+    return job
+
+
+def _fake_hub(current: object, updates: list[object]) -> MagicMock:
+    """Hub-Mock: `current` als Anfangszustand, `updates` nacheinander aus sub.next()."""
+    hub = MagicMock()
+    hub.current.return_value = current
+    sub = hub.subscribe.return_value
+    sub.missing = False
+    sub.next.side_effect = updates
+    return hub
+
+
 class TestJobEventStream(unittest.TestCase):
-    """Tests fuer den SSE-Event-Stream-Generator (mit Mock-Repository)."""
+    """Tests fuer den SSE-Event-Stream-Generator (mit Mock-Hub)."""
 
-    @patch("src.api.sse.SecretaryJobRepository")
-    def test_stream_job_not_found(self, mock_repo_cls: MagicMock) -> None:
+    @patch("src.api.sse.get_job_event_hub")
+    def test_stream_job_not_found(self, mock_get_hub: MagicMock) -> None:
         """Stream sendet Error-Event wenn Job nicht existiert."""
         from src.api.sse import job_event_stream
 
-        mock_repo = mock_repo_cls.return_value
-        mock_repo.get_job.return_value = None
+        mock_get_hub.return_value = hub = _fake_hub(None, [])
 
         events = list(job_event_stream("nonexistent-job"))
         self.assertEqual(len(events), 1)
         self.assertIn("error", events[0])
         self.assertIn("nicht gefunden", events[0])
+        hub.unsubscribe.assert_called_once()
 
-    @patch("src.api.sse.SecretaryJobRepository")
-    def test_stream_completed_job_sends_one_event(self, mock_repo_cls: MagicMock) -> None:
+    @patch("src.api.sse.get_job_event_hub")
+    def test_stream_completed_job_sends_one_event(self, mock_get_hub: MagicMock) -> None:
         """Bereits abgeschlossener Job: Stream sendet 1 Event und schliesst."""
         from src.api.sse import job_event_stream
 
-        mock_repo = mock_repo_cls.return_value
-        completed_job = Job()
-        completed_job.job_id = "job-done"
-        completed_job.job_type = "pdf"
-        completed_job.status = JobStatus.COMPLETED
-        completed_job.results = JobResults(
-            structured_data={"data": {"extracted_text": "# Ergebnis"}}
+        completed_job = _job(
+            "job-done", JobStatus.COMPLETED, 1000,
+            results=JobResults(structured_data={"data": {"extracted_text": "# Ergebnis"}}),
         )
-        mock_repo.get_job.return_value = completed_job
+        mock_get_hub.return_value = _fake_hub(completed_job, [])
 
         events = list(job_event_stream("job-done"))
         self.assertEqual(len(events), 1)
         self.assertIn("completed", events[0])
         self.assertIn("Ergebnis", events[0])
+        self.assertIn("id: 1000", events[0])
 
-    @patch("src.api.sse.time")
-    @patch("src.api.sse.SecretaryJobRepository")
-    def test_stream_pending_to_completed(self, mock_repo_cls: MagicMock, mock_time: MagicMock) -> None:
+    @patch("src.api.sse.get_job_event_hub")
+    def test_stream_pending_to_completed(self, mock_get_hub: MagicMock) -> None:
         """Stream sendet Updates bei Statuswechsel pending -> processing -> completed."""
         from src.api.sse import job_event_stream
 
-        # Genuegend monotonic()-Aufrufe fuer: start_time, heartbeat_init,
-        # initialer check, loop-elapsed, heartbeat-check, loop-elapsed, heartbeat-check, finale Dauer
-        mock_time.monotonic.return_value = 5.0
-        mock_time.sleep = MagicMock()
-
-        pending_job = Job()
-        pending_job.job_id = "job-1"
-        pending_job.job_type = "pdf"
-        pending_job.status = JobStatus.PENDING
-
-        processing_job = Job()
-        processing_job.job_id = "job-1"
-        processing_job.job_type = "pdf"
-        processing_job.status = JobStatus.PROCESSING
-        processing_job.progress = JobProgress(step="extraction", percent=50)
-
-        completed_job = Job()
-        completed_job.job_id = "job-1"
-        completed_job.job_type = "pdf"
-        completed_job.status = JobStatus.COMPLETED
-        completed_job.results = JobResults(
-            structured_data={"data": {"extracted_text": "Fertig"}}
+        pending_job = _job("job-1", JobStatus.PENDING, 1000)
+        processing_job = _job("job-1", JobStatus.PROCESSING, 2000, progress=JobProgress(step="extraction", percent=50))
+        completed_job = _job(
+            "job-1", JobStatus.COMPLETED, 3000,
+            results=JobResults(structured_data={"data": {"extracted_text": "Fertig"}}),
         )
-
-        mock_repo = mock_repo_cls.return_value
-        mock_repo.get_job.side_effect = [pending_job, processing_job, completed_job]
+        # None = Timeout ohne Aenderung -> Heartbeat
+        mock_get_hub.return_value = _fake_hub(pending_job, [processing_job, None, completed_job])
 
         events = list(job_event_stream("job-1"))
 
-        # 3 Events: pending (initial), processing, completed
-        self.assertEqual(len(events), 3)
+        # 3 Events: pending (initial), processing, completed, dazwischen ein Heartbeat
+        self.assertEqual(len(events), 4)
         self.assertIn("pending", events[0])
+        self.assertIn("retry: ", events[0])
         self.assertIn("running", events[1])
-        self.assertIn("completed", events[2])
+        self.assertEqual(events[2], ": heartbeat\n\n")
+        self.assertIn("completed", events[3])
+
+    @patch("src.api.sse.get_job_event_hub")
+    def test_stream_resume_skips_state_client_already_has(self, mock_get_hub: MagicMock) -> None:
+        """Reconnect mit Last-Event-ID: unveraenderter Zustand wird nicht erneut gesendet."""
+        from src.api.sse import job_event_stream
+
+        processing_job = _job("job-1", JobStatus.PROCESSING, 2000, progress=JobProgress(step="x", percent=50))
+        completed_job = _job("job-1", JobStatus.COMPLETED, 3000)
+        mock_get_hub.return_value = _fake_hub(processing_job, [completed_job])
+
+        events = list(job_event_stream("job-1", last_event_id="2000"))
+
+        self.assertEqual(len(events), 2)
+        self.assertTrue(events[0].startswith("retry: "))
+        self.assertIn("id: 3000", events[1])
 
 
 if __name__ == "__main__":
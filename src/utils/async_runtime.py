@@ -0,0 +1,196 @@
+"""
+@fileoverview Async Runtime - Persistent per-thread event loops for synchronous callers
+
+@description
+Ersatz für `asyncio.run()` in synchronem Code, vor allem in den Flask-RESTX-
+Routen. `asyncio.run()` erzeugt pro Aufruf einen neuen Event-Loop und schließt
+ihn danach wieder; an einen Loop gebundene Ressourcen (async HTTP-Clients,
+Connection-Pools) überleben dadurch keinen Request.
+
+`run_async()` führt die Coroutine stattdessen auf einem langlebigen Loop des
+aufrufenden Threads aus. Die Coroutine läuft weiterhin im Thread des Requests:
+Flask-Kontext, thread-lokale Performance-Tracker und blockierende Aufrufe
+innerhalb von `async def` verhalten sich wie bei `asyncio.run()`. Bei einem
+Server mit wiederverwendeten Threads (z.B. gunicorn `gthread`) bleibt jeder
+Loop über viele Requests bestehen; `loop_resource()` hält pro Loop Objekte wie
+HTTP-Clients vor. Der Loop wird geschlossen, wenn der Thread endet; vorher
+bricht `close_loop()` offene Tasks ab, schließt die Ressourcen aus
+`loop_resource()` (`aclose()`/`close()`) und beendet Async-Generatoren.
+
+Unterschied zu `asyncio.run()`: Nicht abgewartete Hintergrund-Tasks werden am
+Ende eines Aufrufs nicht abgebrochen, sondern laufen beim nächsten Aufruf im
+selben Thread weiter.
+
+@module utils.async_runtime
+
+@exports
+- run_async(): T - Führt eine Coroutine auf dem Event-Loop des aktuellen Threads aus
+- loop_resource(): T - Pro Event-Loop einmal erzeugte Ressource (z.B. async HTTP-Client)
+- close_loop(): None - Schließt einen Event-Loop samt Tasks und Loop-Ressourcen
+- close_thread_loop(): None - Schließt den Loop des aktuellen Threads (Ende kurzlebiger Threads)
+
+@usedIn
+- src.api.routes.*: Ausführung der async Prozessoren aus synchronen Routen
+- src.core.llm.provider_manager: async HTTP-Clients pro Loop und Provider
+- src.core.mongodb.secretary_worker_manager, worker_manager: ein Loop pro Job-Thread
+- src.core.processing.process_pool: Loop eines Pool-Prozesses
+
+@dependencies
+- Standard: asyncio, inspect, logging, threading, weakref
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+import weakref
+from typing import Any, Callable, Coroutine, Dict, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class _ThreadLoop:
+    """Hält den Event-Loop eines Threads; schließt ihn, wenn der Thread endet."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+
+    def __del__(self) -> None:
+        try:
+            close_loop(self.loop)
+        except Exception:
+            # __del__ läuft im Thread, der den Holder zuletzt freigibt; dort
+            # kann bereits ein anderer Loop laufen. Dann nur noch schließen.
+            if not self.loop.is_closed() and not self.loop.is_running():
+                self.loop.close()
+
+
+_local = threading.local()
+_resources: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+_resources_lock = threading.Lock()
+
+
+async def _close_resources(resources: Dict[str, Any]) -> None:
+    # In umgekehrter Reihenfolge: SDK-Clients vor dem HTTP-Client, auf dem sie aufsetzen
+    for key, resource in reversed(list(resources.items())):
+        closer = getattr(resource, "aclose", None) or getattr(resource, "close", None)
+        if closer is None:
+            continue
+        try:
+            result = closer()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.warning(f"Loop-Ressource {key} konnte nicht geschlossen werden: {e}")
+
+
+def close_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Schließt einen Event-Loop geordnet.
+
+    Bricht offene Tasks ab, schließt die per `loop_resource()` registrierten
+    Ressourcen, beendet Async-Generatoren und schließt dann den Loop. Nicht
+    aus einem laufenden Loop aufrufen.
+
+    Args:
+        loop: Zu schließender, nicht laufender Event-Loop
+    """
+    if loop.is_closed():
+        return
+    if loop.is_running():
+        raise RuntimeError("close_loop() kann einen laufenden Event-Loop nicht schließen")
+    try:
+        pending = [task for task in asyncio.all_tasks(loop) if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        with _resources_lock:
+            resources = _resources.pop(loop, {})
+        if resources:
+            loop.run_until_complete(_close_resources(resources))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+
+
+def _thread_loop() -> asyncio.AbstractEventLoop:
+    holder: Optional[_ThreadLoop] = getattr(_local, "holder", None)
+    if holder is None or holder.loop.is_closed():
+        holder = _ThreadLoop()
+        _local.holder = holder
+    return holder.loop
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Führt eine Coroutine auf dem langlebigen Event-Loop des aktuellen Threads aus.
+
+    Args:
+        coro: Auszuführende Coroutine
+
+    Returns:
+        T: Ergebnis der Coroutine
+
+    Raises:
+        RuntimeError: Wenn im aktuellen Thread bereits ein Event-Loop läuft
+            (wie asyncio.run(); dort stattdessen `await` verwenden)
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError("run_async() kann nicht aus einem laufenden Event-Loop aufgerufen werden")
+    loop = _thread_loop()
+    asyncio.set_event_loop(loop)
+    return loop.run_until_complete(coro)
+
+
+def close_thread_loop() -> None:
+    """
+    Schließt den Event-Loop des aktuellen Threads sofort (siehe `close_loop`).
+
+    Für Threads, die nur einen Job ausführen: Ressourcen werden beim Ende des
+    Jobs freigegeben statt erst bei der Garbage Collection des Threads.
+    """
+    holder: Optional[_ThreadLoop] = getattr(_local, "holder", None)
+    if holder is None:
+        return
+    _local.holder = None
+    asyncio.set_event_loop(None)
+    close_loop(holder.loop)
+
+
+def loop_resource(key: str, factory: Callable[[], T]) -> T:
+    """
+    Liefert eine an den laufenden Event-Loop gebundene Ressource.
+
+    Die Ressource wird pro Loop einmal mit `factory()` erzeugt und bei
+    weiteren Aufrufen auf demselben Loop wiederverwendet. Nur innerhalb einer
+    Coroutine aufrufen.
+
+    Args:
+        key: Name der Ressource (pro Loop eindeutig)
+        factory: Erzeugt die Ressource, z.B. einen async HTTP-Client
+
+    Returns:
+        T: Die Ressource des aktuellen Loops
+    """
+    loop = asyncio.get_running_loop()
+    with _resources_lock:
+        per_loop = _resources.setdefault(loop, {})
+        if key in per_loop:
+            cached: T = per_loop[key]
+            return cached
+    # Factory außerhalb der Sperre: sie darf selbst loop_resource() aufrufen
+    # (z.B. SDK-Client auf gemeinsamem HTTP-Client). Alle Aufrufe für einen
+    # Loop kommen aus dessen Thread.
+    resource = factory()
+    with _resources_lock:
+        stored: T = per_loop.setdefault(key, resource)
+        return stored
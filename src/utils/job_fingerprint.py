@@ -0,0 +1,102 @@
+"""
+@fileoverview Job Fingerprint - Content hash of a job's input and normalized parameters
+
+@description
+Berechnet einen stabilen Fingerabdruck für Secretary-Jobs, damit dieselbe
+Anfrage (gleiches Dokument bzw. gleiche URL, gleiche Parameter) nicht mehrfach
+verarbeitet wird. Eingänge:
+
+- Ein bereits von der Route berechneter `file_hash` (Upload-Routen hashen
+  beim Speichern), sonst der Inhalt der Eingabedatei (`filename`) als
+  SHA-256. Upload-Pfade sind pro Anfrage zufällig und fließen nicht ein.
+- Alle übrigen Parameter in normalisierter Form (sortierte Keys, `extra`
+  flach eingemischt), ohne zustellungsbezogene Felder (`webhook`).
+- `job_type` und `user_id`: gleiche Eingaben verschiedener Nutzer bleiben
+  getrennte Jobs.
+
+Jobs mit `force_refresh` erhalten keinen Fingerabdruck, weil der Client
+ausdrücklich eine neue Verarbeitung verlangt. Jobs ohne `user_id` ebenfalls
+nicht: anonyme Anfragen verschiedener Clients würden sonst zusammengelegt.
+
+@module utils.job_fingerprint
+
+@exports
+- compute_job_fingerprint(): Optional[str] - Fingerabdruck eines Jobs oder None
+- hash_file(): str - SHA-256 einer Datei (gestreamt)
+
+@usedIn
+- src.core.mongodb.secretary_repository: Duplikaterkennung in create_job
+
+@dependencies
+- Standard: hashlib, json
+- Internal: src.core.models.job_models - Job
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+from src.core.models.job_models import Job
+
+
+# Felder, die nur die Zustellung betreffen, nicht das Ergebnis
+_DELIVERY_KEYS = frozenset({"webhook"})
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: str) -> str:
+    """Berechnet den SHA-256 einer Datei in Blöcken von 1 MiB."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compute_job_fingerprint(job: Job) -> Optional[str]:
+    """
+    Berechnet den Fingerabdruck eines Jobs.
+
+    Args:
+        job: Noch nicht gespeicherter Job
+
+    Returns:
+        Optional[str]: Hex-Digest oder None (ohne user_id, force_refresh, Datei nicht lesbar)
+    """
+    params = job.parameters
+    if params.force_refresh or not job.user_id:
+        return None
+    normalized: Dict[str, Any] = {
+        k: v for k, v in params.to_dict().items() if k not in _DELIVERY_KEYS and k != "extra"
+    }
+    # extra flach einmischen: dieselben Felder landen je nach Route mal oben, mal in extra
+    for k, v in (params.extra or {}).items():
+        if k not in _DELIVERY_KEYS:
+            normalized.setdefault(k, v)
+
+    filename = normalized.pop("filename", None)
+    # Hash aus dem Upload übernehmen, statt die Datei erneut zu lesen
+    content_hash = params.file_hash or normalized.get("file_hash")
+    normalized.pop("file_hash", None)
+    if content_hash:
+        content_hash = f"hash:{content_hash}"
+    elif filename:
+        if os.path.isfile(filename):
+            try:
+                content_hash = hash_file(filename)
+            except OSError:
+                return None
+        else:
+            # Kein lokaler Pfad (z.B. URL oder Name einer Remote-Datei): der Wert selbst ist die Eingabe
+            content_hash = f"name:{filename}"
+
+    document = {
+        "job_type": job.job_type,
+        "user_id": job.user_id,
+        "input": content_hash,
+        "parameters": normalized,
+    }
+    encoded = json.dumps(document, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
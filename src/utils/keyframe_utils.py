@@ -0,0 +1,155 @@
+"""
+Keyframe-Auswahl für die Frame-Extraktion aus Videos.
+
+Foliengestützte Vorträge liefern bei fester Abtastrate hunderte fast
+identische Frames, für die OCR und Bildanalyse später unnötig bezahlt werden.
+Der Keyframe-Modus kombiniert deshalb zwei Stufen:
+
+1. ffmpeg wählt nur Frames mit Szenenwechsel aus (`select='gt(scene,x)'`),
+   der `showinfo`-Filter liefert die zugehörigen Zeitstempel.
+2. Ein Differenz-Hash (dHash, NumPy) verwirft Kandidaten, deren
+   Hamming-Distanz zum zuletzt behaltenen Frame unter einer Schwelle liegt.
+
+Jeder behaltene Frame steht für eine Zeitspanne `[start_s, end_s)`, die bis
+zum nächsten behaltenen Frame (bzw. bis zum Videoende) reicht.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+from PIL import Image
+
+
+# showinfo schreibt pro Frame eine Zeile mit "pts_time:<sekunden>" nach stderr
+_SHOWINFO_PTS_RE = re.compile(r"Parsed_showinfo.*?pts_time:\s*(-?[0-9]+(?:\.[0-9]+)?)")
+
+
+@dataclass(frozen=True, slots=True)
+class KeyframeCandidate:
+    """Von ffmpeg ausgewählter Frame (vor der Duplikat-Filterung)."""
+
+    file_path: Path
+    timestamp_s: float
+
+
+@dataclass(frozen=True, slots=True)
+class Keyframe:
+    """
+    Behaltener Keyframe inkl. repräsentierter Zeitspanne.
+
+    Attributes:
+        file_path: Pfad zur Bilddatei
+        start_s: Beginn der Zeitspanne (Zeitstempel des Frames)
+        end_s: Ende der Zeitspanne (Start des nächsten Keyframes bzw. Videoende)
+        frame_hash: dHash als Hex-String
+        merged_count: Anzahl der Kandidaten, die dieser Frame vertritt (inkl. sich selbst)
+    """
+
+    file_path: Path
+    start_s: float
+    end_s: float
+    frame_hash: str
+    merged_count: int = 1
+
+
+def build_keyframe_filter(scene_threshold: float, width: Optional[int] = None, height: Optional[int] = None) -> str:
+    """
+    Baut die ffmpeg-Filterkette für den Keyframe-Modus.
+
+    Der erste Frame wird immer ausgewählt, damit der Videobeginn abgedeckt ist.
+    Die Kommas im select-Ausdruck sind durch einfache Anführungszeichen geschützt.
+    """
+    if not (0.0 < scene_threshold < 1.0):
+        raise ValueError("scene_threshold muss in (0.0, 1.0) liegen")
+    filters: List[str] = [
+        f"select='eq(n,0)+gt(scene,{scene_threshold:.3f})'",
+        "showinfo",
+    ]
+    if width or height:
+        w = width if width else -1
+        h = height if height else -1
+        filters.append(f"scale={w}:{h}:flags=lanczos")
+    return ",".join(filters)
+
+
+def parse_showinfo_timestamps(stderr: str) -> List[float]:
+    """Liest die pts_time-Werte aus der showinfo-Ausgabe von ffmpeg (in Ausgabereihenfolge)."""
+    return [max(0.0, float(m.group(1))) for m in _SHOWINFO_PTS_RE.finditer(stderr or "")]
+
+
+def compute_dhash(image_path: Path, hash_size: int = 8) -> int:
+    """
+    Berechnet den Differenz-Hash (dHash) eines Bildes.
+
+    Das Bild wird auf (hash_size + 1) x hash_size Graustufen verkleinert;
+    jedes Bit sagt, ob ein Pixel heller ist als sein rechter Nachbar.
+    """
+    with Image.open(image_path) as img:
+        small = img.convert("L").resize((hash_size + 1, hash_size), Image.Resampling.LANCZOS)
+        pixels = np.asarray(small, dtype=np.int16)
+    diff = (pixels[:, 1:] > pixels[:, :-1]).flatten()
+    packed = np.packbits(diff.astype(np.uint8))
+    return int.from_bytes(packed.tobytes(), byteorder="big")
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Anzahl unterschiedlicher Bits zweier Hashes."""
+    return bin(a ^ b).count("1")
+
+
+def deduplicate_keyframes(
+    candidates: Sequence[KeyframeCandidate],
+    max_distance: int,
+    duration_s: float = 0.0,
+    hash_fn: Callable[[Path], int] = compute_dhash,
+) -> List[Keyframe]:
+    """
+    Verwirft Kandidaten, die dem zuletzt behaltenen Frame zu ähnlich sind.
+
+    Verglichen wird bewusst nur mit dem Vorgänger: Folien wiederholen sich in
+    Vorträgen selten direkt, aber kehrt ein Sprecher zu einer früheren Folie
+    zurück, soll diese mit neuem Zeitstempel erneut erscheinen.
+
+    Args:
+        candidates: Kandidaten in zeitlicher Reihenfolge
+        max_distance: Hamming-Distanz, bis zu der zwei Frames als Duplikat gelten
+        duration_s: Videodauer; 0 bedeutet unbekannt
+        hash_fn: Hash-Funktion (für Tests austauschbar)
+
+    Returns:
+        List[Keyframe]: Behaltene Frames mit lückenlosen Zeitspannen
+    """
+    if max_distance < 0:
+        raise ValueError("max_distance muss >= 0 sein")
+
+    ordered = sorted(candidates, key=lambda c: c.timestamp_s)
+    kept: List[KeyframeCandidate] = []
+    kept_hashes: List[int] = []
+    merged: List[int] = []
+    for cand in ordered:
+        cand_hash = hash_fn(cand.file_path)
+        if kept_hashes and hamming_distance(kept_hashes[-1], cand_hash) <= max_distance:
+            merged[-1] += 1
+            continue
+        kept.append(cand)
+        kept_hashes.append(cand_hash)
+        merged.append(1)
+
+    last_ts = ordered[-1].timestamp_s if ordered else 0.0
+    video_end = max(float(duration_s), last_ts)
+    result: List[Keyframe] = []
+    for idx, cand in enumerate(kept):
+        end_s = kept[idx + 1].timestamp_s if idx + 1 < len(kept) else video_end
+        result.append(Keyframe(
+            file_path=cand.file_path,
+            start_s=cand.timestamp_s,
+            end_s=end_s,
+            frame_hash=f"{kept_hashes[idx]:016x}",
+            merged_count=merged[idx],
+        ))
+    return result
@@ -0,0 +1,371 @@
+"""
+@fileoverview Media Store - Shared, deduplicated store for downloaded media files
+
+@description
+Gemeinsamer Ablageort für heruntergeladene Medien (Video-, Audio-Dateien).
+Bisher luden VideoProcessor, YoutubeProcessor und AudioProcessor entfernte
+Medien jeweils in ihr eigenes Arbeitsverzeichnis. Referenzierte ein Session-
+Batch dieselbe Aufzeichnung oder wurde ein Video mit anderem Template erneut
+verarbeitet, wurden dieselben Bytes erneut geholt.
+
+Aufbau unter `root_dir`:
+- objects/<sha256[:2]>/<sha256><suffix>: Inhalte, adressiert über den SHA-256
+- keys/<sha1(key)>.json: Zuordnung Schlüssel -> Inhalt (+ ursprünglicher Dateiname)
+- staging/: temporäre Download-Verzeichnisse (gleiches Dateisystem für atomares rename)
+- locks/: Lock-Dateien pro Schlüssel (prozessübergreifend, per flock/msvcrt)
+
+Features:
+- Schlüssel = kanonische URL bzw. Video-ID plus Variante (z.B. "audio.mp3")
+- Inhaltliche Deduplizierung über den Content-Hash
+- Pro Schlüssel genau ein Download; parallele Anfragen warten darauf. Das
+  Lock hält das Betriebssystem (fcntl.flock, unter Windows msvcrt.locking):
+  Stirbt der ladende Prozess, wird es sofort frei, auch bei langen Downloads
+- Speicherbudget mit LRU-Verdrängung (mtime wird bei jedem Treffer aktualisiert)
+- Auschecken per Hardlink, Reflink (Linux, FICLONE) oder Kopie als Fallback
+
+Hinweis: Ausgecheckte Hardlinks teilen sich den Inode mit dem Store-Objekt.
+Konsumenten dürfen die Datei löschen, aber nicht in-place verändern.
+
+@module utils.media_store
+
+@exports
+- MediaStore: Class - Store mit Locks, Budget und Checkout
+- get_media_store(): Optional[MediaStore] - Singleton gemäß `cache.media_store`
+- media_key_for_url(): str - Store-Schlüssel aus URL und Variante
+
+@usedIn
+- src.processors.video_processor: Audio- und Video-Downloads
+- src.processors.youtube_processor: Audio-Downloads
+- src.processors.audio_processor: Audio-Downloads per URL
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.core.config import Config
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+logger = logging.getLogger(__name__)
+
+# ioctl-Code für Reflinks (Btrfs/XFS) unter Linux
+_FICLONE: int = 0x40049409
+_HASH_CHUNK_SIZE: int = 1024 * 1024
+
+
+def media_key_for_url(url: str, variant: str) -> str:
+    """
+    Bildet den Store-Schlüssel aus kanonischer URL bzw. Video-ID und Variante.
+
+    Die Variante unterscheidet verschiedene Artefakte derselben Quelle
+    (z.B. extrahiertes MP3 vs. vollständiges Video).
+    """
+    # Verzögerter Import, um zirkuläre Importe (src.core.mongodb -> Prozessoren) zu vermeiden
+    from src.core.mongodb.video_info_repository import normalize_video_key
+    return f"{normalize_video_key(url)}|{variant}"
+
+
+def _file_sha256(path: Path) -> str:
+    """Berechnet den SHA-256 einer Datei blockweise."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _try_reflink(src: Path, dest: Path) -> bool:
+    """Versucht einen Copy-on-Write-Klon (nur Linux, nur unterstützte Dateisysteme)."""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        import fcntl
+        with open(src, "rb") as s, open(dest, "wb") as d:
+            fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+        return True
+    except (OSError, ImportError):
+        try:
+            dest.unlink()
+        except OSError:
+            pass
+        return False
+
+
+class MediaStore:
+    """
+    Gemeinsamer, deduplizierter Speicher für heruntergeladene Medien.
+    """
+
+    def __init__(self, root_dir: Path, max_size_bytes: int) -> None:
+        """
+        Args:
+            root_dir: Wurzelverzeichnis des Stores
+            max_size_bytes: Speicherbudget; darüber werden die ältesten Objekte verdrängt
+        """
+        self.root_dir = Path(root_dir)
+        self.max_size_bytes = int(max_size_bytes)
+        self.objects_dir = self.root_dir / "objects"
+        self.keys_dir = self.root_dir / "keys"
+        self.staging_dir = self.root_dir / "staging"
+        self.locks_dir = self.root_dir / "locks"
+        for d in (self.objects_dir, self.keys_dir, self.staging_dir, self.locks_dir):
+            d.mkdir(parents=True, exist_ok=True)
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._key_locks_guard = threading.Lock()
+        self._evict_lock = threading.Lock()
+
+    # --- Schlüssel-Index -------------------------------------------------
+
+    @staticmethod
+    def _key_id(key: str) -> str:
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.keys_dir / f"{self._key_id(key)}.json"
+
+    def _object_path(self, sha256: str, suffix: str) -> Path:
+        return self.objects_dir / sha256[:2] / f"{sha256}{suffix}"
+
+    def _read_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._entry_path(key), "r", encoding="utf-8") as f:
+                data: Any = json.load(f)
+            return data if isinstance(data, dict) else None
+        except (OSError, ValueError):
+            return None
+
+    def _write_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        target = self._entry_path(key)
+        tmp = target.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, target)
+
+    def lookup(self, key: str) -> Optional[Path]:
+        """Liefert das Store-Objekt zum Schlüssel (und markiert es als benutzt) oder None."""
+        entry = self._read_entry(key)
+        if not entry:
+            return None
+        obj = self._object_path(str(entry.get("sha256", "")), str(entry.get("suffix", "")))
+        try:
+            # LRU: mtime als "zuletzt benutzt"
+            os.utime(obj, None)
+        except OSError:
+            # Objekt wurde verdrängt -> Index-Eintrag ist veraltet
+            try:
+                self._entry_path(key).unlink()
+            except OSError:
+                pass
+            return None
+        return obj
+
+    # --- Locks -------------------------------------------------------------
+
+    @contextmanager
+    def _lock_key(self, key: str) -> Iterator[None]:
+        """Thread- und prozessübergreifendes Lock pro Schlüssel."""
+        kid = self._key_id(key)
+        with self._key_locks_guard:
+            thread_lock = self._key_locks.setdefault(kid, threading.Lock())
+        with thread_lock:
+            fd = self._acquire_file_lock(self.locks_dir / f"{kid}.lock")
+            try:
+                yield
+            finally:
+                self._release_file_lock(fd)
+
+    @staticmethod
+    def _acquire_file_lock(lock_path: Path) -> int:
+        """
+        Wartet auf das exklusive Betriebssystem-Lock der Lock-Datei.
+
+        Die Datei bleibt liegen: Würde sie beim Freigeben gelöscht, könnte ein
+        wartender Prozess das Lock auf dem alten Inode erhalten, während ein
+        neuer die neu angelegte Datei sperrt.
+        """
+        fd = os.open(str(lock_path), os.O_CREAT | os.O_RDWR)
+        try:
+            if sys.platform == "win32":
+                while True:
+                    try:
+                        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        # LK_LOCK gibt nach ca. 10 s auf; weiter warten
+                        continue
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+        except BaseException:
+            os.close(fd)
+            raise
+        return fd
+
+    @staticmethod
+    def _release_file_lock(fd: int) -> None:
+        try:
+            if sys.platform == "win32":
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    # --- Ablage / Checkout ---------------------------------------------------
+
+    def _ingest(self, key: str, fetch: Callable[[Path], Path]) -> Path:
+        """Führt den Download in einem Staging-Verzeichnis aus und übernimmt das Ergebnis."""
+        staging = Path(tempfile.mkdtemp(dir=str(self.staging_dir)))
+        try:
+            downloaded = Path(fetch(staging))
+            if not downloaded.is_file():
+                raise FileNotFoundError(f"Download lieferte keine Datei: {downloaded}")
+            sha256 = _file_sha256(downloaded)
+            suffix = downloaded.suffix.lower()
+            obj = self._object_path(sha256, suffix)
+            obj.parent.mkdir(parents=True, exist_ok=True)
+            if obj.exists():
+                # Gleicher Inhalt unter anderem Schlüssel bereits vorhanden
+                os.utime(obj, None)
+            else:
+                os.replace(downloaded, obj)
+            size = obj.stat().st_size
+            self._write_entry(key, {
+                "key": key,
+                "sha256": sha256,
+                "suffix": suffix,
+                "filename": downloaded.name,
+                "size": size,
+                "created_at": time.time(),
+            })
+            logger.info(f"Media-Store: {key} abgelegt ({size} Bytes, sha256={sha256[:12]})")
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        self._enforce_budget(keep=obj)
+        return obj
+
+    def checkout(
+        self,
+        key: str,
+        dest_dir: Path,
+        fetch: Callable[[Path], Path],
+        refresh: bool = False,
+    ) -> Path:
+        """
+        Stellt die Datei zum Schlüssel im Arbeitsverzeichnis bereit.
+
+        Args:
+            key: Store-Schlüssel (siehe media_key_for_url)
+            dest_dir: Arbeitsverzeichnis des Aufrufers
+            fetch: Lädt die Datei in das übergebene Verzeichnis und gibt ihren Pfad zurück
+            refresh: Vorhandenen Eintrag ignorieren und neu laden
+
+        Returns:
+            Path: Pfad der Datei im Arbeitsverzeichnis (ursprünglicher Dateiname)
+        """
+        for _attempt in range(2):
+            obj = None if refresh else self.lookup(key)
+            if obj is None:
+                with self._lock_key(key):
+                    # Ein parallel wartender Aufruf hat den Download evtl. bereits erledigt
+                    obj = None if refresh else self.lookup(key)
+                    if obj is None:
+                        obj = self._ingest(key, fetch)
+                        refresh = False
+            entry = self._read_entry(key) or {}
+            filename = str(entry.get("filename") or obj.name)
+            try:
+                return self._link_into(obj, Path(dest_dir) / filename)
+            except FileNotFoundError:
+                # Zwischen lookup und Link verdrängt -> einmal neu laden
+                refresh = True
+        raise FileNotFoundError(f"Media-Store-Objekt für {key} nicht verfügbar")
+
+    @staticmethod
+    def _link_into(src: Path, dest: Path) -> Path:
+        """Hardlink, sonst Reflink, sonst Kopie."""
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if dest.exists():
+            dest.unlink()
+        if not src.exists():
+            raise FileNotFoundError(str(src))
+        try:
+            os.link(src, dest)
+            return dest
+        except OSError:
+            pass
+        if _try_reflink(src, dest):
+            return dest
+        shutil.copy2(src, dest)
+        return dest
+
+    # --- Budget ------------------------------------------------------------
+
+    def _list_objects(self) -> List[Tuple[float, int, Path]]:
+        items: List[Tuple[float, int, Path]] = []
+        for path in self.objects_dir.glob("*/*"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            items.append((st.st_mtime, st.st_size, path))
+        return items
+
+    def total_size(self) -> int:
+        """Aktuelle Größe aller Store-Objekte in Bytes."""
+        return sum(size for _mtime, size, _path in self._list_objects())
+
+    def _enforce_budget(self, keep: Optional[Path] = None) -> None:
+        """Verdrängt die am längsten unbenutzten Objekte, bis das Budget eingehalten ist."""
+        if self.max_size_bytes <= 0:
+            return
+        with self._evict_lock:
+            items = sorted(self._list_objects())
+            total = sum(size for _mtime, size, _path in items)
+            for _mtime, size, path in items:
+                if total <= self.max_size_bytes:
+                    break
+                if keep is not None and path == keep:
+                    continue
+                try:
+                    path.unlink()
+                    total -= size
+                    logger.info(f"Media-Store: {path.name} verdrängt ({size} Bytes)")
+                except OSError:
+                    pass
+
+
+_media_store: Optional[MediaStore] = None
+_media_store_lock = threading.Lock()
+
+
+def get_media_store() -> Optional[MediaStore]:
+    """Singleton-Zugriff, nur wenn `cache.media_store.enabled` True ist."""
+    global _media_store
+    cfg: Any = Config().get("cache.media_store", {}) or {}
+    if not isinstance(cfg, dict) or not cfg.get("enabled", False):
+        return None
+    if _media_store is None:
+        with _media_store_lock:
+            if _media_store is None:
+                max_size_gb = float(cfg.get("max_size_gb", 20))
+                _media_store = MediaStore(
+                    root_dir=Path(str(cfg.get("dir", "./cache/media_store"))),
+                    max_size_bytes=int(max_size_gb * 1024 ** 3),
+                )
+    return _media_store
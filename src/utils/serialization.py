@@ -0,0 +1,169 @@
+"""
+@fileoverview Serialization - Fast JSON encoding for API responses, SSE and job documents
+
+@description
+Zentrale JSON-Serialisierung auf Basis von orjson. orjson kodiert datetime
+(ISO 8601 wie `isoformat()`), Enums und UUIDs nativ und liefert
+direkt UTF-8-Bytes. Weitere Typen aus dem Projekt übernimmt `_default`:
+Objekte mit `to_dict()` (auch Dataclasses wie Job), übrige Dataclasses,
+ObjectId, Path, Decimal und Mengen.
+
+Eingesetzt in:
+- Flask-RESTX-Antworten (`output_json`) und Flask `jsonify` (`FastJSONProvider`):
+  Routen können Dicts mit datetime-Werten direkt zurückgeben, ohne vorheriges
+  `json.loads(json.dumps(...))`.
+- SSE-Events (`format_sse`).
+- Größenmessung großer Ergebnisfelder (`json_size`).
+
+Ist orjson nicht installiert, wird mit der Standardbibliothek und demselben
+`_default` serialisiert (gleiches Ergebnis, langsamer).
+
+Nicht umgestellt sind Cache-Schlüssel und Fingerprints (`json.dumps(...,
+sort_keys=True)`): deren exakte Bytes müssen stabil bleiben.
+
+@module utils.serialization
+
+@exports
+- dumps(): bytes - JSON als UTF-8-Bytes
+- dumps_str(): str - JSON als String
+- loads(): Any - JSON parsen
+- to_jsonable(): Any - Nur JSON-Typen (datetime -> str, Dataclass -> dict, ...)
+- json_size(): int - Länge der JSON-Kodierung in Bytes
+- dataclass_to_dict(): Dict - asdict() ohne tiefe Kopie
+- output_json(): Response - Flask-RESTX-Representation für application/json
+- FastJSONProvider: Class - Flask JSON-Provider (app.json)
+
+@usedIn
+- src.api.routes: api.representation('application/json')
+- src.dashboard.app, src.api: app.json
+- src.api.sse: format_sse
+- src.api.routes.secretary_job_routes, story_routes: Antworten
+- src.core.models.job_models: to_dict() der Teil-Dataclasses
+
+@dependencies
+- Optional: orjson - Schnelle JSON-Kodierung (Fallback: json)
+- External: flask - Response, DefaultJSONProvider
+"""
+
+import dataclasses
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import PurePath
+from typing import Any, Dict, Optional
+
+from flask import current_app, make_response
+from flask.json.provider import DefaultJSONProvider
+from flask.wrappers import Response
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson nicht installiert
+    _HAS_ORJSON = False
+
+# Nicht-String-Schlüssel (z.B. Seitennummern) wie json.dumps als String kodieren.
+# Dataclasses laufen über _default, damit eigene to_dict()-Formate gelten.
+_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS) if _HAS_ORJSON else 0
+
+
+def _default(obj: Any) -> Any:
+    """Kodiert Typen, die orjson bzw. json nicht selbst kennen."""
+    to_dict = getattr(obj, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    if isinstance(obj, (datetime, date)):
+        # Nur im Fallback ohne orjson
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclass_to_dict(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, PurePath):
+        return obj.as_posix()
+    if type(obj).__name__ == "ObjectId":
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialisiert `obj` als UTF-8-kodiertes JSON."""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, default=_default, option=_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0))
+    return json.dumps(obj, default=_default, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def dumps_str(obj: Any, indent: bool = False) -> str:
+    """Serialisiert `obj` als JSON-String (Umlaute unverändert, nicht als \\u-Escape)."""
+    return dumps(obj, indent=indent).decode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    """Parst JSON aus str oder bytes."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def to_jsonable(obj: Any) -> Any:
+    """Wandelt `obj` in reine JSON-Typen (dict, list, str, int, float, bool, None)."""
+    return loads(dumps(obj))
+
+
+def json_size(obj: Any) -> int:
+    """Länge der JSON-Kodierung in Bytes (Strings und Bytes: ihre Länge)."""
+    if obj is None:
+        return 0
+    if isinstance(obj, (str, bytes)):
+        return len(obj)
+    return len(dumps(obj))
+
+
+def dataclass_to_dict(obj: Any) -> Dict[str, Any]:
+    """
+    Wie `dataclasses.asdict()`, aber ohne tiefe Kopie.
+
+    Dataclasses werden wie bei `asdict()` auch in Listen, Tupeln und Dicts
+    umgewandelt; die Container werden dabei neu aufgebaut. Alle übrigen Werte
+    (z.B. große Strings in Ergebnis-Strukturen) werden übernommen statt mit
+    `copy.deepcopy` dupliziert.
+    """
+    return {f.name: _convert_nested(getattr(obj, f.name)) for f in dataclasses.fields(obj)}
+
+
+def _convert_nested(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclass_to_dict(value)
+    if isinstance(value, list):
+        return [_convert_nested(v) for v in value]
+    if isinstance(value, tuple):
+        # NamedTuples über ihre Felder wiederherstellen (wie asdict)
+        items = [_convert_nested(v) for v in value]
+        return type(value)(*items) if hasattr(value, "_fields") else type(value)(items)
+    if isinstance(value, dict):
+        return {k: _convert_nested(v) for k, v in value.items()}
+    return value
+
+
+def output_json(data: Any, code: int, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Flask-RESTX-Representation für application/json (ersetzt json.dumps)."""
+    resp = make_response(dumps(data, indent=current_app.debug) + b"\n", code)
+    resp.headers.extend(headers or {})
+    resp.mimetype = "application/json"
+    return resp
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON-Provider (`jsonify`, `request.get_json`) auf Basis von `dumps`/`loads`."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return dumps_str(obj, indent=bool(kwargs.get("indent")))
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return current_app.response_class(dumps(obj, indent=current_app.debug) + b"\n", mimetype=self.mimetype)
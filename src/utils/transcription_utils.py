@@ -47,7 +47,9 @@ from typing import (
     cast as type_cast,
     Protocol,
     Coroutine,
-    Tuple
+    Callable,
+    Tuple,
+    TypeVar
 )
 from pathlib import Path
 import time
@@ -76,10 +78,11 @@ from src.core.models.audio import (
 )
 from src.core.exceptions import ProcessingError
 from src.processors.base_processor import BaseProcessor
-from src.core.llm import LLMConfigManager, UseCase
+from src.core.llm import LLMConfigManager, ProviderManager, UseCase
 from src.core.llm.protocols import LLMProvider
 
 # Type-Definitionen
+_T = TypeVar("_T")
 FieldType = tuple[Union[type[str], type[None]], Field]
 
 class AudioSegmentProtocol(Protocol):
@@ -169,7 +172,7 @@ class WhisperTranscriber:
             if configured_model:
                 self.model = configured_model
             if self._logger:
-                self._logger.info(f"Transcription-Modell: {self.model} (Provider: {type(self.provider).__name__})")
+                self._logger.info(f"Transcription-Modell: {self.model} (Provider: {self.provider.get_provider_name() if self.provider else None})")
         except Exception as e:
             # Fallback auf direkten OpenAI-Client wenn Provider nicht verfügbar
             if self._logger:
@@ -193,6 +196,19 @@ class WhisperTranscriber:
         self.debug_dir.mkdir(parents=True, exist_ok=True)
         self.temp_dir.mkdir(parents=True, exist_ok=True)
 
+    def _limited_client_call(self, create: Callable[..., _T], **kwargs: Any) -> _T:
+        """
+        Führt einen direkten SDK-Aufruf (Fallback ohne Provider-Methode) durch den
+        gemeinsamen Concurrency-Limiter aus, wie die Provider-Aufrufe.
+        
+        Args:
+            create: SDK-Methode, z.B. self.client.chat.completions.create
+            **kwargs: Parameter des Aufrufs (inkl. model)
+        """
+        provider_name = self.provider.get_provider_name() if self.provider else "openai"
+        limiter = ProviderManager().get_concurrency_limiter()
+        return limiter.call(provider_name, kwargs.get("model"), create, **kwargs)
+
     def _get_model_token_limit(self, model: str) -> int:
         """
         Gibt das Token-Limit für ein Modell zurück.
@@ -539,7 +555,8 @@ class WhisperTranscriber:
             start_time: float = time.time()
 
             # OpenAI Client-Aufruf
-            response: ChatCompletion = self.client.chat.completions.create(
+            response: ChatCompletion = self._limited_client_call(
+                self.client.chat.completions.create,
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -693,7 +710,8 @@ class WhisperTranscriber:
                 start_time: float = time.time()
 
                 # OpenAI Client-Aufruf
-                response: ChatCompletion = self.client.chat.completions.create(
+                response: ChatCompletion = self._limited_client_call(
+                    self.client.chat.completions.create,
                     model=self.model,
                     messages=[
                         {"role": "system", "content": system_prompt},
@@ -821,7 +839,8 @@ class WhisperTranscriber:
                 start_time: float = time.time()
 
                 # OpenAI Client-Aufruf
-                response: ChatCompletion = self.client.chat.completions.create(
+                response: ChatCompletion = self._limited_client_call(
+                    self.client.chat.completions.create,
                     model=self.model,
                     messages=[
                         {"role": "system", "content": system_prompt},
@@ -1640,14 +1659,16 @@ class WhisperTranscriber:
                             # Fallback auf direkten Client-Aufruf
                             if isinstance(file_path, Path):
                                 with open(file_path, 'rb') as audio_file:
-                                    response = self.client.audio.transcriptions.create(
+                                    response = self._limited_client_call(
+                                        self.client.audio.transcriptions.create,
                                         model=self.model,
                                         file=("audio.mp3", audio_file, "audio/mpeg"),
                                         response_format="verbose_json"
                                     )
                             else:
                                 bytes_io = io.BytesIO(file_path)
-                                response: TranscriptionVerbose = self.client.audio.transcriptions.create(
+                                response: TranscriptionVerbose = self._limited_client_call(
+                                    self.client.audio.transcriptions.create,
                                     model=self.model,
                                     file=("audio.mp3", bytes_io, "audio/mpeg"),
                                     response_format="verbose_json"
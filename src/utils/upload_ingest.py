@@ -0,0 +1,298 @@
+"""
+@fileoverview Upload Ingest - Single-pass streaming of multipart uploads to disk
+
+@description
+Nimmt Datei-Uploads in einem einzigen Durchlauf entgegen. Beim Parsen des
+multipart-Bodys schreibt Werkzeug jede Datei in einen Stream, den
+`IngestRequest` liefert: eine Datei im Staging-Verzeichnis, die beim
+Schreiben gleichzeitig MD5 und Größe berechnet und den Dateianfang für die
+MIME-Erkennung festhält. Der Body wird in Blöcken von `chunk_size_kb`
+gelesen (Werkzeug-Standard: 64 KiB).
+
+`ingest_upload()` übergibt die fertige Datei an ihr Ziel, in der Regel per
+Umbenennen (gleiches Dateisystem), und liefert einen `UploadDescriptor` mit
+Pfad, Größe, Hash und MIME-Type. Routen und Prozessoren müssen die Datei
+danach nicht erneut lesen: Ein Upload von 500 MB wird genau einmal gelesen
+und einmal geschrieben.
+
+Kleine Requests (unter `memory_threshold_kb`) bleiben wie bisher im Speicher;
+`ingest_upload()` schreibt sie in einem Durchlauf und berechnet dabei dieselben
+Werte.
+
+@module utils.upload_ingest
+
+@exports
+- UploadDescriptor: Dataclass - Pfad, Größe, MD5 und MIME-Type eines Uploads
+- IngestRequest: Class - Flask-Request, der Uploads direkt ins Staging schreibt
+- ingest_upload(): UploadDescriptor - Übergibt einen Upload an seinen Zielpfad
+- staged_upload(): Optional[UploadDescriptor] - Werte eines noch nicht übergebenen Uploads
+- sniff_mime_type(): Optional[str] - MIME-Type aus dem Dateianfang
+
+@usedIn
+- src.dashboard.app, src.api: app.request_class
+- src.api.routes.audio_routes, pdf_routes, imageocr_routes, office_routes: Uploads speichern
+- src.processors.metadata_processor: Größe und Pfad ohne erneutes Lesen
+
+@dependencies
+- External: flask, werkzeug - Request, FileStorage, multipart-Parser
+- Optional: python-magic - MIME-Erkennung über libmagic (Fallback: Signaturen, Dateiendung)
+- Internal: src.core.config - Konfiguration `upload_ingest`
+"""
+
+import hashlib
+import mimetypes
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from typing import IO, Any, Dict, Optional, Tuple
+
+from flask import Request
+from werkzeug.datastructures import FileStorage
+from werkzeug.formparser import FormDataParser, MultiPartParser, default_stream_factory
+
+try:
+    import magic
+except Exception:  # pragma: no cover - libmagic nicht installiert
+    magic = None  # type: ignore
+
+
+_HEAD_BYTES = 8192
+
+# Fallback ohne libmagic: (Offset, Signatur, MIME-Type)
+_SIGNATURES: Tuple[Tuple[int, bytes, str], ...] = (
+    (0, b"%PDF-", "application/pdf"),
+    (0, b"\x89PNG\r\n\x1a\n", "image/png"),
+    (0, b"\xff\xd8\xff", "image/jpeg"),
+    (0, b"GIF87a", "image/gif"),
+    (0, b"GIF89a", "image/gif"),
+    (0, b"ID3", "audio/mpeg"),
+    (0, b"OggS", "audio/ogg"),
+    (0, b"fLaC", "audio/flac"),
+    (0, b"\x1aE\xdf\xa3", "video/webm"),
+    (0, b"PK\x03\x04", "application/zip"),
+    (4, b"ftypM4A", "audio/mp4"),
+    (4, b"ftyp", "video/mp4"),
+)
+
+
+@dataclass(frozen=True)
+class UploadDescriptor:
+    """Ergebnis der Übernahme eines Uploads."""
+
+    path: str
+    filename: str
+    size: int
+    md5: str
+    # Aus dem Inhalt erkannt; None, wenn unbekannt
+    mime_type: Optional[str] = None
+    # Vom Client angegeben (multipart Content-Type)
+    declared_mime_type: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "filename": self.filename,
+            "size": self.size,
+            "md5": self.md5,
+            "mime_type": self.mime_type,
+            "declared_mime_type": self.declared_mime_type,
+        }
+
+
+def _settings() -> Dict[str, Any]:
+    # Verzögerter Import, um zirkuläre Importe zu vermeiden
+    from src.core.config import Config
+    return Config().get("upload_ingest", {}) or {}
+
+
+def _chunk_size() -> int:
+    return max(64, int(_settings().get("chunk_size_kb", 1024))) * 1024
+
+
+def sniff_mime_type(head: bytes, filename: Optional[str] = None) -> Optional[str]:
+    """
+    Erkennt den MIME-Type aus den ersten Bytes einer Datei.
+
+    Reihenfolge: libmagic (falls installiert), bekannte Signaturen, Dateiendung.
+    """
+    if head and magic is not None:
+        try:
+            detected = str(magic.from_buffer(head, mime=True))
+            if detected and detected != "application/octet-stream":
+                return detected
+        except Exception:
+            pass
+    for offset, signature, mime_type in _SIGNATURES:
+        if head[offset:offset + len(signature)] == signature:
+            if mime_type == "application/zip" and filename:
+                # DOCX/XLSX/PPTX sind ZIP-Container; die Endung ist genauer
+                return mimetypes.guess_type(filename)[0] or mime_type
+            return mime_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return "audio/wav"
+    return mimetypes.guess_type(filename)[0] if filename else None
+
+
+class _Digest:
+    """Berechnet Größe, MD5 und Dateianfang im selben Durchlauf wie das Schreiben."""
+
+    def __init__(self) -> None:
+        self.size = 0
+        self.md5 = hashlib.md5()
+        self.head = bytearray()
+
+    def update(self, data: bytes) -> None:
+        self.size += len(data)
+        self.md5.update(data)
+        if len(self.head) < _HEAD_BYTES:
+            self.head += data[:_HEAD_BYTES - len(self.head)]
+
+    def describe(self, path: str, filename: str, declared_mime_type: Optional[str]) -> UploadDescriptor:
+        return UploadDescriptor(
+            path=path,
+            filename=filename,
+            size=self.size,
+            md5=self.md5.hexdigest(),
+            mime_type=sniff_mime_type(bytes(self.head), filename),
+            declared_mime_type=declared_mime_type,
+        )
+
+
+class _StagedUpload:
+    """
+    Schreib-/lesbarer Upload-Stream im Staging-Verzeichnis.
+
+    Werkzeug schreibt den Dateiteil sequentiell hinein und spult danach auf
+    den Anfang zurück; alle übrigen Dateioperationen gehen an die Datei.
+    Wird der Upload nicht mit `ingest_upload()` übernommen, löscht `close()`
+    (am Ende des Requests) die Staging-Datei.
+    """
+
+    def __init__(self, staging_dir: str, filename: Optional[str]) -> None:
+        os.makedirs(staging_dir, exist_ok=True)
+        suffix = os.path.splitext(filename or "")[1][:16]
+        fd, self.name = tempfile.mkstemp(prefix="ingest_", suffix=suffix, dir=staging_dir)
+        self._file: IO[bytes] = os.fdopen(fd, "w+b")
+        self.digest = _Digest()
+        self.claimed = False
+
+    def write(self, data: bytes) -> int:
+        self.digest.update(data)
+        return self._file.write(data)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._file, name)
+
+    def __iter__(self) -> Any:
+        return iter(self._file)
+
+    def claim(self, dest_path: str) -> None:
+        """Verschiebt die Staging-Datei an `dest_path` (Umbenennen, sonst Kopie)."""
+        self._file.close()
+        dest_dir = os.path.dirname(os.path.abspath(dest_path))
+        os.makedirs(dest_dir, exist_ok=True)
+        try:
+            os.replace(self.name, dest_path)
+        except OSError:
+            # Anderes Dateisystem
+            shutil.move(self.name, dest_path)
+        self.claimed = True
+
+    def close(self) -> None:
+        self._file.close()
+        if not self.claimed:
+            try:
+                os.unlink(self.name)
+            except OSError:
+                pass
+
+
+class _LargeChunkFormDataParser(FormDataParser):
+    """FormDataParser, der den multipart-Body in großen Blöcken liest."""
+
+    def _parse_multipart(self, stream: IO[bytes], mimetype: str, content_length: Optional[int], options: Dict[str, str]) -> Any:
+        buffer_size = _chunk_size()
+        if self.max_form_memory_size:
+            # Der Decoder-Puffer (Rest + neuer Block) darf max_form_memory_size nicht überschreiten
+            buffer_size = max(64 * 1024, min(buffer_size, self.max_form_memory_size // 2))
+        parser = MultiPartParser(
+            stream_factory=self.stream_factory,
+            max_form_memory_size=self.max_form_memory_size,
+            max_form_parts=self.max_form_parts,
+            cls=self.cls,
+            buffer_size=buffer_size,
+        )
+        boundary = options.get("boundary", "").encode("ascii")
+        if not boundary:
+            raise ValueError("Missing boundary")
+        form, files = parser.parse(stream, boundary, content_length)
+        return stream, form, files
+
+
+class IngestRequest(Request):
+    """Flask-Request, dessen Datei-Uploads direkt ins Staging-Verzeichnis geschrieben werden."""
+
+    form_data_parser_class = _LargeChunkFormDataParser
+
+    def _get_file_stream(
+        self,
+        total_content_length: Optional[int],
+        content_type: Optional[str],
+        filename: Optional[str] = None,
+        content_length: Optional[int] = None,
+    ) -> IO[bytes]:
+        settings = _settings()
+        threshold = int(settings.get("memory_threshold_kb", 500)) * 1024
+        if total_content_length is not None and total_content_length <= threshold:
+            return default_stream_factory(total_content_length, content_type, filename, content_length)
+        staging_dir = str(settings.get("staging_dir", os.path.join("cache", "uploads", ".staging")))
+        return _StagedUpload(staging_dir, filename)  # type: ignore[return-value]
+
+
+def staged_upload(file: FileStorage) -> Optional[UploadDescriptor]:
+    """
+    Werte eines Uploads, der noch im Staging liegt, ohne ihn zu lesen.
+
+    Returns:
+        Optional[UploadDescriptor]: Mit dem Staging-Pfad; None bei Uploads im Speicher
+    """
+    stream: Any = file.stream
+    if not isinstance(stream, _StagedUpload) or stream.claimed:
+        return None
+    stream.flush()
+    return stream.digest.describe(stream.name, file.filename or "", file.mimetype or None)
+
+
+def ingest_upload(file: FileStorage, dest_path: str) -> UploadDescriptor:
+    """
+    Übergibt einen Upload an `dest_path` und liefert Größe, MD5 und MIME-Type.
+
+    Liegt der Upload bereits im Staging (große Requests), wird er nur
+    umbenannt. Sonst wird er in einem Durchlauf geschrieben und dabei
+    vermessen. Danach ist `file` nicht mehr lesbar.
+
+    Args:
+        file: Hochgeladene Datei aus `request.files`
+        dest_path: Zielpfad (Verzeichnis wird angelegt)
+
+    Returns:
+        UploadDescriptor: Werte der Datei unter `dest_path`
+    """
+    filename = file.filename or os.path.basename(dest_path)
+    declared = file.mimetype or None
+    stream: Any = file.stream
+    if isinstance(stream, _StagedUpload) and not stream.claimed:
+        stream.claim(dest_path)
+        return stream.digest.describe(dest_path, filename, declared)
+
+    digest = _Digest()
+    chunk_size = _chunk_size()
+    os.makedirs(os.path.dirname(os.path.abspath(dest_path)), exist_ok=True)
+    if hasattr(stream, "seek"):
+        stream.seek(0)
+    with open(dest_path, "wb") as out:
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            digest.update(chunk)
+            out.write(chunk)
+    return digest.describe(dest_path, filename, declared)
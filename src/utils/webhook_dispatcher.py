@@ -0,0 +1,336 @@
+"""
+@fileoverview Webhook Dispatcher - Background delivery of job webhooks with coalescing
+
+@description
+Stellt Webhooks der Secretary-Jobs im Hintergrund zu, statt sie im Job-Thread
+synchron per `requests.post` zu senden. Ein langsamer Callback-Endpunkt hält
+damit keinen Job mehr auf, und gesprächige Prozessoren erzeugen nicht mehr
+hunderte HTTP-Requests.
+
+Zwei Arten von Zustellungen:
+
+- Fortschritt (`post_progress`): pro Job zusammengefasst. Innerhalb des
+  Fensters `coalesce_window_sec` wird pro Ziel-URL nur der letzte Stand gesendet.
+  Der Aufrufer wartet nicht.
+- Abschluss/Fehler (`send_final`): werden pro Job in Einreihungsreihenfolge
+  zugestellt, nie verworfen und nach allen bereits laufenden Zustellungen
+  dieses Jobs gesendet. Noch nicht gesendeter Fortschritt desselben Jobs
+  entfällt. Der Aufrufer wartet auf das Ergebnis (Response oder Exception),
+  damit Handler die Antwort weiterhin protokollieren können.
+
+Zustellungen eines Jobs laufen nie parallel. Fehlgeschlagene Zustellungen
+(Netzwerkfehler, 429, 5xx) werden mit exponentiellem Backoff wiederholt;
+Fortschritt nur, solange kein neuerer Stand vorliegt. Die Anzahl offener Jobs
+ist begrenzt (`max_pending`): Darüber hinaus wird Fortschritt verworfen und
+Abschluss-Webhooks werden direkt im aufrufenden Thread gesendet.
+
+@module utils.webhook_dispatcher
+
+@exports
+- WebhookDispatcher: Class - Hintergrund-Zustellung mit Coalescing
+- get_webhook_dispatcher(): WebhookDispatcher - Prozessweites Singleton (Konfiguration `generic_worker.webhooks`)
+- shutdown_webhook_dispatcher(): None - Stellt offene Zustellungen beim Herunterfahren zu
+
+@usedIn
+- src.core.mongodb.secretary_worker_manager: Log-Weiterleitung und Fehler-Webhook
+- src.core.processing.handlers.*: Fortschritts- und Abschluss-Webhooks
+
+@dependencies
+- External: requests - HTTP-Client mit Connection-Pool (Session/HTTPAdapter)
+"""
+
+import heapq
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+logger = logging.getLogger(__name__)
+
+# transport(url=..., json=..., headers=..., timeout=...) -> Response (Signatur wie requests.post)
+Transport = Callable[..., Any]
+
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class _Delivery:
+    url: str
+    payload: Dict[str, Any]
+    headers: Dict[str, str]
+    timeout: float
+    final: bool = False
+    future: Optional["Future[Any]"] = None
+
+
+@dataclass
+class _Lane:
+    """Offene Zustellungen eines Jobs."""
+    finals: Deque[_Delivery] = field(default_factory=deque)
+    progress: Dict[str, _Delivery] = field(default_factory=dict)  # URL -> letzter Stand
+    scheduled: bool = False
+    active: bool = False
+    closed: bool = False
+
+
+class WebhookDispatcher:
+    """Hintergrund-Zustellung von Job-Webhooks (siehe Moduldokumentation)."""
+
+    def __init__(
+        self,
+        workers: int = 4,
+        coalesce_window_sec: float = 1.0,
+        max_pending: int = 1000,
+        max_retries: int = 3,
+        backoff_base_sec: float = 0.5,
+        transport: Optional[Transport] = None,
+    ) -> None:
+        self.workers = max(1, workers)
+        self.coalesce_window_sec = coalesce_window_sec
+        self.max_pending = max_pending
+        self.max_retries = max_retries
+        self.backoff_base_sec = backoff_base_sec
+        self._transport = transport or self._build_session_transport(self.workers)
+        self._lanes: Dict[str, _Lane] = {}
+        self._closed_keys: "OrderedDict[str, None]" = OrderedDict()
+        self._due: List[Tuple[float, int, str]] = []  # Heap: (fällig_um, seq, job_key)
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._stopped = False
+
+    @staticmethod
+    def _build_session_transport(pool_size: int) -> Transport:
+        session = requests.Session()
+        # Keep-Alive-Verbindungen pro Callback-Host wiederverwenden
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session.post
+
+    def _ensure_started(self) -> None:
+        if self._threads:
+            return
+        for i in range(self.workers):
+            th = threading.Thread(target=self._worker_loop, name=f"webhook-dispatch-{i}", daemon=True)
+            th.start()
+            self._threads.append(th)
+
+    def _schedule(self, key: str, lane: _Lane, delay: float) -> None:
+        """Plant einen Job-Key ein (Aufrufer hält self._cond)."""
+        if lane.scheduled or lane.active:
+            return
+        lane.scheduled = True
+        self._seq += 1
+        heapq.heappush(self._due, (time.monotonic() + delay, self._seq, key))
+        self._cond.notify()
+
+    def open_job(self, job_key: str) -> None:
+        """Gibt einen abgeschlossenen Job-Key wieder frei (erneuter Lauf nach Requeue)."""
+        with self._cond:
+            self._closed_keys.pop(job_key, None)
+
+    def post_progress(
+        self,
+        job_key: str,
+        url: str,
+        payload: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout: float = 15,
+    ) -> bool:
+        """
+        Reiht einen Fortschritts-Webhook ein (nicht blockierend).
+
+        Returns:
+            bool: False, wenn verworfen (Job bereits abgeschlossen oder Warteschlange voll)
+        """
+        with self._cond:
+            if job_key in self._closed_keys:
+                return False
+            lane = self._lanes.get(job_key)
+            if lane is None:
+                if len(self._lanes) >= self.max_pending:
+                    logger.warning(f"Webhook-Warteschlange voll ({self.max_pending}); Fortschritt für {job_key} verworfen")
+                    return False
+                lane = self._lanes[job_key] = _Lane()
+            if lane.closed:
+                return False
+            # Ersetzt einen noch nicht gesendeten Stand an dieselbe URL (Coalescing)
+            lane.progress[url] = _Delivery(url=url, payload=payload, headers=headers, timeout=timeout)
+            self._ensure_started()
+            self._schedule(job_key, lane, self.coalesce_window_sec)
+        return True
+
+    def send_final(
+        self,
+        job_key: str,
+        url: str,
+        payload: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout: float = 30,
+        wait: bool = True,
+    ) -> Any:
+        """
+        Stellt einen Abschluss- oder Fehler-Webhook in Reihenfolge zu.
+
+        Args:
+            wait: Auf die Zustellung warten und die Response zurückgeben
+
+        Returns:
+            Response (bei wait=True), sonst None
+
+        Raises:
+            Exception: Letzter Fehler, wenn alle Versuche scheitern (nur wait=True)
+        """
+        future: "Future[Any]" = Future()
+        delivery = _Delivery(url=url, payload=payload, headers=headers, timeout=timeout, final=True, future=future)
+        with self._cond:
+            lane = self._lanes.get(job_key)
+            if lane is None and len(self._lanes) >= self.max_pending:
+                overflow = True
+            else:
+                overflow = False
+                if lane is None:
+                    lane = self._lanes[job_key] = _Lane()
+                lane.closed = True
+                lane.progress.clear()  # überholter Fortschritt entfällt
+                lane.finals.append(delivery)
+                self._ensure_started()
+                self._schedule(job_key, lane, 0)
+        if overflow:
+            # Backpressure: im aufrufenden Thread senden statt verwerfen
+            logger.warning(f"Webhook-Warteschlange voll; sende Abschluss-Webhook für {job_key} direkt")
+            self._deliver(job_key, delivery, None)
+        if not wait:
+            return None
+        # Obergrenze: alle Versuche inkl. Backoff
+        max_wait = (timeout + self.backoff_base_sec * (2 ** self.max_retries)) * (self.max_retries + 1) + 60
+        return future.result(timeout=max_wait)
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopped and not self._due:
+                        return
+                    now = time.monotonic()
+                    if self._due and self._due[0][0] <= now:
+                        _, _, key = heapq.heappop(self._due)
+                        lane = self._lanes.get(key)
+                        if lane is None:
+                            continue
+                        lane.scheduled = False
+                        lane.active = True
+                        break
+                    wait_for = (self._due[0][0] - now) if self._due else None
+                    self._cond.wait(timeout=wait_for)
+            try:
+                self._drain_lane(key, lane)
+            finally:
+                with self._cond:
+                    lane.active = False
+                    if lane.finals or lane.progress:
+                        self._schedule(key, lane, 0 if lane.finals else self.coalesce_window_sec)
+                    else:
+                        self._lanes.pop(key, None)
+                        if lane.closed:
+                            # Späte Log-Weiterleitungen dürfen nicht nach dem Abschluss ankommen
+                            self._closed_keys[key] = None
+                            while len(self._closed_keys) > self.max_pending:
+                                self._closed_keys.popitem(last=False)
+
+    def _drain_lane(self, key: str, lane: _Lane) -> None:
+        while True:
+            with self._cond:
+                if lane.finals:
+                    delivery = lane.finals.popleft()
+                elif lane.progress:
+                    url = next(iter(lane.progress))
+                    delivery = lane.progress.pop(url)
+                else:
+                    return
+            self._deliver(key, delivery, lane)
+
+    def _deliver(self, key: str, delivery: _Delivery, lane: Optional[_Lane]) -> None:
+        last_error: Optional[BaseException] = None
+        response: Any = None
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                if not delivery.final and lane is not None:
+                    with self._cond:
+                        superseded = delivery.url in lane.progress or lane.closed
+                    if superseded:
+                        return
+                backoff = self.backoff_base_sec * (2 ** (attempt - 1))
+                time.sleep(backoff + random.uniform(0, backoff / 2))
+            try:
+                response = self._transport(
+                    url=delivery.url, json=delivery.payload, headers=delivery.headers, timeout=delivery.timeout
+                )
+                last_error = None
+                if getattr(response, "status_code", 200) not in _RETRY_STATUS:
+                    break
+            except Exception as e:
+                last_error = e
+        if last_error is not None:
+            logger.warning(f"Webhook an {delivery.url} für {key} fehlgeschlagen: {last_error}")
+        if delivery.future is not None:
+            if last_error is not None:
+                delivery.future.set_exception(last_error)
+            else:
+                delivery.future.set_result(response)
+
+    def pending_jobs(self) -> Set[str]:
+        """Job-Keys mit offenen Zustellungen (Diagnose)."""
+        with self._cond:
+            return {k for k, lane in self._lanes.items() if lane.finals or lane.progress or lane.active}
+
+    def shutdown(self, timeout: float = 10) -> None:
+        """Stellt offene Zustellungen sofort zu und beendet die Worker-Threads."""
+        with self._cond:
+            self._stopped = True
+            # Wartende Fortschritts-Fenster vorziehen
+            self._due = [(0.0, seq, key) for _, seq, key in self._due]
+            heapq.heapify(self._due)
+            self._cond.notify_all()
+        for th in self._threads:
+            th.join(timeout=timeout)
+
+
+_webhook_dispatcher: Optional[WebhookDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_webhook_dispatcher() -> WebhookDispatcher:
+    """Gibt den prozessweiten WebhookDispatcher zurück (Konfiguration: `generic_worker.webhooks`)."""
+    global _webhook_dispatcher
+    if _webhook_dispatcher is None:
+        with _dispatcher_lock:
+            if _webhook_dispatcher is None:
+                from src.core.config import Config
+                cfg: Dict[str, Any] = Config().get("generic_worker.webhooks", {}) or {}
+                _webhook_dispatcher = WebhookDispatcher(
+                    workers=int(cfg.get("workers", 4)),
+                    coalesce_window_sec=float(cfg.get("coalesce_window_sec", 1.0)),
+                    max_pending=int(cfg.get("max_pending_jobs", 1000)),
+                    max_retries=int(cfg.get("max_retries", 3)),
+                    backoff_base_sec=float(cfg.get("backoff_base_sec", 0.5)),
+                )
+    return _webhook_dispatcher
+
+
+def shutdown_webhook_dispatcher(timeout: float = 10) -> None:
+    """Beendet den prozessweiten WebhookDispatcher, falls er erzeugt wurde."""
+    global _webhook_dispatcher
+    with _dispatcher_lock:
+        dispatcher, _webhook_dispatcher = _webhook_dispatcher, None
+    if dispatcher is not None:
+        dispatcher.shutdown(timeout=timeout)
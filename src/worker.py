@@ -0,0 +1,73 @@
+"""
+@fileoverview Worker Entry Point - Job processing without the HTTP API
+
+@description
+Startet nur die Hintergrund-Worker (SessionWorkerManager und
+SecretaryWorkerManager), ohne Flask-App und HTTP-Server. Damit lassen sich
+Jobverarbeitung und API getrennt skalieren: API-Knoten laufen mit
+`SERVER_ROLE=api` unter gunicorn, beliebig viele Worker-Knoten mit
+`python -m src.worker` teilen sich dieselbe `jobs`-Collection (Leases).
+
+SIGTERM/SIGINT beenden den Prozess geordnet: keine neuen Jobs, laufende Jobs
+bis `server.drain_timeout_sec` abwarten, den Rest neu einreihen.
+
+Start:
+    python -m src.worker
+
+@module worker
+
+@usedIn
+- Direct execution: python -m src.worker
+- docker-compose: Service `secretary-worker`
+
+@dependencies
+- External: dotenv - Loading environment variables
+- Internal: src.core.background_workers - Start und Drain der Job-Worker
+- Internal: src.core.mongodb - close_mongodb_connection
+"""
+
+import os
+import signal
+import sys
+import threading
+from types import FrameType
+from typing import Optional
+
+from dotenv import load_dotenv
+
+load_dotenv(os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env'), override=True)
+
+if os.getenv('PYTHONHTTPSVERIFY', '').lower() in {'0', 'false'}:
+    import ssl
+    ssl._create_default_https_context = ssl._create_unverified_context
+
+from src.core.background_workers import start_background_workers, stop_background_workers  # noqa: E402
+from src.core.mongodb import close_mongodb_connection  # noqa: E402
+from src.utils.logger import get_logger  # noqa: E402
+
+logger = get_logger(process_id="worker")
+
+
+def main() -> int:
+    os.environ.setdefault("SERVER_ROLE", "worker")
+    stop_event = threading.Event()
+
+    def _handle_signal(sig: int, frame: Optional[FrameType]) -> None:
+        logger.info(f"Signal {sig} empfangen, beende Worker...")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, _handle_signal)
+    signal.signal(signal.SIGTERM, _handle_signal)
+
+    logger.info("Worker-Prozess wird gestartet")
+    start_background_workers()
+    while not stop_event.wait(1):
+        pass
+    released = stop_background_workers()
+    close_mongodb_connection()
+    logger.info(f"Worker-Prozess beendet ({released} Jobs neu eingereiht)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""
+@fileoverview WSGI Entry Point - Flask application for production servers
+
+@description
+WSGI-Einstiegspunkt für Produktionsserver (gunicorn). Lädt die .env wie
+`src.main`, wendet den optionalen TLS-Workaround (PYTHONHTTPSVERIFY=0) an und
+stellt die Flask-App als `app` bereit, ohne den Entwicklungsserver zu starten.
+
+Start:
+    gunicorn -c python:src.gunicorn_conf src.wsgi:app
+
+@module wsgi
+
+@exports
+- app: Flask - Main Flask application instance
+
+@usedIn
+- src.gunicorn_conf: Lädt die App (preload) im Master-Prozess
+- Docker container: CMD gunicorn ... src.wsgi:app
+
+@dependencies
+- External: dotenv - Loading environment variables
+- Internal: src.dashboard.app - Main Flask application
+"""
+
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv(os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env'), override=True)
+
+# Wie in src.main: muss vor allen Imports passieren, die HTTPS-Verbindungen aufbauen
+if os.getenv('PYTHONHTTPSVERIFY', '').lower() in {'0', 'false'}:
+    import ssl
+    ssl._create_default_https_context = ssl._create_unverified_context
+
+from src.dashboard.app import app  # noqa: E402
+
+__all__ = ["app"]